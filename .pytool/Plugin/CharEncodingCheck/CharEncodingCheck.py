@@ -6,7 +6,10 @@
 
 
 import os
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from edk2toolext.environment.plugintypes.ci_build_plugin import ICiBuildPlugin
 from edk2toolext.environment.var_dict import VarDict
 
@@ -40,6 +43,8 @@ class CharEncodingCheck(ICiBuildPlugin):
     }
     """
 
+    _ResultCache = None
+
     def GetTestName(self, packagename: str, environment: VarDict) -> tuple:
         """ Provide the testcase name and classname for use in reporting
             testclassname: a descriptive string for the testcase can include whitespace
@@ -76,28 +81,47 @@ class CharEncodingCheck(ICiBuildPlugin):
             tc.LogStdError("No Package folder {0}".format(abs_pkg_path))
             return 0
 
-        for (ext, enc) in EcodingMap.items():
-            files = self.WalkDirectoryForExtension([ext], abs_pkg_path)
-            files = [Edk2pathObj.GetEdk2RelativePathFromAbsolutePath(x) for x in files]  # make edk2relative path so can process ignores
-
-            if "IgnoreFiles" in pkgconfig:
-                for a in pkgconfig["IgnoreFiles"]:
-                    a = a.replace(os.sep, "/")
-                    try:
-                        tc.LogStdOut("Ignoring File {0}".format(a))
-                        files.remove(a)
-                    except:
-                        tc.LogStdError("CharEncodingCheck.IgnoreInf -> {0} not found in filesystem.  Invalid ignore file".format(a))
-                        logging.info("CharEncodingCheck.IgnoreInf -> {0} not found in filesystem.  Invalid ignore file".format(a))
-
-            files = [Edk2pathObj.GetAbsolutePathOnThisSystemFromEdk2RelativePath(x) for x in files]
-            for a in files:
-                files_tested += 1
-                if(self.TestEncodingOk(a, enc)):
-                    logging.debug("File {0} Passed Encoding Check {1}".format(a, enc))
-                else:
-                    tc.LogStdError("Encoding Failure in {0}.  Not {1}".format(a, enc))
-                    overall_status += 1
+        # Walk the package once and bucket the files by extension
+        ext_files = dict((ext, []) for ext in EcodingMap)
+        for (root, dirs, names) in os.walk(abs_pkg_path):
+            for name in names:
+                lower_name = name.lower()
+                for ext in EcodingMap:
+                    if lower_name.endswith(ext):
+                        ext_files[ext].append(os.path.join(root, name))
+
+        if "IgnoreFiles" in pkgconfig:
+            # make edk2relative path so can process ignores
+            ignores = set(a.replace(os.sep, "/") for a in pkgconfig["IgnoreFiles"])
+            found = set()
+            for (ext, files) in ext_files.items():
+                relfiles = [Edk2pathObj.GetEdk2RelativePathFromAbsolutePath(x) for x in files]
+                found.update(ignores.intersection(relfiles))
+                ext_files[ext] = [x for (x, r) in zip(files, relfiles) if r not in ignores]
+            for a in pkgconfig["IgnoreFiles"]:
+                a = a.replace(os.sep, "/")
+                tc.LogStdOut("Ignoring File {0}".format(a))
+                if a not in found:
+                    tc.LogStdError("CharEncodingCheck.IgnoreInf -> {0} not found in filesystem.  Invalid ignore file".format(a))
+                    logging.info("CharEncodingCheck.IgnoreInf -> {0} not found in filesystem.  Invalid ignore file".format(a))
+
+        # Check the files not found in the result cache in parallel
+        cache = self._GetResultCache(Edk2pathObj.WorkspacePath)
+        checks = [(a, enc) for (ext, enc) in EcodingMap.items() for a in ext_files[ext]]
+        results = [cache.Lookup(a, enc) for (a, enc) in checks]
+        misses = [index for (index, result) in enumerate(results) if result is None]
+        with ThreadPoolExecutor() as pool:
+            for (index, result) in zip(misses, pool.map(lambda index: self._CheckFile(cache, *checks[index]), misses)):
+                results[index] = result
+        cache.Save()
+
+        for ((a, enc), result) in zip(checks, results):
+            files_tested += 1
+            if(result):
+                logging.debug("File {0} Passed Encoding Check {1}".format(a, enc))
+            else:
+                tc.LogStdError("Encoding Failure in {0}.  Not {1}".format(a, enc))
+                overall_status += 1
 
         tc.LogStdOut("Tested Encoding on {0} files".format(files_tested))
         if overall_status != 0:
@@ -106,13 +130,108 @@ class CharEncodingCheck(ICiBuildPlugin):
             tc.SetSuccess()
         return overall_status
 
-    def TestEncodingOk(self, apath, encodingValue):
+    def TestEncodingOk(self, apath, encodingValue, content=None):
         try:
-            with open(apath, "rb") as fobj:
-                fobj.read().decode(encodingValue)
+            if content is None:
+                with open(apath, "rb") as fobj:
+                    content = fobj.read()
+            content.decode(encodingValue)
         except Exception as exp:
             logging.error("Encoding failure: file: {0} type: {1}".format(apath, encodingValue))
             logging.debug("EXCEPTION: while processing {1} - {0}".format(exp, apath))
             return False
 
         return True
+
+    @classmethod
+    def _GetResultCache(cls, workspace):
+        """ Get the result cache shared by all the packages of a CI invocation
+        """
+        path = os.path.join(workspace, "Build", ".pytool", "Plugin", "CharEncodingCheck", "EncodingCache.json")
+        if cls._ResultCache is None or cls._ResultCache.path != path:
+            cls._ResultCache = EncodingResultCache(path)
+        return cls._ResultCache
+
+    def _CheckFile(self, cache, apath, encodingValue):
+        """ Check the encoding of a file, skipping the decoding if its content
+        did not change since its last check, and update the result cache
+        """
+        try:
+            stat = os.stat(apath)
+            with open(apath, "rb") as fobj:
+                content = fobj.read()
+        except Exception:
+            return self.TestEncodingOk(apath, encodingValue)
+
+        digest = hashlib.sha256(content).hexdigest()
+        result = cache.LookupContent(apath, encodingValue, digest)
+        if result is None:
+            result = self.TestEncodingOk(apath, encodingValue, content)
+        cache.Update(apath, encodingValue, stat, digest, result)
+        return result
+
+
+class EncodingResultCache():
+    """ Custom/private class for the results of the encoding check of each
+    file, keyed by the size, modification time and content hash of the file.
+    It is saved in the Build folder so unchanged files are skipped by the next
+    CI invocations.
+    """
+    CacheVersion = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.changed = False
+        try:
+            with open(path, "r") as f:
+                cache = json.load(f)
+            if cache.get("version") == self.CacheVersion:
+                self.entries = cache["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def Lookup(self, apath, encodingValue):
+        """ Get the result of a file with the same size and modification time,
+        None if it has to be checked again
+        """
+        entry = self.entries.get(apath)
+        if entry is None or entry["encoding"] != encodingValue:
+            return None
+        try:
+            stat = os.stat(apath)
+        except OSError:
+            return None
+        if entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+            return None
+        return entry["result"]
+
+    def LookupContent(self, apath, encodingValue, digest):
+        """ Get the result of a file with the same content hash, None if it has
+        to be checked again
+        """
+        entry = self.entries.get(apath)
+        if entry is None or entry["encoding"] != encodingValue or entry["sha256"] != digest:
+            return None
+        return entry["result"]
+
+    def Update(self, apath, encodingValue, stat, digest, result):
+        self.entries[apath] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": digest,
+            "encoding": encodingValue,
+            "result": result
+        }
+        self.changed = True
+
+    def Save(self):
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump({"version": self.CacheVersion, "files": self.entries}, f)
+            self.changed = False
+        except OSError as e:
+            logging.info("CharEncodingCheck: Failed to save the result cache {0}: {1}".format(self.path, e))
@@ -3,9 +3,13 @@
 # Copyright (c) Microsoft Corporation.
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 ##
+import hashlib
+import json
 import logging
+import os
 from edk2toolext.environment.plugintypes.ci_build_plugin import ICiBuildPlugin
-from edk2toollib.uefi.edk2.guid_list import GuidList
+from edk2toollib.gitignore_parser import parse_gitignore_lines
+from edk2toollib.uefi.edk2.guid_list import GuidList, GuidListEntry
 from edk2toolext.environment.var_dict import VarDict
 
 
@@ -129,9 +133,10 @@ class GuidCheck(ICiBuildPlugin):
         if "IgnoreFoldersAndFiles" in pkgconfig:
             All_Ignores.extend(pkgconfig["IgnoreFoldersAndFiles"])
 
-        # Parse the workspace for all GUIDs
-        gs = GuidList.guidlist_from_filesystem(
-            Edk2pathObj.WorkspacePath, ignore_lines=All_Ignores)
+        # Get all GUIDs of the workspace from its index, the workspace is
+        # parsed only once for all the packages
+        gs = WorkspaceGuidIndex.GetIndex(
+            Edk2pathObj.WorkspacePath).GetGuidList(All_Ignores)
 
         # Remove ignored guidvalue
         if "IgnoreGuidValue" in pkgconfig:
@@ -249,3 +254,111 @@ class ErrorEntry():
         for e in self.entries:
             a += "\t" + str(e) + "\n"
         return a
+
+
+class WorkspaceGuidIndex():
+    """ Custom/private class holding the GUIDs of all the DEC and INF files
+    of a workspace, in the order GuidList.guidlist_from_filesystem finds them.
+
+    The index is built once per CI invocation and shared by all the packages
+    under test. The GUIDs of each file are saved in the Build folder with the
+    hash of the file content, so the next invocations only parse the changed
+    files.
+    """
+    AlwaysIgnored = ["/Build", "/Conf"]
+    CacheVersion = 1
+
+    _Indexes = {}
+
+    @classmethod
+    def GetIndex(cls, workspace: str) -> "WorkspaceGuidIndex":
+        """ Get the index of a workspace, building it on first use
+        """
+        if workspace not in cls._Indexes:
+            cls._Indexes[workspace] = cls(workspace)
+        return cls._Indexes[workspace]
+
+    def __init__(self, workspace: str):
+        self.workspace = workspace
+        self.cache_path = os.path.join(
+            workspace, "Build", ".pytool", "Plugin", "GuidCheck", "GuidIndex.json")
+        self.parents = {}  # Parent folder of each folder walked
+        self.files = []  # (folder, file path, GuidListEntry list) of each file
+        self._Build()
+
+    def _LoadCache(self) -> dict:
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+            if cache.get("version") == self.CacheVersion:
+                return cache["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def _SaveCache(self, files: dict) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w") as f:
+                json.dump({"version": self.CacheVersion, "files": files}, f)
+        except OSError as e:
+            logging.info("GuidCheck: Failed to save the GUID index {0}: {1}".format(self.cache_path, e))
+
+    def _Build(self) -> None:
+        """ Walk the workspace like GuidList.guidlist_from_filesystem does with
+        the folders always ignored, and get the GUIDs of each DEC and INF file
+        from the cache or by parsing it
+        """
+        cache = self._LoadCache()
+        files = {}
+        parsed = 0
+        ignore = parse_gitignore_lines(self.AlwaysIgnored, os.path.join(self.workspace, "nofile.txt"), self.workspace)
+        for root, dirs, names in os.walk(self.workspace):
+            for d in dirs[:]:
+                fullpath = os.path.join(root, d)
+                if ignore(fullpath):
+                    dirs.remove(d)
+                else:
+                    self.parents[fullpath] = root
+
+            for name in names:
+                # Other files don't define any GUID
+                if not name.lower().endswith((".dec", ".inf")):
+                    continue
+                fullpath = os.path.join(root, name)
+                if ignore(fullpath):
+                    continue
+
+                with open(fullpath, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                key = os.path.relpath(fullpath, self.workspace).replace(os.sep, "/")
+                entry = cache.get(key)
+                if entry is not None and entry.get("sha256") == digest:
+                    guids = [GuidListEntry(n, g, fullpath) for (n, g) in entry["guids"]]
+                else:
+                    guids = GuidList.parse_guids_from_edk2_file(fullpath)
+                    parsed += 1
+                files[key] = {"sha256": digest, "guids": [[g.name, g.guid] for g in guids]}
+                self.files.append((root, fullpath, guids))
+
+        logging.debug("GuidCheck: Indexed {0} files, parsed {1}".format(len(files), parsed))
+        if files != cache:
+            self._SaveCache(files)
+
+    def GetGuidList(self, ignore_lines: list) -> list:
+        """ Get the same list as GuidList.guidlist_from_filesystem with
+        ignore_lines, which must include the folders always ignored
+        """
+        ignore = parse_gitignore_lines(ignore_lines, os.path.join(self.workspace, "nofile.txt"), self.workspace)
+        ignored_dirs = {self.workspace: False}
+
+        def IsIgnoredDir(folder):
+            if folder not in ignored_dirs:
+                ignored_dirs[folder] = IsIgnoredDir(self.parents[folder]) or ignore(folder)
+            return ignored_dirs[folder]
+
+        guids = []
+        for (root, fullpath, entries) in self.files:
+            if not IsIgnoredDir(root) and not ignore(fullpath):
+                guids.extend(entries)
+        return guids
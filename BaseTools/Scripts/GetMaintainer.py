@@ -12,6 +12,7 @@ from collections import OrderedDict
 import argparse
 import os
 import re
+import sys
 import SetupGit
 
 EXPRESSIONS = {
@@ -25,6 +26,11 @@ EXPRESSIONS = {
     'webpage':    re.compile(r'^W:\s*(?P<webpage>.*?)\r*$')
 }
 
+# Characters of a path pattern that stop its literal prefix
+PATTERN_SPECIAL = set('*?[](){}+^$|\\')
+
+COMPILED_PATTERNS = {}
+
 def printsection(section):
     """Prints out the dictionary describing a Maintainers.txt section."""
     print('===')
@@ -49,6 +55,22 @@ def pattern_to_regex(pattern):
 
     return pattern
 
+def compile_pattern(pattern):
+    """Returns the compiled regex of a path pattern, compiling it
+       only once."""
+    if pattern not in COMPILED_PATTERNS:
+        COMPILED_PATTERNS[pattern] = re.compile(pattern_to_regex(pattern))
+    return COMPILED_PATTERNS[pattern]
+
+def pattern_prefix(pattern):
+    """Returns the directories of the literal prefix of a path pattern,
+       which any path it matches starts with."""
+    for index, char in enumerate(pattern):
+        if char in PATTERN_SPECIAL:
+            pattern = pattern[:index]
+            break
+    return pattern.split('/')[:-1]
+
 def path_in_section(path, section):
     """Returns True of False indicating whether the path is covered by
        the current section."""
@@ -56,15 +78,11 @@ def path_in_section(path, section):
         return False
 
     for pattern in section['file']:
-        regex = pattern_to_regex(pattern)
-
-        match = re.match(regex, path)
+        match = compile_pattern(pattern).match(path)
         if match:
             # Check if there is an exclude pattern that applies
             for pattern in section['exclude']:
-                regex = pattern_to_regex(pattern)
-
-                match = re.match(regex, path)
+                match = compile_pattern(pattern).match(path)
                 if match:
                     return False
 
@@ -72,39 +90,86 @@ def path_in_section(path, section):
 
     return False
 
+class SectionIndex(list):
+    """The list of Maintainers.txt sections, with their F: patterns in a
+       trie of the directories of their literal prefix. The sections
+       covering a path are found by matching only the patterns stored
+       along its directories."""
+
+    def __init__(self, sections):
+        list.__init__(self, sections)
+        self.trie = ({}, [])
+        self.excludes = []
+        self.matches = {}
+        for index, section in enumerate(self):
+            self.excludes.append([compile_pattern(pattern) for pattern in section.get('exclude', [])])
+            for pattern in section.get('file', []):
+                node = self.trie
+                for directory in pattern_prefix(pattern):
+                    node = node[0].setdefault(directory, ({}, []))
+                node[1].append((index, compile_pattern(pattern)))
+
+    def sections_for(self, path):
+        """Returns the sections covering the path, in file order."""
+        if path not in self.matches:
+            matched = set()
+            node = self.trie
+            directories = path.split('/')[:-1]
+            while True:
+                for index, regex in node[1]:
+                    if index not in matched and regex.match(path):
+                        matched.add(index)
+                if not directories or directories[0] not in node[0]:
+                    break
+                node = node[0][directories.pop(0)]
+
+            self.matches[path] = [self[index] for index in sorted(matched)
+                                  if not any(regex.match(path) for regex in self.excludes[index])]
+        return self.matches[path]
+
 def get_section_maintainers(path, section):
     """Returns a list with email addresses to any M: and R: entries
        matching the provided path in the provided section."""
+    if path_in_section(path, section):
+        return get_section_addresses(path, section)
+
+    return [], []
+
+def get_section_addresses(path, section):
+    """Returns a list with email addresses to any M: and R: entries of
+       the provided section, which covers the provided path."""
     maintainers = []
     lists = []
     nowarn_status = ['Supported', 'Maintained']
 
-    if path_in_section(path, section):
-        for status in section['status']:
-            if status not in nowarn_status:
-                print('WARNING: Maintained status for "%s" is \'%s\'!' % (path, status))
-        for address in section['maintainer'], section['reviewer']:
-            # Convert to list if necessary
-            if isinstance(address, list):
-                maintainers += address
-            else:
-                lists += [address]
-        for address in section['list']:
-            # Convert to list if necessary
-            if isinstance(address, list):
-                lists += address
-            else:
-                lists += [address]
+    for status in section['status']:
+        if status not in nowarn_status:
+            print('WARNING: Maintained status for "%s" is \'%s\'!' % (path, status))
+    for address in section['maintainer'], section['reviewer']:
+        # Convert to list if necessary
+        if isinstance(address, list):
+            maintainers += address
+        else:
+            lists += [address]
+    for address in section['list']:
+        # Convert to list if necessary
+        if isinstance(address, list):
+            lists += address
+        else:
+            lists += [address]
 
     return maintainers, lists
 
 def get_maintainers(path, sections, level=0):
     """For 'path', iterates over all sections, returning maintainers
        for matching ones."""
+    if not isinstance(sections, SectionIndex):
+        sections = SectionIndex(sections)
+
     maintainers = []
     lists = []
-    for section in sections:
-        tmp_maint, tmp_lists = get_section_maintainers(path, section)
+    for section in sections.sections_for(path):
+        tmp_maint, tmp_lists = get_section_addresses(path, section)
         if tmp_maint:
             maintainers += tmp_maint
         if tmp_lists:
@@ -123,6 +188,15 @@ def get_maintainers(path, sections, level=0):
 
     return maintainers + lists
 
+def get_maintainers_batch(paths, sections):
+    """Yields a (path, addresses) tuple for each of the paths, matching
+       them against sections indexed only once."""
+    if not isinstance(sections, SectionIndex):
+        sections = SectionIndex(sections)
+
+    for path in paths:
+        yield path, get_maintainers(path, sections)
+
 def parse_maintainers_line(line):
     """Parse one line of Maintainers.txt, returning any match group and its key."""
     for key, expression in EXPRESSIONS.items():
@@ -169,13 +243,31 @@ if __name__ == '__main__':
     PARSER.add_argument('-l', '--lookup',
                         help='Find section matches for path LOOKUP',
                         required=False)
+    PARSER.add_argument('-b', '--batch',
+                        help='Find section matches for each path listed in file BATCH (- for stdin)',
+                        required=False)
     ARGS = PARSER.parse_args()
 
     REPO = SetupGit.locate_repo()
 
     CONFIG_FILE = os.path.join(REPO.working_dir, 'Maintainers.txt')
 
-    SECTIONS = parse_maintainers_file(CONFIG_FILE)
+    SECTIONS = SectionIndex(parse_maintainers_file(CONFIG_FILE))
+
+    if ARGS.batch:
+        if ARGS.batch == '-':
+            PATHS = sys.stdin.read().splitlines()
+        else:
+            with open(ARGS.batch, 'r') as text:
+                PATHS = text.read().splitlines()
+        PATHS = [path.strip().replace('\\','/') for path in PATHS if path.strip()]
+        for file, addresslist in get_maintainers_batch(PATHS, SECTIONS):
+            print(file)
+            for address in list(OrderedDict.fromkeys(addresslist or [])):
+                if '<' in address and '>' in address:
+                    address = address.split('>', 1)[0] + '>'
+                print('  %s' % address)
+        sys.exit(0)
 
     if ARGS.lookup:
         FILES = [ARGS.lookup.replace('\\','/')]
@@ -15,6 +15,9 @@ __copyright__ = "Copyright (c) 2015 - 2016, Intel Corporation  All rights reserv
 
 import email
 import argparse
+import concurrent.futures
+import contextlib
+import io
 import os
 import re
 import subprocess
@@ -636,50 +639,107 @@ class CheckOnePatch:
 
         self.author_email = pmail['from']
 
+def check_git_commit(name, email, patch, level):
+    """Checks the committer email address and the patch of a commit.
+
+    Returns the result of the checks with the output they printed, so
+    commits checked by concurrent processes are reported in order.
+    """
+    Verbose.level = level
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        ok = EmailAddressCheck(email, 'Committer').ok
+        ok &= CheckOnePatch(name, patch).ok
+    return ok, output.getvalue()
+
 class CheckGitCommits:
     """Reads patches from git based on the specified git revision range.
 
-    The patches are read from git, and then checked.
+    The patches of all the commits are streamed from a single git process,
+    and then checked by a pool of processes.
     """
 
-    def __init__(self, rev_spec, max_count):
-        commits = self.read_commit_list_from_git(rev_spec, max_count)
+    def __init__(self, rev_spec, max_count, jobs=None):
+        commits, emails = self.read_commit_list_from_git(rev_spec, max_count)
+        names = commits
         if len(commits) == 1 and Verbose.level > Verbose.ONELINE:
-            commits = [ rev_spec ]
+            names = [ rev_spec ]
         self.ok = True
         blank_line = False
-        for commit in commits:
+        patches = self.read_patches_from_git(commits)
+        if len(commits) > 1 and jobs != 1:
+            pool = concurrent.futures.ProcessPoolExecutor(jobs)
+            results = pool.map(check_git_commit, names, emails, patches,
+                               [Verbose.level] * len(commits))
+        else:
+            pool = None
+            results = map(check_git_commit, names, emails, patches,
+                          [Verbose.level] * len(commits))
+        for name, (ok, output) in zip(names, results):
             if Verbose.level > Verbose.ONELINE:
                 if blank_line:
                     print()
                 else:
                     blank_line = True
-                print('Checking git commit:', commit)
-            email = self.read_committer_email_address_from_git(commit)
-            self.ok &= EmailAddressCheck(email, 'Committer').ok
-            patch = self.read_patch_from_git(commit)
-            self.ok &= CheckOnePatch(commit, patch).ok
+                print('Checking git commit:', name)
+            sys.stdout.write(output)
+            self.ok &= ok
+        if pool is not None:
+            pool.shutdown()
         if not commits:
             print("Couldn't find commit matching: '{}'".format(rev_spec))
 
     def read_commit_list_from_git(self, rev_spec, max_count):
-        # Run git to get the commit patch
-        cmd = [ 'rev-list', '--abbrev-commit', '--no-walk' ]
+        # Run git to get the commits with their committer email
+        cmd = [ 'rev-list', '--abbrev-commit', '--no-walk',
+                '--format=%cn <%ce>' ]
         if max_count is not None:
             cmd.append('--max-count=' + str(max_count))
         cmd.append(rev_spec)
         out = self.run_git(*cmd)
-        return out.split() if out else []
-
-    def read_patch_from_git(self, commit):
-        # Run git to get the commit patch
-        return self.run_git('show', '--pretty=email', '--no-textconv',
-                            '--no-use-mailmap', commit)
-
-    def read_committer_email_address_from_git(self, commit):
-        # Run git to get the committer email
-        return self.run_git('show', '--pretty=%cn <%ce>', '--no-patch',
-                            '--no-use-mailmap', commit)
+        lines = out.splitlines() if out else []
+        commits = [line.split()[1] for line in lines[0::2]]
+        emails = [line + '\n' for line in lines[1::2]]
+        return commits, emails
+
+    commit_header_re = re.compile(br'''^
+                                      From \s ([0-9a-f]{40,64})
+                                      \s Mon \s Sep \s 17 \s 00:00:00 \s 2001 $
+                                  ''',
+                                  re.VERBOSE)
+
+    def read_patches_from_git(self, commits):
+        """Yields the email formatted patch of each commit, in order.
+
+        The patches are read as they are written by a single git log
+        process, and are the same as the ones from git show.
+        """
+        if not commits:
+            return
+        p = subprocess.Popen([ 'git', 'log', '--pretty=email', '--no-textconv',
+                               '--no-use-mailmap', '--cc', '--no-walk=unsorted',
+                               '--stdin' ],
+                             stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE)
+        p.stdin.write(('\n'.join(commits) + '\n').encode())
+        p.stdin.close()
+        index = 0
+        patch = None
+        for line in p.stdout:
+            mo = self.commit_header_re.match(line)
+            if mo is not None and index < len(commits) and \
+               mo.group(1).decode().startswith(commits[index]):
+                if patch is not None:
+                    # git log separates the patches with a blank line
+                    if patch[-1] == b'\n':
+                        patch.pop()
+                    yield b''.join(patch).decode('utf-8', 'ignore')
+                patch = []
+                index += 1
+            patch.append(line)
+        if patch is not None:
+            yield b''.join(patch).decode('utf-8', 'ignore')
+        p.wait()
 
     def run_git(self, *args):
         cmd = [ 'git' ]
@@ -715,12 +775,12 @@ class CheckOneArg:
     checker.
     """
 
-    def __init__(self, param, max_count=None):
+    def __init__(self, param, max_count=None, jobs=None):
         self.ok = True
         if param == '-' or os.path.exists(param):
             checker = CheckOnePatchFile(param)
         else:
-            checker = CheckGitCommits(param, max_count)
+            checker = CheckGitCommits(param, max_count, jobs)
         self.ok = checker.ok
 
 class PatchCheckApp:
@@ -753,7 +813,7 @@ class PatchCheckApp:
                 return
             except ValueError:
                 pass
-        self.ok &= CheckOneArg(arg, self.count).ok
+        self.ok &= CheckOneArg(arg, self.count, self.args.jobs).ok
         self.count = None
 
     def parse_options(self):
@@ -762,6 +822,9 @@ class PatchCheckApp:
                             version='%(prog)s ' + VersionNumber)
         parser.add_argument('patches', nargs='*',
                             help='[patch file | git rev list]')
+        parser.add_argument('-j', '--jobs', type=int,
+                            help='Number of processes checking the git commits '
+                                 '(default: number of CPUs)')
         group = parser.add_mutually_exclusive_group()
         group.add_argument("--oneline",
                            action="store_true",
@@ -770,6 +833,8 @@ class PatchCheckApp:
                            action="store_true",
                            help="Print nothing")
         self.args = parser.parse_args()
+        if self.args.jobs is not None and self.args.jobs < 1:
+            parser.error('argument -j/--jobs: must be at least 1')
         if self.args.oneline:
             Verbose.level = Verbose.ONELINE
         if self.args.silent:
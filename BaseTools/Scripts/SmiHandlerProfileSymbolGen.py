@@ -9,9 +9,12 @@
 ##
 
 from __future__ import print_function
-import os
 import re
 import sys
+import hashlib
+import subprocess
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from optparse import OptionParser
 
 from xml.dom.minidom import parse
@@ -20,9 +23,35 @@ import xml.dom.minidom
 versionNumber = "1.1"
 __copyright__ = "Copyright (c) 2016, Intel Corporation. All rights reserved."
 
+#
+# Output of nm and DIA2Dump, parsed with the precompiled expressions below
+#
+# 000113ca T AllocatePool c:\home\edk-ii\MdePkg\Library\UefiMemoryAllocationLib\MemoryAllocationLib.c:399
+nmLinePattern = re.compile(r"([0-9a-fA-F]*)\s+[T|D|t|d]\s+(\w+)\s*((?:[a-zA-Z]:)?[\w+\-./_a-zA-Z0-9\\]*):?([0-9]*)")
+
+#   ** GetDebugPrintErrorLevel
+# line 32 at [0000C790][0001:0000B790], len = 0x3 c:\home\edk-ii\mdepkg\library\basedebugprinterrorlevellib\basedebugprinterrorlevellib.c (MD5: 687C0AE564079D35D56ED5D84A6164CC)
+# line 36 at [0000C793][0001:0000B793], len = 0x5
+# line 37 at [0000C798][0001:0000B798], len = 0x2
+dia2LinePattern = re.compile(r"\s+line ([0-9]+) at \[([0-9a-fA-F]{8})\]\[[0-9a-fA-F]{4}\:[0-9a-fA-F]{8}\], len = 0x[0-9a-fA-F]+\s*([\w+\-\:./_a-zA-Z0-9\\]*)\s*")
+dia2FuncPattern = re.compile(r"\*\*\s+(\w+)\s*")
+
+#
+# Run a command and return the lines of its output, None if it can't be run
+#
+def runCommand(command):
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, universal_newlines=True)
+    except OSError:
+        return None
+    reportLines = process.stdout.readlines()
+    process.wait()
+    return reportLines
+
 class Symbols:
     def __init__(self):
         self.listLineAddress = []
+        self.listAddress = []
         self.pdbName = ""
         # Cache for function
         self.functionName = ""
@@ -31,99 +60,76 @@ class Symbols:
 
 
     def getSymbol (self, rva):
-        index = 0
         lineName  = 0
         sourceName = "??"
-        while index + 1 < self.lineCount :
-            if self.listLineAddress[index][0] <= rva and self.listLineAddress[index + 1][0] > rva :
-                offset = rva - self.listLineAddress[index][0]
-                functionName = self.listLineAddress[index][1]
-                lineName = self.listLineAddress[index][2]
-                sourceName = self.listLineAddress[index][3]
-                if lineName == 0 :
-                  return [functionName]
-                else :
-                  return [functionName, sourceName, lineName]
-            index += 1
+        # Last line at or before rva, the last line of the list is only an end marker
+        index = bisect_right (self.listAddress, rva) - 1
+        if index >= 0 and index + 1 < self.lineCount :
+            offset = rva - self.listLineAddress[index][0]
+            functionName = self.listLineAddress[index][1]
+            lineName = self.listLineAddress[index][2]
+            sourceName = self.listLineAddress[index][3]
+            if lineName == 0 :
+              return [functionName]
+            else :
+              return [functionName, sourceName, lineName]
 
         return []
 
+    def sortLineAddress(self):
+        self.lineCount = len (self.listLineAddress)
+        self.listLineAddress = sorted(self.listLineAddress, key=lambda symbolAddress:symbolAddress[0])
+        self.listAddress = [symbolAddress[0] for symbolAddress in self.listLineAddress]
+
     def parse_debug_file(self, driverName, pdbName):
-        if cmp (pdbName, "") == 0 :
+        if pdbName == "" :
             return
         self.pdbName = pdbName;
 
-        try:
-            nmCommand = "nm"
-            nmLineOption = "-l"
-            print("parsing (debug) - " + pdbName)
-            os.system ('%s %s %s > nmDump.line.log' % (nmCommand, nmLineOption, pdbName))
-        except :
+        nmCommand = "nm"
+        nmLineOption = "-l"
+        reportLines = runCommand ([nmCommand, nmLineOption, pdbName])
+        if reportLines is None:
             print('ERROR: nm command not available.  Please verify PATH')
             return
 
         #
         # parse line
         #
-        linefile = open("nmDump.line.log")
-        reportLines = linefile.readlines()
-        linefile.close()
-
-        # 000113ca T AllocatePool c:\home\edk-ii\MdePkg\Library\UefiMemoryAllocationLib\MemoryAllocationLib.c:399
-        patchLineFileMatchString = "([0-9a-fA-F]*)\s+[T|D|t|d]\s+(\w+)\s*((?:[a-zA-Z]:)?[\w+\-./_a-zA-Z0-9\\\\]*):?([0-9]*)"
-
         for reportLine in reportLines:
-            match = re.match(patchLineFileMatchString, reportLine)
+            match = nmLinePattern.match(reportLine)
             if match is not None:
                 rva = int (match.group(1), 16)
                 functionName = match.group(2)
                 sourceName = match.group(3)
-                if cmp (match.group(4), "") != 0 :
+                if match.group(4) != "" :
                     lineName = int (match.group(4))
                 else :
                     lineName = 0
                 self.listLineAddress.append ([rva, functionName, lineName, sourceName])
 
-        self.lineCount = len (self.listLineAddress)
-
-        self.listLineAddress = sorted(self.listLineAddress, key=lambda symbolAddress:symbolAddress[0])
+        self.sortLineAddress()
 
     def parse_pdb_file(self, driverName, pdbName):
-        if cmp (pdbName, "") == 0 :
+        if pdbName == "" :
             return
         self.pdbName = pdbName;
 
-        try:
-            #DIA2DumpCommand = "\"C:\\Program Files (x86)\Microsoft Visual Studio 14.0\\DIA SDK\\Samples\\DIA2Dump\\x64\\Debug\\Dia2Dump.exe\""
-            DIA2DumpCommand = "Dia2Dump.exe"
-            #DIA2SymbolOption = "-p"
-            DIA2LinesOption = "-l"
-            print("parsing (pdb) - " + pdbName)
-            #os.system ('%s %s %s > DIA2Dump.symbol.log' % (DIA2DumpCommand, DIA2SymbolOption, pdbName))
-            os.system ('%s %s %s > DIA2Dump.line.log' % (DIA2DumpCommand, DIA2LinesOption, pdbName))
-        except :
+        #DIA2DumpCommand = "\"C:\\Program Files (x86)\Microsoft Visual Studio 14.0\\DIA SDK\\Samples\\DIA2Dump\\x64\\Debug\\Dia2Dump.exe\""
+        DIA2DumpCommand = "Dia2Dump.exe"
+        DIA2LinesOption = "-l"
+        reportLines = runCommand ([DIA2DumpCommand, DIA2LinesOption, pdbName])
+        if reportLines is None:
             print('ERROR: DIA2Dump command not available.  Please verify PATH')
             return
 
         #
         # parse line
         #
-        linefile = open("DIA2Dump.line.log")
-        reportLines = linefile.readlines()
-        linefile.close()
-
-        #   ** GetDebugPrintErrorLevel
-        # line 32 at [0000C790][0001:0000B790], len = 0x3 c:\home\edk-ii\mdepkg\library\basedebugprinterrorlevellib\basedebugprinterrorlevellib.c (MD5: 687C0AE564079D35D56ED5D84A6164CC)
-        # line 36 at [0000C793][0001:0000B793], len = 0x5
-        # line 37 at [0000C798][0001:0000B798], len = 0x2
-
-        patchLineFileMatchString = "\s+line ([0-9]+) at \[([0-9a-fA-F]{8})\]\[[0-9a-fA-F]{4}\:[0-9a-fA-F]{8}\], len = 0x[0-9a-fA-F]+\s*([\w+\-\:./_a-zA-Z0-9\\\\]*)\s*"
-        patchLineFileMatchStringFunc = "\*\*\s+(\w+)\s*"
-
         for reportLine in reportLines:
-            match = re.match(patchLineFileMatchString, reportLine)
+            match = dia2LinePattern.match(reportLine)
             if match is not None:
-                if cmp (match.group(3), "") != 0 :
+                if match.group(3) != "" :
                     self.sourceName = match.group(3)
                 sourceName = self.sourceName
                 functionName = self.functionName
@@ -132,16 +138,68 @@ class Symbols:
                 lineName = int (match.group(1))
                 self.listLineAddress.append ([rva, functionName, lineName, sourceName])
             else :
-                match = re.match(patchLineFileMatchStringFunc, reportLine)
+                match = dia2FuncPattern.match(reportLine)
                 if match is not None:
                     self.functionName = match.group(1)
 
-        self.lineCount = len (self.listLineAddress)
-        self.listLineAddress = sorted(self.listLineAddress, key=lambda symbolAddress:symbolAddress[0])
+        self.sortLineAddress()
 
 class SymbolsFile:
     def __init__(self):
         self.symbolsTable = {}
+        # Symbols parsed from each debug file, keyed by the digest of its content
+        self.symbolsCache = {}
+        self.digestTable = {}
+        # Progress message of each debug file being parsed
+        self.progressTable = {}
+        self.pool = ThreadPoolExecutor()
+
+    def getDigest(self, pdbName):
+        if pdbName not in self.digestTable:
+            try:
+                with open(pdbName, "rb") as pdbFile:
+                    self.digestTable[pdbName] = hashlib.sha256(pdbFile.read()).hexdigest()
+            except Exception:
+                self.digestTable[pdbName] = pdbName
+        return self.digestTable[pdbName]
+
+    #
+    # Start to parse a debug file in the worker pool, once for each content
+    #
+    def prefetchSymbols(self, driverName, pdbName):
+        digest = self.getDigest(pdbName)
+        if digest not in self.symbolsCache:
+            symbols = Symbols()
+            if pdbName[-3:] == "pdb" :
+                parser = symbols.parse_pdb_file
+                progress = "parsing (pdb) - " + pdbName
+            else :
+                parser = symbols.parse_debug_file
+                progress = "parsing (debug) - " + pdbName
+            future = self.pool.submit(parser, driverName, pdbName)
+            self.symbolsCache[digest] = (symbols, future)
+            if pdbName != "" :
+                self.progressTable[future] = progress
+        return digest
+
+    #
+    # Wait for the debug files being parsed, the progress is printed from the
+    # main thread as each of them is done
+    #
+    def waitSymbols(self):
+        for future in as_completed(list(self.progressTable)):
+            future.result()
+            print(self.progressTable.pop(future))
+
+    def getSymbols(self, driverName, pdbName):
+        (symbols, future) = self.symbolsCache[self.prefetchSymbols(driverName, pdbName)]
+        future.result()
+        if future in self.progressTable:
+            print(self.progressTable.pop(future))
+        return symbols
+
+    def close(self):
+        self.pool.shutdown()
 
 symbolsFile = ""
 
@@ -246,6 +304,14 @@ def main():
 
     SmiHandlerDatabase = SmiHandlerProfile.getElementsByTagName("SmiHandlerDatabase")
     SmiHandlerCategory = SmiHandlerDatabase[0].getElementsByTagName("SmiHandlerCategory")
+
+    # Parse the debug files of all the modules in parallel
+    for Pdb in SmiHandlerDatabase[0].getElementsByTagName("Pdb"):
+        Module = Pdb.parentNode
+        if Module.tagName == "Module" and Module.parentNode.tagName == "SmiHandler":
+            symbolsFile.prefetchSymbols (Module.getAttribute("Name"), Pdb.childNodes[0].data)
+    symbolsFile.waitSymbols()
+
     for smiHandlerCategory in SmiHandlerCategory:
         SmiEntry = smiHandlerCategory.getElementsByTagName("SmiEntry")
         for smiEntry in SmiEntry:
@@ -263,12 +329,7 @@ def main():
 
                     Module[0].removeChild(Pdb[0])
 
-                    symbolsFile.symbolsTable[driverName] = Symbols()
-
-                    if cmp (pdbName[-3:], "pdb") == 0 :
-                        symbolsFile.symbolsTable[driverName].parse_pdb_file (driverName, pdbName)
-                    else :
-                        symbolsFile.symbolsTable[driverName].parse_debug_file (driverName, pdbName)
+                    symbolsFile.symbolsTable[driverName] = symbolsFile.getSymbols (driverName, pdbName)
 
                     Handler = smiHandler.getElementsByTagName("Handler")
                     RVA = Handler[0].getElementsByTagName("RVA")
@@ -294,8 +355,10 @@ def main():
                             SymbolNode = createSym(symbolName)
                             Caller[0].appendChild(SymbolNode)
 
+    symbolsFile.close()
+
     try :
-        newfile = open(Options.outputfilename, "w")
+        newfile = open(Options.outputfilename, "wb")
     except Exception:
         print("fail to open output" + Options.outputfilename)
         return 1
@@ -33,6 +33,8 @@ import os
 import uuid
 import struct
 import re
+import bisect
+import json
 from ctypes import c_char, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p
 from ctypes import ARRAY, sizeof
 from ctypes import Structure, LittleEndianStructure
@@ -340,6 +342,9 @@ EFI_IMAGE_NT_OPTIONAL_HDR64_MAGIC = 0x20b
 DIRECTORY_DEBUG = 6
 
 
+# DOS (MZ) and TE (VZ) image signatures
+_pe_te_signature = re.compile(b'[MV]Z')
+
 image_machine_dict = {
     0x014c: "IA32",
     0x0200: "IPF",
@@ -624,10 +629,19 @@ class GuidNames:
     in the build the path the build product should imply the
     relative location of that builds Guid.xref file.
 
+    Guid.xref files are only parsed when a name is first looked up, so any
+    number of build output directories can be added cheaply. A pre-parsed
+    copy of each Guid.xref is kept next to it (Guid.xref.json) and reused
+    while the Guid.xref is unchanged.
+
     Attributes
     ??????----
     _dict_ : dictionary
         dictionary of EFI_GUID (uuid) strings to C global names
+    _names_ : dictionary
+        dictionary of C global names to EFI_GUID (uuid) strings
+    use_cache : bool
+        read and write the pre-parsed Guid.xref.json files
 
     Methods
     -------
@@ -637,6 +651,10 @@ class GuidNames:
         convert a UUID string to a C global constant name.
     to_guid(guid_name)
         convert a C global constant EFI_GUID name to uuid hex string.
+    to_names(uuid)
+        all the C global names a UUID string has in the loaded files.
+    items()
+        (uuid, name) pairs of all known EFI_GUID's.
     is_guid_str(name)
        name is a hex UUID string.
        Example: 49152E77-1ADA-4764-B7A2-7AFEFED95E8B
@@ -676,7 +694,12 @@ class GuidNames:
             'gEfiAcpi20TableGuid',
     }
 
+    _names_ = None
+    _aliases_ = {}
+
     guid_files = []
+    _pending_files = []
+    use_cache = True
 
     def __init__(self, uuid=None, pointer_width=8):
         self.uuid = None if uuid is None else self.to_uuid(uuid)
@@ -684,7 +707,7 @@ class GuidNames:
     def __str__(self):
         if self.uuid is None:
             result = ''
-            for key, value in GuidNames._dict_.items():
+            for key, value in GuidNames.items():
                 result += f'{key}: {value}\n'
         else:
             result = self.to_name(self.uuid)
@@ -707,15 +730,42 @@ class GuidNames:
             uuid = str(uuid)
         if cls.is_c_guid(uuid):
             uuid = cls.from_c_guid(uuid)
+        cls._load_pending_files()
         return cls._dict_.get(uuid.upper(), uuid.upper())
 
+    @classmethod
+    def to_names(cls, uuid):
+        if not isinstance(uuid, str):
+            uuid = str(uuid)
+        if cls.is_c_guid(uuid):
+            uuid = cls.from_c_guid(uuid)
+        cls._load_pending_files()
+        key = uuid.upper()
+        if key not in cls._dict_:
+            return []
+        return cls._aliases_.get(key, [cls._dict_[key]])
+
     @classmethod
     def to_guid(cls, guid_name):
-        for key, value in cls._dict_.items():
-            if guid_name == value:
-                return key.upper()
-        else:
-            raise KeyError(key)
+        cls._load_pending_files()
+        if cls._names_ is None:
+            # first match in _dict_ order wins, like a linear search, then
+            # the names replaced by a later Guid.xref are still found
+            cls._names_ = {}
+            for key, value in cls._dict_.items():
+                cls._names_.setdefault(value, key.upper())
+            for key, names in cls._aliases_.items():
+                for name in names:
+                    cls._names_.setdefault(name, key.upper())
+        try:
+            return cls._names_[guid_name]
+        except KeyError:
+            raise KeyError(guid_name)
+
+    @classmethod
+    def items(cls):
+        cls._load_pending_files()
+        return cls._dict_.items()
 
     @classmethod
     def is_guid_str(cls, name):
@@ -772,6 +822,8 @@ class GuidNames:
                     build_root = os.path.join(
                         module_path.rsplit(i, 1)[0], i)
                     break
+            else:
+                return False
 
             xref = os.path.join(build_root, 'FV', 'Guid.xref')
 
@@ -779,22 +831,66 @@ class GuidNames:
             # only processes the file one time
             return True
 
-        with open(xref) as f:
-            content = f.readlines()
-            cls.guid_files.append(xref)
-
-            for lines in content:
-                try:
-                    if cls.is_guid_str(lines):
-                        # a regex would be more pedantic
-                        words = lines.split()
-                        cls._dict_[words[0].upper()] = words[1].strip('\n')
-                except ValueError:
-                    pass
+        if not os.path.isfile(xref):
+            return False
 
-            return True
+        # parsed on the first lookup
+        cls.guid_files.append(xref)
+        cls._pending_files.append(xref)
+        return True
 
-        return False
+    @ classmethod
+    def _load_pending_files(cls):
+        if not cls._pending_files:
+            return
+
+        pending, cls._pending_files = cls._pending_files, []
+        for xref in pending:
+            for key, name in cls._read_guid_file(xref):
+                names = cls._aliases_.get(key)
+                if names is None:
+                    names = [cls._dict_[key]] if key in cls._dict_ else []
+                    cls._aliases_[key] = names
+                if name not in names:
+                    names.append(name)
+                cls._dict_[key] = name
+
+        cls._names_ = None
+
+    @ classmethod
+    def _read_guid_file(cls, xref):
+        """Return the (uuid, name) pairs of a Guid.xref file"""
+        cache = xref + '.json'
+        stat = os.stat(xref)
+        if cls.use_cache:
+            try:
+                with open(cache) as f:
+                    content = json.load(f)
+                if (content['mtime'] == stat.st_mtime_ns and
+                        content['size'] == stat.st_size):
+                    return content['guids']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        guids = []
+        with open(xref) as f:
+            for lines in f:
+                if cls.is_guid_str(lines):
+                    # a regex would be more pedantic
+                    words = lines.split()
+                    if len(words) >= 2:
+                        guids.append((words[0].upper(), words[1]))
+
+        if cls.use_cache:
+            try:
+                with open(cache, 'w') as f:
+                    json.dump({'mtime': stat.st_mtime_ns,
+                               'size': stat.st_size,
+                               'guids': guids}, f)
+            except OSError:
+                pass
+
+        return guids
 
 
 class EFI_HOB_GENERIC_HEADER(LittleEndianStructure):
@@ -1837,6 +1933,120 @@ class EfiConfigurationTable:
         return ImageLoad
 
 
+class EfiMemoryFile:
+    '''
+    File like object that makes a file look like memory at a given address,
+    with the same semantics as the debugger file objects: seek() takes a
+    memory address and reading memory that is not backed by the file raises
+    MemoryError. It is used to test the debugger independent code, or to
+    search a ROM image dumped to a file.
+
+    Attributes
+    ??????
+    base : int
+        Memory address of the first byte of the file
+    reads : int
+        Number of read() calls, i.e. debugger round trips
+    '''
+
+    def __init__(self, file, base=0):
+        self._file = file
+        self._file.seek(0, 2)
+        self._size = self._file.tell()
+        self._offset = 0
+        self.base = base
+        self.reads = 0
+
+    def tell(self):
+        return self._offset
+
+    def read(self, size=-1):
+        self.reads += 1
+        if size == -1:
+            size = self.base + self._size - self._offset
+        start = self._offset - self.base
+        if start < 0 or start + size > self._size:
+            raise MemoryError(
+                f'could not read memory 0x{size:x}'
+                + f' bytes from 0x{self._offset:08x}')
+        self._file.seek(start)
+        data = self._file.read(size)
+        self._offset += size
+        return data
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self._offset = offset
+        elif whence == 1:
+            self._offset += offset
+        else:
+            # whence == 2 is seek from end
+            raise NotImplementedError
+
+    def seekable(self):
+        return True
+
+
+class PeTeImageCache:
+    '''
+    Address ranges of the PE/COFF (TE) images found in memory, kept sorted by
+    load address so the image that contains an address is found with a
+    binary search. The debugger EfiSymbols classes share one instance with
+    PeTeImage.pcToPeCoff() so a pc in a known image does not search memory.
+
+    Methods
+    -----------
+    add(pecoff)
+        remember the range of a parsed PeTeImage
+    find(address)
+        return the PeTeImage that contains address, or None
+    remove(address)
+        forget the image that contains address
+    clear()
+        forget all images
+    '''
+
+    def __init__(self):
+        self._starts = []
+        self._images = []
+
+    def __len__(self):
+        return len(self._images)
+
+    def __iter__(self):
+        return iter(self._images)
+
+    def add(self, pecoff):
+        index = bisect.bisect_left(self._starts, pecoff.LoadAddress)
+        if (index < len(self._starts) and
+                self._starts[index] == pecoff.LoadAddress):
+            self._images[index] = pecoff
+        else:
+            self._starts.insert(index, pecoff.LoadAddress)
+            self._images.insert(index, pecoff)
+
+    def find(self, address):
+        index = bisect.bisect_right(self._starts, address) - 1
+        if index >= 0 and address <= self._images[index].EndLoadAddress:
+            return self._images[index]
+        return None
+
+    def remove(self, address):
+        pecoff = self.find(address)
+        if pecoff is not None:
+            index = bisect.bisect_left(self._starts, pecoff.LoadAddress)
+            del self._starts[index]
+            del self._images[index]
+        return pecoff
+
+    def clear(self):
+        self._starts = []
+        self._images = []
+
+
 class PeTeImage:
     '''
     A class to abstract PE/COFF or TE image processing via passing in a
@@ -1861,12 +2071,15 @@ class PeTeImage:
 
     Methods
     -----------
-    pcToPeCoff(address, step, max_range, rom_range)
+    pcToPeCoff(address, step, max_range, rom_range, cache)
         Given an address(pc) find the PE/COFF image it is in
     sections_to_str()
         return a string giving info for all the PE/COFF sections
     '''
 
+    # Size of the memory window read at once when searching for a header
+    search_window = 0x10000
+
     def __init__(self, file, address=0):
         self._file = file
 
@@ -1960,12 +2173,22 @@ class PeTeImage:
                    address,
                    step=None,
                    max_range=None,
-                   rom_range=[0xFE800000, 0xFFFFFFFF]):
+                   rom_range=[0xFE800000, 0xFFFFFFFF],
+                   cache=None):
         """
         Given an address search backwards for PE/COFF (TE) header
         For DXE 4K is probably OK
         For PEI you might have to search every 4 bytes.
+        Memory is read search_window bytes at a time and scanned locally.
+        If a PeTeImageCache is passed in, an address in a known image is
+        resolved without reading memory, and a found image is added to it.
         """
+        if cache is not None:
+            pecoff = cache.find(address)
+            if pecoff is not None:
+                self.__dict__.update(pecoff.__dict__)
+                return True
+
         if step is None:
             step = 0x1000
 
@@ -1979,15 +2202,47 @@ class PeTeImage:
 
         # Align address to page boundary for memory image search.
         address = address & ~(step-1)
-        # Search every step backward
-        offset_range = list(range(0, min(max_range, address), step))
-        for offset in offset_range:
-            if self.maybe(address - offset):
-                if self.parse():
-                    return True
+        # Search every step backward, down to the lowest probe address
+        limit = min(max_range, address)
+        if limit <= 0:
+            return False
+        lowest = address - ((limit - 1) // step) * step
+        window = max(step, self.search_window - self.search_window % step)
+        high = address
+        while high >= lowest:
+            low = max(lowest, high - window + step)
+            for probe in self._probe_window(low, high, step):
+                if self.maybe(probe):
+                    if self.parse():
+                        if cache is not None:
+                            cache.add(self)
+                        return True
+            high = low - step
 
         return False
 
+    def _probe_window(self, low, high, step):
+        """
+        Return the addresses from high down to low, every step, that start
+        with a PE/COFF (TE) signature, reading the memory in one go.
+        If the window can not be read every address is returned so maybe()
+        probes them one by one.
+        """
+        size = high - low + 2
+        try:
+            self._file.seek(low)
+            data = self._file.read(size)
+        except Exception:
+            data = None
+        if data is None or len(data) != size:
+            return range(high, low - 1, -step)
+
+        hits = [low + match.start()
+                for match in _pe_te_signature.finditer(data)
+                if match.start() % step == 0]
+        hits.reverse()
+        return hits
+
     def maybe(self, offset=None):
         """Probe to see if this offset is likely a PE/COFF or TE file """
         self.LoadAddress = 0
@@ -42,6 +42,7 @@ import shlex
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from efi_debugging import PeTeImage, patch_ctypes            # noqa: E402
+from efi_debugging import PeTeImageCache                      # noqa: E402
 from efi_debugging import EfiHob, GuidNames, EfiStatusClass  # noqa: E402
 from efi_debugging import EfiBootMode, EfiDevicePath         # noqa: E402
 from efi_debugging import EfiConfigurationTable, EfiTpl      # noqa: E402
@@ -111,6 +112,7 @@ class EfiSymbols:
     """Class to manage EFI Symbols"""
 
     loaded = {}
+    images = PeTeImageCache()
     stride = None
     range = None
     verbose = False
@@ -131,6 +133,7 @@ class EfiSymbols:
     @ classmethod
     def clear(cls):
         cls.loaded = {}
+        cls.images.clear()
 
     @ classmethod
     def add_symbols_for_pecoff(cls, pecoff):
@@ -146,6 +149,7 @@ class EfiSymbols:
                               False, True)
 
             cls.loaded[pecoff.TextAddress] = pecoff
+            cls.images.add(pecoff)
             if cls.verbose:
                 print(f'\n{res:s}\n')
             return ''
@@ -166,8 +170,12 @@ class EfiSymbols:
             # skip the probe of the remote
             return f'{pecoff} is already loaded'
 
+        if reprobe:
+            cls.images.remove(address)
+
         pecoff = PeTeImage(cls.file, None)
-        if pecoff.pcToPeCoff(address, cls.stride, cls.range):
+        if pecoff.pcToPeCoff(address, cls.stride, cls.range,
+                             cache=cls.images):
             res = cls.add_symbols_for_pecoff(pecoff)
             return f'{res}{pecoff}'
         else:
@@ -178,10 +186,9 @@ class EfiSymbols:
         if not isinstance(address, int):
             address = int(address)
 
-        for value in cls.loaded.values():
-            if (address >= value.LoadAddress and
-                    address <= value.EndLoadAddress):
-                return value
+        pecoff = cls.images.find(address)
+        if pecoff is not None and pecoff.TextAddress in cls.loaded:
+            return cls.loaded[pecoff.TextAddress]
 
         return None
 
@@ -443,7 +450,7 @@ class EfiGuidCmd (gdb.Command):
             print(f'{key}: {extra}{name}')
 
         else:
-            for key, value in GuidNames._dict_.items():
+            for key, value in GuidNames.items():
                 if options.verbose:
                     extra = f'{GuidNames.to_c_guid(key)}: '
                 else:
@@ -820,10 +827,9 @@ class EfiSymbolsCmd (gdb.Command):
                 res = self.efi_symbols.address_to_symbols(address)
                 print(res)
 
-        # sync up the GUID database from the build output
+        # sync up the GUID database from the build output(s)
         for m in gdb.objfiles():
-            if GuidNames.add_build_guid_file(str(m.filename)):
-                break
+            GuidNames.add_build_guid_file(str(m.filename))
 
         self.restore_user_state()
 
@@ -17,7 +17,7 @@ import os
 from pathlib import Path
 from efi_debugging import EfiDevicePath, EfiConfigurationTable, EfiTpl
 from efi_debugging import EfiHob, GuidNames, EfiStatusClass, EfiBootMode
-from efi_debugging import PeTeImage, patch_ctypes
+from efi_debugging import PeTeImage, PeTeImageCache, patch_ctypes
 
 try:
     # Just try for LLDB in case PYTHONPATH is already correctly setup
@@ -107,6 +107,7 @@ class EfiSymbols:
     """
 
     loaded = {}
+    images = PeTeImageCache()
     stride = None
     range = None
     verbose = False
@@ -129,6 +130,7 @@ class EfiSymbols:
     @ classmethod
     def clear(cls):
         cls.loaded = {}
+        cls.images.clear()
 
     @ classmethod
     def add_symbols_for_pecoff(cls, pecoff):
@@ -147,6 +149,7 @@ class EfiSymbols:
                 module, pecoff.LoadAddress + pecoff.TeAdjust)
             if SBError.success:
                 cls.loaded[pecoff.LoadAddress] = (pecoff, module)
+                cls.images.add(pecoff)
                 return ''
 
         return 'Symbols NOT FOUND: '
@@ -165,8 +168,12 @@ class EfiSymbols:
             # skip the probe of the remote
             return f'{pecoff} is already loaded'
 
+        if reprobe:
+            cls.images.remove(address)
+
         pecoff = PeTeImage(cls._file, None)
-        if pecoff.pcToPeCoff(address, cls.stride, cls.range):
+        if pecoff.pcToPeCoff(address, cls.stride, cls.range,
+                             cache=cls.images):
             res = cls.add_symbols_for_pecoff(pecoff)
             return f'{res}{pecoff}'
         else:
@@ -177,11 +184,9 @@ class EfiSymbols:
         if not isinstance(address, int):
             address = int(address)
 
-        for (pecoff, module) in cls.loaded.values():
-            if (address >= pecoff.LoadAddress and
-                    address <= pecoff.EndLoadAddress):
-
-                return pecoff, module
+        pecoff = cls.images.find(address)
+        if pecoff is not None and pecoff.LoadAddress in cls.loaded:
+            return cls.loaded[pecoff.LoadAddress]
 
         return None, None
 
@@ -582,7 +587,7 @@ class EfiGuidCommand:
             print(f'{key}: {extra}{name}')
 
         else:
-            for key, value in GuidNames._dict_.items():
+            for key, value in GuidNames.items():
                 if options.verbose:
                     extra = f'{GuidNames.to_c_guid(key)}: '
                 else:
@@ -775,10 +780,9 @@ class EfiSymbolicateCommand(object):
                     res = efi_symbols.address_to_symbols(address)
                     self.lldb_print(res)
 
-        # keep trying module file names until we find a GUID xref file
+        # add the GUID xref file of every build the modules come from
         for m in exe_ctx.target.modules:
-            if GuidNames.add_build_guid_file(str(m.file)):
-                break
+            GuidNames.add_build_guid_file(str(m.file))
 
 
 def CHAR16_TypeSummary(valobj, internal_dict):
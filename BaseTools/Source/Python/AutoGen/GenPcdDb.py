@@ -8,13 +8,13 @@ from __future__ import absolute_import
 from io import BytesIO
 from Common.Misc import *
 from Common.StringUtils import StringToArray
-from struct import pack
+from struct import pack, pack_into
+from itertools import accumulate
 from .ValidCheckingInfoObject import VAR_CHECK_PCD_VARIABLE_TAB_CONTAINER
 from .ValidCheckingInfoObject import VAR_CHECK_PCD_VARIABLE_TAB
 from .ValidCheckingInfoObject import GetValidationObject
 from Common.VariableAttributes import VariableAttributes
 import copy
-from struct import unpack
 from Common.DataType import *
 from Common import GlobalData
 from Common import EdkLogger
@@ -247,33 +247,49 @@ class DbItemList:
         self.DataList = DataList if DataList else []
         self.RawDataList = RawDataList if RawDataList else []
         self.ListSize = 0
+        self._Offsets = None
 
-    def GetInterOffset(self, Index):
-        Offset = 0
+    ## Get the size of each item in the list
+    def GetItemSizes(self):
         if self.ItemSize == 0:
             #
             # Variable length, need to calculate one by one
             #
-            assert(Index < len(self.RawDataList))
-            for ItemIndex in range(Index):
-                Offset += len(self.RawDataList[ItemIndex])
-        else:
-            Offset = self.ItemSize * Index
+            return [len(Item) for Item in self.RawDataList]
+        return [self.ItemSize] * len(self.RawDataList)
+
+    ## Get the offsets of all items, computed once for the whole list
+    #
+    #  The item count must not change after the first offset has been queried,
+    #  the values of the items may still be fixed up.
+    #
+    def GetOffsets(self):
+        if self._Offsets is None:
+            self._Offsets = [0]
+            self._Offsets.extend(accumulate(self.GetItemSizes()))
+        return self._Offsets
 
-        return Offset
+    def GetInterOffset(self, Index):
+        if self.ItemSize == 0:
+            assert(Index < len(self.RawDataList))
+            return self.GetOffsets()[Index]
+        return self.ItemSize * Index
 
     def GetListSize(self):
         if self.ListSize:
             return self.ListSize
-        if len(self.RawDataList) == 0:
-            self.ListSize = 0
-            return self.ListSize
-        if self.ItemSize == 0:
-            self.ListSize = self.GetInterOffset(len(self.RawDataList) - 1) + len(self.RawDataList[len(self.RawDataList)-1])
-        else:
-            self.ListSize = self.ItemSize * len(self.RawDataList)
+        self.ListSize = self.GetOffsets()[-1]
         return self.ListSize
 
+    ## Pack the values of all records with one struct call
+    #
+    #  @param Format:   The struct format of one record, without the byte order
+    #  @param Values:   The flattened integer values of all records
+    #
+    @staticmethod
+    def PackRecords(Format, Values):
+        return pack('=' + Format * (len(Values) // len(Format)), *Values)
+
     def PackData(self):
         ## PackGuid
         #
@@ -289,21 +305,15 @@ class DbItemList:
 
         PackStr = PACK_CODE_BY_SIZE[self.ItemSize]
 
-        Buffer = bytearray()
+        Values = []
         for Datas in self.RawDataList:
             if type(Datas) in (list, tuple):
-                for Data in Datas:
-                    if PackStr:
-                        Buffer += pack(PackStr, GetIntegerValue(Data))
-                    else:
-                        Buffer += PackGuid(Data)
+                Values.extend(Datas)
             else:
-                if PackStr:
-                    Buffer += pack(PackStr, GetIntegerValue(Datas))
-                else:
-                    Buffer += PackGuid(Datas)
-
-        return Buffer
+                Values.append(Datas)
+        if not PackStr:
+            return bytearray(b''.join(PackGuid(Data) for Data in Values))
+        return bytearray(self.PackRecords(PackStr[1:], [GetIntegerValue(Data) for Data in Values]))
 
 ## DbExMapTblItemList
 #
@@ -314,14 +324,10 @@ class DbExMapTblItemList (DbItemList):
         DbItemList.__init__(self, ItemSize, DataList, RawDataList)
 
     def PackData(self):
-        Buffer = bytearray()
-        PackStr = "=LHH"
+        Values = []
         for Datas in self.RawDataList:
-            Buffer += pack(PackStr,
-                           GetIntegerValue(Datas[0]),
-                           GetIntegerValue(Datas[1]),
-                           GetIntegerValue(Datas[2]))
-        return Buffer
+            Values.extend(GetIntegerValue(Data) for Data in Datas[:3])
+        return bytearray(self.PackRecords("LHH", Values))
 
 ## DbComItemList
 #
@@ -332,47 +338,28 @@ class DbComItemList (DbItemList):
     def __init__(self, ItemSize, DataList=None, RawDataList=None):
         DbItemList.__init__(self, ItemSize, DataList, RawDataList)
 
-    def GetInterOffset(self, Index):
-        Offset = 0
-        if self.ItemSize == 0:
-            #
-            # Variable length, need to calculate one by one
-            # The only variable table is stringtable, it is not Composite item, should not reach here
-            #
-            assert(False)
-        else:
-            assert(Index < len(self.RawDataList))
-            for ItemIndex in range(Index):
-                Offset += len(self.RawDataList[ItemIndex]) * self.ItemSize
-
-        return Offset
-
-    def GetListSize(self):
-        if self.ListSize:
-            return self.ListSize
-        if self.ItemSize == 0:
-            assert(False)
-        else:
-            if len(self.RawDataList) == 0:
-                self.ListSize = 0
-            else:
-                self.ListSize = self.GetInterOffset(len(self.RawDataList) - 1) + len(self.RawDataList[len(self.RawDataList)-1]) * self.ItemSize
+    def GetItemSizes(self):
+        #
+        # The only variable table is stringtable, it is not Composite item, should not reach here
+        #
+        assert(self.ItemSize != 0)
+        return [len(Item) * self.ItemSize for Item in self.RawDataList]
 
-        return self.ListSize
+    def GetInterOffset(self, Index):
+        assert(Index < len(self.RawDataList))
+        return self.GetOffsets()[Index]
 
     def PackData(self):
         PackStr = PACK_CODE_BY_SIZE[self.ItemSize]
 
-        Buffer = bytearray()
+        Values = []
         for DataList in self.RawDataList:
             for Data in DataList:
                 if type(Data) in (list, tuple):
-                    for SingleData in Data:
-                        Buffer += pack(PackStr, GetIntegerValue(SingleData))
+                    Values.extend(Data)
                 else:
-                    Buffer += pack(PackStr, GetIntegerValue(Data))
-
-        return Buffer
+                    Values.append(Data)
+        return bytearray(self.PackRecords(PackStr[1:], [GetIntegerValue(Data) for Data in Values]))
 
 ## DbVariableTableItemList
 #
@@ -383,57 +370,26 @@ class DbVariableTableItemList (DbComItemList):
         DbComItemList.__init__(self, ItemSize, DataList, RawDataList)
 
     def PackData(self):
-        PackStr = "=LLHHLHH"
-        Buffer = bytearray()
+        Values = []
         for DataList in self.RawDataList:
             for Data in DataList:
-                Buffer += pack(PackStr,
-                               GetIntegerValue(Data[0]),
-                               GetIntegerValue(Data[1]),
-                               GetIntegerValue(Data[2]),
-                               GetIntegerValue(Data[3]),
-                               GetIntegerValue(Data[4]),
-                               GetIntegerValue(Data[5]),
-                               GetIntegerValue(0))
-        return Buffer
+                Values.extend(GetIntegerValue(Item) for Item in Data[:6])
+                Values.append(0)
+        return bytearray(self.PackRecords("LLHHLHH", Values))
 
 class DbStringHeadTableItemList(DbItemList):
     def __init__(self,ItemSize,DataList=None,RawDataList=None):
         DbItemList.__init__(self, ItemSize, DataList, RawDataList)
 
-    def GetInterOffset(self, Index):
-        Offset = 0
+    def GetItemSizes(self):
         if self.ItemSize == 0:
-            #
-            # Variable length, need to calculate one by one
-            #
-            assert(Index < len(self.RawDataList))
-            for ItemIndex in range(Index):
-                Offset += len(self.RawDataList[ItemIndex])
-        else:
-            for innerIndex in range(Index):
-                if type(self.RawDataList[innerIndex]) in (list, tuple):
-                    Offset += len(self.RawDataList[innerIndex]) * self.ItemSize
-                else:
-                    Offset += self.ItemSize
+            return [len(Item) for Item in self.RawDataList]
+        return [len(Item) * self.ItemSize if type(Item) in (list, tuple) else self.ItemSize for Item in self.RawDataList]
 
-        return Offset
-
-    def GetListSize(self):
-        if self.ListSize:
-            return self.ListSize
-        if len(self.RawDataList) == 0:
-            self.ListSize = 0
-            return self.ListSize
+    def GetInterOffset(self, Index):
         if self.ItemSize == 0:
-            self.ListSize = self.GetInterOffset(len(self.RawDataList) - 1) + len(self.RawDataList[len(self.RawDataList)-1])
-        else:
-            for Datas in self.RawDataList:
-                if type(Datas) in (list, tuple):
-                    self.ListSize += len(Datas) * self.ItemSize
-                else:
-                    self.ListSize += self.ItemSize
-        return self.ListSize
+            assert(Index < len(self.RawDataList))
+        return self.GetOffsets()[Index]
 
 ## DbSkuHeadTableItemList
 #
@@ -444,13 +400,11 @@ class DbSkuHeadTableItemList (DbItemList):
         DbItemList.__init__(self, ItemSize, DataList, RawDataList)
 
     def PackData(self):
-        PackStr = "=LL"
-        Buffer = bytearray()
+        Values = []
         for Data in self.RawDataList:
-            Buffer += pack(PackStr,
-                           GetIntegerValue(Data[0]),
-                           GetIntegerValue(Data[1]))
-        return Buffer
+            Values.append(GetIntegerValue(Data[0]))
+            Values.append(GetIntegerValue(Data[1]))
+        return bytearray(self.PackRecords("LL", Values))
 
 ## DbSizeTableItemList
 #
@@ -460,21 +414,15 @@ class DbSizeTableItemList (DbItemList):
     def __init__(self, ItemSize, DataList=None, RawDataList=None):
         DbItemList.__init__(self, ItemSize, DataList, RawDataList)
 
-    def GetListSize(self):
-        length = 0
-        for Data in self.RawDataList:
-            length += (1 + len(Data[1]))
-        return length * self.ItemSize
+    def GetItemSizes(self):
+        return [(1 + len(Data[1])) * self.ItemSize for Data in self.RawDataList]
+
     def PackData(self):
-        PackStr = "=H"
-        Buffer = bytearray()
+        Values = []
         for Data in self.RawDataList:
-            Buffer += pack(PackStr,
-                           GetIntegerValue(Data[0]))
-            for subData in Data[1]:
-                Buffer += pack(PackStr,
-                           GetIntegerValue(subData))
-        return Buffer
+            Values.append(GetIntegerValue(Data[0]))
+            Values.extend(GetIntegerValue(subData) for subData in Data[1])
+        return bytearray(self.PackRecords("H", Values))
 
 ## DbStringItemList
 #
@@ -496,33 +444,16 @@ class DbStringItemList (DbComItemList):
             Len = LenList[Index]
             RawDatas = RawDataList[Index]
             assert(Len >= len(RawDatas))
-            ActualDatas = []
-            for i in range(len(RawDatas)):
-                ActualDatas.append(RawDatas[i])
-            for i in range(len(RawDatas), Len):
-                ActualDatas.append(0)
-            DataList.append(ActualDatas)
+            DataList.append(list(RawDatas) + [0] * (Len - len(RawDatas)))
         self.LenList = LenList
         DbComItemList.__init__(self, ItemSize, DataList, RawDataList)
-    def GetInterOffset(self, Index):
-        Offset = 0
 
-        assert(Index < len(self.LenList))
-        for ItemIndex in range(Index):
-            Offset += self.LenList[ItemIndex]
-
-        return Offset
+    def GetItemSizes(self):
+        return list(self.LenList)
 
-    def GetListSize(self):
-        if self.ListSize:
-            return self.ListSize
-
-        if len(self.LenList) == 0:
-            self.ListSize = 0
-        else:
-            self.ListSize = self.GetInterOffset(len(self.LenList) - 1) + self.LenList[len(self.LenList)-1]
-
-        return self.ListSize
+    def GetInterOffset(self, Index):
+        assert(Index < len(self.LenList))
+        return self.GetOffsets()[Index]
 
     def PackData(self):
         self.RawDataList = self.DataList
@@ -694,56 +625,40 @@ def BuildExDataBase(Dict):
     # The FixedHeader length of the PCD_DATABASE_INIT, from Signature to Pad
     FixedHeaderLen = 80
 
-    # Get offset of SkuId table in the database
-    SkuIdTableOffset = FixedHeaderLen
+    # Get the offset of every table in the database, the tables after the
+    # init table items start at an 8 byte aligned offset
+    TableOffset = {}
+    DbOffset = FixedHeaderLen
     for DbIndex in range(len(DbTotal)):
-        if DbTotal[DbIndex] is SkuidValue:
-            break
-        SkuIdTableOffset += DbItemTotal[DbIndex].GetListSize()
-
-
-    # Get offset of SkuValue table in the database
+        TableOffset.setdefault(id(DbTotal[DbIndex]), (DbIndex, DbOffset))
+        DbOffset += DbItemTotal[DbIndex].GetListSize()
+        if DbIndex + 1 == InitTableNum:
+            if DbOffset % 8:
+                DbOffset += (8 - DbOffset % 8)
 
     # Fix up the LocalTokenNumberTable, SkuHeader table
+    TokenTypeValues = {}
     for (LocalTokenNumberTableIndex, (Offset, Table)) in enumerate(LocalTokenNumberTable):
-        DbIndex = 0
-        DbOffset = FixedHeaderLen
-        for DbIndex in range(len(DbTotal)):
-            if DbTotal[DbIndex] is Table:
-                DbOffset += DbItemTotal[DbIndex].GetInterOffset(Offset)
-                break
-            DbOffset += DbItemTotal[DbIndex].GetListSize()
-            if DbIndex + 1 == InitTableNum:
-                if DbOffset % 8:
-                    DbOffset += (8 - DbOffset % 8)
-        else:
+        if id(Table) not in TableOffset:
             assert(False)
+        DbIndex, DbOffset = TableOffset[id(Table)]
+        DbOffset += DbItemTotal[DbIndex].GetInterOffset(Offset)
 
-        TokenTypeValue = Dict['TOKEN_TYPE'][LocalTokenNumberTableIndex]
-        TokenTypeValue = GetTokenTypeValue(TokenTypeValue)
-        LocalTokenNumberTable[LocalTokenNumberTableIndex] = DbOffset|int(TokenTypeValue)
+        TokenType = Dict['TOKEN_TYPE'][LocalTokenNumberTableIndex]
+        if TokenType not in TokenTypeValues:
+            TokenTypeValues[TokenType] = int(GetTokenTypeValue(TokenType))
+        LocalTokenNumberTable[LocalTokenNumberTableIndex] = DbOffset|TokenTypeValues[TokenType]
         # if PCD_TYPE_SKU_ENABLED, then we need to fix up the SkuTable
 
-
-
-
     # resolve variable table offset
     for VariableEntries in VariableTable:
         skuindex = 0
         for VariableEntryPerSku in VariableEntries:
             (VariableHeadGuidIndex, VariableHeadStringIndex, SKUVariableOffset, VariableOffset, VariableRefTable, VariableAttribute) = VariableEntryPerSku[:]
-            DbIndex = 0
-            DbOffset = FixedHeaderLen
-            for DbIndex in range(len(DbTotal)):
-                if DbTotal[DbIndex] is VariableRefTable:
-                    DbOffset += DbItemTotal[DbIndex].GetInterOffset(VariableOffset)
-                    break
-                DbOffset += DbItemTotal[DbIndex].GetListSize()
-                if DbIndex + 1 == InitTableNum:
-                    if DbOffset % 8:
-                        DbOffset += (8 - DbOffset % 8)
-            else:
+            if id(VariableRefTable) not in TableOffset:
                 assert(False)
+            DbIndex, DbOffset = TableOffset[id(VariableRefTable)]
+            DbOffset += DbItemTotal[DbIndex].GetInterOffset(VariableOffset)
             if isinstance(VariableRefTable[0], list):
                 DbOffset += skuindex * 4
             skuindex += 1
@@ -789,74 +704,31 @@ def BuildExDataBase(Dict):
     # Construct the database buffer
     Guid = "{0x3c7d193c, 0x682c, 0x4c14, 0xa6, 0x8f, 0x55, 0x2d, 0xea, 0x4f, 0x43, 0x7e}"
     Guid = StringArrayToList(Guid)
-    Buffer = PackByteFormatGUID(Guid)
-
-    b = pack("=L", DATABASE_VERSION)
-    Buffer += b
-
-    b = pack('=L', DbTotalLength - UninitDataBaseSize)
-
-    Buffer += b
-    b = pack('=Q', SystemSkuId)
-
-    Buffer += b
-    b = pack('=L', 0)
-
-    Buffer += b
-    b = pack('=L', UninitDataBaseSize)
-
-    Buffer += b
-    b = pack('=L', LocalTokenNumberTableOffset)
-
-    Buffer += b
-    b = pack('=L', ExMapTableOffset)
-
-    Buffer += b
-    b = pack('=L', GuidTableOffset)
-
-    Buffer += b
-    b = pack('=L', StringTableOffset)
-
-    Buffer += b
-    b = pack('=L', SizeTableOffset)
-
-    Buffer += b
-    b = pack('=L', SkuIdTableOffset)
-
-    Buffer += b
-    b = pack('=L', DbPcdNameOffset)
-
-    Buffer += b
-    b = pack('=H', LocalTokenCount)
-
-    Buffer += b
-    b = pack('=H', ExTokenCount)
-
-    Buffer += b
-    b = pack('=H', GuidTableCount)
-
-    Buffer += b
-    b = pack('=B', Pad)
-    Buffer += b
-    Buffer += b
-    Buffer += b
-    Buffer += b
-    Buffer += b
-    Buffer += b
-
-    Index = 0
-    for Item in DbItemTotal:
-        Index +=1
-        packdata = Item.PackData()
-        for i in range(len(packdata)):
-            Buffer += packdata[i:i + 1]
-        if Index == InitTableNum:
-            if len(Buffer) % 8:
-                for num in range(8 - len(Buffer) % 8):
-                    b = pack('=B', Pad)
-                    Buffer += b
-            break
-    return Buffer
+    Buffer = bytearray(FixedHeaderLen)
+    pack_into('=16sLLQLLLLLLLLLHHH6B', Buffer, 0,
+              PackByteFormatGUID(Guid),
+              DATABASE_VERSION,
+              DbTotalLength - UninitDataBaseSize,
+              SystemSkuId,
+              0,
+              UninitDataBaseSize,
+              LocalTokenNumberTableOffset,
+              ExMapTableOffset,
+              GuidTableOffset,
+              StringTableOffset,
+              SizeTableOffset,
+              SkuIdTableOffset,
+              DbPcdNameOffset,
+              LocalTokenCount,
+              ExTokenCount,
+              GuidTableCount,
+              *([Pad] * 6))
+
+    for Item in DbItemTotal[:InitTableNum]:
+        Buffer += Item.PackData()
+    if len(Buffer) % 8:
+        Buffer += bytes([Pad] * (8 - len(Buffer) % 8))
+    return bytes(Buffer)
 
 ## Create code for PCD database
 #
@@ -892,35 +764,26 @@ def CreatePcdDatabaseCode (Info, AutoGenC, AutoGenH):
     Changed = SaveFileOnChange(DbFileName, DbFile.getvalue(), True)
 def CreatePcdDataBase(PcdDBData):
     delta = {}
+    defaultdata = PcdDBData[(TAB_DEFAULT, "0")][1]
     for skuname, skuid in PcdDBData:
-        if len(PcdDBData[(skuname, skuid)][1]) != len(PcdDBData[(TAB_DEFAULT, "0")][1]):
+        if len(PcdDBData[(skuname, skuid)][1]) != len(defaultdata):
             EdkLogger.error("build", AUTOGEN_ERROR, "The size of each sku in one pcd are not same")
     for skuname, skuid in PcdDBData:
         if skuname == TAB_DEFAULT:
             continue
-        delta[(skuname, skuid)] = [(index, data, hex(data)) for index, data in enumerate(PcdDBData[(skuname, skuid)][1]) if PcdDBData[(skuname, skuid)][1][index] != PcdDBData[(TAB_DEFAULT, "0")][1][index]]
-    databasebuff = PcdDBData[(TAB_DEFAULT, "0")][0]
+        delta[(skuname, skuid)] = [(index, data) for index, (data, default) in enumerate(zip(PcdDBData[(skuname, skuid)][1], defaultdata)) if data != default]
+    databasebuff = bytearray(PcdDBData[(TAB_DEFAULT, "0")][0])
 
     for skuname, skuid in delta:
         # 8 byte align
         if len(databasebuff) % 8 > 0:
-            for i in range(8 - (len(databasebuff) % 8)):
-                databasebuff += pack("=B", 0)
-        databasebuff += pack('=Q', int(skuid))
-        databasebuff += pack('=Q', 0)
-        databasebuff += pack('=L', 8+8+4+4*len(delta[(skuname, skuid)]))
-        for item in delta[(skuname, skuid)]:
-            databasebuff += pack("=L", item[0])
-            databasebuff = databasebuff[:-1] + pack("=B", item[1])
-    totallen = len(databasebuff)
-    totallenbuff = pack("=L", totallen)
-    newbuffer = databasebuff[:32]
-    for i in range(4):
-        newbuffer += totallenbuff[i:i+1]
-    for i in range(36, totallen):
-        newbuffer += databasebuff[i:i+1]
-
-    return newbuffer
+            databasebuff += bytes(8 - (len(databasebuff) % 8))
+        databasebuff += pack('=QQL', int(skuid), 0, 8+8+4+4*len(delta[(skuname, skuid)]))
+        # the low 3 bytes hold the offset and the high byte holds the new value
+        databasebuff += DbItemList.PackRecords("L", [(item[0] & 0xFFFFFF) | (item[1] << 24) for item in delta[(skuname, skuid)]])
+    pack_into("=L", databasebuff, 32, len(databasebuff))
+
+    return bytes(databasebuff)
 
 def CreateVarCheckBin(VarCheckTab):
     return VarCheckTab[(TAB_DEFAULT, "0")]
@@ -959,10 +822,7 @@ def NewCreatePcdDatabasePhaseSpecificAutoGen(Platform, Phase):
     if DynamicPcdSet_Sku:
         for skuname, skuid in DynamicPcdSet_Sku:
             AdditionalAutoGenH, AdditionalAutoGenC, PcdDbBuffer, VarCheckTab = CreatePcdDatabasePhaseSpecificAutoGen (Platform, DynamicPcdSet_Sku[(skuname, skuid)], Phase)
-            final_data = ()
-            for item in range(len(PcdDbBuffer)):
-                final_data += unpack("B", PcdDbBuffer[item:item+1])
-            PcdDBData[(skuname, skuid)] = (PcdDbBuffer, final_data)
+            PcdDBData[(skuname, skuid)] = (PcdDbBuffer, tuple(PcdDbBuffer))
             PcdDriverAutoGenData[(skuname, skuid)] = (AdditionalAutoGenH, AdditionalAutoGenC)
             VarCheckTableData[(skuname, skuid)] = VarCheckTab
         if Platform.Platform.VarCheckFlag:
@@ -972,10 +832,7 @@ def NewCreatePcdDatabasePhaseSpecificAutoGen(Platform, Phase):
         AdditionalAutoGenH, AdditionalAutoGenC =  CreateAutoGen(PcdDriverAutoGenData)
     else:
         AdditionalAutoGenH, AdditionalAutoGenC, PcdDbBuffer, VarCheckTab = CreatePcdDatabasePhaseSpecificAutoGen (Platform, {}, Phase)
-        final_data = ()
-        for item in range(len(PcdDbBuffer)):
-            final_data += unpack("B", PcdDbBuffer[item:item + 1])
-        PcdDBData[(TAB_DEFAULT, "0")] = (PcdDbBuffer, final_data)
+        PcdDBData[(TAB_DEFAULT, "0")] = (PcdDbBuffer, tuple(PcdDbBuffer))
 
     return AdditionalAutoGenH, AdditionalAutoGenC, CreatePcdDataBase(PcdDBData)
 ## Create PCD database in DXE or PEI phase
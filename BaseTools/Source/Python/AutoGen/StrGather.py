@@ -13,6 +13,8 @@ import re
 import Common.EdkLogger as EdkLogger
 from Common.BuildToolError import *
 from .UniClassObject import *
+from .UniClassObject import GetCacheDirectory
+from Common.caching import content_cache
 from io import BytesIO
 from struct import pack, unpack
 from Common.LongFilePathSupport import OpenLongFilePath as open
@@ -56,6 +58,9 @@ CHAR_ARRAY_DEFIN = 'unsigned char'
 COMMON_FILE_NAME = 'Strings'
 STRING_TOKEN = re.compile('STRING_TOKEN *\(([A-Z0-9_]+) *\)', re.MULTILINE | re.UNICODE)
 
+## String tokens referenced by source files, keyed by the file content
+gStringTokenCache = content_cache()
+
 EFI_HII_ARRAY_SIZE_LENGTH = 4
 EFI_HII_PACKAGE_HEADER_LENGTH = 4
 EFI_HII_HDR_SIZE_LENGTH = 4
@@ -510,6 +515,22 @@ def GetFileList(SourceFileList, IncludeList, SkipList):
 
     return FileList
 
+## GetStringTokens
+#
+# Get the names of all string tokens referenced by a source file
+#
+# @param File:            The source file
+#
+# @retval list:           The string names, in the order of the first reference
+#
+def GetStringTokens(File):
+    StrNames = {}
+    with open(File, 'r') as SourceFile:
+        for Line in SourceFile:
+            for StrName in STRING_TOKEN.findall(Line):
+                StrNames[StrName] = None
+    return list(StrNames)
+
 ## SearchString
 #
 # Search whether all string defined in UniObjectClass are referenced
@@ -525,14 +546,15 @@ def SearchString(UniObjectClass, FileList, IsCompatibleMode):
     if FileList == []:
         return UniObjectClass
 
+    CacheDir = GetCacheDirectory('StringTokenCache')
     for File in FileList:
         try:
             if os.path.isfile(File):
-                Lines = open(File, 'r')
-                for Line in Lines:
-                    for StrName in STRING_TOKEN.findall(Line):
-                        EdkLogger.debug(EdkLogger.DEBUG_5, "Found string identifier: " + StrName)
-                        UniObjectClass.SetStringReferenced(StrName)
+                with open(File, 'rb') as SourceFile:
+                    Content = SourceFile.read()
+                for StrName in gStringTokenCache.get(Content, lambda: GetStringTokens(File), CacheDir, File):
+                    EdkLogger.debug(EdkLogger.DEBUG_5, "Found string identifier: " + StrName)
+                    UniObjectClass.SetStringReferenced(StrName)
         except:
             EdkLogger.error("UnicodeStringGather", AUTOGEN_ERROR, "SearchString: Error while processing file", File=File, RaiseError=False)
             raise
@@ -19,7 +19,9 @@ from Common.BuildToolError import *
 from Common.StringUtils import GetLineNo
 from Common.Misc import PathClass
 from Common.LongFilePathSupport import LongFilePath
+from Common.caching import content_cache
 from Common.GlobalData import *
+import Common.GlobalData as GlobalData
 ##
 # Static definitions
 #
@@ -40,6 +42,23 @@ BACK_SLASH_PLACEHOLDER = u'\u0006'
 
 gIncludePattern = re.compile("^#include +[\"<]+([^\"< >]+)[>\"]+$", re.MULTILINE | re.UNICODE)
 
+## Pre-processed lines of .uni files, keyed by the file content
+gUniLinesCache = content_cache()
+
+## Language and string definitions parsed from the pre-processed lines of .uni files
+gUniStringsCache = content_cache()
+
+## Get the directory shared by all build processes to keep a cache in
+#
+# @param Name:   The name of the cache
+#
+# @retval None:  No build is running, the cache is only kept in memory
+#
+def GetCacheDirectory(Name):
+    if not os.path.isabs(GlobalData.gDatabasePath):
+        return None
+    return os.path.join(os.path.dirname(GlobalData.gDatabasePath), Name)
+
 ## Convert a unicode string to a Hex list
 #
 # Convert a unicode string to a Hex list
@@ -50,6 +69,9 @@ gIncludePattern = re.compile("^#include +[\"<]+([^\"< >]+)[>\"]+$", re.MULTILINE
 # @retval List:  The formatted hex list
 #
 def UniToHexList(Uni):
+    Bytes = Uni.encode('utf_16_le', 'surrogatepass')
+    if len(Bytes) == 2 * len(Uni):
+        return [gHexByteList[Byte] for Byte in Bytes]
     List = []
     for Item in Uni:
         Temp = '%04X' % ord(Item)
@@ -57,6 +79,9 @@ def UniToHexList(Uni):
         List.append('0x' + Temp[0:2])
     return List
 
+## The formatted hex of each byte value, used by UniToHexList
+gHexByteList = ['0x%02X' % Byte for Byte in range(256)]
+
 LangConvTable = {'eng':'en', 'fra':'fr', \
                  'aar':'aa', 'abk':'ab', 'ave':'ae', 'afr':'af', 'aka':'ak', 'amh':'am', \
                  'arg':'an', 'ara':'ar', 'asm':'as', 'ava':'av', 'aym':'ay', 'aze':'az', \
@@ -230,7 +255,7 @@ class UniFileClassObject(object):
             self.LoadUniFiles(FileList)
 
     #
-    # Get Language definition
+    # Get Language definition, it is returned as (LangName, LangPrintName)
     #
     def GetLangDef(self, File, Line):
         Lang = shlex.split(Line.split(u"//")[0])
@@ -247,7 +272,12 @@ class UniFileClassObject(object):
         else:
             LangName = GetLanguageCode(Lang[1], self.IsCompatibleMode, self.File)
             LangPrintName = Lang[2]
+        return LangName, LangPrintName
 
+    #
+    # Add Language definition
+    #
+    def AddLangDef(self, LangName, LangPrintName):
         IsLangInDef = False
         for Item in self.LanguageDef:
             if Item[0] == LangName:
@@ -292,6 +322,10 @@ class UniFileClassObject(object):
         except:
             EdkLogger.Error("build", FILE_OPEN_FAILURE, ExtraData=File)
 
+        return UniFileClassObject.DecodeUniData(FileIn, FileName)
+
+    @staticmethod
+    def DecodeUniData(FileIn, FileName):
         #
         # Detect Byte Order Mark at beginning of file.  Default to UTF-8
         #
@@ -338,11 +372,12 @@ class UniFileClassObject(object):
                                     ErrMsg('UCS-2', LineNumber))
 
     #
-    # Get String name and value
+    # Get String name and value, a list of (Name, Language, Value) is returned
     #
     def GetStringObject(self, Item):
         Language = ''
         Value = ''
+        StringList = []
 
         Name = Item.split()[1]
         # Check the string name
@@ -358,7 +393,8 @@ class UniFileClassObject(object):
                 Language = LanguageList[IndexI].split()[0]
                 Value = LanguageList[IndexI][LanguageList[IndexI].find(u'\"') + len(u'\"') : LanguageList[IndexI].rfind(u'\"')] #.replace(u'\r\n', u'')
                 Language = GetLanguageCode(Language, self.IsCompatibleMode, self.File)
-                self.AddStringToList(Name, Language, Value)
+                StringList.append((Name, Language, Value))
+        return StringList
 
     #
     # Get include file list and load them
@@ -372,11 +408,39 @@ class UniFileClassObject(object):
     #
     def PreProcess(self, File):
         try:
-            FileIn = UniFileClassObject.OpenUniFile(LongFilePath(File.Path))
-        except UnicodeError as X:
-            EdkLogger.error("build", FILE_READ_FAILURE, "File read failure: %s" % str(X), ExtraData=File.Path);
+            with open(LongFilePath(File.Path), mode='rb') as UniFile:
+                FileIn = UniFile.read()
         except OSError:
             EdkLogger.error("Unicode File Parser", FILE_NOT_FOUND, ExtraData=File.Path)
+
+        Lines = []
+        for Line in gUniLinesCache.get(FileIn, lambda: self.PreProcessContent(File, FileIn), GetCacheDirectory('UniCache'), File.Path):
+            #
+            # The include files are resolved for every module, they depend on its include path
+            #
+            if isinstance(Line, tuple):
+                for Dir in [File.Dir] + self.IncludePathList:
+                    IncFile = PathClass(str(Line[0]), Dir)
+                    if os.path.isfile(IncFile.Path):
+                        Lines.extend(self.PreProcess(IncFile))
+                        break
+                else:
+                    EdkLogger.error("Unicode File Parser", FILE_NOT_FOUND, Message="Cannot find include file", ExtraData=str(Line[0]))
+                continue
+
+            Lines.append(Line)
+
+        return Lines
+
+    #
+    # Pre-process the content of one .uni file, an #include is returned as
+    # the tuple (FileName,)
+    #
+    def PreProcessContent(self, File, FileIn):
+        try:
+            FileIn = UniFileClassObject.DecodeUniData(FileIn, LongFilePath(File.Path))
+        except UnicodeError as X:
+            EdkLogger.error("build", FILE_READ_FAILURE, "File read failure: %s" % str(X), ExtraData=File.Path);
         except:
             EdkLogger.error("build", FILE_OPEN_FAILURE, ExtraData=File.Path);
 
@@ -430,13 +494,7 @@ class UniFileClassObject(object):
 
             IncList = gIncludePattern.findall(Line)
             if len(IncList) == 1:
-                for Dir in [File.Dir] + self.IncludePathList:
-                    IncFile = PathClass(str(IncList[0]), Dir)
-                    if os.path.isfile(IncFile.Path):
-                        Lines.extend(self.PreProcess(IncFile))
-                        break
-                else:
-                    EdkLogger.error("Unicode File Parser", FILE_NOT_FOUND, Message="Cannot find include file", ExtraData=str(IncList[0]))
+                Lines.append((IncList[0],))
                 continue
 
             Lines.append(Line)
@@ -455,6 +513,25 @@ class UniFileClassObject(object):
         #
         Lines = self.PreProcess(File)
 
+        #
+        # The definitions depend only on the lines and the mode, they are
+        # parsed once and added to the string lists of every module
+        #
+        Content = repr((self.IsCompatibleMode, Lines)).encode('utf-8')
+        for Item in gUniStringsCache.get(Content, lambda: self.ParseUniLines(File, Lines), GetCacheDirectory('UniStringCache'), File.Path):
+            if Item[0] == u'#langdef':
+                self.AddLangDef(Item[1], Item[2])
+            else:
+                self.AddStringToList(Item[1], Item[2], Item[3])
+
+    #
+    # Parse the pre-processed lines of a .uni file, the definitions are
+    # returned in order as (u'#langdef', LangName, LangPrintName) and
+    # (u'#string', Name, Language, Value)
+    #
+    def ParseUniLines(self, File, Lines):
+        ItemList = []
+
         #
         # Get Unicode Information
         #
@@ -469,7 +546,7 @@ class UniFileClassObject(object):
             # Get Language def information
             #
             if Line.find(u'#langdef ') >= 0:
-                self.GetLangDef(File, Line)
+                ItemList.append((u'#langdef',) + self.GetLangDef(File, Line))
                 continue
 
             Name = ''
@@ -505,7 +582,7 @@ class UniFileClassObject(object):
                     MatchString = gIdentifierPattern.match(Name)
                     if MatchString is None:
                         EdkLogger.error('Unicode File Parser', FORMAT_INVALID, 'The string token name %s defined in UNI file %s contains the invalid character.' % (Name, self.File))
-                self.AddStringToList(Name, Language, Value)
+                ItemList.append((u'#string', Name, Language, Value))
                 continue
 
             #
@@ -530,9 +607,11 @@ class UniFileClassObject(object):
                         StringItem = StringItem + Lines[IndexJ]
                     elif Lines[IndexJ].count(u'\"') >= 2:
                         StringItem = StringItem[ : StringItem.rfind(u'\"')] + Lines[IndexJ][Lines[IndexJ].find(u'\"') + len(u'\"') : ]
-                self.GetStringObject(StringItem)
+                ItemList.extend((u'#string',) + String for String in self.GetStringObject(StringItem))
                 continue
 
+        return ItemList
+
     #
     # Load multiple .uni files
     #
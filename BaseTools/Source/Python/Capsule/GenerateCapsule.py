@@ -28,12 +28,28 @@ import tempfile
 import shutil
 import platform
 import json
+import mmap
+import hashlib
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from Common.Uefi.Capsule.UefiCapsuleHeader import UefiCapsuleHeaderClass
 from Common.Uefi.Capsule.FmpCapsuleHeader  import FmpCapsuleHeaderClass
 from Common.Uefi.Capsule.FmpAuthHeader     import FmpAuthHeaderClass
 from Common.Uefi.Capsule.CapsuleDependency import CapsuleDependencyClass
 from Common.Edk2.Capsule.FmpPayloadHeader  import FmpPayloadHeaderClass
 
+#
+# The cryptography package is optional, openssl is run to sign the payloads
+# if it is not installed.
+#
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+except ImportError:
+    x509 = None
+
 #
 # Globals for help information
 #
@@ -113,6 +129,14 @@ def VerifyPayloadSignTool (Payload, CertData, ToolPath, PfxFile, SubjectName, Ve
     raise ValueError ('GenerateCapsule: error: signtool verify is not supported.')
 
 def SignPayloadOpenSsl (Payload, ToolPath, SignerPrivateCertFile, OtherPublicCertFile, TrustedPublicCertFile, Verbose = False):
+    #
+    # Sign in process unless the path of openssl is given
+    #
+    if ToolPath is None and _LoadSigningCertificates (SignerPrivateCertFile, OtherPublicCertFile) is not None:
+        if Verbose:
+            print ('Sign payload with the cryptography package')
+        return SignPayloadCryptography (Payload, SignerPrivateCertFile, OtherPublicCertFile)
+
     #
     # Build openssl command
     #
@@ -141,6 +165,130 @@ def SignPayloadOpenSsl (Payload, ToolPath, SignerPrivateCertFile, OtherPublicCer
 
     return Signature
 
+#
+# DER encoding of the PKCS7 detached signature generated by
+# "openssl smime -sign -binary -outform DER -md sha256"
+#
+def _DerEncode (Tag, Content):
+    Length = len (Content)
+    if Length < 0x80:
+        return bytes ([Tag, Length]) + Content
+    LengthBytes = Length.to_bytes ((Length.bit_length () + 7) // 8, 'big')
+    return bytes ([Tag, 0x80 | len (LengthBytes)]) + LengthBytes + Content
+
+def _DerSequence (*Items):
+    return _DerEncode (0x30, b''.join (Items))
+
+def _DerSet (Items, Tag = 0x31):
+    # the elements of a SET OF are sorted by their encoding
+    return _DerEncode (Tag, b''.join (sorted (Items)))
+
+def _DerInteger (Value):
+    return _DerEncode (0x02, Value.to_bytes (Value.bit_length () // 8 + 1, 'big'))
+
+def _DerOid (Oid):
+    Arcs = [int (Arc) for Arc in Oid.split ('.')]
+    Content = bytearray ([Arcs[0] * 40 + Arcs[1]])
+    for Arc in Arcs[2:]:
+        Bytes = [Arc & 0x7F]
+        Arc >>= 7
+        while Arc:
+            Bytes.insert (0, 0x80 | (Arc & 0x7F))
+            Arc >>= 7
+        Content.extend (Bytes)
+    return _DerEncode (0x06, bytes (Content))
+
+def _DerTime (Time):
+    if 1950 <= Time.year < 2050:
+        return _DerEncode (0x17, Time.strftime ('%y%m%d%H%M%SZ').encode ())
+    return _DerEncode (0x18, Time.strftime ('%Y%m%d%H%M%SZ').encode ())
+
+_OID_DATA             = _DerOid ('1.2.840.113549.1.7.1')
+_OID_SIGNED_DATA      = _DerOid ('1.2.840.113549.1.7.2')
+_OID_CONTENT_TYPE     = _DerOid ('1.2.840.113549.1.9.3')
+_OID_MESSAGE_DIGEST   = _DerOid ('1.2.840.113549.1.9.4')
+_OID_SIGNING_TIME     = _DerOid ('1.2.840.113549.1.9.5')
+_OID_SMIME_CAPS       = _DerOid ('1.2.840.113549.1.9.15')
+_SHA256_ALGORITHM     = _DerSequence (_DerOid ('2.16.840.1.101.3.4.2.1'), b'\x05\x00')
+_RSA_ALGORITHM        = _DerSequence (_DerOid ('1.2.840.113549.1.1.1'), b'\x05\x00')
+
+#
+# The S/MIME capabilities added by openssl: AES-256, AES-192 and AES-128 CBC,
+# 3DES, RC2 with 128 and 64 bit keys, DES and RC2 with 40 bit keys
+#
+_SMIME_CAPABILITIES = _DerSequence (
+    _DerSequence (_DerOid ('2.16.840.1.101.3.4.1.42')),
+    _DerSequence (_DerOid ('2.16.840.1.101.3.4.1.22')),
+    _DerSequence (_DerOid ('2.16.840.1.101.3.4.1.2')),
+    _DerSequence (_DerOid ('1.2.840.113549.3.7')),
+    _DerSequence (_DerOid ('1.2.840.113549.3.2'), _DerInteger (128)),
+    _DerSequence (_DerOid ('1.2.840.113549.3.2'), _DerInteger (64)),
+    _DerSequence (_DerOid ('1.3.14.3.2.7')),
+    _DerSequence (_DerOid ('1.2.840.113549.3.2'), _DerInteger (40))
+    )
+
+## Load the signer certificate and key, and the other public certificates
+#
+# Returns None if the cryptography package is not available or the key is not
+# a RSA key, the payloads are signed by openssl in that case.
+#
+@lru_cache (maxsize = None)
+def _LoadSigningCertificates (SignerPrivateCertFile, OtherPublicCertFile):
+    if x509 is None or not hasattr (x509, 'load_pem_x509_certificates'):
+        return None
+    try:
+        with open (SignerPrivateCertFile, 'rb') as File:
+            SignerData = File.read ()
+        with open (OtherPublicCertFile, 'rb') as File:
+            OtherData = File.read ()
+        SignerCert = x509.load_pem_x509_certificate (SignerData)
+        SignerKey  = serialization.load_pem_private_key (SignerData, password = None)
+        OtherCerts = x509.load_pem_x509_certificates (OtherData)
+    except Exception:
+        return None
+    if not isinstance (SignerKey, rsa.RSAPrivateKey):
+        return None
+    CertList = [Cert.public_bytes (serialization.Encoding.DER) for Cert in [SignerCert] + OtherCerts]
+    IssuerAndSerial = _DerSequence (SignerCert.issuer.public_bytes (), _DerInteger (SignerCert.serial_number))
+    return SignerKey, CertList, IssuerAndSerial
+
+## Sign a payload in process with the cryptography package
+#
+# The signature is encoded the same way as the one of SignPayloadOpenSsl(), and
+# is identical to it when it is generated in the same second.
+#
+def SignPayloadCryptography (Payload, SignerPrivateCertFile, OtherPublicCertFile, SigningTime = None):
+    Certificates = _LoadSigningCertificates (SignerPrivateCertFile, OtherPublicCertFile)
+    if Certificates is None:
+        raise ValueError ('GenerateCapsule: error: can not sign with the cryptography package.')
+    SignerKey, CertList, IssuerAndSerial = Certificates
+    if SigningTime is None:
+        SigningTime = datetime.datetime.now (datetime.timezone.utc)
+
+    Attributes = [
+        _DerSequence (_OID_CONTENT_TYPE, _DerSet ([_OID_DATA])),
+        _DerSequence (_OID_SIGNING_TIME, _DerSet ([_DerTime (SigningTime)])),
+        _DerSequence (_OID_MESSAGE_DIGEST, _DerSet ([_DerEncode (0x04, hashlib.sha256 (Payload).digest ())])),
+        _DerSequence (_OID_SMIME_CAPS, _DerSet ([_SMIME_CAPABILITIES]))
+        ]
+    Signature = SignerKey.sign (_DerSet (Attributes), padding.PKCS1v15 (), hashes.SHA256 ())
+    SignerInfo = _DerSequence (
+                   _DerInteger (1),
+                   IssuerAndSerial,
+                   _SHA256_ALGORITHM,
+                   _DerSet (Attributes, Tag = 0xA0),
+                   _RSA_ALGORITHM,
+                   _DerEncode (0x04, Signature)
+                   )
+    SignedData = _DerSequence (
+                   _DerInteger (1),
+                   _DerSet ([_SHA256_ALGORITHM]),
+                   _DerSequence (_OID_DATA),
+                   _DerSet (CertList, Tag = 0xA0),
+                   _DerSet ([SignerInfo])
+                   )
+    return _DerSequence (_OID_SIGNED_DATA, _DerEncode (0xA0, SignedData))
+
 def VerifyPayloadOpenSsl (Payload, CertData, ToolPath, SignerPrivateCertFile, OtherPublicCertFile, TrustedPublicCertFile, Verbose = False):
     #
     # Create a temporary directory
@@ -199,6 +347,26 @@ if __name__ == '__main__':
                 continue
             yield arg
 
+    #
+    # Large payloads and capsules are memory mapped instead of read, the
+    # headers wrapping them only reference the mapped pages
+    #
+    def ReadBinaryFile (File):
+        try:
+            return memoryview (mmap.mmap (File.fileno (), 0, access = mmap.ACCESS_READ))
+        except (ValueError, OSError):
+            return File.read ()
+
+    #
+    # Write the buffers one by one, the pages of a memory mapped file are
+    # released once written so the resident size stays near one payload
+    #
+    def WriteBufferList (File, BufferList):
+        for Buffer in BufferList:
+            File.write (Buffer)
+            if isinstance (Buffer, memoryview) and isinstance (Buffer.obj, mmap.mmap) and hasattr (mmap, 'MADV_DONTNEED'):
+                Buffer.obj.madvise (mmap.MADV_DONTNEED)
+
     def ValidateUnsignedInteger (Argument):
         try:
             Value = int (Argument, 0)
@@ -321,7 +489,7 @@ if __name__ == '__main__':
             try:
                 if args.Verbose:
                     print ('Read binary input file {File}'.format (File = PayloadFile.name))
-                Payload = PayloadFile.read()
+                Payload = ReadBinaryFile (PayloadFile)
                 PayloadFile.close ()
             except:
                 print ('GenerateCapsule: error: can not read binary input file {File}'.format (File = PayloadFile.name))
@@ -578,6 +746,7 @@ if __name__ == '__main__':
             except Exception as Msg:
                 print ('GenerateCapsule: error:' + str(Msg))
                 sys.exit (1)
+        PayloadList = []
         for SinglePayloadDescriptor in PayloadDescriptorList:
             ImageCapsuleSupport = 0x0000000000000000
             Result = SinglePayloadDescriptor.Payload
@@ -585,7 +754,7 @@ if __name__ == '__main__':
                 FmpPayloadHeader.FwVersion              = SinglePayloadDescriptor.FwVersion
                 FmpPayloadHeader.LowestSupportedVersion = SinglePayloadDescriptor.LowestSupportedVersion
                 FmpPayloadHeader.Payload                = SinglePayloadDescriptor.Payload
-                Result = FmpPayloadHeader.Encode ()
+                Result = FmpPayloadHeader.EncodeList ()
                 if args.Verbose:
                     FmpPayloadHeader.DumpInfo ()
             except:
@@ -595,41 +764,53 @@ if __name__ == '__main__':
                 CapsuleDependency.Payload = Result
                 CapsuleDependency.DepexExp = SinglePayloadDescriptor.DepexExp
                 ImageCapsuleSupport        |= FmpCapsuleHeader.CAPSULE_SUPPORT_DEPENDENCY
-                Result = CapsuleDependency.Encode ()
+                Result = CapsuleDependency.EncodeList ()
                 if args.Verbose:
                     CapsuleDependency.DumpInfo ()
-            if SinglePayloadDescriptor.UseOpenSsl or SinglePayloadDescriptor.UseSignTool:
-                #
-                # Sign image with 64-bit MonotonicCount appended to end of image
-                #
-                try:
-                    if SinglePayloadDescriptor.UseSignTool:
-                        CertData = SignPayloadSignTool (
-                            Result + struct.pack ('<Q', SinglePayloadDescriptor.MonotonicCount),
-                            SinglePayloadDescriptor.SigningToolPath,
-                            SinglePayloadDescriptor.SignToolPfxFile,
-                            SinglePayloadDescriptor.SignToolSubjectName,
-                            Verbose = args.Verbose
-                        )
-                    else:
-                        CertData = SignPayloadOpenSsl (
-                            Result + struct.pack ('<Q', SinglePayloadDescriptor.MonotonicCount),
-                            SinglePayloadDescriptor.SigningToolPath,
-                            SinglePayloadDescriptor.OpenSslSignerPrivateCertFile,
-                            SinglePayloadDescriptor.OpenSslOtherPublicCertFile,
-                            SinglePayloadDescriptor.OpenSslTrustedPublicCertFile,
-                            Verbose = args.Verbose
-                        )
-                except Exception as Msg:
-                    print ('GenerateCapsule: error: can not sign payload \n' + str(Msg))
-                    sys.exit (1)
+            PayloadList.append ((SinglePayloadDescriptor, Result, ImageCapsuleSupport))
+
+        #
+        # Sign images with 64-bit MonotonicCount appended to end of image,
+        # the payloads are independent and may be signed concurrently
+        #
+        def SignPayload (SinglePayloadDescriptor, Result):
+            if not SinglePayloadDescriptor.UseSignTool and not SinglePayloadDescriptor.UseOpenSsl:
+                return None
+            Image = b''.join (Result + [struct.pack ('<Q', SinglePayloadDescriptor.MonotonicCount)])
+            if SinglePayloadDescriptor.UseSignTool:
+                return SignPayloadSignTool (
+                    Image,
+                    SinglePayloadDescriptor.SigningToolPath,
+                    SinglePayloadDescriptor.SignToolPfxFile,
+                    SinglePayloadDescriptor.SignToolSubjectName,
+                    Verbose = args.Verbose
+                )
+            return SignPayloadOpenSsl (
+                Image,
+                SinglePayloadDescriptor.SigningToolPath,
+                SinglePayloadDescriptor.OpenSslSignerPrivateCertFile,
+                SinglePayloadDescriptor.OpenSslOtherPublicCertFile,
+                SinglePayloadDescriptor.OpenSslTrustedPublicCertFile,
+                Verbose = args.Verbose
+            )
 
+        try:
+            with ThreadPoolExecutor (max_workers = args.Jobs) as Executor:
+                CertDataList = list (Executor.map (SignPayload,
+                                                   [Payload[0] for Payload in PayloadList],
+                                                   [Payload[1] for Payload in PayloadList]))
+        except Exception as Msg:
+            print ('GenerateCapsule: error: can not sign payload \n' + str(Msg))
+            sys.exit (1)
+
+        for (SinglePayloadDescriptor, Result, ImageCapsuleSupport), CertData in zip (PayloadList, CertDataList):
+            if CertData is not None:
                 try:
                     FmpAuthHeader.MonotonicCount = SinglePayloadDescriptor.MonotonicCount
                     FmpAuthHeader.CertData       = CertData
                     FmpAuthHeader.Payload        = Result
                     ImageCapsuleSupport          |= FmpCapsuleHeader.CAPSULE_SUPPORT_AUTHENTICATION
-                    Result = FmpAuthHeader.Encode ()
+                    Result = FmpAuthHeader.EncodeList ()
                     if args.Verbose:
                         FmpAuthHeader.DumpInfo ()
                 except:
@@ -640,7 +821,7 @@ if __name__ == '__main__':
             for EmbeddedDriver in EmbeddedDriverDescriptorList:
                 FmpCapsuleHeader.AddEmbeddedDriver(EmbeddedDriver)
 
-            Result = FmpCapsuleHeader.Encode ()
+            Result = FmpCapsuleHeader.EncodeList ()
             if args.Verbose:
                 FmpCapsuleHeader.DumpInfo ()
         except:
@@ -653,7 +834,7 @@ if __name__ == '__main__':
             UefiCapsuleHeader.PopulateSystemTable = False
             UefiCapsuleHeader.InitiateReset       = 'InitiateReset'       in args.CapsuleFlag
             UefiCapsuleHeader.Payload             = Result
-            Result = UefiCapsuleHeader.Encode ()
+            Result = UefiCapsuleHeader.EncodeList ()
             if args.Verbose:
                 UefiCapsuleHeader.DumpInfo ()
         except:
@@ -662,7 +843,7 @@ if __name__ == '__main__':
         try:
             if args.Verbose:
                 print ('Write binary output file {File}'.format (File = args.OutputFile.name))
-            args.OutputFile.write (Result)
+            WriteBufferList (args.OutputFile, Result)
             args.OutputFile.close ()
         except:
             print ('GenerateCapsule: error: can not write binary output file {File}'.format (File = args.OutputFile.name))
@@ -690,7 +871,7 @@ if __name__ == '__main__':
                                             args.HardwareInstance,
                                             args.UpdateImageIndex,
                                             args.SignToolPfxFile,
-                                            args.SignSubjectName,
+                                            args.SignToolSubjectName,
                                             args.OpenSslSignerPrivateCertFile,
                                             args.OpenSslOtherPublicCertFile,
                                             args.OpenSslTrustedPublicCertFile,
@@ -782,6 +963,11 @@ if __name__ == '__main__':
                                                             None
                                                             ))
                 JsonIndex = 0
+                #
+                # The signatures of the payloads are verified concurrently
+                #
+                Executor = ThreadPoolExecutor (max_workers = args.Jobs)
+                VerifyList = []
                 for SinglePayloadDescriptor in PayloadDescriptorList:
                     if args.Verbose:
                         print ('========')
@@ -800,28 +986,28 @@ if __name__ == '__main__':
                         #
                         # Verify Image with 64-bit MonotonicCount appended to end of image
                         #
-                        try:
-                          if SinglePayloadDescriptor.UseSignTool:
-                              CertData = VerifyPayloadSignTool (
-                                           FmpAuthHeader.Payload + struct.pack ('<Q', FmpAuthHeader.MonotonicCount),
-                                           FmpAuthHeader.CertData,
-                                           SinglePayloadDescriptor.SigningToolPath,
-                                           SinglePayloadDescriptor.SignToolPfxFile,
-                                           SinglePayloadDescriptor.SignToolSubjectName,
-                                           Verbose = args.Verbose
-                                           )
-                          else:
-                              CertData = VerifyPayloadOpenSsl (
-                                           FmpAuthHeader.Payload + struct.pack ('<Q', FmpAuthHeader.MonotonicCount),
-                                           FmpAuthHeader.CertData,
-                                           SinglePayloadDescriptor.SigningToolPath,
-                                           SinglePayloadDescriptor.OpenSslSignerPrivateCertFile,
-                                           SinglePayloadDescriptor.OpenSslOtherPublicCertFile,
-                                           SinglePayloadDescriptor.OpenSslTrustedPublicCertFile,
-                                           Verbose = args.Verbose
-                                           )
-                        except Exception as Msg:
-                            print ('GenerateCapsule: warning: payload verification failed Index = {Index} \n'.format (Index = JsonIndex + 1) + str(Msg))
+                        if SinglePayloadDescriptor.UseSignTool:
+                            Future = Executor.submit (
+                                       VerifyPayloadSignTool,
+                                       b''.join ([FmpAuthHeader.Payload, struct.pack ('<Q', FmpAuthHeader.MonotonicCount)]),
+                                       FmpAuthHeader.CertData,
+                                       SinglePayloadDescriptor.SigningToolPath,
+                                       SinglePayloadDescriptor.SignToolPfxFile,
+                                       SinglePayloadDescriptor.SignToolSubjectName,
+                                       Verbose = args.Verbose
+                                       )
+                        else:
+                            Future = Executor.submit (
+                                       VerifyPayloadOpenSsl,
+                                       b''.join ([FmpAuthHeader.Payload, struct.pack ('<Q', FmpAuthHeader.MonotonicCount)]),
+                                       FmpAuthHeader.CertData,
+                                       SinglePayloadDescriptor.SigningToolPath,
+                                       SinglePayloadDescriptor.OpenSslSignerPrivateCertFile,
+                                       SinglePayloadDescriptor.OpenSslOtherPublicCertFile,
+                                       SinglePayloadDescriptor.OpenSslTrustedPublicCertFile,
+                                       Verbose = args.Verbose
+                                       )
+                        VerifyList.append ((JsonIndex, Future))
                     else:
                         if args.Verbose:
                             print ('--------')
@@ -858,6 +1044,12 @@ if __name__ == '__main__':
                             print ('No FMP_PAYLOAD_HEADER')
                             print ('========')
                         sys.exit (1)
+                for Index, Future in VerifyList:
+                    try:
+                        Future.result ()
+                    except Exception as Msg:
+                        print ('GenerateCapsule: warning: payload verification failed Index = {Index} \n'.format (Index = Index + 1) + str(Msg))
+                Executor.shutdown ()
                 #
                 # Write embedded driver file(s)
                 #
@@ -887,7 +1079,7 @@ if __name__ == '__main__':
                     print ('Write binary output file {File}'.format (File = args.OutputFile.name))
                 PayloadDecodePath = args.OutputFile.name + '.Payload.{Index:d}.bin'.format (Index = PayloadIndex + 1)
                 with open (PayloadDecodePath, 'wb') as PayloadDecodeFile:
-                    PayloadDecodeFile.write (SinglePayloadDescriptor.Payload)
+                    WriteBufferList (PayloadDecodeFile, [SinglePayloadDescriptor.Payload])
                 PayloadIndex = PayloadIndex + 1
             except:
                 print ('GenerateCapsule: error: can not write binary output file {File}'.format (File = SinglePayloadDescriptor.OutputFile.name))
@@ -1004,6 +1196,9 @@ if __name__ == '__main__':
     parser.add_argument ("--signing-tool-path", dest = 'SigningToolPath',
                          help = "Path to signtool or OpenSSL tool.  Optional if path to tools are already in PATH.")
 
+    parser.add_argument ("--jobs", dest = 'Jobs', type = ValidateUnsignedInteger, default = 1,
+                         help = "Number of payloads signed or verified concurrently.  Default is 1.")
+
     parser.add_argument ("--embedded-driver", dest = 'EmbeddedDriver', type = argparse.FileType('rb'), action='append', default = [],
                          help = "Path to embedded UEFI driver to add to capsule.")
 
@@ -1024,6 +1219,10 @@ if __name__ == '__main__':
     #
     args = parser.parse_args()
 
+    if args.Jobs == 0:
+        print ('GenerateCapsule: error: Argument --jobs must be at least 1')
+        sys.exit (1)
+
     #
     # Read binary input file
     #
@@ -1035,7 +1234,7 @@ if __name__ == '__main__':
         try:
             if args.Verbose:
                 print ('Read binary input file {File}'.format (File = args.InputFile.name))
-            Buffer = args.InputFile.read ()
+            Buffer = ReadBinaryFile (args.InputFile)
             args.InputFile.close ()
         except:
             print ('GenerateCapsule: error: can not read binary input file {File}'.format (File = args.InputFile.name))
@@ -12,6 +12,7 @@ FmpPayloadHeader
 '''
 
 import struct
+from Common.Uefi.Capsule.BufferList import ToBufferList, BufferListSize
 
 def _SIGNATURE_32 (A, B, C, D):
     return struct.unpack ('=I',bytearray (A + B + C + D, 'ascii'))[0]
@@ -44,6 +45,13 @@ class FmpPayloadHeaderClass (object):
         self.Payload                = b''
 
     def Encode (self):
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payload is referenced instead of copied
+    #
+    # The Payload may be a bytes-like object or a list of them.
+    #
+    def EncodeList (self):
         FmpPayloadHeader = struct.pack (
                                      self._StructFormat,
                                      self.Signature,
@@ -52,7 +60,7 @@ class FmpPayloadHeaderClass (object):
                                      self.LowestSupportedVersion
                                      )
         self._Valid = True
-        return FmpPayloadHeader + self.Payload
+        return [FmpPayloadHeader] + ToBufferList (self.Payload)
 
     def Decode (self, Buffer):
         if len (Buffer) < self._StructSize:
@@ -82,4 +90,4 @@ class FmpPayloadHeaderClass (object):
         print ('FMP_PAYLOAD_HEADER.HeaderSize             = {HeaderSize:08X}'.format (HeaderSize = self.HeaderSize))
         print ('FMP_PAYLOAD_HEADER.FwVersion              = {FwVersion:08X}'.format (FwVersion = self.FwVersion))
         print ('FMP_PAYLOAD_HEADER.LowestSupportedVersion = {LowestSupportedVersion:08X}'.format (LowestSupportedVersion = self.LowestSupportedVersion))
-        print ('sizeof (Payload)                          = {Size:08X}'.format (Size = len (self.Payload)))
+        print ('sizeof (Payload)                          = {Size:08X}'.format (Size = BufferListSize (self.Payload)))
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: BSD-2-Clause-Patent
 
 import re
+from Common.caching import lazy_regex
 
 gIsWindows = None
 gWorkspace = "."
@@ -36,32 +37,32 @@ gGuidDict = {}
 _MacroNamePattern = "[A-Z][A-Z0-9_]*"
 
 ## Regular expression for matching macro used in DSC/DEC/INF file inclusion
-gMacroRefPattern = re.compile("\$\(({})\)".format(_MacroNamePattern), re.UNICODE)
-gMacroDefPattern = re.compile("^(DEFINE|EDK_GLOBAL)[ \t]+")
-gMacroNamePattern = re.compile("^{}$".format(_MacroNamePattern))
+gMacroRefPattern = lazy_regex("\$\(({})\)".format(_MacroNamePattern), re.UNICODE)
+gMacroDefPattern = lazy_regex("^(DEFINE|EDK_GLOBAL)[ \t]+")
+gMacroNamePattern = lazy_regex("^{}$".format(_MacroNamePattern))
 
 # definition for a GUID.  used to create regular expressions below.
 _HexChar = r"[0-9a-fA-F]"
 _GuidPattern = r"{Hex}{{8}}-{Hex}{{4}}-{Hex}{{4}}-{Hex}{{4}}-{Hex}{{12}}".format(Hex=_HexChar)
 
 ## Regular expressions for GUID matching
-gGuidPattern = re.compile(r'{}'.format(_GuidPattern))
-gGuidPatternEnd = re.compile(r'{}$'.format(_GuidPattern))
+gGuidPattern = lazy_regex(r'{}'.format(_GuidPattern))
+gGuidPatternEnd = lazy_regex(r'{}$'.format(_GuidPattern))
 
 ## Regular expressions for HEX matching
-g4HexChar = re.compile(r'{}{{4}}'.format(_HexChar))
-gHexPattern = re.compile(r'0[xX]{}+'.format(_HexChar))
-gHexPatternAll = re.compile(r'0[xX]{}+$'.format(_HexChar))
+g4HexChar = lazy_regex(r'{}{{4}}'.format(_HexChar))
+gHexPattern = lazy_regex(r'0[xX]{}+'.format(_HexChar))
+gHexPatternAll = lazy_regex(r'0[xX]{}+$'.format(_HexChar))
 
 ## Regular expressions for string identifier checking
-gIdentifierPattern = re.compile('^[a-zA-Z][a-zA-Z0-9_]*$', re.UNICODE)
+gIdentifierPattern = lazy_regex('^[a-zA-Z][a-zA-Z0-9_]*$', re.UNICODE)
 ## Regular expression for GUID c structure format
 _GuidCFormatPattern = r"{{\s*0[xX]{Hex}{{1,8}}\s*,\s*0[xX]{Hex}{{1,4}}\s*,\s*0[xX]{Hex}{{1,4}}" \
                       r"\s*,\s*{{\s*0[xX]{Hex}{{1,2}}\s*,\s*0[xX]{Hex}{{1,2}}" \
                       r"\s*,\s*0[xX]{Hex}{{1,2}}\s*,\s*0[xX]{Hex}{{1,2}}" \
                       r"\s*,\s*0[xX]{Hex}{{1,2}}\s*,\s*0[xX]{Hex}{{1,2}}" \
                       r"\s*,\s*0[xX]{Hex}{{1,2}}\s*,\s*0[xX]{Hex}{{1,2}}\s*}}\s*}}".format(Hex=_HexChar)
-gGuidCFormatPattern = re.compile(r"{}".format(_GuidCFormatPattern))
+gGuidCFormatPattern = lazy_regex(r"{}".format(_GuidCFormatPattern))
 
 #
 # A global variable for whether current build in AutoGen phase or not.
@@ -6,7 +6,7 @@
 #
 
 import os
-import platform
+import sys
 import shutil
 import codecs
 
@@ -16,7 +16,7 @@ import codecs
 #
 def LongFilePath(FileName):
     FileName = os.path.normpath(FileName)
-    if platform.system() == 'Windows':
+    if sys.platform == 'win32':
         if FileName.startswith('\\\\?\\'):
             return FileName
         if FileName.startswith('\\\\'):
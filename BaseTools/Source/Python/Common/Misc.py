@@ -25,6 +25,8 @@ import uuid
 import subprocess
 import tempfile
 from collections import OrderedDict
+from functools import lru_cache
+from itertools import repeat
 
 import Common.LongFilePathOs as os
 from Common import EdkLogger as EdkLogger
@@ -38,21 +40,21 @@ from Common.LongFilePathSupport import CopyLongFilePath as CopyLong
 from Common.LongFilePathSupport import LongFilePath as LongFilePath
 from Common.MultipleWorkspace import MultipleWorkspace as mws
 from CommonDataClass.Exceptions import BadExpression
-from Common.caching import cached_property
+from Common.caching import cached_property, lazy_regex
 import struct
 
-ArrayIndex = re.compile("\[\s*[0-9a-fA-FxX]*\s*\]")
+ArrayIndex = lazy_regex("\[\s*[0-9a-fA-FxX]*\s*\]")
 ## Regular expression used to find out place holders in string template
-gPlaceholderPattern = re.compile("\$\{([^$()\s]+)\}", re.MULTILINE | re.UNICODE)
+gPlaceholderPattern = lazy_regex("\$\{([^$()\s]+)\}", re.MULTILINE | re.UNICODE)
 
 ## regular expressions for map file processing
-startPatternGeneral = re.compile("^Start[' ']+Length[' ']+Name[' ']+Class")
-addressPatternGeneral = re.compile("^Address[' ']+Publics by Value[' ']+Rva\+Base")
-valuePatternGcc = re.compile('^([\w_\.]+) +([\da-fA-Fx]+) +([\da-fA-Fx]+)$')
-pcdPatternGcc = re.compile('^([\da-fA-Fx]+) +([\da-fA-Fx]+)')
-secReGeneral = re.compile('^([\da-fA-F]+):([\da-fA-F]+) +([\da-fA-F]+)[Hh]? +([.\w\$]+) +(\w+)', re.UNICODE)
+startPatternGeneral = lazy_regex("^Start[' ']+Length[' ']+Name[' ']+Class")
+addressPatternGeneral = lazy_regex("^Address[' ']+Publics by Value[' ']+Rva\+Base")
+valuePatternGcc = lazy_regex('^([\w_\.]+) +([\da-fA-Fx]+) +([\da-fA-Fx]+)$')
+pcdPatternGcc = lazy_regex('^([\da-fA-Fx]+) +([\da-fA-Fx]+)')
+secReGeneral = lazy_regex('^([\da-fA-F]+):([\da-fA-F]+) +([\da-fA-F]+)[Hh]? +([.\w\$]+) +(\w+)', re.UNICODE)
 
-StructPattern = re.compile(r'[_a-zA-Z][0-9A-Za-z_]*$')
+StructPattern = lazy_regex(r'[_a-zA-Z][0-9A-Za-z_]*$')
 
 ## Dictionary used to store dependencies of files
 gDependencyDatabase = {}    # arch : {file path : [dependent files list]}
@@ -702,35 +704,43 @@ class TemplateString(object):
             self._Template = TemplateSection
             self._PlaceHolderList = []
 
-            # Split the section into sub-sections according to the position of placeholders
-            if PlaceHolderList:
-                self._SubSectionList = []
-                SubSectionStart = 0
-                #
-                # The placeholders passed in must be in the format of
-                #
-                #   PlaceHolderName, PlaceHolderStartPoint, PlaceHolderEndPoint
-                #
-                for PlaceHolder, Start, End in PlaceHolderList:
-                    self._SubSectionList.append(TemplateSection[SubSectionStart:Start])
-                    self._SubSectionList.append(TemplateSection[Start:End])
-                    self._PlaceHolderList.append(PlaceHolder)
-                    SubSectionStart = End
-                if SubSectionStart < len(TemplateSection):
-                    self._SubSectionList.append(TemplateSection[SubSectionStart:])
-            else:
-                self._SubSectionList = [TemplateSection]
+            #
+            # Split the section into the fixed text around the placeholders. The
+            # placeholders passed in must be in the format of
+            #
+            #   PlaceHolderName, PlaceHolderStartPoint, PlaceHolderEndPoint
+            #
+            self._FragmentList = []
+            FragmentStart = 0
+            for PlaceHolder, Start, End in PlaceHolderList:
+                self._FragmentList.append(TemplateSection[FragmentStart:Start])
+                self._PlaceHolderList.append(PlaceHolder)
+                FragmentStart = End
+            self._FragmentList.append(TemplateSection[FragmentStart:])
+
+            #
+            # The section is compiled into a format string with one "%s" per
+            # placeholder, so that one instance is built by a single format
+            # operation
+            #
+            self._Format = "%s".join(Fragment.replace("%", "%%") for Fragment in self._FragmentList)
 
         def __str__(self):
             return self._Template + " : " + str(self._PlaceHolderList)
 
         def Instantiate(self, PlaceHolderValues):
+            if not self._PlaceHolderList:
+                return self._Template
+
             RepeatTime = -1
-            RepeatPlaceHolders = {}
-            NonRepeatPlaceHolders = {}
+            ValueList = []
+            IsRepeated = []
 
             for PlaceHolder in self._PlaceHolderList:
                 if PlaceHolder not in PlaceHolderValues:
+                    # keep the placeholder as it is
+                    ValueList.append("${%s}" % PlaceHolder)
+                    IsRepeated.append(False)
                     continue
                 Value = PlaceHolderValues[PlaceHolder]
                 if type(Value) in self._LIST_TYPES:
@@ -743,31 +753,24 @@ class TemplateString(object):
                                     "${%s} has different repeat time from others!" % PlaceHolder,
                                     ExtraData=str(self._Template)
                                     )
-                    RepeatPlaceHolders["${%s}" % PlaceHolder] = Value
+                    IsRepeated.append(True)
                 else:
-                    NonRepeatPlaceHolders["${%s}" % PlaceHolder] = Value
+                    IsRepeated.append(False)
+                ValueList.append(Value)
 
-            if NonRepeatPlaceHolders:
-                StringList = []
-                for S in self._SubSectionList:
-                    if S not in NonRepeatPlaceHolders:
-                        StringList.append(S)
-                    else:
-                        StringList.append(str(NonRepeatPlaceHolders[S]))
-            else:
-                StringList = self._SubSectionList
+            if RepeatTime < 0:
+                return self._Format % tuple(ValueList)
 
-            if RepeatPlaceHolders:
-                TempStringList = []
-                for Index in range(RepeatTime):
-                    for S in StringList:
-                        if S not in RepeatPlaceHolders:
-                            TempStringList.append(S)
-                        else:
-                            TempStringList.append(str(RepeatPlaceHolders[S][Index]))
-                StringList = TempStringList
+            # A section of only one repeated placeholder is a join of its values
+            if len(ValueList) == 1:
+                if not RepeatTime:
+                    return ""
+                Prefix, Suffix = self._FragmentList
+                return Prefix + (Suffix + Prefix).join(map(str, ValueList[0])) + Suffix
 
-            return "".join(StringList)
+            ColumnList = [Value if Repeated else repeat(Value, RepeatTime) for Value, Repeated in zip(ValueList, IsRepeated)]
+            Format = self._Format
+            return "".join([Format % Values for Values in zip(*ColumnList)])
 
     ## Constructor
     def __init__(self, Template=None):
@@ -785,41 +788,13 @@ class TemplateString(object):
 
     ## Split the template string into fragments per the ${BEGIN} and ${END} flags
     #
+    #   The sections do not change once parsed, so they are shared by all the
+    #   objects of the same template in the process.
+    #
     #   @retval     list    A list of TemplateString.Section objects
     #
     def _Parse(self, Template):
-        SectionStart = 0
-        SearchFrom = 0
-        MatchEnd = 0
-        PlaceHolderList = []
-        TemplateSectionList = []
-        while Template:
-            MatchObj = gPlaceholderPattern.search(Template, SearchFrom)
-            if not MatchObj:
-                if MatchEnd <= len(Template):
-                    TemplateSection = TemplateString.Section(Template[SectionStart:], PlaceHolderList)
-                    TemplateSectionList.append(TemplateSection)
-                break
-
-            MatchString = MatchObj.group(1)
-            MatchStart = MatchObj.start()
-            MatchEnd = MatchObj.end()
-
-            if MatchString == self._REPEAT_START_FLAG:
-                if MatchStart > SectionStart:
-                    TemplateSection = TemplateString.Section(Template[SectionStart:MatchStart], PlaceHolderList)
-                    TemplateSectionList.append(TemplateSection)
-                SectionStart = MatchEnd
-                PlaceHolderList = []
-            elif MatchString == self._REPEAT_END_FLAG:
-                TemplateSection = TemplateString.Section(Template[SectionStart:MatchStart], PlaceHolderList)
-                TemplateSectionList.append(TemplateSection)
-                SectionStart = MatchEnd
-                PlaceHolderList = []
-            else:
-                PlaceHolderList.append((MatchString, MatchStart - SectionStart, MatchEnd - SectionStart))
-            SearchFrom = MatchEnd
-        return TemplateSectionList
+        return _ParseTemplate(Template)
 
     ## Replace the string template with dictionary of placeholders and append it to previous one
     #
@@ -829,7 +804,7 @@ class TemplateString(object):
     def Append(self, AppendString, Dictionary=None):
         if Dictionary:
             SectionList = self._Parse(AppendString)
-            self.String.append( "".join(S.Instantiate(Dictionary) for S in SectionList))
+            self.String.append( "".join([S.Instantiate(Dictionary) for S in SectionList]))
         else:
             if isinstance(AppendString,list):
                 self.String.extend(AppendString)
@@ -843,7 +818,48 @@ class TemplateString(object):
     #   @retval     str             The string replaced with placeholder values
     #
     def Replace(self, Dictionary=None):
-        return "".join(S.Instantiate(Dictionary) for S in self._TemplateSectionList)
+        return "".join([S.Instantiate(Dictionary) for S in self._TemplateSectionList])
+
+## Parse a template of TemplateString into sections
+#
+#   @param      Template    The template string
+#
+#   @retval     tuple       The TemplateString.Section objects of the template
+#
+@lru_cache(maxsize=1024)
+def _ParseTemplate(Template):
+    SectionStart = 0
+    SearchFrom = 0
+    MatchEnd = 0
+    PlaceHolderList = []
+    TemplateSectionList = []
+    while Template:
+        MatchObj = gPlaceholderPattern.search(Template, SearchFrom)
+        if not MatchObj:
+            if MatchEnd <= len(Template):
+                TemplateSection = TemplateString.Section(Template[SectionStart:], PlaceHolderList)
+                TemplateSectionList.append(TemplateSection)
+            break
+
+        MatchString = MatchObj.group(1)
+        MatchStart = MatchObj.start()
+        MatchEnd = MatchObj.end()
+
+        if MatchString == TemplateString._REPEAT_START_FLAG:
+            if MatchStart > SectionStart:
+                TemplateSection = TemplateString.Section(Template[SectionStart:MatchStart], PlaceHolderList)
+                TemplateSectionList.append(TemplateSection)
+            SectionStart = MatchEnd
+            PlaceHolderList = []
+        elif MatchString == TemplateString._REPEAT_END_FLAG:
+            TemplateSection = TemplateString.Section(Template[SectionStart:MatchStart], PlaceHolderList)
+            TemplateSectionList.append(TemplateSection)
+            SectionStart = MatchEnd
+            PlaceHolderList = []
+        else:
+            PlaceHolderList.append((MatchString, MatchStart - SectionStart, MatchEnd - SectionStart))
+        SearchFrom = MatchEnd
+    return tuple(TemplateSectionList)
 
 ## Progress indicator class
 #
@@ -0,0 +1,164 @@
+## @file
+# Redirect the output of external programs to the build log
+#
+# All pipes of the child processes are owned by one multiplexer thread which
+# reads them in large chunks and splits them into lines, instead of using one
+# reader thread per pipe.
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+##
+# Import Modules
+#
+import os
+import sys
+import selectors
+from threading import Thread, Event, Lock
+
+## Size of a single read from a pipe
+gReadChunkSize = 64 * 1024
+
+## Characters which need a shell to interpret a command line
+gShellSpecialChars = frozenset(' \t\r\n|&;<>()$`\\"\'*?[]#~%!{}^')
+
+## Check whether a command can be executed directly without a shell
+#
+# The command is simple if joining its arguments with spaces and letting the
+# shell split them again gives back exactly the same arguments.
+#
+#   @param  Command     The command as a list of arguments
+#
+#   @retval True        The command can be executed directly
+#   @retval False       The command must be executed by the shell
+#
+def IsSimpleCommand(Command):
+    # Windows needs the shell to find the .bat wrappers of the tools
+    if sys.platform == 'win32' or not Command:
+        return False
+    if '=' in Command[0]:
+        return False
+    for Arg in Command:
+        if not Arg or not gShellSpecialChars.isdisjoint(Arg):
+            return False
+    return True
+
+## One redirected stream
+#
+# Splits the data read from the stream into lines, and passes each line,
+# stripped and decoded, to the line handler.
+#
+class OutputChannel(object):
+    def __init__(self, Stream, LineHandler):
+        self.Stream = Stream
+        self.LineHandler = LineHandler
+        self.Done = Event()
+        self.Size = 0
+        self._Partial = b''
+
+    def Feed(self, Data):
+        self.Size += len(Data)
+        Lines = (self._Partial + Data).split(b'\n')
+        self._Partial = Lines.pop()
+        for Line in Lines:
+            self.LineHandler(Line.rstrip().decode(encoding='utf-8', errors='ignore'))
+
+    def Close(self):
+        if self._Partial:
+            self.LineHandler(self._Partial.rstrip().decode(encoding='utf-8', errors='ignore'))
+            self._Partial = b''
+        self.Done.set()
+
+    ## Wait until the end of the stream has been reached
+    def Wait(self):
+        self.Done.wait()
+
+## Thread owning the pipes of all child processes
+class OutputMultiplexer(object):
+    def __init__(self):
+        self._Pid = os.getpid()
+        self._Lock = Lock()
+        self._Pending = []
+        self._Selector = selectors.DefaultSelector()
+        self._WakeupRead, self._WakeupWrite = os.pipe()
+        self._Selector.register(self._WakeupRead, selectors.EVENT_READ)
+        self._Thread = Thread(target=self._Run, name="Output-Multiplexer")
+        self._Thread.daemon = True
+        self._Thread.start()
+
+    ## Add a stream, the selector is only touched by the multiplexer thread
+    def Register(self, Channel):
+        with self._Lock:
+            self._Pending.append(Channel)
+        os.write(self._WakeupWrite, b'\0')
+
+    def _Run(self):
+        while True:
+            for Key, Mask in self._Selector.select():
+                if Key.fileobj == self._WakeupRead:
+                    os.read(self._WakeupRead, 4096)
+                    with self._Lock:
+                        Pending, self._Pending = self._Pending, []
+                    for Channel in Pending:
+                        self._Selector.register(Channel.Stream, selectors.EVENT_READ, Channel)
+                    continue
+                Channel = Key.data
+                try:
+                    Data = os.read(Key.fd, gReadChunkSize)
+                except OSError:
+                    Data = b''
+                try:
+                    if Data:
+                        Channel.Feed(Data)
+                        continue
+                    self._Selector.unregister(Key.fileobj)
+                    Channel.Close()
+                except Exception:
+                    # never leave the waiting thread blocked
+                    if Key.fd in self._Selector.get_map():
+                        self._Selector.unregister(Key.fileobj)
+                    Channel.Done.set()
+
+_Multiplexer = None
+_MultiplexerLock = Lock()
+
+## Get the multiplexer of the current process, creating it at first use
+def GetOutputMultiplexer():
+    global _Multiplexer
+    with _MultiplexerLock:
+        if _Multiplexer is None or _Multiplexer._Pid != os.getpid():
+            _Multiplexer = OutputMultiplexer()
+        return _Multiplexer
+
+## Reader used where pipes cannot be polled (Windows)
+def _ReadStream(Channel):
+    try:
+        while True:
+            Data = Channel.Stream.read1(gReadChunkSize)
+            if not Data:
+                break
+            Channel.Feed(Data)
+    finally:
+        Channel.Close()
+
+## Redirect the output streams of a child process
+#
+#   @param  Redirections    List of (Stream, LineHandler) pairs, the stream
+#                           must be a binary pipe of a Popen object
+#
+#   @retval list            The OutputChannel of each stream, in the same order
+#
+def RedirectOutput(Redirections):
+    Channels = [OutputChannel(Stream, LineHandler) for Stream, LineHandler in Redirections if Stream]
+    if sys.platform == 'win32':
+        for Channel in Channels:
+            ReaderThread = Thread(target=_ReadStream, args=(Channel,))
+            ReaderThread.name = "Output-Redirector"
+            ReaderThread.daemon = True
+            ReaderThread.start()
+    else:
+        Multiplexer = GetOutputMultiplexer()
+        for Channel in Channels:
+            Multiplexer.Register(Channel)
+    return Channels
@@ -0,0 +1,37 @@
+## @file
+# Module with the helpers for the payloads given as a list of buffers.
+#
+# The capsule structures are encoded to a list of buffers, so large payloads,
+# usually memory mapped from the input files, are referenced by each header
+# that wraps them instead of being copied, and the final capsule is written
+# with one write per buffer.
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+'''
+BufferList
+'''
+
+## Get a payload as a list of buffers
+#
+#   @param  Payload     A bytes-like object or a list of bytes-like objects
+#
+#   @retval list        The list of bytes-like objects
+#
+def ToBufferList (Payload):
+    if isinstance (Payload, list):
+        return Payload
+    return [Payload]
+
+## Get the size in bytes of a payload
+#
+#   @param  Payload     A bytes-like object or a list of bytes-like objects
+#
+#   @retval int         The total size of the buffers
+#
+def BufferListSize (Payload):
+    if isinstance (Payload, list):
+        return sum (map (len, Payload))
+    return len (Payload)
@@ -9,6 +9,7 @@ import json
 import sys
 import uuid
 import re
+from Common.Uefi.Capsule.BufferList import ToBufferList, BufferListSize
 
 '''
 CapsuleDependency
@@ -82,13 +83,27 @@ class OpConvert (object):
             BinTemp += struct.pack ('<{PackSize}{PackFmt}'.format (PackSize = PackSize, PackFmt = PackFmt), Value)
         return BinTemp
 
+    ## Get the size of the null terminated string operand that follows the opcode
+    #
+    # The Buffer may be a memoryview of a large payload, so the terminator is
+    # searched in small blocks instead of copying the whole buffer.
+    #
+    def StringSize (self, Buffer):
+        Offset = 1
+        while Offset < len (Buffer):
+            Block = bytes (Buffer[Offset:Offset + 0x100])
+            if b'\x00' in Block:
+                return Offset + Block.index (b'\x00')
+            Offset = Offset + len (Block)
+        raise ValueError
+
     def OpDecode (self, Buffer):
         Opcode = struct.unpack ('<b', Buffer[0:1])[0]
         if Opcode <= 0x02:
             OperandSize, PackSize, PackFmt, EncodeConvert, DecodeConvert = self._DepexOperations[Opcode]
             if Opcode == 0x02:
                 try:
-                    PackSize = Buffer[1:].index (b'\x00') + 1
+                    PackSize = self.StringSize (Buffer)
                     OperandSize = PackSize
                 except:
                     Message = 'CapsuleDependency: OpConvert: error: decode failed with wrong opcode/string.'
@@ -263,6 +278,13 @@ class CapsuleDependencyClass (object):
             i += 1
 
     def Encode (self):
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payload is referenced instead of copied
+    #
+    # The Payload may be a bytes-like object or a list of them.
+    #
+    def EncodeList (self):
         # initialize
         self.Depex = b''
         self._DepexDump = []
@@ -334,7 +356,7 @@ class CapsuleDependencyClass (object):
 
         self._Valid = True
         self._DepexSize = len (self.Depex)
-        return self.Depex + self.Payload
+        return [self.Depex] + ToBufferList (self.Payload)
 
     def Decode (self, Buffer):
         # initialize
@@ -406,4 +428,4 @@ class CapsuleDependencyClass (object):
             print ('}')
 
             print ('sizeof (EFI_FIRMWARE_IMAGE_DEP.Dependencies)    = {Size:08X}'.format (Size = self._DepexSize))
-            print ('sizeof (Payload)                                = {Size:08X}'.format (Size = len (self.Payload)))
+            print ('sizeof (Payload)                                = {Size:08X}'.format (Size = BufferListSize (self.Payload)))
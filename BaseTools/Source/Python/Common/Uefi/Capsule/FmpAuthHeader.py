@@ -12,6 +12,7 @@ FmpAuthHeader
 
 import struct
 import uuid
+from Common.Uefi.Capsule.BufferList import ToBufferList, BufferListSize
 
 class FmpAuthHeaderClass (object):
     # ///
@@ -120,6 +121,13 @@ class FmpAuthHeaderClass (object):
 
 
     def Encode (self):
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payload is referenced instead of copied
+    #
+    # The Payload may be a bytes-like object or a list of them.
+    #
+    def EncodeList (self):
         if self.wRevision != self._WIN_CERT_REVISION:
             raise ValueError
         if self.wCertificateType != self._WIN_CERT_TYPE_EFI_GUID:
@@ -138,7 +146,7 @@ class FmpAuthHeaderClass (object):
                                  )
         self._Valid = True
 
-        return FmpAuthHeader + self.CertData + self.Payload
+        return [FmpAuthHeader, self.CertData] + ToBufferList (self.Payload)
 
     def Decode (self, Buffer):
         if len (Buffer) < self._StructSize:
@@ -187,4 +195,4 @@ class FmpAuthHeaderClass (object):
         print ('EFI_FIRMWARE_IMAGE_AUTHENTICATION.AuthInfo.Hdr.wCertificateType = {wCertificateType:04X}'.format (wCertificateType = self.wCertificateType))
         print ('EFI_FIRMWARE_IMAGE_AUTHENTICATION.AuthInfo.CertType             = {Guid}'.format (Guid = str(self.CertType).upper()))
         print ('sizeof (EFI_FIRMWARE_IMAGE_AUTHENTICATION.AuthInfo.CertData)    = {Size:08X}'.format (Size = len (self.CertData)))
-        print ('sizeof (Payload)                                                = {Size:08X}'.format (Size = len (self.Payload)))
+        print ('sizeof (Payload)                                                = {Size:08X}'.format (Size = BufferListSize (self.Payload)))
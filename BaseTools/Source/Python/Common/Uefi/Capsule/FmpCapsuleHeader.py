@@ -12,6 +12,7 @@ FmpCapsuleHeader
 
 import struct
 import uuid
+from Common.Uefi.Capsule.BufferList import ToBufferList, BufferListSize
 
 class FmpCapsuleImageHeaderClass (object):
     # typedef struct {
@@ -74,8 +75,15 @@ class FmpCapsuleImageHeaderClass (object):
         self.VendorCodeBytes        = b''
 
     def Encode (self):
-        self.UpdateImageSize      = len (self.Payload)
-        self.UpdateVendorCodeSize = len (self.VendorCodeBytes)
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payload is referenced instead of copied
+    #
+    # The Payload and the VendorCodeBytes may be bytes-like objects or lists of them.
+    #
+    def EncodeList (self):
+        self.UpdateImageSize      = BufferListSize (self.Payload)
+        self.UpdateVendorCodeSize = BufferListSize (self.VendorCodeBytes)
         FmpCapsuleImageHeader = struct.pack (
                                          self._StructFormat,
                                          self.Version,
@@ -88,7 +96,7 @@ class FmpCapsuleImageHeaderClass (object):
                                          self.ImageCapsuleSupport
                                          )
         self._Valid = True
-        return FmpCapsuleImageHeader + self.Payload + self.VendorCodeBytes
+        return [FmpCapsuleImageHeader] + ToBufferList (self.Payload) + ToBufferList (self.VendorCodeBytes)
 
     def Decode (self, Buffer):
         if len (Buffer) < self._StructSize:
@@ -128,8 +136,8 @@ class FmpCapsuleImageHeaderClass (object):
         print ('EFI_FIRMWARE_MANAGEMENT_CAPSULE_IMAGE_HEADER.UpdateVendorCodeSize   = {UpdateVendorCodeSize:08X}'.format (UpdateVendorCodeSize = self.UpdateVendorCodeSize))
         print ('EFI_FIRMWARE_MANAGEMENT_CAPSULE_IMAGE_HEADER.UpdateHardwareInstance = {UpdateHardwareInstance:016X}'.format (UpdateHardwareInstance = self.UpdateHardwareInstance))
         print ('EFI_FIRMWARE_MANAGEMENT_CAPSULE_IMAGE_HEADER.ImageCapsuleSupport    = {ImageCapsuleSupport:016X}'.format (ImageCapsuleSupport = self.ImageCapsuleSupport))
-        print ('sizeof (Payload)                                                    = {Size:08X}'.format (Size = len (self.Payload)))
-        print ('sizeof (VendorCodeBytes)                                            = {Size:08X}'.format (Size = len (self.VendorCodeBytes)))
+        print ('sizeof (Payload)                                                    = {Size:08X}'.format (Size = BufferListSize (self.Payload)))
+        print ('sizeof (VendorCodeBytes)                                            = {Size:08X}'.format (Size = BufferListSize (self.VendorCodeBytes)))
 
 class FmpCapsuleHeaderClass (object):
     # typedef struct {
@@ -192,6 +200,10 @@ class FmpCapsuleHeaderClass (object):
         return self._FmpCapsuleImageHeaderList[Index]
 
     def Encode (self):
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payloads are referenced instead of copied
+    def EncodeList (self):
         self.EmbeddedDriverCount = len (self._EmbeddedDriverList)
         self.PayloadItemCount    = len (self._PayloadList)
 
@@ -202,10 +214,12 @@ class FmpCapsuleHeaderClass (object):
                                     self.PayloadItemCount
                                     )
 
-        FmpCapsuleData = b''
+        FmpCapsuleData = []
+        self._ItemOffsetList = []
+        self._FmpCapsuleImageHeaderList = []
         Offset = self._StructSize + (self.EmbeddedDriverCount + self.PayloadItemCount) * self._ItemOffsetSize
         for EmbeddedDriver in self._EmbeddedDriverList:
-            FmpCapsuleData = FmpCapsuleData + EmbeddedDriver
+            FmpCapsuleData.append (EmbeddedDriver)
             self._ItemOffsetList.append (Offset)
             Offset = Offset + len (EmbeddedDriver)
         Index = 1
@@ -217,20 +231,20 @@ class FmpCapsuleHeaderClass (object):
             FmpCapsuleImageHeader.VendorCodeBytes        = VendorCodeBytes
             FmpCapsuleImageHeader.UpdateHardwareInstance = HardwareInstance
             FmpCapsuleImageHeader.ImageCapsuleSupport    = CapsuleSupport
-            FmpCapsuleImage = FmpCapsuleImageHeader.Encode ()
-            FmpCapsuleData = FmpCapsuleData + FmpCapsuleImage
+            FmpCapsuleImage = FmpCapsuleImageHeader.EncodeList ()
+            FmpCapsuleData.extend (FmpCapsuleImage)
 
             self._ItemOffsetList.append (Offset)
             self._FmpCapsuleImageHeaderList.append (FmpCapsuleImageHeader)
 
-            Offset = Offset + len (FmpCapsuleImage)
+            Offset = Offset + BufferListSize (FmpCapsuleImage)
             Index = Index + 1
 
         for Offset in self._ItemOffsetList:
           FmpCapsuleHeader = FmpCapsuleHeader + struct.pack (self._ItemOffsetFormat, Offset)
 
         self._Valid = True
-        return FmpCapsuleHeader + FmpCapsuleData
+        return [FmpCapsuleHeader] + FmpCapsuleData
 
     def Decode (self, Buffer):
         if len (Buffer) < self._StructSize:
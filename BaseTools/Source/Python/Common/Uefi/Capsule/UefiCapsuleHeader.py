@@ -11,6 +11,7 @@ UefiCapsuleHeader
 
 import struct
 import uuid
+from Common.Uefi.Capsule.BufferList import ToBufferList, BufferListSize
 
 class UefiCapsuleHeaderClass (object):
     # typedef struct {
@@ -61,6 +62,13 @@ class UefiCapsuleHeaderClass (object):
         self.Payload             = b''
 
     def Encode (self):
+        return b''.join (self.EncodeList ())
+
+    ## Encode to a list of buffers, the payload is referenced instead of copied
+    #
+    # The Payload may be a bytes-like object or a list of them.
+    #
+    def EncodeList (self):
         Flags = self.OemFlags
         if self.PersistAcrossReset:
             Flags = Flags | self._CAPSULE_FLAGS_PERSIST_ACROSS_RESET
@@ -69,7 +77,7 @@ class UefiCapsuleHeaderClass (object):
         if self.InitiateReset:
             Flags = Flags | self._CAPSULE_FLAGS_INITIATE_RESET
 
-        self.CapsuleImageSize = self.HeaderSize + len (self.Payload)
+        self.CapsuleImageSize = self.HeaderSize + BufferListSize (self.Payload)
 
         UefiCapsuleHeader = struct.pack (
                                      self._StructFormat,
@@ -80,7 +88,7 @@ class UefiCapsuleHeaderClass (object):
                                      0
                                      )
         self._Valid = True
-        return UefiCapsuleHeader + self.Payload
+        return [UefiCapsuleHeader] + ToBufferList (self.Payload)
 
     def Decode (self, Buffer):
         if len (Buffer) < self._StructSize:
@@ -127,4 +135,4 @@ class UefiCapsuleHeaderClass (object):
         if self.InitiateReset:
             print ('  CAPSULE_FLAGS_INITIATE_RESET')
         print ('EFI_CAPSULE_HEADER.CapsuleImageSize = {Size:08X}'.format (Size = self.CapsuleImageSize))
-        print ('sizeof (Payload)                    = {Size:08X}'.format (Size = len (self.Payload)))
+        print ('sizeof (Payload)                    = {Size:08X}'.format (Size = BufferListSize (self.Payload)))
@@ -8,6 +8,11 @@
 
 ## Import Modules
 #
+import re
+import os
+import pickle
+import hashlib
+import tempfile
 
 # for class function
 class cached_class_function(object):
@@ -39,3 +44,78 @@ class cached_basic_function(object):
         Value = self._function(*args,**kwargs)
         self.__dict__['_do'] = lambda self,*args,**kwargs:Value
         return Value
+
+# for module level regular expression, compiled on first use
+class lazy_regex(object):
+    def __init__(self, pattern, flags=0):
+        self._pattern = pattern
+        self._flags = flags
+    def __getattr__(self, Name):
+        # never compile for special method lookups (copy, pickle, ...)
+        if Name.startswith('__'):
+            raise AttributeError(Name)
+        Compiled = self.__dict__.get('_compiled')
+        if Compiled is None:
+            Compiled = self.__dict__['_compiled'] = re.compile(self.__dict__['_pattern'], self.__dict__['_flags'])
+        # keep the bound attribute so later lookups skip __getattr__
+        Value = self.__dict__[Name] = getattr(Compiled, Name)
+        return Value
+
+_missing = object()
+
+# for data parsed from the content of a file, keyed by the digest of the content
+#
+# Entries are kept in memory and, when a directory is given, also pickled into
+# it, so that other processes and later runs reuse them while the content
+# does not change. The entries on disk are kept in a sub-directory for each
+# source file, and only the one of its latest content is kept.
+class content_cache(object):
+    def __init__(self):
+        self._entries = {}
+    def get(self, content, parse, directory=None, source=None):
+        key = hashlib.md5(content).hexdigest()
+        if key in self._entries:
+            return self._entries[key]
+        path = None
+        if directory and source:
+            path = os.path.join(directory, hashlib.md5(os.path.normcase(os.path.abspath(source)).encode('utf-8')).hexdigest(), key)
+        value = self._load(path) if path else _missing
+        if value is _missing:
+            value = parse()
+            if path:
+                self._save(path, value)
+        self._entries[key] = value
+        return value
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, 'rb') as fd:
+                return pickle.load(fd)
+        except Exception:
+            return _missing
+    @staticmethod
+    def _save(path, value):
+        # write to a temporary file first, so readers never see a partial entry
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as output:
+                    pickle.dump(value, output, pickle.HIGHEST_PROTOCOL)
+                os.replace(temp, path)
+            except Exception:
+                os.remove(temp)
+                raise
+            # remove the entries of the previous contents of the source
+            for name in os.listdir(directory):
+                if name != os.path.basename(path) and not name.startswith('tmp'):
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass
+        except Exception:
+            # a cache which cannot be written is not an error
+            pass
+    def clear(self):
+        self._entries.clear()
@@ -1171,42 +1171,46 @@ class Eot(object):
                     EdkLogger.error("Eot", EdkLogger.EOT_ERROR, "Can not find file %s " % MapFile)
                 EotGlobalData.gMAP_FILE.append(MapFile)
 
+        self.PhaseTimes = []
+
         # Generate source file list
-        self.GenerateSourceFileList(self.SourceFileList, self.IncludeDirList)
+        self.RunPhase("Source file list", self.GenerateSourceFileList, self.SourceFileList, self.IncludeDirList)
 
         # Generate guid list of dec file list
-        self.ParseDecFile(self.DecFileList)
+        self.RunPhase("Dec files", self.ParseDecFile, self.DecFileList)
 
         # Generate guid list from GUID list file
-        self.ParseGuidList(self.GuidList)
+        self.RunPhase("Guid list", self.ParseGuidList, self.GuidList)
 
         # Init Eot database
-        EotGlobalData.gDb = Database.Database(Database.DATABASE_PATH)
-        EotGlobalData.gDb.InitDatabase(self.IsInit)
+        self.RunPhase("Database init", self.InitDatabase)
 
         # Build ECC database
-        self.BuildDatabase()
+        self.RunPhase("Database build", self.BuildDatabase)
 
         # Parse Ppi/Protocol
-        self.ParseExecutionOrder()
+        self.RunPhase("Ppi/Protocol search", self.ParseExecutionOrder)
 
         # Merge Identifier tables
-        self.GenerateQueryTable()
+        self.RunPhase("Query table", self.GenerateQueryTable)
 
         # Generate report database
-        self.GenerateReportDatabase()
+        self.RunPhase("Report database", self.GenerateReportDatabase)
 
         # Load Fv Info
-        self.LoadFvInfo()
+        self.RunPhase("Fv dispatch", self.LoadFvInfo)
 
         # Load Map Info
-        self.LoadMapInfo()
+        self.RunPhase("Map files", self.LoadMapInfo)
 
         # Generate Report
-        self.GenerateReport()
+        self.RunPhase("Report", self.GenerateReport)
 
         # Convert log file
-        self.ConvertLogFile(self.LogFile)
+        self.RunPhase("Log file", self.ConvertLogFile, self.LogFile)
+
+        for Phase, Duration in self.PhaseTimes:
+            EdkLogger.verbose("EOT phase %-20s %8.3f s" % (Phase, Duration))
 
         # DONE
         EdkLogger.quiet("EOT FINISHED!")
@@ -1214,6 +1218,29 @@ class Eot(object):
         # Close Database
         EotGlobalData.gDb.Close()
 
+    ## RunPhase() method
+    #
+    #  Run one phase of EOT and record the time it takes
+    #
+    #  @param self: The object pointer
+    #  @param Phase: Name of the phase
+    #  @param Function: The method running the phase
+    #
+    def RunPhase(self, Phase, Function, *Args):
+        StartTime = time.time()
+        Function(*Args)
+        self.PhaseTimes.append((Phase, time.time() - StartTime))
+
+    ## InitDatabase() method
+    #
+    #  Open the Eot database, a new one is created when IsInit is set
+    #
+    #  @param self: The object pointer
+    #
+    def InitDatabase(self):
+        EotGlobalData.gDb = Database.Database(Database.DATABASE_PATH)
+        EotGlobalData.gDb.InitDatabase(self.IsInit)
+
     ## ParseDecFile() method
     #
     #  parse DEC file and get all GUID names with GUID values as {GuidName : GuidValue}
@@ -1452,15 +1479,14 @@ class Eot(object):
     #
     def GenerateQueryTable(self):
         EdkLogger.quiet("Generating temp query table for analysis ... ")
-        for Identifier in EotGlobalData.gIdentifierTableList:
-            SqlCommand = """insert into Query (Name, Modifier, Value, Model)
-                            select Name, Modifier, Value, Model from %s where (Model = %s or Model = %s)""" \
-                            % (Identifier[0], MODEL_IDENTIFIER_VARIABLE, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION)
-            EotGlobalData.gDb.TblReport.Exec(SqlCommand)
-            SqlCommand = """insert into Query2 (Name, Modifier, Value, Model)
-                            select Name, Modifier, Value, Model from %s where Model = %s""" \
-                            % (Identifier[0], MODEL_IDENTIFIER_MACRO_DEFINE)
-            EotGlobalData.gDb.TblReport.Exec(SqlCommand)
+        SqlCommand = """insert into Query (Name, Modifier, Value, Model)
+                        select Name, Modifier, Value, Model from Identifier where Model in (%s, %s) order by ID""" \
+                        % (MODEL_IDENTIFIER_VARIABLE, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION)
+        EotGlobalData.gDb.TblReport.Exec(SqlCommand)
+        SqlCommand = """insert into Query2 (Name, Modifier, Value, Model)
+                        select Name, Modifier, Value, Model from Identifier where Model = %s order by ID""" \
+                        % MODEL_IDENTIFIER_MACRO_DEFINE
+        EotGlobalData.gDb.TblReport.Exec(SqlCommand)
 
     ## ParseExecutionOrder() method
     #
@@ -1473,76 +1499,55 @@ class Eot(object):
     def ParseExecutionOrder(self):
         EdkLogger.quiet("Searching Ppi/Protocol ... ")
         for Identifier in EotGlobalData.gIdentifierTableList:
-            ModuleID, ModuleName, ModuleGuid, SourceFileID, SourceFileFullPath, ItemName, ItemType, ItemMode, GuidName, GuidMacro, GuidValue, BelongsToFunction, Enabled = \
-            -1, '', '', -1, '', '', '', '', '', '', '', '', 0
-
             SourceFileID = Identifier[0].replace('Identifier', '')
             SourceFileFullPath = Identifier[1]
-            Identifier = Identifier[0]
+            FileID = int(SourceFileID)
 
             # Find Ppis
             ItemMode = 'Produced'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.InstallPpi', '->InstallPpi', 'PeiInstallPpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchPpi(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.InstallPpi', '->InstallPpi', 'PeiInstallPpi'))
+            SearchPpi(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode)
 
             ItemMode = 'Produced'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.ReInstallPpi', '->ReInstallPpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchPpi(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 2)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.ReInstallPpi', '->ReInstallPpi'))
+            SearchPpi(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 2)
 
-            SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode)
+            SearchPpiCallFunction(SourceFileID, SourceFileFullPath, ItemMode)
 
             ItemMode = 'Consumed'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.LocatePpi', '->LocatePpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchPpi(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.LocatePpi', '->LocatePpi'))
+            SearchPpi(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode)
 
-            SearchFunctionCalling(Identifier, SourceFileID, SourceFileFullPath, 'Ppi', ItemMode)
+            SearchFunctionCalling(SourceFileID, SourceFileFullPath, 'Ppi', ItemMode)
 
             ItemMode = 'Callback'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.NotifyPpi', '->NotifyPpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchPpi(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.NotifyPpi', '->NotifyPpi'))
+            SearchPpi(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode)
 
             # Find Protocols
             ItemMode = 'Produced'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%' or Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.InstallProtocolInterface', '.ReInstallProtocolInterface', '->InstallProtocolInterface', '->ReInstallProtocolInterface', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchProtocols(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 1)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.InstallProtocolInterface', '.ReInstallProtocolInterface', '->InstallProtocolInterface', '->ReInstallProtocolInterface'))
+            SearchProtocols(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 1)
 
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.InstallMultipleProtocolInterfaces', '->InstallMultipleProtocolInterfaces', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchProtocols(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 2)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.InstallMultipleProtocolInterfaces', '->InstallMultipleProtocolInterfaces'))
+            SearchProtocols(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 2)
 
-            SearchFunctionCalling(Identifier, SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
+            SearchFunctionCalling(SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
 
             ItemMode = 'Consumed'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.LocateProtocol', '->LocateProtocol', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchProtocols(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 0)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.LocateProtocol', '->LocateProtocol'))
+            SearchProtocols(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 0)
 
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.HandleProtocol', '->HandleProtocol', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchProtocols(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 1)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.HandleProtocol', '->HandleProtocol'))
+            SearchProtocols(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 1)
 
-            SearchFunctionCalling(Identifier, SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
+            SearchFunctionCalling(SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
 
             ItemMode = 'Callback'
-            SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                            where (Name like '%%%s%%' or Name like '%%%s%%') and Model = %s""" \
-                            % (Identifier, '.RegisterProtocolNotify', '->RegisterProtocolNotify', MODEL_IDENTIFIER_FUNCTION_CALLING)
-            SearchProtocols(SqlCommand, Identifier, SourceFileID, SourceFileFullPath, ItemMode, 0)
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('.RegisterProtocolNotify', '->RegisterProtocolNotify'))
+            SearchProtocols(RecordSet.get(FileID, []), SourceFileID, SourceFileFullPath, ItemMode, 0)
 
-            SearchFunctionCalling(Identifier, SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
+            SearchFunctionCalling(SourceFileID, SourceFileFullPath, 'Protocol', ItemMode)
 
         # Hard Code
         EotGlobalData.gDb.TblReport.Insert(-2, '', '', -1, '', '', 'Ppi', 'Produced', 'gEfiSecPlatformInformationPpiGuid', '', '', '', 0)
@@ -1577,6 +1582,7 @@ class Eot(object):
             EdkLogger.quiet("Building database for source code done!")
 
         EotGlobalData.gIdentifierTableList = GetTableList((MODEL_FILE_C, MODEL_FILE_H), 'Identifier', EotGlobalData.gDb)
+        BuildIdentifierTable(EotGlobalData.gDb, EotGlobalData.gIdentifierTableList)
 
     ## BuildMetaDataFileDatabase() method
     #
@@ -199,6 +199,56 @@ def GetTableList(FileModelList, Table, Db):
 
     return TableList
 
+## BuildIdentifierTable() method
+#
+#  Merge the identifier tables of all source files into the indexed table
+#  Identifier, so that searches run once for all files instead of once for
+#  each per file table
+#
+#  @param  Db: Eot database
+#  @param  TableList: A list of identifier tables got by GetTableList
+#
+def BuildIdentifierTable(Db, TableList):
+    _SearchCache.clear()
+    Db.TblIdentifier.Drop()
+    Db.TblIdentifier.Create()
+    for Table in TableList:
+        SqlCommand = """insert into Identifier (Modifier, Type, Name, Value, Model, BelongsToFile, BelongsToFunction,
+                                                StartLine, StartColumn, EndLine, EndColumn)
+                        select Modifier, Type, Name, Value, Model, BelongsToFile, BelongsToFunction,
+                               StartLine, StartColumn, EndLine, EndColumn from %s order by ID""" % Table[0]
+        Db.TblIdentifier.Exec(SqlCommand)
+    Db.TblIdentifier.Exec("""create index IdentifierFileModelName on Identifier(BelongsToFile, Model, Name)""")
+    Db.TblIdentifier.Exec("""create index IdentifierModel on Identifier(Model)""")
+    Db.TblFunction.Exec("""create index IF NOT EXISTS FunctionFileLine on Function(BelongsToFile, StartLine)""")
+    Db.Conn.commit()
+
+## Results of SearchIdentifiers, valid until the Identifier table is rebuilt
+_SearchCache = {}
+
+## SearchIdentifiers() method
+#
+#  Search the identifiers of all files whose column contains one of the
+#  patterns, in a single query. The result is cached for the other files.
+#
+#  @param  Model: Model of the identifiers
+#  @param  Patterns: A tuple of strings to search
+#  @param  Column: The column to search, Name or Value
+#
+#  @return: A dict of {FileID : [(Value, Name, BelongsToFile, StartLine, EndLine), ...]}
+#
+def SearchIdentifiers(Model, Patterns, Column='Name'):
+    Key = (Model, Patterns, Column)
+    if Key not in _SearchCache:
+        Condition = ' or '.join("%s like '%%%s%%'" % (Column, Pattern) for Pattern in Patterns)
+        SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from Identifier
+                        where (%s) and Model = %s order by ID""" % (Condition, Model)
+        Result = {}
+        for Record in EotGlobalData.gDb.TblIdentifier.Exec(SqlCommand):
+            Result.setdefault(int(Record[2]), []).append(Record)
+        _SearchCache[Key] = Result
+    return _SearchCache[Key]
+
 ## GetAllIncludeDir() method
 #
 #  Find all Include directories
@@ -394,19 +444,15 @@ def SearchBelongsToFunction(BelongsToFile, StartLine, EndLine):
 #  Search all used PPI calling function 'PeiServicesReInstallPpi' and 'PeiServicesInstallPpi'
 #  Store the result to database
 #
-#  @param Identifier: Table id
 #  @param SourceFileID: Source file id
 #  @param SourceFileFullPath: Source file full path
 #  @param ItemMode: Mode of the item
 #
-def SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode):
+def SearchPpiCallFunction(SourceFileID, SourceFileFullPath, ItemMode):
     ItemName, ItemType, GuidName, GuidMacro, GuidValue = '', 'Ppi', '', '', ''
-    SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                    where (Name like '%%%s%%' and Model = %s)""" \
-                    % (Identifier, 'PeiServicesReInstallPpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
     BelongsToFunctionID, BelongsToFunction = -1, ''
     Db = EotGlobalData.gDb.TblReport
-    RecordSet = Db.Exec(SqlCommand)
+    RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('PeiServicesReInstallPpi',)).get(int(SourceFileID), [])
     for Record in RecordSet:
         Index = 0
         BelongsToFile, StartLine, EndLine = Record[2], Record[3], Record[4]
@@ -422,8 +468,8 @@ def SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode
             if Variable.startswith('&'):
                 Variable = Variable[1:]
             # Get variable value
-            SqlCommand = """select Value from %s where (Name like '%%%s%%') and Model = %s""" \
-                         % (Identifier, Variable, MODEL_IDENTIFIER_VARIABLE)
+            SqlCommand = """select Value from Identifier where BelongsToFile = %s and Model = %s and (Name like '%%%s%%') order by ID""" \
+                         % (SourceFileID, MODEL_IDENTIFIER_VARIABLE, Variable)
             NewRecordSet = Db.Exec(SqlCommand)
             if NewRecordSet:
                 NewRecord = NewRecordSet[0][0]
@@ -440,18 +486,9 @@ def SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode
                             EotGlobalData.gOP_UN_MATCHED.write('%s, %s, %s, %s, %s, %s\n' % (ItemType, ItemMode, SourceFileID, SourceFileFullPath, StartLine, NewParameter))
 
     ItemName, ItemType, GuidName, GuidMacro, GuidValue = '', 'Ppi', '', '', ''
-    SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                    where (Value like '%%%s%%' and Model = %s)""" \
-                    % (Identifier, 'PeiServicesInstallPpi', MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION)
     BelongsToFunctionID, BelongsToFunction = -1, ''
-    Db = EotGlobalData.gDb.TblReport
-    RecordSet = Db.Exec(SqlCommand)
-
-    SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
-                    where (Name like '%%%s%%' and Model = %s)""" \
-                    % (Identifier, 'PeiServicesInstallPpi', MODEL_IDENTIFIER_FUNCTION_CALLING)
-    Db = EotGlobalData.gDb.TblReport
-    RecordSet2 = Db.Exec(SqlCommand)
+    RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION, ('PeiServicesInstallPpi',), 'Value').get(int(SourceFileID), [])
+    RecordSet2 = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, ('PeiServicesInstallPpi',)).get(int(SourceFileID), [])
 
     for Record in RecordSet + RecordSet2:
         if Record == []:
@@ -469,8 +506,8 @@ def SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode
         if Variable.startswith('&'):
             Variable = Variable[1:]
         # Get variable value
-        SqlCommand = """select Value from %s where (Name like '%%%s%%') and Model = %s""" \
-                     % (Identifier, Variable, MODEL_IDENTIFIER_VARIABLE)
+        SqlCommand = """select Value from Identifier where BelongsToFile = %s and Model = %s and (Name like '%%%s%%') order by ID""" \
+                     % (SourceFileID, MODEL_IDENTIFIER_VARIABLE, Variable)
         NewRecordSet = Db.Exec(SqlCommand)
         if NewRecordSet:
             NewRecord = NewRecordSet[0][0]
@@ -490,18 +527,16 @@ def SearchPpiCallFunction(Identifier, SourceFileID, SourceFileFullPath, ItemMode
 #  Search all used PPI calling function
 #  Store the result to database
 #
-#  @param SqlCommand: SQL command statement
-#  @param Table: Table id
+#  @param RecordSet: The calling records of the file got by SearchIdentifiers
 #  @param SourceFileID: Source file id
 #  @param SourceFileFullPath: Source file full path
 #  @param ItemMode: Mode of the item
 #  @param PpiMode: Mode of PPI
 #
-def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, PpiMode = 1):
+def SearchPpi(RecordSet, SourceFileID, SourceFileFullPath, ItemMode, PpiMode = 1):
     ItemName, ItemType, GuidName, GuidMacro, GuidValue = '', 'Ppi', '', '', ''
     BelongsToFunctionID, BelongsToFunction = -1, ''
     Db = EotGlobalData.gDb.TblReport
-    RecordSet = Db.Exec(SqlCommand)
     for Record in RecordSet:
         Parameter = GetPpiParameter(Record[0], PpiMode)
         BelongsToFile, StartLine, EndLine = Record[2], Record[3], Record[4]
@@ -520,7 +555,8 @@ def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, Ppi
             continue
 
         # Direct Parameter.Guid
-        SqlCommand = """select Value from %s where (Name like '%%%s.Guid%%' or Name like '%%%s->Guid%%') and Model = %s""" % (Table, Parameter, Parameter, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION)
+        SqlCommand = """select Value from Identifier where BelongsToFile = %s and Model = %s and (Name like '%%%s.Guid%%' or Name like '%%%s->Guid%%') order by ID""" \
+                     % (SourceFileID, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION, Parameter, Parameter)
         NewRecordSet = Db.Exec(SqlCommand)
         for NewRecord in NewRecordSet:
             GuidName = GetParameterName(NewRecord[0])
@@ -532,7 +568,7 @@ def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, Ppi
             Key = Parameter
             if Key.rfind(' ') > -1:
                 Key = Key[Key.rfind(' ') : ].strip().replace('&', '')
-            Value = FindKeyValue(EotGlobalData.gDb.TblFile, Table, Key)
+            Value = FindKeyValue(EotGlobalData.gDb.TblIdentifier, SourceFileID, Key)
             List = GetSplitValueList(Value.replace('\n', ''), TAB_COMMA_SPLIT)
             if len(List) > 1:
                 GuidName = GetParameterName(List[1])
@@ -547,7 +583,8 @@ def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, Ppi
                 try:
                     Index = int(Parameter[Start + 1 : End])
                     Parameter = Parameter[0 : Start]
-                    SqlCommand = """select Value from %s where Name = '%s' and Model = %s""" % (Table, Parameter, MODEL_IDENTIFIER_VARIABLE)
+                    SqlCommand = """select Value from Identifier where BelongsToFile = %s and Model = %s and Name = '%s' order by ID""" \
+                                 % (SourceFileID, MODEL_IDENTIFIER_VARIABLE, Parameter)
                     NewRecordSet = Db.Exec(SqlCommand)
                     for NewRecord in NewRecordSet:
                         NewParameter = GetSplitValueList(NewRecord[0], '}')[Index]
@@ -564,8 +601,8 @@ def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, Ppi
                             and Inf.Model = %s and Inf.Value1 = File.FullPath and File.Model = %s""" % (SourceFileFullPath, MODEL_EFI_SOURCE_FILE, MODEL_FILE_C)
             NewRecordSet = Db.Exec(SqlCommand)
             for NewRecord in NewRecordSet:
-                Table = 'Identifier' + str(NewRecord[0])
-                SqlCommand = """select Value from %s where Name = '%s' and Modifier = 'EFI_PEI_PPI_DESCRIPTOR' and Model = %s""" % (Table, Parameter, MODEL_IDENTIFIER_VARIABLE)
+                SqlCommand = """select Value from Identifier where BelongsToFile = %s and Model = %s and Name = '%s' and Modifier = 'EFI_PEI_PPI_DESCRIPTOR' order by ID""" \
+                             % (NewRecord[0], MODEL_IDENTIFIER_VARIABLE, Parameter)
                 PpiSet = Db.Exec(SqlCommand)
                 if PpiSet != []:
                     GuidName = GetPpiParameter(PpiSet[0][0])
@@ -582,18 +619,16 @@ def SearchPpi(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, Ppi
 #  Search all used PROTOCOL calling function
 #  Store the result to database
 #
-#  @param SqlCommand: SQL command statement
-#  @param Table: Table id
+#  @param RecordSet: The calling records of the file got by SearchIdentifiers
 #  @param SourceFileID: Source file id
 #  @param SourceFileFullPath: Source file full path
 #  @param ItemMode: Mode of the item
 #  @param ProtocolMode: Mode of PROTOCOL
 #
-def SearchProtocols(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMode, ProtocolMode):
+def SearchProtocols(RecordSet, SourceFileID, SourceFileFullPath, ItemMode, ProtocolMode):
     ItemName, ItemType, GuidName, GuidMacro, GuidValue = '', 'Protocol', '', '', ''
     BelongsToFunctionID, BelongsToFunction = -1, ''
     Db = EotGlobalData.gDb.TblReport
-    RecordSet = Db.Exec(SqlCommand)
     for Record in RecordSet:
         Parameter = ''
         BelongsToFile, StartLine, EndLine = Record[2], Record[3], Record[4]
@@ -618,7 +653,7 @@ def SearchProtocols(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMod
                     Db.Insert(-1, '', '', SourceFileID, SourceFileFullPath, ItemName, ItemType, ItemMode, GuidName, GuidMacro, GuidValue, BelongsToFunction, 0)
                     IsFound = True
                 else:
-                    NewValue = FindKeyValue(EotGlobalData.gDb.TblFile, Table, Protocol)
+                    NewValue = FindKeyValue(EotGlobalData.gDb.TblIdentifier, SourceFileID, Protocol)
                     if Protocol != NewValue and NewValue.endswith('Guid'):
                         GuidName = GetParameterName(NewValue)
                         Db.Insert(-1, '', '', SourceFileID, SourceFileFullPath, ItemName, ItemType, ItemMode, GuidName, GuidMacro, GuidValue, BelongsToFunction, 0)
@@ -635,14 +670,12 @@ def SearchProtocols(SqlCommand, Table, SourceFileID, SourceFileFullPath, ItemMod
 #  Search all used PPI/PROTOCOL calling function by library
 #  Store the result to database
 #
-#  @param SqlCommand: SQL command statement
-#  @param Table: Table id
 #  @param SourceFileID: Source file id
 #  @param SourceFileFullPath: Source file full path
 #  @param ItemType: Type of the item, PPI or PROTOCOL
 #  @param ItemMode: Mode of item
 #
-def SearchFunctionCalling(Table, SourceFileID, SourceFileFullPath, ItemType, ItemMode):
+def SearchFunctionCalling(SourceFileID, SourceFileFullPath, ItemType, ItemMode):
     LibraryList = {}
     Db = EotGlobalData.gDb.TblReport
     Parameters, ItemName, GuidName, GuidMacro, GuidValue, BelongsToFunction = [], '', '', '', '', ''
@@ -659,10 +692,7 @@ def SearchFunctionCalling(Table, SourceFileID, SourceFileFullPath, ItemType, Ite
 
     for Library in LibraryList:
         Index = LibraryList[Library]
-        SqlCommand = """select Value, StartLine from %s
-                        where Name like '%%%s%%' and Model = %s""" \
-                        % (Table, Library, MODEL_IDENTIFIER_FUNCTION_CALLING)
-        RecordSet = Db.Exec(SqlCommand)
+        RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, (Library,)).get(int(SourceFileID), [])
         for Record in RecordSet:
             IsFound = False
             if Index == -1:
@@ -671,7 +701,7 @@ def SearchFunctionCalling(Table, SourceFileID, SourceFileFullPath, ItemType, Ite
                     Parameters.append(GetParameterName(Parameter))
             else:
                 Parameters = [GetProtocolParameter(Record[0], Index)]
-            StartLine = Record[1]
+            StartLine = Record[3]
             for Parameter in Parameters:
                 if Parameter.startswith('g') or Parameter.endswith('Guid') or Parameter == 'ShellEnvProtocol' or Parameter == 'ShellInterfaceProtocol':
                     GuidName = GetParameterName(Parameter)
@@ -760,19 +790,20 @@ def GetParameterName(Parameter):
 #
 # Find key value of a variable
 #
-#  @param Db: Database to be searched
-#  @param Table: Table to be searched
+#  @param Db: Table of the identifiers to be searched
+#  @param FileID: The file whose identifiers are searched
 #  @param Key: The keyword
 #
 #  @return Value: The value of the keyword
 #
-def FindKeyValue(Db, Table, Key):
-    SqlCommand = """select Value from %s where Name = '%s' and (Model = %s or Model = %s)""" % (Table, Key, MODEL_IDENTIFIER_VARIABLE, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION)
+def FindKeyValue(Db, FileID, Key):
+    SqlCommand = """select Value from %s where BelongsToFile = %s and Model in (%s, %s) and Name = '%s' order by ID""" \
+                 % (Db.Table, FileID, MODEL_IDENTIFIER_VARIABLE, MODEL_IDENTIFIER_ASSIGNMENT_EXPRESSION, Key)
     RecordSet = Db.Exec(SqlCommand)
     Value = ''
     for Record in RecordSet:
         if Record[0] != 'NULL':
-            Value = FindKeyValue(Db, Table, GetParameterName(Record[0]))
+            Value = FindKeyValue(Db, FileID, GetParameterName(Record[0]))
 
     if Value != '':
         return Value
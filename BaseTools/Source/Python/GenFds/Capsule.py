@@ -220,7 +220,8 @@ class Capsule (CapsuleClassObject):
                                 CapOutputFile,
                                 [self.CapInfFileName],
                                 Capsule=True,
-                                FfsList=CapFileList
+                                FfsList=CapFileList,
+                                FdfSection='Capsule.' + self.UiCapsuleName
                                 )
 
         GenFdsGlobalVariable.VerboseLogger( "\nGenerate %s Capsule Successfully" %self.UiCapsuleName)
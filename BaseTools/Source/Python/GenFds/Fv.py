@@ -160,7 +160,8 @@ class FV (object):
                                     AddressFile=FvInfoFileName,
                                     FfsList=FfsFileList,
                                     ForceRebase=self.FvForceRebase,
-                                    FileSystemGuid=FFSGuid
+                                    FileSystemGuid=FFSGuid,
+                                    FdfSection='FV.' + self.UiFvName
                                     )
 
             NewFvInfo = None
@@ -193,7 +194,8 @@ class FV (object):
                                                 AddressFile=FvInfoFileName,
                                                 FfsList=FfsFileList,
                                                 ForceRebase=self.FvForceRebase,
-                                                FileSystemGuid=FFSGuid
+                                                FileSystemGuid=FFSGuid,
+                                                FdfSection='FV.' + self.UiFvName
                                                 )
 
             #
@@ -38,6 +38,9 @@ from .FfsFileStatement import FileStatement
 import Common.DataType as DataType
 from struct import Struct
 
+## Files in the FFS directory giving the name of the FFS file of a FILE statement
+gFfsNameFilePattern = compile(r'\S+(.ui)$|\S+(fv.sec.txt)$|\S+(.pe32.txt)$|\S+(.te.txt)$|\S+(.pic.txt)$|\S+(.raw.txt)$|\S+(.ffs.txt)$')
+
 ## Version and Copyright
 versionNumber = "1.0" + ' ' + gBUILD_VERSION
 __version__ = "%prog Version " + versionNumber
@@ -81,7 +84,9 @@ def resetFdsGlobalVariable():
     GenFdsGlobalVariable.SharpCounter = 0
     GenFdsGlobalVariable.SharpNumberPerLine = 40
     GenFdsGlobalVariable.FdfFile = ''
-    GenFdsGlobalVariable.FdfFileTimeStamp = 0
+    GenFdsGlobalVariable.FdfSectionDict = {}
+    GenFdsGlobalVariable.FileDigestCache = {}
+    GenFdsGlobalVariable.PendingDigestDict = {}
     GenFdsGlobalVariable.FixedLoadAddress = False
     GenFdsGlobalVariable.PlatformName = ''
 
@@ -160,7 +165,7 @@ def GenFdsApi(FdsCommandDict, WorkSpaceDataBase=None):
                 EdkLogger.error("GenFds", FILE_NOT_FOUND, ExtraData=FdfFilename)
 
             GenFdsGlobalVariable.FdfFile = FdfFilename
-            GenFdsGlobalVariable.FdfFileTimeStamp = os.path.getmtime(FdfFilename)
+            GenFdsGlobalVariable.FdfSectionDict = GenFdsGlobalVariable.GetFdfSectionDict(FdfFilename)
         else:
             EdkLogger.error("GenFds", OPTION_MISSING, "Missing FDF filename")
 
@@ -670,20 +675,119 @@ class GenFds(object):
             ModuleObj = BuildDb.BuildObject[Key, TAB_COMMON, GenFdsGlobalVariable.TargetName, GenFdsGlobalVariable.ToolChainTag]
             print(ModuleObj.BaseName + ' ' + ModuleObj.ModuleType)
 
+    ## Find the files giving the name of the FFS file of a FILE statement
+    #
+    #   @param  FileStatementGuid   The GUID of the FILE statement
+    #
+    #   @retval list    The UI sections, or else the command files of the sections
+    #                   of the FFS file, empty if the FFS file is not generated
+    #
+    @staticmethod
+    def _GetFileStatementNameFiles(FileStatementGuid):
+        FfsPath = glob(os.path.join(GenFdsGlobalVariable.FvDir, 'Ffs', FileStatementGuid) + TAB_STAR)
+        if not FfsPath or not os.path.exists(FfsPath[0]):
+            return []
+        MatchDict = {}
+        for File in os.listdir(FfsPath[0]):
+            Match = gFfsNameFilePattern.search(File)
+            if Match:
+                for Index in range(1, 8):
+                    if Match.group(Index):
+                        MatchDict.setdefault(Match.group(Index), []).append(os.path.join(FfsPath[0], File))
+        for Ext in ('.ui', 'fv.sec.txt', '.pe32.txt', '.te.txt', '.pic.txt', '.raw.txt', '.ffs.txt'):
+            if Ext in MatchDict:
+                return MatchDict[Ext]
+        return []
+
+    ## Get the name of the FFS file of a FILE statement
+    #
+    #   @param  NameFileList    The files found by _GetFileStatementNameFiles()
+    #
+    @staticmethod
+    def _GetFileStatementName(NameFileList):
+        Name = []
+        # the UI sections are preferred to the command files
+        if NameFileList[0].endswith('ui'):
+            for File in NameFileList:
+                with open(File, 'rb') as F:
+                    F.read()
+                    length = F.tell()
+                    F.seek(4)
+                    TmpStr = unpack('%dh' % ((length - 4) // 2), F.read())
+                    Name = ''.join(chr(c) for c in TmpStr[:-1])
+        else:
+            for File in NameFileList:
+                with open(File, 'r') as F:
+                    Name.append((F.read().split()[-1]))
+        return ' '.join(Name) if isinstance(Name, type([])) else Name
+
+    ## Generate the GUID cross reference file Guid.xref
+    #
+    #   Each module is taken once, from the first arch it is built for. The file
+    #   is only generated again if the meta files, the FFS files of the FILE
+    #   statements or the build options it is generated from are changed.
+    #
+    #   @param  BuildDb         Database from build meta data files
+    #   @param  ArchList        The Arch list of platform
+    #   @param  FdfParserObj    FDF contents parser
+    #
     @staticmethod
     def GenerateGuidXRefFile(BuildDb, ArchList, FdfParserObj):
         GuidXRefFileName = os.path.join(GenFdsGlobalVariable.FvDir, "Guid.xref")
+        Target = GenFdsGlobalVariable.TargetName
+        ToolChain = GenFdsGlobalVariable.ToolChainTag
+        PlatformDict = {}
+        PackageDict = {}
+        ModuleSet = set()
+        FileGuidSet = set()
+        # Modules and FILE statements of each arch, as (INF file, IsFdfModule) or (GUID, name files)
+        XRefItemDict = {}
+        MetaFileList = [GenFdsGlobalVariable.ActivePlatform.Path, GenFdsGlobalVariable.FdfFile]
+        MetaFileList.extend(IncludedFile.FileName for IncludedFile in FdfParserObj.GetAllIncludedFile())
+        for Arch in ArchList:
+            PlatformDataBase = BuildDb.BuildObject[GenFdsGlobalVariable.ActivePlatform, Arch, Target, ToolChain]
+            PlatformDict[Arch] = PlatformDataBase
+            XRefItemList = XRefItemDict[Arch] = []
+            MetaFileList.extend(sorted(str(File) for File in PlatformDataBase._RawData.IncludedFiles))
+            # The package objects of each arch are kept, their GUIDs depend on the arch
+            PackageDict[Arch] = GenFdsGlobalVariable.WorkSpace.GetPackageList(GenFdsGlobalVariable.ActivePlatform, Arch, Target, ToolChain)
+            for ModuleFile in PlatformDataBase.Modules:
+                if ModuleFile not in ModuleSet:
+                    ModuleSet.add(ModuleFile)
+                    XRefItemList.append((ModuleFile, False))
+            if Arch != ArchList[0]:
+                continue
+            for FvName in FdfParserObj.Profile.FvDict:
+                for FfsObj in FdfParserObj.Profile.FvDict[FvName].FfsList:
+                    if not isinstance(FfsObj, FileStatement):
+                        InfPath = PathClass(NormPath(mws.join(GenFdsGlobalVariable.WorkSpaceDir, FfsObj.InfFileName)))
+                        if InfPath not in ModuleSet:
+                            ModuleSet.add(InfPath)
+                            XRefItemList.append((InfPath, True))
+                    elif FfsObj.NameGuid not in FileGuidSet:
+                        FileGuidSet.add(FfsObj.NameGuid)
+                        NameFileList = GenFds._GetFileStatementNameFiles(FfsObj.NameGuid)
+                        if NameFileList:
+                            XRefItemList.append((FfsObj.NameGuid, NameFileList))
+                            MetaFileList.extend(NameFileList)
+        for Arch in ArchList:
+            MetaFileList.extend(str(Item) for Item, Data in XRefItemDict[Arch] if not isinstance(Data, list))
+        MetaFileList.extend(dict.fromkeys(P.MetaFile.Path for Arch in ArchList for P in PackageDict[Arch]))
+        BuildOptionList = ArchList + [Target, ToolChain] + \
+                          ['%s=%s' % Item for Item in sorted(GlobalData.gGlobalDefines.items())] + \
+                          [str(Pcd) for Pcd in GlobalData.BuildOptionPcd]
+        if not GenFdsGlobalVariable.NeedsUpdate(GuidXRefFileName, MetaFileList, BuildOptionList):
+            GenFdsGlobalVariable.InfLogger("\nGUID cross reference file can be found at %s" % GuidXRefFileName)
+            return
+
         GuidXRefFile = []
         PkgGuidDict = {}
         GuidDict = {}
-        ModuleList = []
-        FileGuidList = []
         VariableGuidSet = set()
         for Arch in ArchList:
-            PlatformDataBase = BuildDb.BuildObject[GenFdsGlobalVariable.ActivePlatform, Arch, GenFdsGlobalVariable.TargetName, GenFdsGlobalVariable.ToolChainTag]
-            PkgList = GenFdsGlobalVariable.WorkSpace.GetPackageList(GenFdsGlobalVariable.ActivePlatform, Arch, GenFdsGlobalVariable.TargetName, GenFdsGlobalVariable.ToolChainTag)
-            for P in PkgList:
+            for P in PackageDict[Arch]:
                 PkgGuidDict.update(P.Guids)
+            PlatformDataBase = PlatformDict[Arch]
             for Name, Guid in PlatformDataBase.Pcds:
                 Pcd = PlatformDataBase.Pcds[Name, Guid]
                 if Pcd.Type in [TAB_PCDS_DYNAMIC_HII, TAB_PCDS_DYNAMIC_EX_HII]:
@@ -691,92 +795,22 @@ class GenFds(object):
                         Sku = Pcd.SkuInfoList[SkuId]
                         if Sku.VariableGuid in VariableGuidSet:continue
                         VariableGuidSet.add(Sku.VariableGuid)
-                        if Sku.VariableGuid and Sku.VariableGuid in PkgGuidDict.keys():
+                        if Sku.VariableGuid and Sku.VariableGuid in PkgGuidDict:
                             GuidDict[Sku.VariableGuid] = PkgGuidDict[Sku.VariableGuid]
-            for ModuleFile in PlatformDataBase.Modules:
-                Module = BuildDb.BuildObject[ModuleFile, Arch, GenFdsGlobalVariable.TargetName, GenFdsGlobalVariable.ToolChainTag]
-                if Module in ModuleList:
+            for Item, Data in XRefItemDict[Arch]:
+                if isinstance(Data, list):
+                    Name = GenFds._GetFileStatementName(Data)
+                    if Name:
+                        GuidXRefFile.append("%s %s\n" % (Item, Name))
                     continue
-                else:
-                    ModuleList.append(Module)
-                if GlobalData.gGuidPattern.match(ModuleFile.BaseName):
-                    GuidXRefFile.append("%s %s\n" % (ModuleFile.BaseName, Module.BaseName))
+                Module = BuildDb.BuildObject[Item, Arch, Target, ToolChain]
+                if not Data and GlobalData.gGuidPattern.match(Item.BaseName):
+                    GuidXRefFile.append("%s %s\n" % (Item.BaseName, Module.BaseName))
                 else:
                     GuidXRefFile.append("%s %s\n" % (Module.Guid, Module.BaseName))
                 GuidDict.update(Module.Protocols)
                 GuidDict.update(Module.Guids)
                 GuidDict.update(Module.Ppis)
-            for FvName in FdfParserObj.Profile.FvDict:
-                for FfsObj in FdfParserObj.Profile.FvDict[FvName].FfsList:
-                    if not isinstance(FfsObj, FileStatement):
-                        InfPath = PathClass(NormPath(mws.join(GenFdsGlobalVariable.WorkSpaceDir, FfsObj.InfFileName)))
-                        FdfModule = BuildDb.BuildObject[InfPath, Arch, GenFdsGlobalVariable.TargetName, GenFdsGlobalVariable.ToolChainTag]
-                        if FdfModule in ModuleList:
-                            continue
-                        else:
-                            ModuleList.append(FdfModule)
-                        GuidXRefFile.append("%s %s\n" % (FdfModule.Guid, FdfModule.BaseName))
-                        GuidDict.update(FdfModule.Protocols)
-                        GuidDict.update(FdfModule.Guids)
-                        GuidDict.update(FdfModule.Ppis)
-                    else:
-                        FileStatementGuid = FfsObj.NameGuid
-                        if FileStatementGuid in FileGuidList:
-                            continue
-                        else:
-                            FileGuidList.append(FileStatementGuid)
-                        Name = []
-                        FfsPath = os.path.join(GenFdsGlobalVariable.FvDir, 'Ffs')
-                        FfsPath = glob(os.path.join(FfsPath, FileStatementGuid) + TAB_STAR)
-                        if not FfsPath:
-                            continue
-                        if not os.path.exists(FfsPath[0]):
-                            continue
-                        MatchDict = {}
-                        ReFileEnds = compile('\S+(.ui)$|\S+(fv.sec.txt)$|\S+(.pe32.txt)$|\S+(.te.txt)$|\S+(.pic.txt)$|\S+(.raw.txt)$|\S+(.ffs.txt)$')
-                        FileList = os.listdir(FfsPath[0])
-                        for File in FileList:
-                            Match = ReFileEnds.search(File)
-                            if Match:
-                                for Index in range(1, 8):
-                                    if Match.group(Index) and Match.group(Index) in MatchDict:
-                                        MatchDict[Match.group(Index)].append(File)
-                                    elif Match.group(Index):
-                                        MatchDict[Match.group(Index)] = [File]
-                        if not MatchDict:
-                            continue
-                        if '.ui' in MatchDict:
-                            for File in MatchDict['.ui']:
-                                with open(os.path.join(FfsPath[0], File), 'rb') as F:
-                                    F.read()
-                                    length = F.tell()
-                                    F.seek(4)
-                                    TmpStr = unpack('%dh' % ((length - 4) // 2), F.read())
-                                    Name = ''.join(chr(c) for c in TmpStr[:-1])
-                        else:
-                            FileList = []
-                            if 'fv.sec.txt' in MatchDict:
-                                FileList = MatchDict['fv.sec.txt']
-                            elif '.pe32.txt' in MatchDict:
-                                FileList = MatchDict['.pe32.txt']
-                            elif '.te.txt' in MatchDict:
-                                FileList = MatchDict['.te.txt']
-                            elif '.pic.txt' in MatchDict:
-                                FileList = MatchDict['.pic.txt']
-                            elif '.raw.txt' in MatchDict:
-                                FileList = MatchDict['.raw.txt']
-                            elif '.ffs.txt' in MatchDict:
-                                FileList = MatchDict['.ffs.txt']
-                            else:
-                                pass
-                            for File in FileList:
-                                with open(os.path.join(FfsPath[0], File), 'r') as F:
-                                    Name.append((F.read().split()[-1]))
-                        if not Name:
-                            continue
-
-                        Name = ' '.join(Name) if isinstance(Name, type([])) else Name
-                        GuidXRefFile.append("%s %s\n" %(FileStatementGuid, Name))
 
        # Append GUIDs, Protocols, and PPIs to the Xref file
         GuidXRefFile.append("\n")
@@ -786,6 +820,7 @@ class GenFds(object):
         if GuidXRefFile:
             GuidXRefFile = ''.join(GuidXRefFile)
             SaveFileOnChange(GuidXRefFileName, GuidXRefFile, False)
+            GenFdsGlobalVariable.SaveDigest(GuidXRefFileName)
             GenFdsGlobalVariable.InfLogger("\nGUID cross reference file can be found at %s" % GuidXRefFileName)
         elif os.path.exists(GuidXRefFileName):
             os.remove(GuidXRefFileName)
@@ -14,6 +14,8 @@ from __future__ import absolute_import
 
 import Common.LongFilePathOs as os
 import sys
+import time
+import hashlib
 from sys import stdout
 from subprocess import PIPE,Popen
 from struct import Struct
@@ -22,6 +24,7 @@ from array import array
 from Common.BuildToolError import COMMAND_FAILURE,GENFDS_ERROR
 from Common import EdkLogger
 from Common.Misc import SaveFileOnChange
+from Common.OutputMultiplexer import IsSimpleCommand
 
 from Common.TargetTxtClassObject import TargetTxtDict
 from Common.ToolDefClassObject import ToolDefDict,gDefaultToolsDefFile
@@ -60,7 +63,9 @@ class GenFdsGlobalVariable:
     SharpCounter = 0
     SharpNumberPerLine = 40
     FdfFile = ''
-    FdfFileTimeStamp = 0
+    FdfSectionDict = {}
+    FileDigestCache = {}
+    PendingDigestDict = {}
     FixedLoadAddress = False
     PlatformName = ''
 
@@ -402,35 +407,99 @@ class GenFdsGlobalVariable:
             Str = mws.join(GenFdsGlobalVariable.WorkSpaceDir, String)
         return os.path.normpath(Str)
 
-    ## Check if the input files are newer than output files
+    ## Get the text of the sections in FDF file
+    #
+    #   @param  FdfFile         Path of FDF file
+    #
+    #   @retval dict            The text of each section, keyed by the upper case
+    #                           section name without brackets, such as "FV.FVMAIN"
+    #
+    @staticmethod
+    def GetFdfSectionDict(FdfFile):
+        SectionDict = {}
+        SectionLines = None
+        with open(FdfFile, 'r') as Fdf:
+            for Line in Fdf:
+                Stripped = Line.strip()
+                if Stripped.startswith('[') and Stripped.find(']') > 0:
+                    SectionLines = []
+                    for Name in Stripped[1:Stripped.find(']')].split(','):
+                        SectionDict[''.join(Name.split()).upper()] = SectionLines
+                if SectionLines is not None:
+                    SectionLines.append(Line)
+        return {Name: ''.join(Lines) for Name, Lines in SectionDict.items()}
+
+    ## Get the digest of the content of a file
+    #
+    #   The digest is cached as long as the size and the modification time of the
+    #   file don't change, so each file is read once per GenFds run.
+    #
+    #   @param  File            Path of the file
+    #
+    @staticmethod
+    def _GetFileDigest(File):
+        Stat = os.stat(File)
+        Cached = GenFdsGlobalVariable.FileDigestCache.get(File)
+        if Cached and Cached[0] == Stat.st_mtime_ns and Cached[1] == Stat.st_size:
+            return Cached[2]
+        with open(File, 'rb') as Fd:
+            Digest = hashlib.md5(Fd.read()).hexdigest()
+        GenFdsGlobalVariable.FileDigestCache[File] = (Stat.st_mtime_ns, Stat.st_size, Digest)
+        return Digest
+
+    ## Check if the output file needs to be generated again
+    #
+    #   The output is up to date if it exists and the digest of the content of the
+    #   input files, the tool command line and the FDF section text is the same as
+    #   the one saved in the ".hash" file of the output by SaveDigest(), the time
+    #   stamps of the files are not used.
     #
     #   @param  Output          Path of output file
     #   @param  Input           Path list of input files
+    #   @param  Command         The command line generating the output
+    #   @param  FdfSection      Name of the FDF section the output is generated from
     #
-    #   @retval True            if Output doesn't exist, or any Input is newer
-    #   @retval False           if all Input is older than Output
+    #   @retval True            if Output doesn't exist, or any Input, the Command
+    #                           or the FDF section is changed
+    #   @retval False           if the Output is up to date
     #
     @staticmethod
-    def NeedsUpdate(Output, Input):
-        if not os.path.exists(Output):
-            return True
+    def NeedsUpdate(Output, Input, Command=None, FdfSection=None):
+        GenFdsGlobalVariable.PendingDigestDict.pop(Output, None)
         # always update "Output" if no "Input" given
         if not Input:
             return True
 
-        # if fdf file is changed after the 'Output" is generated, update the 'Output'
-        OutputTime = os.path.getmtime(Output)
-        if GenFdsGlobalVariable.FdfFileTimeStamp > OutputTime:
-            return True
-
+        Hash = hashlib.md5()
+        if Command:
+            Hash.update(' '.join(Command).encode('utf-8'))
+        if FdfSection:
+            Hash.update(GenFdsGlobalVariable.FdfSectionDict.get(FdfSection.upper(), '').encode('utf-8'))
         for F in Input:
             # always update "Output" if any "Input" doesn't exist
             if not os.path.exists(F):
                 return True
-            # always update "Output" if any "Input" is newer than "Output"
-            if os.path.getmtime(F) > OutputTime:
-                return True
-        return False
+            Hash.update(('\n%s\n%s' % (F, GenFdsGlobalVariable._GetFileDigest(F))).encode('utf-8'))
+        Digest = Hash.hexdigest()
+
+        if os.path.exists(Output) and os.path.exists(Output + '.hash'):
+            with open(Output + '.hash', 'r') as HashFile:
+                if HashFile.read() == Digest:
+                    return False
+        # the output will be rewritten by the tool
+        GenFdsGlobalVariable.FileDigestCache.pop(Output, None)
+        GenFdsGlobalVariable.PendingDigestDict[Output] = Digest
+        return True
+
+    ## Save the digest calculated by NeedsUpdate() once the output is generated
+    #
+    #   @param  Output          Path of output file
+    #
+    @staticmethod
+    def SaveDigest(Output):
+        Digest = GenFdsGlobalVariable.PendingDigestDict.pop(Output, None)
+        if Digest and os.path.exists(Output):
+            SaveFileOnChange(Output + '.hash', Digest, False)
 
     @staticmethod
     def GenerateSection(Output, Input, Type=None, CompressionType=None, Guid=None,
@@ -499,9 +568,10 @@ class GenFdsGlobalVariable:
                 if ' '.join(Cmd).strip() not in GenFdsGlobalVariable.SecCmdList:
                     GenFdsGlobalVariable.SecCmdList.append(' '.join(Cmd).strip())
             else:
-                if not GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile]):
+                if not GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile], Cmd):
                     return
                 GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate section")
+                GenFdsGlobalVariable.SaveDigest(Output)
         else:
             Cmd += ("-o", Output)
             Cmd += Input
@@ -514,9 +584,10 @@ class GenFdsGlobalVariable:
                     Cmd = ['-test', '-e', Input[0], "&&"] + Cmd
                 if ' '.join(Cmd).strip() not in GenFdsGlobalVariable.SecCmdList:
                     GenFdsGlobalVariable.SecCmdList.append(' '.join(Cmd).strip())
-            elif GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile]):
-                GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, Input))
+            elif GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile], Cmd):
+                GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, Input))
                 GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate section")
+                GenFdsGlobalVariable.SaveDigest(Output)
                 if (os.path.getsize(Output) >= GenFdsGlobalVariable.LARGE_FILE_SIZE and
                     GenFdsGlobalVariable.LargeFileInFvFlags):
                     GenFdsGlobalVariable.LargeFileInFvFlags[-1] = True
@@ -563,24 +634,21 @@ class GenFdsGlobalVariable:
         CommandFile = Output + '.txt'
         SaveFileOnChange(CommandFile, ' '.join(Cmd), False)
 
-        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, Input))
         if MakefilePath:
             if (tuple(Cmd), tuple(GenFdsGlobalVariable.SecCmdList), tuple(GenFdsGlobalVariable.CopyList)) not in GenFdsGlobalVariable.FfsCmdDict:
                 GenFdsGlobalVariable.FfsCmdDict[tuple(Cmd), tuple(GenFdsGlobalVariable.SecCmdList), tuple(GenFdsGlobalVariable.CopyList)] = MakefilePath
             GenFdsGlobalVariable.SecCmdList = []
             GenFdsGlobalVariable.CopyList = []
         else:
-            if not GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile]):
+            if not GenFdsGlobalVariable.NeedsUpdate(Output, list(Input) + [CommandFile], Cmd):
                 return
+            GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, Input))
             GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate FFS")
+            GenFdsGlobalVariable.SaveDigest(Output)
 
     @staticmethod
     def GenerateFirmwareVolume(Output, Input, BaseAddress=None, ForceRebase=None, Capsule=False, Dump=False,
-                               AddressFile=None, MapFile=None, FfsList=[], FileSystemGuid=None):
-        if not GenFdsGlobalVariable.NeedsUpdate(Output, Input+FfsList):
-            return
-        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, Input))
-
+                               AddressFile=None, MapFile=None, FfsList=[], FileSystemGuid=None, FdfSection=None):
         Cmd = ["GenFv"]
         if BaseAddress:
             Cmd += ("-r", BaseAddress)
@@ -604,16 +672,16 @@ class GenFdsGlobalVariable:
         for I in Input:
             Cmd += ("-i", I)
 
+        if not GenFdsGlobalVariable.NeedsUpdate(Output, Input+FfsList, Cmd, FdfSection):
+            return
+        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, Input))
         GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate FV")
+        GenFdsGlobalVariable.SaveDigest(Output)
 
     @staticmethod
     def GenerateFirmwareImage(Output, Input, Type="efi", SubType=None, Zero=False,
                               Strip=False, Replace=False, TimeStamp=None, Join=False,
                               Align=None, Padding=None, Convert=False, IsMakefile=False):
-        if not GenFdsGlobalVariable.NeedsUpdate(Output, Input) and not IsMakefile:
-            return
-        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, Input))
-
         Cmd = ["GenFw"]
         if Type.lower() == "te":
             Cmd.append("-t")
@@ -640,8 +708,10 @@ class GenFdsGlobalVariable:
         if IsMakefile:
             if " ".join(Cmd).strip() not in GenFdsGlobalVariable.SecCmdList:
                 GenFdsGlobalVariable.SecCmdList.append(" ".join(Cmd).strip())
-        else:
+        elif GenFdsGlobalVariable.NeedsUpdate(Output, Input, Cmd):
+            GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, Input))
             GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate firmware image")
+            GenFdsGlobalVariable.SaveDigest(Output)
 
     @staticmethod
     def GenerateOptionRom(Output, EfiInput, BinaryInput, Compress=False, ClassCode=None,
@@ -665,11 +735,6 @@ class GenFdsGlobalVariable:
                 Cmd.append(BinFile)
                 InputList.append (BinFile)
 
-        # Check List
-        if not GenFdsGlobalVariable.NeedsUpdate(Output, InputList) and not IsMakefile:
-            return
-        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, InputList))
-
         if ClassCode:
             Cmd += ("-l", ClassCode)
         if Revision:
@@ -683,15 +748,13 @@ class GenFdsGlobalVariable:
         if IsMakefile:
             if " ".join(Cmd).strip() not in GenFdsGlobalVariable.SecCmdList:
                 GenFdsGlobalVariable.SecCmdList.append(" ".join(Cmd).strip())
-        else:
+        elif GenFdsGlobalVariable.NeedsUpdate(Output, InputList, Cmd):
+            GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, InputList))
             GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to generate option rom")
+            GenFdsGlobalVariable.SaveDigest(Output)
 
     @staticmethod
     def GuidTool(Output, Input, ToolPath, Options='', returnValue=[], IsMakefile=False):
-        if not GenFdsGlobalVariable.NeedsUpdate(Output, Input) and not IsMakefile:
-            return
-        GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of newer %s" % (Output, Input))
-
         Cmd = [ToolPath, ]
         Cmd += Options.split(' ')
         Cmd += ("-o", Output)
@@ -699,8 +762,15 @@ class GenFdsGlobalVariable:
         if IsMakefile:
             if " ".join(Cmd).strip() not in GenFdsGlobalVariable.SecCmdList:
                 GenFdsGlobalVariable.SecCmdList.append(" ".join(Cmd).strip())
+        elif not GenFdsGlobalVariable.NeedsUpdate(Output, Input, Cmd):
+            # the output was generated successfully by the same command before
+            if returnValue != []:
+                returnValue[0] = 0
         else:
+            GenFdsGlobalVariable.DebugLogger(EdkLogger.DEBUG_5, "%s needs update because of changed %s" % (Output, Input))
             GenFdsGlobalVariable.CallExternalTool(Cmd, "Failed to call " + ToolPath, returnValue)
+            if returnValue == [] or returnValue[0] == 0:
+                GenFdsGlobalVariable.SaveDigest(Output)
 
     @staticmethod
     def CallExternalTool (cmd, errorMess, returnValue=[]):
@@ -722,11 +792,17 @@ class GenFdsGlobalVariable:
             if GenFdsGlobalVariable.SharpCounter % GenFdsGlobalVariable.SharpNumberPerLine == 0:
                 stdout.write('\n')
 
+        BeginTime = time.time()
         try:
-            PopenObject = Popen(' '.join(cmd), stdout=PIPE, stderr=PIPE, shell=True)
+            if IsSimpleCommand(cmd):
+                PopenObject = Popen(list(cmd), stdout=PIPE, stderr=PIPE)
+            else:
+                PopenObject = Popen(' '.join(cmd), stdout=PIPE, stderr=PIPE, shell=True)
         except Exception as X:
             EdkLogger.error("GenFds", COMMAND_FAILURE, ExtraData="%s: %s" % (str(X), cmd[0]))
         (out, error) = PopenObject.communicate()
+        EdkLogger.debug(EdkLogger.DEBUG_1, "%s: %dms, %d bytes of output" % (' '.join(cmd),
+                        int(round((time.time() - BeginTime) * 1000)), len(out) + len(error)))
 
         while PopenObject.returncode is None:
             PopenObject.wait()
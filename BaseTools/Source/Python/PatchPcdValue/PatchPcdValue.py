@@ -18,7 +18,8 @@ from Common.BuildToolError import *
 import Common.EdkLogger as EdkLogger
 from Common.BuildVersion import gBUILD_VERSION
 import array
-from Common.DataType import *
+from Common.DataType import TAB_UINT8, TAB_UINT16, TAB_UINT32, TAB_UINT64, TAB_VOID, \
+                            TAB_PCD_NUMERIC_TYPES_VOID, TAB_PCD_CLEAN_NUMERIC_TYPES
 
 # Version and Copyright
 __version_number__ = ("0.10" + " " + gBUILD_VERSION)
@@ -148,6 +148,22 @@ class IpiDatabase(object):
         )""" % self.ModDepexTable
         self.Cur.execute(SqlCommand)
 
+        #
+        # Create the indexes of the columns used by the queries, the tables
+        # of a database created by an older version get them here too
+        #
+        for (IndexName, Table, Columns) in [
+            ('DpFileListDpIndex', self.DpFileListTable, 'DpGuid, DpVersion'),
+            ('PkgDpIndex', self.PkgTable, 'DpGuid, DpVersion'),
+            ('ModInPkgPkgIndex', self.ModInPkgTable, 'PackageGuid, PackageVersion'),
+            ('StandaloneModDpIndex', self.StandaloneModTable, 'DpGuid, DpVersion'),
+            ('ModDepexModIndex', self.ModDepexTable, 'ModuleGuid, ModuleVersion, InstallPath'),
+            ('ModDepexDepexIndex', self.ModDepexTable, 'DepexGuid')
+            ]:
+            SqlCommand = """create index IF NOT EXISTS %s on %s (%s)""" % \
+            (IndexName, Table, Columns)
+            self.Cur.execute(SqlCommand)
+
         self.Conn.commit()
 
         Logger.Verbose(ST.MSG_INIT_IPI_FINISH)
@@ -160,19 +176,30 @@ class IpiDatabase(object):
 
     ## Add a distribution install information from DpObj
     #
+    # The rows of each table are collected first and inserted with one
+    # statement per table, in the transaction committed by the caller.
+    #
     # @param DpObj:
     # @param NewDpPkgFileName: New DpPkg File Name
     # @param DpPkgFileName: DpPkg File Name
     # @param RePackage: A RePackage
     #
     def AddDPObject(self, DpObj, NewDpPkgFileName, DpPkgFileName, RePackage):
+        DpGuid = DpObj.Header.GetGuid()
+        DpVersion = DpObj.Header.GetVersion()
+        CurrentTime = time.time()
+        PkgRowList = []
+        ModInPkgRowList = []
+        StandaloneModRowList = []
+        ModDepexRowList = []
+        DpFileRowList = []
         try:
             for PkgKey in DpObj.PackageSurfaceArea.keys():
                 PkgGuid = PkgKey[0]
                 PkgVersion = PkgKey[1]
                 PkgInstallPath = PkgKey[2]
-                self._AddPackage(PkgGuid, PkgVersion, DpObj.Header.GetGuid(), \
-                                 DpObj.Header.GetVersion(), PkgInstallPath)
+                PkgRowList.append(self._GetPackageRow(PkgGuid, PkgVersion, CurrentTime, DpGuid, \
+                                                      DpVersion, PkgInstallPath))
                 PkgObj = DpObj.PackageSurfaceArea[PkgKey]
                 for ModKey in PkgObj.GetModuleDict().keys():
                     ModGuid = ModKey[0]
@@ -181,48 +208,54 @@ class IpiDatabase(object):
                     ModInstallPath = ModKey[3]
                     ModInstallPath = \
                     os.path.normpath(os.path.join(PkgInstallPath, ModInstallPath))
-                    self._AddModuleInPackage(ModGuid, ModVersion, ModName, PkgGuid, \
-                                             PkgVersion, ModInstallPath)
+                    ModInPkgRowList.append(self._GetModuleInPackageRow(ModGuid, ModVersion, ModName, \
+                                                                       CurrentTime, PkgGuid, PkgVersion, \
+                                                                       ModInstallPath))
                     ModObj = PkgObj.GetModuleDict()[ModKey]
                     for Dep in ModObj.GetPackageDependencyList():
                         DepexGuid = Dep.GetGuid()
                         DepexVersion = Dep.GetVersion()
-                        self._AddModuleDepex(ModGuid, ModVersion, ModName, ModInstallPath, \
-                                             DepexGuid, DepexVersion)
+                        ModDepexRowList.append(self._GetModuleDepexRow(ModGuid, ModVersion, ModName, \
+                                                                       ModInstallPath, DepexGuid, \
+                                                                       DepexVersion))
                 for (FilePath, Md5Sum) in PkgObj.FileList:
-                    self._AddDpFilePathList(DpObj.Header.GetGuid(), \
-                                            DpObj.Header.GetVersion(), FilePath, \
-                                            Md5Sum)
+                    DpFileRowList.append(self._GetDpFileRow(DpGuid, DpVersion, FilePath, Md5Sum))
 
             for ModKey in DpObj.ModuleSurfaceArea.keys():
                 ModGuid = ModKey[0]
                 ModVersion = ModKey[1]
                 ModName = ModKey[2]
                 ModInstallPath = ModKey[3]
-                self._AddStandaloneModule(ModGuid, ModVersion, ModName, \
-                                          DpObj.Header.GetGuid(), \
-                                          DpObj.Header.GetVersion(), \
-                                          ModInstallPath)
+                StandaloneModRowList.append(self._GetStandaloneModuleRow(ModGuid, ModVersion, ModName, \
+                                                                         CurrentTime, DpGuid, DpVersion, \
+                                                                         ModInstallPath))
                 ModObj = DpObj.ModuleSurfaceArea[ModKey]
                 for Dep in ModObj.GetPackageDependencyList():
                     DepexGuid = Dep.GetGuid()
                     DepexVersion = Dep.GetVersion()
-                    self._AddModuleDepex(ModGuid, ModVersion, ModName, ModInstallPath, \
-                                         DepexGuid, DepexVersion)
+                    ModDepexRowList.append(self._GetModuleDepexRow(ModGuid, ModVersion, ModName, \
+                                                                   ModInstallPath, DepexGuid, DepexVersion))
                 for (Path, Md5Sum) in ModObj.FileList:
-                    self._AddDpFilePathList(DpObj.Header.GetGuid(), \
-                                            DpObj.Header.GetVersion(), \
-                                            Path, Md5Sum)
+                    DpFileRowList.append(self._GetDpFileRow(DpGuid, DpVersion, Path, Md5Sum))
 
             #
             # add tool/misc files
             #
             for (Path, Md5Sum) in DpObj.FileList:
-                self._AddDpFilePathList(DpObj.Header.GetGuid(), \
-                                        DpObj.Header.GetVersion(), Path, Md5Sum)
+                DpFileRowList.append(self._GetDpFileRow(DpGuid, DpVersion, Path, Md5Sum))
 
-            self._AddDp(DpObj.Header.GetGuid(), DpObj.Header.GetVersion(), \
-                        NewDpPkgFileName, DpPkgFileName, RePackage)
+            self.Cur.executemany("""insert into %s values(?, ?, ?, ?, ?, ?)""" % \
+                                 self.PkgTable, PkgRowList)
+            self.Cur.executemany("""insert into %s values(?, ?, ?, ?, ?, ?, ?)""" % \
+                                 self.ModInPkgTable, ModInPkgRowList)
+            self.Cur.executemany("""insert into %s values(?, ?, ?, ?, ?, ?, ?)""" % \
+                                 self.StandaloneModTable, StandaloneModRowList)
+            self.Cur.executemany("""insert into %s values(?, ?, ?, ?, ?, ?)""" % \
+                                 self.ModDepexTable, ModDepexRowList)
+            self.Cur.executemany("""insert into %s values(?, ?, ?, ?)""" % \
+                                 self.DpFileListTable, DpFileRowList)
+
+            self._AddDp(DpGuid, DpVersion, NewDpPkgFileName, DpPkgFileName, RePackage)
 
         except sqlite3.IntegrityError as DetailMsg:
             Logger.Error("UPT",
@@ -252,21 +285,19 @@ class IpiDatabase(object):
         else:
             PkgFileName = NewDpFileName
         CurrentTime = time.time()
-        SqlCommand = \
-        """insert into %s values('%s', '%s', %s, '%s', '%s', '%s')""" % \
-        (self.DpTable, Guid, Version, CurrentTime, PkgFileName, \
-         DistributionFileName, str(RePackage).upper())
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """insert into %s values(?, ?, ?, ?, ?, ?)""" % self.DpTable
+        self.Cur.execute(SqlCommand, (Guid, Version, CurrentTime, PkgFileName, \
+                                      DistributionFileName, str(RePackage).upper()))
 
 
-    ## Add a file list from DP
+    ## Get the row of a file from DP
     #
     # @param DpGuid: A DpGuid
     # @param DpVersion: A DpVersion
     # @param Path: A Path
     # @param Path: A Md5Sum
     #
-    def _AddDpFilePathList(self, DpGuid, DpVersion, Path, Md5Sum):
+    def _GetDpFileRow(self, DpGuid, DpVersion, Path, Md5Sum):
         Path = os.path.normpath(Path)
         if pf.system() == 'Windows':
             if Path.startswith(self.Workspace):
@@ -274,20 +305,18 @@ class IpiDatabase(object):
         else:
             if Path.startswith(self.Workspace + os.sep):
                 Path = Path[len(self.Workspace)+1:]
-        SqlCommand = """insert into %s values('%s', '%s', '%s', '%s')""" % \
-        (self.DpFileListTable, Path, DpGuid, DpVersion, Md5Sum)
-
-        self.Cur.execute(SqlCommand)
+        return (Path, DpGuid, DpVersion, Md5Sum)
 
-    ## Add a package install information
+    ## Get the row of a package install information
     #
     # @param Guid: A package guid
     # @param Version: A package version
+    # @param InstallTime: The install time
     # @param DpGuid: A DpGuid
     # @param DpVersion: A DpVersion
     # @param Path: A Path
     #
-    def _AddPackage(self, Guid, Version, DpGuid=None, DpVersion=None, Path=''):
+    def _GetPackageRow(self, Guid, Version, InstallTime, DpGuid=None, DpVersion=None, Path=''):
 
         if Version is None or len(Version.strip()) == 0:
             Version = 'N/A'
@@ -298,26 +327,20 @@ class IpiDatabase(object):
         if DpVersion is None or len(DpVersion.strip()) == 0:
             DpVersion = 'N/A'
 
-        #
-        # Add newly installed package information to DB.
-        #
-        CurrentTime = time.time()
-        SqlCommand = \
-        """insert into %s values('%s', '%s', %s, '%s', '%s', '%s')""" % \
-        (self.PkgTable, Guid, Version, CurrentTime, DpGuid, DpVersion, Path)
-        self.Cur.execute(SqlCommand)
+        return (Guid, Version, InstallTime, DpGuid, DpVersion, Path)
 
-    ## Add a module that from a package install information
+    ## Get the row of a module that from a package install information
     #
     # @param Guid:    Module Guid
     # @param Version: Module version
     # @param Name:    Module Name
+    # @param InstallTime: The install time
     # @param PkgGuid: Package Guid
     # @param PkgVersion: Package version
     # @param Path:    Package relative path that module installs
     #
-    def _AddModuleInPackage(self, Guid, Version, Name, PkgGuid=None, \
-                            PkgVersion=None, Path=''):
+    def _GetModuleInPackageRow(self, Guid, Version, Name, InstallTime, PkgGuid=None, \
+                               PkgVersion=None, Path=''):
 
         if Version is None or len(Version.strip()) == 0:
             Version = 'N/A'
@@ -333,27 +356,20 @@ class IpiDatabase(object):
         else:
             Path = Path.replace('/', os.sep)
 
-        #
-        # Add module from package information to DB.
-        #
-        CurrentTime = time.time()
-        SqlCommand = \
-        """insert into %s values('%s', '%s', '%s', %s, '%s', '%s', '%s')""" % \
-        (self.ModInPkgTable, Guid, Version, Name, CurrentTime, PkgGuid, PkgVersion, \
-         Path)
-        self.Cur.execute(SqlCommand)
+        return (Guid, Version, Name, InstallTime, PkgGuid, PkgVersion, Path)
 
-    ## Add a module that is standalone install information
+    ## Get the row of a module that is standalone install information
     #
     # @param Guid: a module Guid
     # @param Version: a module Version
     # @param Name: a module name
+    # @param InstallTime: The install time
     # @param DpGuid: a DpGuid
     # @param DpVersion: a DpVersion
     # @param Path: path
     #
-    def _AddStandaloneModule(self, Guid, Version, Name, DpGuid=None, \
-                             DpVersion=None, Path=''):
+    def _GetStandaloneModuleRow(self, Guid, Version, Name, InstallTime, DpGuid=None, \
+                                DpVersion=None, Path=''):
 
         if Version is None or len(Version.strip()) == 0:
             Version = 'N/A'
@@ -364,26 +380,19 @@ class IpiDatabase(object):
         if DpVersion is None or len(DpVersion.strip()) == 0:
             DpVersion = 'N/A'
 
-        #
-        # Add module standalone information to DB.
-        #
-        CurrentTime = time.time()
-        SqlCommand = \
-        """insert into %s values('%s', '%s', '%s', %s, '%s', '%s', '%s')""" % \
-        (self.StandaloneModTable, Guid, Version, Name, CurrentTime, DpGuid, \
-         DpVersion, Path)
-        self.Cur.execute(SqlCommand)
+        return (Guid, Version, Name, InstallTime, DpGuid, DpVersion, Path)
 
-    ## Add a module depex
+    ## Get the row of a module depex
     #
     # @param Guid: a module Guid
     # @param Version: a module Version
     # @param Name: a module name
+    # @param Path: a module install path
     # @param DepexGuid: a module DepexGuid
     # @param DepexVersion: a module DepexVersion
     #
-    def _AddModuleDepex(self, Guid, Version, Name, Path, DepexGuid=None, \
-                        DepexVersion=None):
+    def _GetModuleDepexRow(self, Guid, Version, Name, Path, DepexGuid=None, \
+                           DepexVersion=None):
 
         if DepexGuid is None or len(DepexGuid.strip()) == 0:
             DepexGuid = 'N/A'
@@ -396,12 +405,7 @@ class IpiDatabase(object):
         else:
             Path = Path.replace('/', os.sep)
 
-        #
-        # Add module depex information to DB.
-        #
-        SqlCommand = """insert into %s values('%s', '%s', '%s', '%s', '%s', '%s')"""\
-         % (self.ModDepexTable, Guid, Version, Name, Path, DepexGuid, DepexVersion)
-        self.Cur.execute(SqlCommand)
+        return (Guid, Version, Name, Path, DepexGuid, DepexVersion)
 
     ## Remove a distribution install information, if no version specified,
     # remove all DPs with this Guid.
@@ -417,83 +421,62 @@ class IpiDatabase(object):
         #
         SqlCommand = \
         """delete from ModDepexInfo where ModDepexInfo.ModuleGuid in
-        (select ModuleGuid from StandaloneModInfo as B where B.DpGuid = '%s'
-        and B.DpVersion = '%s')
+        (select ModuleGuid from StandaloneModInfo as B where B.DpGuid = ?
+        and B.DpVersion = ?)
         and ModDepexInfo.ModuleVersion in
         (select ModuleVersion from StandaloneModInfo as B
-        where B.DpGuid = '%s' and B.DpVersion = '%s')
+        where B.DpGuid = ? and B.DpVersion = ?)
         and ModDepexInfo.ModuleName in
         (select ModuleName from StandaloneModInfo as B
-        where B.DpGuid = '%s' and B.DpVersion = '%s')
+        where B.DpGuid = ? and B.DpVersion = ?)
         and ModDepexInfo.InstallPath in
         (select InstallPath from StandaloneModInfo as B
-        where B.DpGuid = '%s' and B.DpVersion = '%s') """ % \
-        (DpGuid, DpVersion, DpGuid, DpVersion, DpGuid, DpVersion, DpGuid, DpVersion)
+        where B.DpGuid = ? and B.DpVersion = ?) """
 
-        self.Cur.execute(SqlCommand)
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion) * 4)
         #
         # delete from ModDepex the from pkg module's dependency
         #
-        for Pkg in PkgList:
-
-            SqlCommand = \
-            """delete from ModDepexInfo where ModDepexInfo.ModuleGuid in
-            (select ModuleGuid from ModInPkgInfo
-            where ModInPkgInfo.PackageGuid ='%s' and
-            ModInPkgInfo.PackageVersion = '%s')
-            and ModDepexInfo.ModuleVersion in
-            (select ModuleVersion from ModInPkgInfo
-            where ModInPkgInfo.PackageGuid ='%s' and
-            ModInPkgInfo.PackageVersion = '%s')
-            and ModDepexInfo.ModuleName in
-            (select ModuleName from ModInPkgInfo
-            where ModInPkgInfo.PackageGuid ='%s' and
-            ModInPkgInfo.PackageVersion = '%s')
-            and ModDepexInfo.InstallPath in
-            (select InstallPath from ModInPkgInfo where
-            ModInPkgInfo.PackageGuid ='%s'
-            and ModInPkgInfo.PackageVersion = '%s')""" \
-                            % (Pkg[0], Pkg[1], Pkg[0], Pkg[1], Pkg[0], Pkg[1], Pkg[0], Pkg[1])
+        SqlCommand = \
+        """delete from ModDepexInfo where ModDepexInfo.ModuleGuid in
+        (select ModuleGuid from ModInPkgInfo
+        where ModInPkgInfo.PackageGuid = ? and
+        ModInPkgInfo.PackageVersion = ?)
+        and ModDepexInfo.ModuleVersion in
+        (select ModuleVersion from ModInPkgInfo
+        where ModInPkgInfo.PackageGuid = ? and
+        ModInPkgInfo.PackageVersion = ?)
+        and ModDepexInfo.ModuleName in
+        (select ModuleName from ModInPkgInfo
+        where ModInPkgInfo.PackageGuid = ? and
+        ModInPkgInfo.PackageVersion = ?)
+        and ModDepexInfo.InstallPath in
+        (select InstallPath from ModInPkgInfo where
+        ModInPkgInfo.PackageGuid = ?
+        and ModInPkgInfo.PackageVersion = ?)"""
 
-            self.Cur.execute(SqlCommand)
+        self.Cur.executemany(SqlCommand, [(Pkg[0], Pkg[1]) * 4 for Pkg in PkgList])
         #
         # delete the standalone module
         #
         SqlCommand = \
-        """delete from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-        (self.StandaloneModTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        """delete from %s where DpGuid = ? and DpVersion = ?""" % self.StandaloneModTable
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
         #
         # delete the from pkg module
         #
-        for Pkg in PkgList:
-            SqlCommand = \
-            """delete from %s where %s.PackageGuid ='%s'
-            and %s.PackageVersion = '%s'""" % \
-            (self.ModInPkgTable, self.ModInPkgTable, Pkg[0], \
-             self.ModInPkgTable, Pkg[1])
-            self.Cur.execute(SqlCommand)
-        #
-        # delete packages
-        #
-        SqlCommand = \
-        """delete from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-        (self.PkgTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
-        #
-        # delete file list from DP
-        #
         SqlCommand = \
-        """delete from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-        (self.DpFileListTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        """delete from %s where %s.PackageGuid = ?
+        and %s.PackageVersion = ?""" % \
+        (self.ModInPkgTable, self.ModInPkgTable, self.ModInPkgTable)
+        self.Cur.executemany(SqlCommand, [(Pkg[0], Pkg[1]) for Pkg in PkgList])
         #
-        # delete DP
+        # delete packages, file list from DP and DP
         #
-        SqlCommand = \
-        """delete from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-        (self.DpTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        for Table in (self.PkgTable, self.DpFileListTable, self.DpTable):
+            SqlCommand = \
+            """delete from %s where DpGuid = ? and DpVersion = ?""" % Table
+            self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
 
         #self.Conn.commit()
 
@@ -508,17 +491,15 @@ class IpiDatabase(object):
             Version = 'N/A'
             Logger.Verbose(ST.MSG_GET_DP_INSTALL_LIST)
             (DpGuid, DpVersion) = (Guid, Version)
-            SqlCommand = """select * from %s where DpGuid ='%s'""" % \
-            (self.DpTable, DpGuid)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where DpGuid = ?""" % self.DpTable
+            self.Cur.execute(SqlCommand, (DpGuid,))
 
         else:
             Logger.Verbose(ST.MSG_GET_DP_INSTALL_INFO_START)
             (DpGuid, DpVersion) = (Guid, Version)
             SqlCommand = \
-            """select * from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-            (self.DpTable, DpGuid, DpVersion)
-            self.Cur.execute(SqlCommand)
+            """select * from %s where DpGuid = ? and DpVersion = ?""" % self.DpTable
+            self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
 
         DpList = []
         for DpInfo in self.Cur:
@@ -537,16 +518,15 @@ class IpiDatabase(object):
     # @param Version: distribution package version
     #
     def GetDpInstallDirList(self, Guid, Version):
-        SqlCommand = """select InstallPath from PkgInfo where DpGuid = '%s' and DpVersion = '%s'""" % (Guid, Version)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select InstallPath from PkgInfo where DpGuid = ? and DpVersion = ?"""
+        self.Cur.execute(SqlCommand, (Guid, Version))
         DirList = []
         for Result in self.Cur:
             if Result[0] not in DirList:
                 DirList.append(Result[0])
 
-        SqlCommand = """select InstallPath from StandaloneModInfo where DpGuid = '%s' and DpVersion = '%s'""" % \
-                     (Guid, Version)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select InstallPath from StandaloneModInfo where DpGuid = ? and DpVersion = ?"""
+        self.Cur.execute(SqlCommand, (Guid, Version))
         for Result in self.Cur:
             if Result[0] not in DirList:
                 DirList.append(Result[0])
@@ -563,9 +543,8 @@ class IpiDatabase(object):
 
         (DpGuid, DpVersion) = (Guid, Version)
         SqlCommand = \
-        """select * from %s where DpGuid ='%s' and DpVersion = '%s'""" % \
-        (self.DpFileListTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        """select * from %s where DpGuid = ? and DpVersion = ?""" % self.DpFileListTable
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
 
         PathList = []
         for Result in self.Cur:
@@ -608,9 +587,8 @@ class IpiDatabase(object):
     # @param DistributionFile: Distribution File
     #
     def GetDpByName(self, DistributionFile):
-        SqlCommand = """select * from %s where NewPkgFileName = '%s'""" % \
-        (self.DpTable, DistributionFile)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select * from %s where NewPkgFileName = ?""" % self.DpTable
+        self.Cur.execute(SqlCommand, (DistributionFile,))
 
         for Result in self.Cur:
             DpGuid = Result[0]
@@ -631,24 +609,20 @@ class IpiDatabase(object):
         if DpVersion == '' or DpGuid == '':
 
             (PackageGuid, PackageVersion) = (Guid, Version)
-            SqlCommand = """select * from %s where PackageGuid ='%s'
-            and PackageVersion = '%s'""" % (self.PkgTable, PackageGuid, \
-                                            PackageVersion)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where PackageGuid = ?
+            and PackageVersion = ?""" % self.PkgTable
+            self.Cur.execute(SqlCommand, (PackageGuid, PackageVersion))
 
         elif Version is None or len(Version.strip()) == 0:
 
-            SqlCommand = """select * from %s where PackageGuid ='%s'""" % \
-            (self.PkgTable, Guid)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where PackageGuid = ?""" % self.PkgTable
+            self.Cur.execute(SqlCommand, (Guid,))
         else:
             (PackageGuid, PackageVersion) = (Guid, Version)
-            SqlCommand = """select * from %s where PackageGuid ='%s' and
-            PackageVersion = '%s'
-                            and DpGuid = '%s' and DpVersion = '%s'""" % \
-                            (self.PkgTable, PackageGuid, PackageVersion, \
-                             DpGuid, DpVersion)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where PackageGuid = ? and
+            PackageVersion = ?
+                            and DpGuid = ? and DpVersion = ?""" % self.PkgTable
+            self.Cur.execute(SqlCommand, (PackageGuid, PackageVersion, DpGuid, DpVersion))
 
         PkgList = []
         for PkgInfo in self.Cur:
@@ -670,19 +644,18 @@ class IpiDatabase(object):
     def GetModInPackage(self, Guid, Version, Name, Path, PkgGuid='', PkgVersion=''):
         (ModuleGuid, ModuleVersion, ModuleName, InstallPath) = (Guid, Version, Name, Path)
         if PkgVersion == '' or PkgGuid == '':
-            SqlCommand = """select * from %s where ModuleGuid ='%s' and
-            ModuleVersion = '%s' and InstallPath = '%s'
-            and ModuleName = '%s'""" % (self.ModInPkgTable, ModuleGuid, \
-                                       ModuleVersion, InstallPath, ModuleName)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where ModuleGuid = ? and
+            ModuleVersion = ? and InstallPath = ?
+            and ModuleName = ?""" % self.ModInPkgTable
+            self.Cur.execute(SqlCommand, (ModuleGuid, ModuleVersion, InstallPath, ModuleName))
         else:
-            SqlCommand = """select * from %s where ModuleGuid ='%s' and
-            ModuleVersion = '%s' and InstallPath = '%s'
-            and ModuleName = '%s' and PackageGuid ='%s'
-            and PackageVersion = '%s'
-                            """ % (self.ModInPkgTable, ModuleGuid, \
-                                   ModuleVersion, InstallPath, ModuleName, PkgGuid, PkgVersion)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where ModuleGuid = ? and
+            ModuleVersion = ? and InstallPath = ?
+            and ModuleName = ? and PackageGuid = ?
+            and PackageVersion = ?
+                            """ % self.ModInPkgTable
+            self.Cur.execute(SqlCommand, (ModuleGuid, ModuleVersion, InstallPath, ModuleName, \
+                                          PkgGuid, PkgVersion))
 
         ModList = []
         for ModInfo in self.Cur:
@@ -703,18 +676,17 @@ class IpiDatabase(object):
     def GetStandaloneModule(self, Guid, Version, Name, Path, DpGuid='', DpVersion=''):
         (ModuleGuid, ModuleVersion, ModuleName, InstallPath) = (Guid, Version, Name, Path)
         if DpGuid == '':
-            SqlCommand = """select * from %s where ModuleGuid ='%s' and
-            ModuleVersion = '%s' and InstallPath = '%s'
-            and ModuleName = '%s'""" % (self.StandaloneModTable, ModuleGuid, \
-                                       ModuleVersion, InstallPath, ModuleName)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where ModuleGuid = ? and
+            ModuleVersion = ? and InstallPath = ?
+            and ModuleName = ?""" % self.StandaloneModTable
+            self.Cur.execute(SqlCommand, (ModuleGuid, ModuleVersion, InstallPath, ModuleName))
 
         else:
-            SqlCommand = """select * from %s where ModuleGuid ='%s' and
-            ModuleVersion = '%s' and InstallPath = '%s' and ModuleName = '%s' and DpGuid ='%s' and DpVersion = '%s'
-                            """ % (self.StandaloneModTable, ModuleGuid, \
-                                   ModuleVersion, ModuleName, InstallPath, DpGuid, DpVersion)
-            self.Cur.execute(SqlCommand)
+            SqlCommand = """select * from %s where ModuleGuid = ? and
+            ModuleVersion = ? and InstallPath = ? and ModuleName = ? and DpGuid = ? and DpVersion = ?
+                            """ % self.StandaloneModTable
+            self.Cur.execute(SqlCommand, (ModuleGuid, ModuleVersion, InstallPath, ModuleName, \
+                                          DpGuid, DpVersion))
 
         ModList = []
         for ModInfo in self.Cur:
@@ -735,10 +707,10 @@ class IpiDatabase(object):
     def GetSModInsPathListFromDp(self, DpGuid, DpVersion):
 
         PathList = []
-        SqlCommand = """select InstallPath from %s where DpGuid ='%s'
-        and DpVersion = '%s'
-                        """ % (self.StandaloneModTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select InstallPath from %s where DpGuid = ?
+        and DpVersion = ?
+                        """ % self.StandaloneModTable
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
 
         for Result in self.Cur:
             InstallPath = Result[0]
@@ -753,9 +725,9 @@ class IpiDatabase(object):
     #
     def GetPackageListFromDp(self, DpGuid, DpVersion):
 
-        SqlCommand = """select * from %s where DpGuid ='%s' and
-        DpVersion = '%s' """ % (self.PkgTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select * from %s where DpGuid = ? and
+        DpVersion = ? """ % self.PkgTable
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
 
         PkgList = []
         for PkgInfo in self.Cur:
@@ -787,13 +759,11 @@ class IpiDatabase(object):
             SqlCommand = """select t1.ModuleGuid, t1.ModuleVersion,
             t1.InstallPath from %s as t1, %s as t2 where
             t1.ModuleGuid = t2.ModuleGuid and
-            t1.ModuleVersion = t2.ModuleVersion and t2.DepexGuid ='%s'
-            and (t2.DepexVersion = '%s' or t2.DepexVersion = 'N/A') and
-            t1.PackageGuid != '%s' and t1.PackageVersion != '%s'
-                        """ % (self.ModInPkgTable, \
-                               self.ModDepexTable, Pkg[0], Pkg[1], Pkg[0], \
-                               Pkg[1])
-            self.Cur.execute(SqlCommand)
+            t1.ModuleVersion = t2.ModuleVersion and t2.DepexGuid = ?
+            and (t2.DepexVersion = ? or t2.DepexVersion = 'N/A') and
+            t1.PackageGuid != ? and t1.PackageVersion != ?
+                        """ % (self.ModInPkgTable, self.ModDepexTable)
+            self.Cur.execute(SqlCommand, (Pkg[0], Pkg[1], Pkg[0], Pkg[1]))
             for ModInfo in self.Cur:
                 ModGuid = ModInfo[0]
                 ModVersion = ModInfo[1]
@@ -807,13 +777,11 @@ class IpiDatabase(object):
             SqlCommand = \
             """select t1.ModuleGuid, t1.ModuleVersion, t1.InstallPath
             from %s as t1, %s as t2 where t1.ModuleGuid = t2.ModuleGuid and
-            t1.ModuleVersion = t2.ModuleVersion and t2.DepexGuid ='%s'
-            and (t2.DepexVersion = '%s' or t2.DepexVersion = 'N/A') and
-                            t1.DpGuid != '%s' and t1.DpVersion != '%s'
-                        """ % \
-                        (self.StandaloneModTable, self.ModDepexTable, Pkg[0], \
-                         Pkg[1], DpGuid, DpVersion)
-            self.Cur.execute(SqlCommand)
+            t1.ModuleVersion = t2.ModuleVersion and t2.DepexGuid = ?
+            and (t2.DepexVersion = ? or t2.DepexVersion = 'N/A') and
+                            t1.DpGuid != ? and t1.DpVersion != ?
+                        """ % (self.StandaloneModTable, self.ModDepexTable)
+            self.Cur.execute(SqlCommand, (Pkg[0], Pkg[1], DpGuid, DpVersion))
             for ModInfo in self.Cur:
                 ModGuid = ModInfo[0]
                 ModVersion = ModInfo[1]
@@ -835,10 +803,10 @@ class IpiDatabase(object):
         #
         SqlCommand = """select FilePath
                         from %s
-                        where DpGuid = '%s' and DpVersion = '%s' and
+                        where DpGuid = ? and DpVersion = ? and
                         FilePath like '%%.inf'
-                    """ % (self.DpFileListTable, DpGuid, DpVersion)
-        self.Cur.execute(SqlCommand)
+                    """ % self.DpFileListTable
+        self.Cur.execute(SqlCommand, (DpGuid, DpVersion))
         for ModuleInfo in self.Cur:
             FilePath = ModuleInfo[0]
             ModList.append(os.path.join(self.Workspace, FilePath))
@@ -857,16 +825,16 @@ class IpiDatabase(object):
         #
         # Get module depex information to DB.
         #
-        SqlCommand = """select * from %s where ModuleGuid ='%s' and
-        ModuleVersion = '%s' and InstallPath ='%s'
-                            """ % (self.ModDepexTable, Guid, Version, Path)
-        self.Cur.execute(SqlCommand)
+        SqlCommand = """select DepexGuid, DepexVersion from %s where ModuleGuid = ? and
+        ModuleVersion = ? and InstallPath = ?
+                            """ % self.ModDepexTable
+        self.Cur.execute(SqlCommand, (Guid, Version, Path))
 
 
         DepexList = []
         for DepInfo in self.Cur:
-            DepexGuid = DepInfo[3]
-            DepexVersion = DepInfo[4]
+            DepexGuid = DepInfo[0]
+            DepexVersion = DepInfo[1]
             DepexList.append((DepexGuid, DepexVersion))
 
         return DepexList
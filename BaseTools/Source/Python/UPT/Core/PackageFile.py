@@ -18,6 +18,7 @@ import os.path
 import zipfile
 import tempfile
 import platform
+from hashlib import md5
 
 from Logger.ToolError import FILE_OPEN_FAILURE
 from Logger.ToolError import FILE_CHECKSUM_FAILURE
@@ -33,13 +34,75 @@ from Library.Misc import RemoveDirectory
 from Core.FileHook import __FileHookOpen__
 from Common.MultipleWorkspace import MultipleWorkspace as mws
 
+#
+# Size of the blocks read to compute the signature of the zip file
+#
+PACK_BLOCK_SIZE = 1024 * 1024
+
+## DigestFile
+#
+# Wrap the zip file being created to compute the MD5 digest of the data while
+# it is written. The data written since the last commit is kept until the
+# next one, so the header of the entry being written can still be updated,
+# as ZipFile.write() does when the entry is closed. The digest is dropped if
+# data already committed is updated.
+#
+class DigestFile:
+    def __init__(self, File):
+        self._File = File
+        self._Digest = md5()
+        self._Position = File.tell()
+        self._Committed = self._Position
+        self._Pending = bytearray()
+
+    def write(self, Data):
+        if self._Digest is not None:
+            Offset = self._Position - self._Committed
+            if 0 <= Offset <= len(self._Pending):
+                self._Pending[Offset:Offset + len(Data)] = Data
+            else:
+                self._Digest = None
+                self._Pending = bytearray()
+        self._Position += len(Data)
+        return self._File.write(Data)
+
+    def tell(self):
+        return self._Position
+
+    def seek(self, Offset, Whence=os.SEEK_SET):
+        self._Position = self._File.seek(Offset, Whence)
+        return self._Position
+
+    def flush(self):
+        self._File.flush()
+
+    def close(self):
+        self._File.close()
+
+    ## Add the data written since the last commit to the digest
+    #
+    def Commit(self):
+        if self._Digest is not None:
+            self._Digest.update(self._Pending)
+            self._Committed += len(self._Pending)
+            self._Pending = bytearray()
+
+    ## Get the MD5 digest of the data written, or None if it was updated
+    #
+    def GetDigest(self):
+        self.Commit()
+        return self._Digest
 
 class PackageFile:
     def __init__(self, FileName, Mode="r"):
         self._FileName = FileName
+        self._DigestFile = None
         if Mode not in ["r", "w", "a"]:
             Mode = "r"
         try:
+            if Mode == "w":
+                self._DigestFile = DigestFile(open(FileName, 'w+b'))
+                FileName = self._DigestFile
             self._ZipFile = zipfile.ZipFile(FileName, Mode, \
                                             zipfile.ZIP_DEFLATED)
             self._Files = {}
@@ -142,13 +205,16 @@ class PackageFile:
                                 ExtraData="%s is not in %s!" % \
                                 (SinF, self._FileName))
             self._Files.pop(SinF)
-        self._ZipFile.close()
+        self.Close()
 
-        self._ZipFile = zipfile.ZipFile(self._FileName, "w", \
+        self._DigestFile = DigestFile(open(self._FileName, 'w+b'))
+        self._ZipFile = zipfile.ZipFile(self._DigestFile, "w", \
                                         zipfile.ZIP_DEFLATED)
+        FilesToPack = list(self._Files)
+        self._Files = {}
         Cwd = os.getcwd()
         os.chdir(TmpDir)
-        self.PackFiles(self._Files)
+        self.PackFiles(FilesToPack)
         os.chdir(Cwd)
         RemoveDirectory(TmpDir, True)
 
@@ -193,16 +259,27 @@ class PackageFile:
         self.PackFiles(FilesToPack)
         os.chdir(Cwd)
 
-    ## Pack the file
+    ## Pack the files
     #
     # @param Files:  the files to pack
     #
     def PackFiles(self, Files):
         for File in Files:
-            Cwd = os.getcwd()
-            os.chdir(mws.getWs(mws.WORKSPACE, File))
-            self.PackFile(File)
-            os.chdir(Cwd)
+            if platform.system() != 'Windows':
+                File = File.replace('\\', '/')
+            #
+            # avoid packing same file multiple times
+            #
+            if os.path.normpath(File) in self._Files:
+                continue
+            try:
+                Logger.Info("packing ..." + File)
+                self._ZipFile.write(os.path.join(mws.getWs(mws.WORKSPACE, File), File), File)
+                self._CommitDigest()
+                self._Files[os.path.normpath(File)] = File
+            except BaseException as Xstr:
+                Logger.Error("PackagingTool", FILE_COMPRESS_FAILURE,
+                                ExtraData="%s (%s)" % (File, str(Xstr)))
 
     ## Pack the file
     #
@@ -216,12 +293,13 @@ class PackageFile:
             #
             if platform.system() != 'Windows':
                 File = File.replace('\\', '/')
-            ZipedFilesNameList = self._ZipFile.namelist()
-            for ZipedFile in ZipedFilesNameList:
-                if File == os.path.normpath(ZipedFile):
-                    return
+            if os.path.normpath(File) in self._Files:
+                return
             Logger.Info("packing ..." + File)
             self._ZipFile.write(File, ArcName)
+            self._CommitDigest()
+            ZipedFile = self._ZipFile.filelist[-1].filename
+            self._Files[os.path.normpath(ZipedFile)] = ZipedFile
         except BaseException as Xstr:
             Logger.Error("PackagingTool", FILE_COMPRESS_FAILURE,
                             ExtraData="%s (%s)" % (File, str(Xstr)))
@@ -236,15 +314,42 @@ class PackageFile:
             if os.path.splitext(ArcName)[1].lower() == '.pkg':
                 Data = Data.encode('utf_8')
             self._ZipFile.writestr(ArcName, Data)
+            self._CommitDigest()
+            self._Files[os.path.normpath(ArcName)] = ArcName
         except BaseException as Xstr:
             Logger.Error("PackagingTool", FILE_COMPRESS_FAILURE,
                             ExtraData="%s (%s)" % (ArcName, str(Xstr)))
 
+    ## Add the entry just written to the digest of the zip file
+    #
+    def _CommitDigest(self):
+        if self._DigestFile:
+            self._DigestFile.Commit()
+
     ## Close file
     #
     #
     def Close(self):
         self._ZipFile.close()
+        if self._DigestFile:
+            self._DigestFile.close()
+
+    ## Get the MD5 signature of the file
+    #
+    # The digest computed while the file was created is used unless data of
+    # an entry already written was updated, the closed file is read again
+    # otherwise.
+    #
+    def GetMd5Signature(self):
+        Digest = None
+        if self._DigestFile:
+            Digest = self._DigestFile.GetDigest()
+        if Digest is None:
+            Digest = md5()
+            with open(self._FileName, 'rb') as FileObj:
+                for Block in iter(lambda: FileObj.read(PACK_BLOCK_SIZE), b''):
+                    Digest.update(Block)
+        return Digest.hexdigest()
 
 
 
@@ -15,11 +15,27 @@ XmlRoutines
 # Import Modules
 #
 import xml.dom.minidom
+from xml.etree import ElementTree
 import re
 import codecs
 from Logger.ToolError import PARSER_ERROR
 import Logger.Log as Logger
 
+## XML element of the trees built by XmlIterParseFile
+#
+# The namespace is removed from the tag, so the functions of this file get the
+# same result on these elements and on the XML DOM nodes. As a XML DOM node,
+# an element is true even when it has no child.
+#
+class XmlTreeElement(ElementTree.Element):
+    __slots__ = ()
+
+    def __init__(self, Tag, Attrib={}, **Extra):
+        ElementTree.Element.__init__(self, Tag.rpartition('}')[2], Attrib, **Extra)
+
+    def __bool__(self):
+        return True
+
 ## Create a element of XML
 #
 # @param Name
@@ -62,6 +78,8 @@ def CreateXmlElement(Name, String, NodeList, AttributeList):
 def XmlList(Dom, String):
     if String is None or String == "" or Dom is None or Dom == "":
         return []
+    if isinstance(Dom, XmlTreeElement):
+        return _XmlTreeList(Dom, String)
     if Dom.nodeType == Dom.DOCUMENT_NODE:
         Dom = Dom.documentElement
     if String[0] == "/":
@@ -85,6 +103,28 @@ def XmlList(Dom, String):
 
     return Nodes
 
+## Get a list of XML elements of a tree using XPath style syntax.
+#
+# @param  Element            The root XML element.
+# @param  String             A XPath style path.
+#
+def _XmlTreeList(Element, String):
+    if String[0] == "/":
+        String = String[1:]
+    TagList = String.split('/')
+    Nodes = [Element]
+    End = len(TagList) - 1
+    for Index, Tag in enumerate(TagList):
+        ChildNodes = []
+        for Node in Nodes:
+            if Node.tag == Tag:
+                if Index < End:
+                    ChildNodes.extend(Node)
+                else:
+                    ChildNodes.append(Node)
+        Nodes = ChildNodes
+
+    return Nodes
 
 ## Get a single XML node using XPath style syntax.
 #
@@ -97,7 +137,8 @@ def XmlList(Dom, String):
 def XmlNode(Dom, String):
     if String is None or String == ""  or Dom is None or Dom == "":
         return None
-    if Dom.nodeType == Dom.DOCUMENT_NODE:
+    IsTree = isinstance(Dom, XmlTreeElement)
+    if not IsTree and Dom.nodeType == Dom.DOCUMENT_NODE:
         Dom = Dom.documentElement
     if String[0] == "/":
         String = String[1:]
@@ -107,16 +148,31 @@ def XmlNode(Dom, String):
     ChildNodes = [Dom]
     while Index <= End:
         for Node in ChildNodes:
-            if Node.nodeType == Node.ELEMENT_NODE and \
-               Node.tagName == TagList[Index]:
+            if IsTree:
+                Found = Node.tag == TagList[Index]
+            else:
+                Found = Node.nodeType == Node.ELEMENT_NODE and \
+                        Node.tagName == TagList[Index]
+            if Found:
                 if Index < End:
-                    ChildNodes = Node.childNodes
+                    ChildNodes = Node if IsTree else Node.childNodes
                 else:
                     return Node
                 break
         Index += 1
     return None
 
+## Get the data of the first child of a XML node
+#
+# The data of a XML element of a tree is its text, None when it has no text.
+#
+# @param  Dom                The XML DOM node or element.
+#
+def _XmlFirstChildData(Dom):
+    if isinstance(Dom, XmlTreeElement):
+        return Dom.text
+    return Dom.firstChild.data
+
 
 ## Get a single XML element using XPath style syntax.
 #
@@ -128,7 +184,7 @@ def XmlNode(Dom, String):
 #
 def XmlElement(Dom, String):
     try:
-        return XmlNode(Dom, String).firstChild.data.strip()
+        return _XmlFirstChildData(XmlNode(Dom, String)).strip()
     except BaseException:
         return ""
 
@@ -143,7 +199,7 @@ def XmlElement(Dom, String):
 #
 def XmlElement2(Dom, String):
     try:
-        HelpStr = XmlNode(Dom, String).firstChild.data
+        HelpStr = _XmlFirstChildData(XmlNode(Dom, String))
         gRemovePrettyRe = re.compile(r"""(?:(\n *)  )(.*)\1""", re.DOTALL)
         HelpStr = re.sub(gRemovePrettyRe, r"\2", HelpStr)
         return HelpStr
@@ -160,7 +216,7 @@ def XmlElement2(Dom, String):
 #
 def XmlElementData(Dom):
     try:
-        return Dom.firstChild.data.strip()
+        return _XmlFirstChildData(Dom).strip()
     except BaseException:
         return ""
 
@@ -187,6 +243,8 @@ def XmlElementList(Dom, String):
 #
 def XmlAttribute(Dom, Attribute):
     try:
+        if isinstance(Dom, XmlTreeElement):
+            return Dom.get(Attribute, '')
         return Dom.getAttribute(Attribute)
     except BaseException:
         return ''
@@ -201,6 +259,8 @@ def XmlAttribute(Dom, Attribute):
 #
 def XmlNodeName(Dom):
     try:
+        if isinstance(Dom, XmlTreeElement):
+            return Dom.tag.strip()
         return Dom.nodeName.strip()
     except BaseException:
         return ''
@@ -221,3 +281,31 @@ def XmlParseFile(FileName):
     except BaseException as XExcept:
         XmlFile.close()
         Logger.Error('\nUPT', PARSER_ERROR, XExcept, File=FileName, RaiseError=True)
+
+## Parse an XML file incrementally.
+#
+# Parse the input XML file named FileName and yield the XML elements which
+# are children of its root element named Tag, once each of them is complete.
+# The elements are removed from the tree after being processed, so the whole
+# file is never loaded.
+#
+# @param  FileName           The XML file name.
+# @param  Tag                The tag of the root element.
+#
+def XmlIterParseFile(FileName, Tag):
+    Parser = ElementTree.XMLParser(target=ElementTree.TreeBuilder(element_factory=XmlTreeElement))
+    Root = None
+    Depth = 0
+    try:
+        for Event, Element in ElementTree.iterparse(FileName, ('start', 'end'), Parser):
+            if Event == 'start':
+                if Root is None:
+                    Root = Element
+                Depth += 1
+                continue
+            Depth -= 1
+            if Depth == 1 and Root.tag == Tag:
+                yield Element
+                Root.remove(Element)
+    except (ElementTree.ParseError, OSError) as XExcept:
+        Logger.Error('\nUPT', PARSER_ERROR, XExcept, File=FileName, RaiseError=True)
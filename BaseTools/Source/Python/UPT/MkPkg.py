@@ -21,7 +21,6 @@ from sys import stdin
 from sys import platform
 from traceback import format_exc
 from platform import python_version
-from hashlib import md5
 from time import strftime
 from time import localtime
 from uuid import uuid4
@@ -124,13 +123,9 @@ def Main(Options = None):
                 FileList += ToolObject.GetFileList()
             if MiscObject:
                 FileList += MiscObject.GetFileList()
+            FromFileList = []
             for FileObject in FileList:
-                #
-                # If you have unicode file names, please convert them to byte
-                # strings in your desired encoding before passing them to
-                # write().
-                #
-                FromFile = os.path.normpath(FileObject.GetURI()).encode('utf_8')
+                FromFile = os.path.normpath(FileObject.GetURI())
                 FileFullPath = mws.join(WorkspaceDir, FromFile)
                 if FileFullPath in RePkgDict:
                     (DpGuid, DpVersion, DpName, Repackage) = RePkgDict[FileFullPath]
@@ -143,7 +138,8 @@ def Main(Options = None):
                                      )
                     else:
                         DistPkg.Header.RePackage = True
-                ContentFile.PackFile(FromFile)
+                FromFileList.append(FromFile)
+            ContentFile.PackFiles(FromFileList)
             chdir(Cwd)
 
         #
@@ -190,7 +186,7 @@ def Main(Options = None):
         #
         # Add Md5Signature
         #
-        DistPkg.Header.Signature = md5(open(str(ContentFile), 'rb').read()).hexdigest()
+        DistPkg.Header.Signature = ContentFile.GetMd5Signature()
         #
         # Add current Date
         #
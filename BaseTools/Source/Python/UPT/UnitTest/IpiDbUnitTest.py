@@ -0,0 +1,173 @@
+## @file
+# This file contain unit test for IpiDb
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import os
+import tempfile
+import time
+import unittest
+
+import Logger.Log as Logger
+from Core.IpiDb import IpiDatabase
+from Library.Misc import RemoveDirectory
+from Core.DistributionPackageClass import DistributionPackageClass
+from Object.POM.PackageObject import PackageObject
+from Object.POM.ModuleObject import ModuleObject
+from Object.POM.ModuleObject import PackageDependencyObject
+
+#
+# Size of the synthetic distribution package
+#
+PACKAGE_NUMBER = 10
+MODULE_NUMBER = 40
+FILE_NUMBER = 10000
+
+DP_GUID = '3c7f8d3d-2ad1-4a5b-9b8f-5a1e0c7d1f00'
+DP_VERSION = '1.0'
+
+def MakeGuid(Kind, Index):
+    return '%08x-0000-4000-8000-%012x' % (Kind, Index)
+
+def MakeDependency(Guid, Version):
+    Dependency = PackageDependencyObject()
+    Dependency.SetGuid(Guid)
+    Dependency.SetVersion(Version)
+    return Dependency
+
+#
+# Build a distribution package with PACKAGE_NUMBER packages, each of them
+# with MODULE_NUMBER modules, and FILE_NUMBER files in total
+#
+def MakeDistributionPackage(Guid=DP_GUID, Version=DP_VERSION, PathPrefix='Dp'):
+    DistPkg = DistributionPackageClass()
+    DistPkg.Header.SetGuid(Guid)
+    DistPkg.Header.SetVersion(Version)
+    FileIndex = 0
+    FilesPerPackage = FILE_NUMBER // (PACKAGE_NUMBER + 1)
+    for PkgIndex in range(PACKAGE_NUMBER):
+        PkgGuid = MakeGuid(1, PkgIndex)
+        PkgPath = '%s/Pkg%d' % (PathPrefix, PkgIndex)
+        Package = PackageObject()
+        ModuleDict = {}
+        for ModIndex in range(MODULE_NUMBER):
+            Module = ModuleObject()
+            Module.SetPackageDependencyList([MakeDependency(MakeGuid(1, (PkgIndex + 1) % PACKAGE_NUMBER), ''),
+                                             MakeDependency(MakeGuid(1, PkgIndex), '1.0')])
+            ModuleDict[(MakeGuid(2, PkgIndex * MODULE_NUMBER + ModIndex), '1.0', 'Module%d' % ModIndex,
+                        'Module%d/Module%d.inf' % (ModIndex, ModIndex))] = Module
+        Package.SetModuleDict(ModuleDict)
+        Package.FileList = []
+        for Index in range(FilesPerPackage):
+            Package.FileList.append(('%s/File%d.c' % (PkgPath, FileIndex), '%032x' % FileIndex))
+            FileIndex += 1
+        DistPkg.PackageSurfaceArea[(PkgGuid, '1.0', PkgPath)] = Package
+    for ModIndex in range(MODULE_NUMBER):
+        Module = ModuleObject()
+        Module.SetPackageDependencyList([MakeDependency(MakeGuid(1, ModIndex % PACKAGE_NUMBER), '')])
+        Module.FileList = [('%s/Standalone%d/Module.inf' % (PathPrefix, ModIndex), '%032x' % FileIndex)]
+        FileIndex += 1
+        DistPkg.ModuleSurfaceArea[(MakeGuid(3, ModIndex), '1.0', 'Standalone%d' % ModIndex,
+                                   '%s/Standalone%d' % (PathPrefix, ModIndex))] = Module
+    while FileIndex < FILE_NUMBER:
+        DistPkg.FileList.append(('%s/Tools/File%d.py' % (PathPrefix, FileIndex), '%032x' % FileIndex))
+        FileIndex += 1
+    return DistPkg
+
+#
+# Test install and remove of a distribution package
+#
+class IpiDatabaseTest(unittest.TestCase):
+    def setUp(self):
+        Logger.Initialize()
+        Logger.SetLevel(Logger.QUIET)
+        self.Workspace = tempfile.mkdtemp()
+        self.DataBase = IpiDatabase(os.path.join(self.Workspace, 'Conf', 'DistributionPackageDatabase.db'),
+                                    self.Workspace)
+        self.DataBase.InitDatabase()
+
+    def tearDown(self):
+        self.DataBase.CloseDb()
+        RemoveDirectory(self.Workspace, True)
+
+    def testInstallRemove(self):
+        DistPkg = MakeDistributionPackage()
+        Start = time.time()
+        self.DataBase.AddDPObject(DistPkg, 'Dp.dist', 'Dp.dist', False)
+        self.DataBase.Commit()
+        InstallTime = time.time() - Start
+
+        FileList = self.DataBase.GetDpFileList(DP_GUID, DP_VERSION)
+        self.assertEqual(len(FileList), FILE_NUMBER)
+        self.assertIn((os.path.join(self.Workspace, os.path.normpath('Dp/Pkg0/File0.c')), '%032x' % 0), FileList)
+        self.assertEqual(len(self.DataBase.GetPackageListFromDp(DP_GUID, DP_VERSION)), PACKAGE_NUMBER)
+        self.assertEqual(len(self.DataBase.GetSModInsPathListFromDp(DP_GUID, DP_VERSION)), MODULE_NUMBER)
+        self.assertEqual(len(self.DataBase.GetDpModuleList(DP_GUID, DP_VERSION)), MODULE_NUMBER)
+        self.assertEqual(self.DataBase.GetDpByName('Dp.dist')[:2], (DP_GUID, DP_VERSION))
+        self.assertEqual(len(self.DataBase.GetPackage(MakeGuid(1, 3), '1.0')), 1)
+
+        ModPath = os.path.normpath('Dp/Pkg1/Module2/Module2.inf')
+        ModList = self.DataBase.GetModInPackage(MakeGuid(2, MODULE_NUMBER + 2), '1.0', 'Module2', ModPath)
+        self.assertEqual(len(ModList), 1)
+        self.assertEqual(self.DataBase.GetModuleDepex(MakeGuid(2, MODULE_NUMBER + 2), '1.0', ModPath),
+                         [(MakeGuid(1, 2), 'N/A'), (MakeGuid(1, 1), '1.0')])
+        ModList = self.DataBase.GetStandaloneModule(MakeGuid(3, 5), '1.0', 'Standalone5', 'Dp/Standalone5')
+        self.assertEqual(len(ModList), 1)
+        ModList = self.DataBase.GetStandaloneModule(MakeGuid(3, 5), '1.0', 'Standalone5', 'Dp/Standalone5',
+                                                    DP_GUID, DP_VERSION)
+        self.assertEqual(len(ModList), 1)
+
+        Start = time.time()
+        self.DataBase.RemoveDpObj(DP_GUID, DP_VERSION)
+        self.DataBase.Commit()
+        RemoveTime = time.time() - Start
+        print('\n%d files: install %.3fs, remove %.3fs' % (FILE_NUMBER, InstallTime, RemoveTime))
+
+        self.assertEqual(self.DataBase.GetDpFileList(DP_GUID, DP_VERSION), [])
+        self.assertEqual(self.DataBase.GetPackageListFromDp(DP_GUID, DP_VERSION), [])
+        self.assertEqual(self.DataBase.GetModuleDepex(MakeGuid(2, MODULE_NUMBER + 2), '1.0', ModPath), [])
+        self.assertEqual(self.DataBase.InventoryDistInstalled(), [])
+        for Table in ('ModInPkgInfo', 'StandaloneModInfo', 'ModDepexInfo'):
+            self.DataBase.Cur.execute('select count(*) from %s' % Table)
+            self.assertEqual(self.DataBase.Cur.fetchone()[0], 0)
+
+    #
+    # A file path with a quote used to break the generated SQL statements
+    #
+    def testQuotedPath(self):
+        DistPkg = MakeDistributionPackage(PathPrefix="Vendor's")
+        self.DataBase.AddDPObject(DistPkg, "Vendor's.dist", "Vendor's.dist", True)
+        self.DataBase.Commit()
+        self.assertEqual(len(self.DataBase.GetDpFileList(DP_GUID, DP_VERSION)), FILE_NUMBER)
+        self.assertEqual(self.DataBase.GetDpByName("Vendor's.dist")[:2], (DP_GUID, DP_VERSION))
+        self.DataBase.RemoveDpObj(DP_GUID, DP_VERSION)
+        self.DataBase.Commit()
+        self.assertEqual(self.DataBase.GetDpFileList(DP_GUID, DP_VERSION), [])
+
+    #
+    # The removal of a distribution package keeps the other ones
+    #
+    def testRemoveOne(self):
+        OtherGuid = '3c7f8d3d-2ad1-4a5b-9b8f-5a1e0c7d1f01'
+        self.DataBase.AddDPObject(MakeDistributionPackage(), 'Dp.dist', 'Dp.dist', False)
+        OtherDistPkg = DistributionPackageClass()
+        OtherDistPkg.Header.SetGuid(OtherGuid)
+        OtherDistPkg.Header.SetVersion(DP_VERSION)
+        OtherDistPkg.FileList = [('Other/File.txt', '%032x' % 0)]
+        self.DataBase.AddDPObject(OtherDistPkg, 'Other.dist', 'Other.dist', False)
+        self.DataBase.Commit()
+        self.DataBase.RemoveDpObj(DP_GUID, DP_VERSION)
+        self.DataBase.Commit()
+        self.assertEqual(len(self.DataBase.InventoryDistInstalled()), 1)
+        self.assertEqual(len(self.DataBase.GetDpFileList(OtherGuid, DP_VERSION)), 1)
+
+    def testIndex(self):
+        self.DataBase.Cur.execute("explain query plan select * from DpFileListInfo where DpGuid = ? and DpVersion = ?",
+                                  (DP_GUID, DP_VERSION))
+        self.assertIn('USING INDEX', ' '.join(str(Row[-1]) for Row in self.DataBase.Cur))
+
+if __name__ == '__main__':
+    Logger.Initialize()
+    unittest.main()
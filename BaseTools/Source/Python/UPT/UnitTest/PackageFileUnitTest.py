@@ -0,0 +1,100 @@
+## @file
+# This file contain unit test for PackageFile
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import os
+import tempfile
+import time
+import unittest
+import zipfile
+from hashlib import md5
+
+import Logger.Log as Logger
+from Core.PackageFile import PackageFile
+from Library.Misc import RemoveDirectory
+from Common.MultipleWorkspace import MultipleWorkspace as mws
+
+#
+# The files of MdePkg are packed
+#
+WORKSPACE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', '..'))
+PACKAGE = 'MdePkg'
+
+def GetPackageFileList():
+    FileList = []
+    for Root, Dirs, Files in os.walk(os.path.join(WORKSPACE, PACKAGE)):
+        Dirs.sort()
+        for File in sorted(Files):
+            FileList.append(os.path.relpath(os.path.join(Root, File), WORKSPACE))
+    return FileList
+
+def GetMd5Signature(FileName):
+    with open(FileName, 'rb') as FileObj:
+        return md5(FileObj.read()).hexdigest()
+
+#
+# Test packing of the files of a package
+#
+class PackageFileTest(unittest.TestCase):
+    def setUp(self):
+        Logger.Initialize()
+        Logger.SetLevel(Logger.QUIET)
+        mws.setWs(WORKSPACE)
+        self.TempDir = tempfile.mkdtemp()
+        self.FileList = GetPackageFileList()
+
+    def tearDown(self):
+        RemoveDirectory(self.TempDir, True)
+
+    #
+    # The content zip file is the one ZipFile.write() creates
+    #
+    def testPackFiles(self):
+        ExpectedFile = os.path.join(self.TempDir, 'Expected.content')
+        Start = time.time()
+        with zipfile.ZipFile(ExpectedFile, 'w', zipfile.ZIP_DEFLATED) as ZipFile:
+            for File in self.FileList:
+                ZipFile.write(os.path.join(WORKSPACE, File), File)
+        ExpectedSignature = GetMd5Signature(ExpectedFile)
+        ExpectedTime = time.time() - Start
+
+        ContentFile = PackageFile(os.path.join(self.TempDir, 'dist.content'), 'w')
+        Start = time.time()
+        ContentFile.PackFiles(self.FileList + self.FileList[:10])
+        ContentFile.Close()
+        Signature = ContentFile.GetMd5Signature()
+        PackTime = time.time() - Start
+        print('\n%d files: ZipFile.write() %.3fs, PackFiles() %.3fs' % (len(self.FileList), ExpectedTime, PackTime))
+
+        self.assertEqual(Signature, ExpectedSignature)
+        self.assertEqual(GetMd5Signature(str(ContentFile)), ExpectedSignature)
+
+    #
+    # The header of each entry is updated when it is closed, the signature
+    # is still computed while the file is written
+    #
+    def testPackFile(self):
+        Cwd = os.getcwd()
+        os.chdir(WORKSPACE)
+        try:
+            ContentFile = PackageFile(os.path.join(self.TempDir, 'dist.content'), 'w')
+            ContentFile.PackFiles(self.FileList[:10])
+            ContentFile.PackFile(self.FileList[10])
+            ContentFile.PackFile(self.FileList[0])
+            ContentFile.PackFile(os.path.join(os.curdir, self.FileList[1]))
+            ContentFile.PackData('Data', 'dist.pkg')
+            ContentFile.Close()
+        finally:
+            os.chdir(Cwd)
+        self.assertIsNotNone(ContentFile._DigestFile.GetDigest())
+        self.assertEqual(ContentFile.GetMd5Signature(), GetMd5Signature(str(ContentFile)))
+        with zipfile.ZipFile(str(ContentFile)) as ZipFile:
+            self.assertIsNone(ZipFile.testzip())
+            self.assertEqual(ZipFile.namelist(), [File.replace(os.sep, '/') for File in self.FileList[:11]] + ['dist.pkg'])
+
+if __name__ == '__main__':
+    Logger.Initialize()
+    unittest.main()
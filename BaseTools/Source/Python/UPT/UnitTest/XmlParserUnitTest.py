@@ -0,0 +1,245 @@
+## @file
+# This file contain unit test for the DistributionPackage XML loading
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import os
+import tempfile
+import time
+import unittest
+
+import Logger.Log as Logger
+from Logger.ToolError import FatalError
+from Library.Misc import RemoveDirectory
+from Xml import XmlParser
+from Xml.XmlParser import DistributionPackageXml
+
+#
+# Templates of the synthetic distribution package description
+#
+HEADER = '''<?xml version="1.0" encoding="utf-8"?>
+<DistributionPackage xmlns="http://www.uefi.org/2011/1.1" xmlns:xsi="http:/www.w3.org/2001/XMLSchema-instance">
+  <DistributionHeader ReadOnly="False" RePackage="True">
+    <Name BaseName="Synthetic">Synthetic Distribution</Name>
+    <GUID Version="1.0">3c7f8d3d-2ad1-4a5b-9b8f-5a1e0c7d1f00</GUID>
+    <Vendor>Vendor &amp; Co</Vendor>
+    <Date>2026-10-19T00:00:00</Date>
+    <Copyright>Copyright (c) 2026, Intel Corporation. All rights reserved.</Copyright>
+    <License>SPDX-License-Identifier: BSD-2-Clause-Patent</License>
+    <Abstract>Synthetic distribution</Abstract>
+    <Description>Synthetic distribution
+      with a description on several lines</Description>
+    <Signature>0123456789abcdef0123456789abcdef</Signature>
+    <XmlSpecification>1.1</XmlSpecification>
+  </DistributionHeader>
+'''
+MODULE = '''    <ModuleSurfaceArea>
+      <Header>
+        <Name BaseName="Module%(Index)d">Module%(Index)d</Name>
+        <GUID Version="1.0">%(Guid)s</GUID>
+        <Copyright>Copyright (c) 2026, Intel Corporation. All rights reserved.</Copyright>
+        <License>SPDX-License-Identifier: BSD-2-Clause-Patent</License>
+        <Abstract>Module %(Index)d</Abstract>
+        <Description>Synthetic module %(Index)d</Description>
+      </Header>
+      <ModuleProperties SupArchList="IA32 X64">
+        <ModuleType>DXE_DRIVER</ModuleType>
+        <Path>%(Path)s</Path>
+      </ModuleProperties>
+      <LibraryClassDefinitions>
+        <LibraryClass Usage="ALWAYS_CONSUMED">
+          <Keyword>BaseLib</Keyword>
+        </LibraryClass>
+      </LibraryClassDefinitions>
+      <SourceFiles>
+%(SourceFiles)s      </SourceFiles>
+      <PackageDependencies>
+        <Package>
+          <GUID Version="1.0">5a1e0c7d-2ad1-4a5b-9b8f-3c7f8d3d1f00</GUID>
+        </Package>
+      </PackageDependencies>
+      <Guids>
+        <GuidCName Usage="SOMETIMES_CONSUMES" GuidType="GUID">
+          <CName>gSyntheticGuid%(Index)d</CName>
+        </GuidCName>
+      </Guids>
+      <Protocols>
+        <Protocol Usage="ALWAYS_CONSUMES">
+          <CName>gSyntheticProtocolGuid</CName>
+        </Protocol>
+      </Protocols>
+      <PcdCoded>
+        <PcdEntry PcdItemType="FIXED_AT_BUILD" PcdUsage="ALWAYS_CONSUMES">
+          <CName>PcdSynthetic</CName>
+          <TokenSpaceGuidCName>gSyntheticTokenSpaceGuid</TokenSpaceGuidCName>
+        </PcdEntry>
+      </PcdCoded>
+      <DxeDepex>
+        <Expression>gSyntheticProtocolGuid</Expression>
+      </DxeDepex>
+    </ModuleSurfaceArea>
+'''
+PACKAGE_HEADER = '''  <PackageSurfaceArea>
+    <Header>
+      <Name BaseName="Pkg%(Index)d">Pkg%(Index)d</Name>
+      <GUID Version="1.0">%(Guid)s</GUID>
+      <Copyright>Copyright (c) 2026, Intel Corporation. All rights reserved.</Copyright>
+      <License>SPDX-License-Identifier: BSD-2-Clause-Patent</License>
+      <Abstract>Package %(Index)d</Abstract>
+      <PackagePath>Pkg%(Index)d</PackagePath>
+    </Header>
+    <GuidDeclarations>
+      <Entry>
+        <CName>gSyntheticTokenSpaceGuid</CName>
+        <GuidValue>5a1e0c7d-2ad1-4a5b-9b8f-3c7f8d3d1f01</GuidValue>
+      </Entry>
+    </GuidDeclarations>
+    <PcdDeclarations>
+      <PcdEntry SupArchList="IA32 X64">
+        <TokenSpaceGuidCname>gSyntheticTokenSpaceGuid</TokenSpaceGuidCname>
+        <Token>0x00000001</Token>
+        <CName>PcdSynthetic</CName>
+        <DatumType>UINT32</DatumType>
+        <ValidUsage>FixedPcd</ValidUsage>
+        <DefaultValue>0x0</DefaultValue>
+      </PcdEntry>
+    </PcdDeclarations>
+    <Modules>
+'''
+PACKAGE_END = '''    </Modules>
+  </PackageSurfaceArea>
+'''
+FOOTER = '''  <Tools>
+    <Header>
+      <Name>Tools</Name>
+    </Header>
+    <Filename Executable="true" OS="Linux">Tools/Tool.py</Filename>
+  </Tools>
+  <MiscellaneousFiles>
+    <Header>
+      <Name>Misc</Name>
+    </Header>
+    <Filename>Misc/ReadMe.txt</Filename>
+  </MiscellaneousFiles>
+  <UserExtensions UserId="Synthetic" Identifier="Test">Statement</UserExtensions>
+</DistributionPackage>
+'''
+
+#
+# Write a description with PackageNumber packages of ModuleNumber modules,
+# ModuleNumber standalone modules, and FileNumber source files per module
+#
+def MakeDescription(FileName, PackageNumber, ModuleNumber, FileNumber):
+    SourceFiles = ''.join('        <Filename>File%d.c</Filename>\n' % Number for Number in range(FileNumber))
+    with open(FileName, 'w') as File:
+        File.write(HEADER)
+        Index = 0
+        for PkgIndex in range(PackageNumber):
+            File.write(PACKAGE_HEADER % {'Index': PkgIndex, 'Guid': '%08x-0000-4000-8000-%012x' % (1, PkgIndex)})
+            for ModIndex in range(ModuleNumber):
+                Module = MODULE % {'Index': Index, 'Guid': '%08x-0000-4000-8000-%012x' % (2, Index),
+                                   'Path': 'Pkg%d/Module%d' % (PkgIndex, Index), 'SourceFiles': SourceFiles}
+                File.write('  ' + Module.replace('\n    ', '\n      '))
+                Index += 1
+            File.write(PACKAGE_END)
+        for ModIndex in range(ModuleNumber):
+            File.write(MODULE % {'Index': Index, 'Guid': '%08x-0000-4000-8000-%012x' % (2, Index),
+                                 'Path': 'Standalone/Module%d' % Index, 'SourceFiles': SourceFiles})
+            Index += 1
+        File.write(FOOTER)
+
+#
+# Get the values of the objects of a distribution package, to compare them
+#
+def GetState(Object):
+    if isinstance(Object, (list, tuple)):
+        return [GetState(Item) for Item in Object]
+    if isinstance(Object, dict):
+        return [(GetState(Key), GetState(Value)) for Key, Value in Object.items()]
+    if hasattr(Object, '__dict__'):
+        return (type(Object).__name__, GetState(vars(Object)))
+    return Object
+
+#
+# Test the incremental loading against the XML DOM one
+#
+class DistributionPackageXmlTest(unittest.TestCase):
+    def setUp(self):
+        Logger.Initialize()
+        Logger.SetLevel(Logger.QUIET)
+        self.TempDir = tempfile.mkdtemp()
+        self.FileName = os.path.join(self.TempDir, 'dist.pkg')
+
+    def tearDown(self):
+        RemoveDirectory(self.TempDir, True)
+
+    def testFromXml(self):
+        MakeDescription(self.FileName, 2, 3, 4)
+        self.assertLess(os.path.getsize(self.FileName), XmlParser.ITERPARSE_FILE_SIZE)
+        Expected = DistributionPackageXml().FromXml(self.FileName)
+        DistP = DistributionPackageXml().FromXmlIterParse(self.FileName)
+        self.assertEqual(len(DistP.PackageSurfaceArea), 2)
+        self.assertEqual(len(DistP.ModuleSurfaceArea), 3)
+        self.assertEqual(DistP.Header.GetVendor(), 'Vendor & Co')
+        self.assertEqual([File.GetURI() for File in DistP.Tools.GetFileList()], ['Tools/Tool.py'])
+        self.assertEqual(GetState(DistP), GetState(Expected))
+
+    def testParseError(self):
+        with open(self.FileName, 'w') as File:
+            File.write(HEADER)
+        self.assertRaises(FatalError, DistributionPackageXml().FromXmlIterParse, self.FileName)
+
+    #
+    # A description of ITERPARSE_FILE_SIZE or more is loaded incrementally
+    # by FromXml()
+    #
+    def testIterParseSelected(self):
+        MakeDescription(self.FileName, 2, 3, 4)
+        Expected = DistributionPackageXml().FromXml(self.FileName)
+
+        IterParseFileSize = XmlParser.ITERPARSE_FILE_SIZE
+        XmlParser.ITERPARSE_FILE_SIZE = os.path.getsize(self.FileName)
+        FromXmlIterParse = DistributionPackageXml.FromXmlIterParse
+        Called = []
+        def CountFromXmlIterParse(Self, Filename):
+            Called.append(Filename)
+            return FromXmlIterParse(Self, Filename)
+        DistributionPackageXml.FromXmlIterParse = CountFromXmlIterParse
+        try:
+            DistP = DistributionPackageXml().FromXml(self.FileName)
+        finally:
+            XmlParser.ITERPARSE_FILE_SIZE = IterParseFileSize
+            DistributionPackageXml.FromXmlIterParse = FromXmlIterParse
+
+        self.assertEqual(Called, [self.FileName])
+        self.assertEqual(GetState(DistP), GetState(Expected))
+
+    #
+    # Loading a description of about 50 MB is faster than with minidom, only
+    # run when UPT_XML_TIMING is set
+    #
+    @unittest.skipUnless(os.environ.get('UPT_XML_TIMING'), 'set UPT_XML_TIMING to time the loading of a large description')
+    def testIterParseTime(self):
+        MakeDescription(self.FileName, 4, 1800, 100)
+        self.assertGreaterEqual(os.path.getsize(self.FileName), XmlParser.ITERPARSE_FILE_SIZE)
+        Start = time.time()
+        DistP = DistributionPackageXml().FromXml(self.FileName)
+        IterParseTime = time.time() - Start
+        self.assertEqual(len(DistP.ModuleSurfaceArea), 1800)
+        self.assertEqual(sum(len(Package.GetModuleDict()) for Package in DistP.PackageSurfaceArea.values()), 4 * 1800)
+
+        IterParseFileSize = XmlParser.ITERPARSE_FILE_SIZE
+        XmlParser.ITERPARSE_FILE_SIZE = os.path.getsize(self.FileName) + 1
+        try:
+            Start = time.time()
+            DistributionPackageXml().FromXml(self.FileName)
+            DomTime = time.time() - Start
+        finally:
+            XmlParser.ITERPARSE_FILE_SIZE = IterParseFileSize
+        self.assertLess(IterParseTime, DomTime)
+
+if __name__ == '__main__':
+    Logger.Initialize()
+    unittest.main()
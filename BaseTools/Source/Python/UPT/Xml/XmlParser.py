@@ -13,12 +13,14 @@ XmlParser
 ##
 # Import Modules
 #
+import os
 import re
 
 from Library.Xml.XmlRoutines import XmlNode
 from Library.Xml.XmlRoutines import CreateXmlElement
 from Library.Xml.XmlRoutines import XmlList
 from Library.Xml.XmlRoutines import XmlParseFile
+from Library.Xml.XmlRoutines import XmlIterParseFile
 from Core.DistributionPackageClass import DistributionPackageClass
 from Object.POM.ModuleObject import DepexObject
 from Library.ParserValidate import IsValidInfMoudleType
@@ -45,6 +47,11 @@ from Xml.PackageSurfaceAreaXml import PackageSurfaceAreaXml
 
 import Logger.Log as Logger
 
+#
+# Size from which a distribution package XML file is parsed incrementally
+#
+ITERPARSE_FILE_SIZE = 4 * 1024 * 1024
+
 ##
 # DistributionPackageXml
 #
@@ -157,6 +164,8 @@ class DistributionPackageXml(object):
 
     def FromXml(self, Filename=None):
         if Filename is not None:
+            if os.path.getsize(Filename) >= ITERPARSE_FILE_SIZE:
+                return self.FromXmlIterParse(Filename)
             self.DistP = DistributionPackageClass()
             #
             # Load to XML
@@ -218,6 +227,58 @@ class DistributionPackageXml(object):
 
             return self.DistP
 
+    ## Parse a distribution package XML file incrementally
+    #
+    # Each child of DistributionPackage is parsed into the same objects as
+    # FromXml() does once the element is complete, and then released, the
+    # XML tree of the whole file is never built.
+    #
+    # @param Filename:  the distribution package XML file
+    #
+    def FromXmlIterParse(self, Filename):
+        self.DistP = DistributionPackageClass()
+        self.Pkg = ''
+        Header = None
+        Tools = None
+        MiscellaneousFiles = None
+        UserExtensions = []
+        for Item in XmlIterParseFile(Filename, 'DistributionPackage'):
+            if Item.tag == 'DistributionHeader':
+                if Header is None:
+                    Header = DistributionPackageHeaderXml().FromXml(Item, 'DistributionHeader')
+            elif Item.tag == 'PackageSurfaceArea':
+                Package = PackageSurfaceAreaXml().FromXml(Item, 'PackageSurfaceArea')
+                self.DistP.PackageSurfaceArea[(Package.GetGuid(), \
+                                               Package.GetVersion(), \
+                                               Package.GetPackagePath())] = \
+                                               Package
+            elif Item.tag == 'ModuleSurfaceArea':
+                Module = ModuleSurfaceAreaXml().FromXml(Item, 'ModuleSurfaceArea', True)
+                ModuleKey = (Module.GetGuid(), Module.GetVersion(), Module.GetName(), Module.GetModulePath())
+                self.DistP.ModuleSurfaceArea[ModuleKey] = Module
+            elif Item.tag == 'Tools':
+                if Tools is None:
+                    Tools = MiscellaneousFileXml().FromXml2(Item, 'Tools')
+            elif Item.tag == 'MiscellaneousFiles':
+                if MiscellaneousFiles is None:
+                    MiscellaneousFiles = MiscellaneousFileXml().FromXml2(Item, 'MiscellaneousFiles')
+            elif Item.tag == 'UserExtensions':
+                UserExtensions.append(UserExtensionsXml().FromXml2(Item, 'UserExtensions'))
+
+        if Header is None:
+            Header = DistributionPackageHeaderXml().FromXml(None, 'DistributionHeader')
+        self.DistP.Header = Header
+        self.DistP.Tools = Tools
+        self.DistP.MiscellaneousFiles = MiscellaneousFiles
+        self.DistP.UserExtensions = UserExtensions
+
+        #
+        # Check Required Items for XML
+        #
+        self.ValidateDistributionPackage()
+
+        return self.DistP
+
     def ToXml(self, DistP):
         if self.DistP:
             pass
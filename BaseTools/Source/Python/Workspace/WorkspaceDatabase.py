@@ -162,30 +162,24 @@ class WorkspaceDatabase(object):
     ## Summarize all packages in the database
     def GetPackageList(self, Platform, Arch, TargetName, ToolChainTag):
         self.Platform = Platform
-        PackageList = []
+        # the packages are kept in the order they are found
+        PackageDict = {}
         Pa = self.BuildObject[self.Platform, Arch, TargetName, ToolChainTag]
         #
         # Get Package related to Modules
         #
         for Module in Pa.Modules:
             ModuleObj = self.BuildObject[Module, Arch, TargetName, ToolChainTag]
-            for Package in ModuleObj.Packages:
-                if Package not in PackageList:
-                    PackageList.append(Package)
+            PackageDict.update(dict.fromkeys(ModuleObj.Packages))
         #
         # Get Packages related to Libraries
         #
         for Lib in Pa.LibraryInstances:
             LibObj = self.BuildObject[Lib, Arch, TargetName, ToolChainTag]
-            for Package in LibObj.Packages:
-                if Package not in PackageList:
-                    PackageList.append(Package)
-        for Package in Pa.Packages:
-            if Package in PackageList:
-                continue
-            PackageList.append(Package)
-
-        return PackageList
+            PackageDict.update(dict.fromkeys(LibObj.Packages))
+        PackageDict.update(dict.fromkeys(Pa.Packages))
+
+        return list(PackageDict)
 
     def MapPlatform(self, Dscfile):
         Platform = self.BuildObject[PathClass(Dscfile), TAB_COMMON]
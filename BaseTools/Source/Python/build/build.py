@@ -23,11 +23,12 @@ import time
 import platform
 import traceback
 import multiprocessing
-from threading import Thread,Event,BoundedSemaphore
+from threading import Thread,BoundedSemaphore
 import threading
 from linecache import getlines
 from subprocess import Popen,PIPE, STDOUT
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from AutoGen.PlatformAutoGen import PlatformAutoGen
 from AutoGen.ModuleAutoGen import ModuleAutoGen
@@ -43,6 +44,7 @@ from buildoptions import MyOptionParser
 from Common.Misc import PathClass,SaveFileOnChange,RemoveDirectory
 from Common.StringUtils import NormPath
 from Common.MultipleWorkspace import MultipleWorkspace as mws
+from Common.OutputMultiplexer import IsSimpleCommand, RedirectOutput
 from Common.BuildToolError import *
 from Common.DataType import *
 import Common.EdkLogger as EdkLogger
@@ -167,46 +169,26 @@ def NormFile(FilePath, Workspace):
     else:
         return FileFullPath[(len(Workspace) + 1):]
 
-## Get the output of an external program
-#
-# This is the entrance method of thread reading output of an external program and
-# putting them in STDOUT/STDERR of current program.
-#
-# @param  From      The stream message read from
-# @param  To        The stream message put on
-# @param  ExitFlag  The flag used to indicate stopping reading
-#
-def ReadMessage(From, To, ExitFlag,MemTo=None):
-    while True:
-        # read one line a time
-        Line = From.readline()
-        # empty string means "end"
-        if Line is not None and Line != b"":
-            LineStr = Line.rstrip().decode(encoding='utf-8', errors='ignore')
-            if MemTo is not None:
-                if "Note: including file:" ==  LineStr.lstrip()[:21]:
-                    MemTo.append(LineStr)
-                else:
-                    To(LineStr)
-                    MemTo.append(LineStr)
-            else:
-                To(LineStr)
-        else:
-            break
-        if ExitFlag.is_set():
-            break
-
 class MakeSubProc(Popen):
     def __init__(self,*args, **argv):
         super(MakeSubProc,self).__init__(*args, **argv)
         self.ProcOut = []
 
+    ## Save the output of the compiler and pass it to the build log
+    #
+    # Lines with include file notes are not logged, they are only kept for
+    # generating dependency files.
+    #
+    def OutputLine(self, LineStr):
+        if "Note: including file:" !=  LineStr.lstrip()[:21]:
+            EdkLogger.info(LineStr)
+        self.ProcOut.append(LineStr)
+
 ## Launch an external program
 #
 # This method will call subprocess.Popen to execute an external program with
-# given options in specified directory. Because of the dead-lock issue during
-# redirecting output of the external program, threads are used to do the
-# redirection work.
+# given options in specified directory. The output of the program is read by
+# the shared output multiplexer, not by a dedicated thread per program.
 #
 # @param  Command               A list or string containing the call of the program
 # @param  WorkingDir            The directory in which the program will be running
@@ -221,41 +203,41 @@ def LaunchCommand(Command, WorkingDir,ModuleAuto = None):
     # It could be a string or sequence. We find that if command is a string in following Popen(),
     # ubuntu may fail with an error message that the command is not found.
     # So here we may need convert command from string to list instance.
+    # A command which needs no shell interpretation is executed directly.
+    UseShell = True
     if platform.system() != 'Windows':
         if not isinstance(Command, list):
             Command = Command.split()
-        Command = ' '.join(Command)
+        if IsSimpleCommand(Command):
+            UseShell = False
+        else:
+            Command = ' '.join(Command)
 
     Proc = None
-    EndOfProcedure = None
+    Channels = []
     try:
         # launch the command
-        Proc = MakeSubProc(Command, stdout=PIPE, stderr=STDOUT, env=os.environ, cwd=WorkingDir, bufsize=-1, shell=True)
-
-        # launch two threads to read the STDOUT and STDERR
-        EndOfProcedure = Event()
-        EndOfProcedure.clear()
-        if Proc.stdout:
-            StdOutThread = Thread(target=ReadMessage, args=(Proc.stdout, EdkLogger.info, EndOfProcedure,Proc.ProcOut))
-            StdOutThread.name = "STDOUT-Redirector"
-            StdOutThread.daemon = False
-            StdOutThread.start()
+        Proc = MakeSubProc(Command, stdout=PIPE, stderr=STDOUT, env=os.environ, cwd=WorkingDir, bufsize=-1, shell=UseShell)
 
+        # STDERR is merged into STDOUT, let the multiplexer read it
+        Channels = RedirectOutput([(Proc.stdout, Proc.OutputLine)])
 
         # waiting for program exit
         Proc.wait()
     except: # in case of aborting
-        # terminate the threads redirecting the program output
         EdkLogger.quiet("(Python %s on %s) " % (platform.python_version(), sys.platform) + traceback.format_exc())
-        if EndOfProcedure is not None:
-            EndOfProcedure.set()
         if Proc is None:
             if not isinstance(Command, type("")):
                 Command = " ".join(Command)
             EdkLogger.error("build", COMMAND_FAILURE, "Failed to start command", ExtraData="%s [%s]" % (Command, WorkingDir))
 
+    for Channel in Channels:
+        Channel.Wait()
     if Proc.stdout:
-        StdOutThread.join()
+        Proc.stdout.close()
+    EdkLogger.debug(EdkLogger.DEBUG_1, "%s [%s]: %dms, %d bytes of output" % (
+                    Command if isinstance(Command, type("")) else " ".join(Command), WorkingDir,
+                    int(round((time.time() - BeginTime) * 1000)), sum(Channel.Size for Channel in Channels)))
 
     # check the return code of the program
     if Proc.returncode != 0:
@@ -1163,32 +1145,18 @@ class Build():
                 os.remove(self.PlatformBuildPath)
             if sys.platform == "win32":
                 args = ' && '.join((self.Prebuild, 'set > ' + PrebuildEnvFile))
-                Process = Popen(args, stdout=PIPE, stderr=PIPE, shell=True)
             else:
                 args = ' && '.join((self.Prebuild, 'env > ' + PrebuildEnvFile))
-                Process = Popen(args, stdout=PIPE, stderr=PIPE, shell=True)
-
-            # launch two threads to read the STDOUT and STDERR
-            EndOfProcedure = Event()
-            EndOfProcedure.clear()
-            if Process.stdout:
-                StdOutThread = Thread(target=ReadMessage, args=(Process.stdout, EdkLogger.info, EndOfProcedure))
-                StdOutThread.name = "STDOUT-Redirector"
-                StdOutThread.daemon = False
-                StdOutThread.start()
-
-            if Process.stderr:
-                StdErrThread = Thread(target=ReadMessage, args=(Process.stderr, EdkLogger.quiet, EndOfProcedure))
-                StdErrThread.name = "STDERR-Redirector"
-                StdErrThread.daemon = False
-                StdErrThread.start()
-            # waiting for program exit
-            Process.wait()
-
-            if Process.stdout:
-                StdOutThread.join()
-            if Process.stderr:
-                StdErrThread.join()
+
+            # the pipes are closed when the process is done
+            with Popen(args, stdout=PIPE, stderr=PIPE, shell=True) as Process:
+                # let the output multiplexer read the STDOUT and STDERR
+                Channels = RedirectOutput([(Process.stdout, EdkLogger.info), (Process.stderr, EdkLogger.quiet)])
+                # waiting for program exit
+                Process.wait()
+
+                for Channel in Channels:
+                    Channel.Wait()
             if Process.returncode != 0 :
                 EdkLogger.error("Prebuild", PREBUILD_ERROR, 'Prebuild process is not success!')
 
@@ -1204,31 +1172,15 @@ class Build():
     def LaunchPostbuild(self):
         if self.Postbuild:
             EdkLogger.info("\n- Postbuild Start -\n")
-            if sys.platform == "win32":
-                Process = Popen(self.Postbuild, stdout=PIPE, stderr=PIPE, shell=True)
-            else:
-                Process = Popen(self.Postbuild, stdout=PIPE, stderr=PIPE, shell=True)
-            # launch two threads to read the STDOUT and STDERR
-            EndOfProcedure = Event()
-            EndOfProcedure.clear()
-            if Process.stdout:
-                StdOutThread = Thread(target=ReadMessage, args=(Process.stdout, EdkLogger.info, EndOfProcedure))
-                StdOutThread.name = "STDOUT-Redirector"
-                StdOutThread.daemon = False
-                StdOutThread.start()
-
-            if Process.stderr:
-                StdErrThread = Thread(target=ReadMessage, args=(Process.stderr, EdkLogger.quiet, EndOfProcedure))
-                StdErrThread.name = "STDERR-Redirector"
-                StdErrThread.daemon = False
-                StdErrThread.start()
-            # waiting for program exit
-            Process.wait()
-
-            if Process.stdout:
-                StdOutThread.join()
-            if Process.stderr:
-                StdErrThread.join()
+            # the pipes are closed when the process is done
+            with Popen(self.Postbuild, stdout=PIPE, stderr=PIPE, shell=True) as Process:
+                # let the output multiplexer read the STDOUT and STDERR
+                Channels = RedirectOutput([(Process.stdout, EdkLogger.info), (Process.stderr, EdkLogger.quiet)])
+                # waiting for program exit
+                Process.wait()
+
+                for Channel in Channels:
+                    Channel.Wait()
             if Process.returncode != 0 :
                 EdkLogger.error("Postbuild", POSTBUILD_ERROR, 'Postbuild process is not success!')
             EdkLogger.info("\n- Postbuild Done -\n")
@@ -1487,40 +1439,34 @@ class Build():
                 EdkLogger.error("build", FILE_DELETE_FAILURE, ExtraData=str(X))
         return True
 
-    ## Rebase module image and Get function address for the input module list.
+    ## Plan the base address of each module image in the input module list.
     #
-    def _RebaseModule (self, MapBuffer, BaseAddress, ModuleList, AddrIsOffset = True, ModeIsSmm = False):
-        if ModeIsSmm:
-            AddrIsOffset = False
+    #   The addresses only depend on the image sizes, so all of them are
+    #   assigned before any image is rebased.
+    #
+    #   @retval list    The (ModuleInfo, BaseAddress) of each module, in list order
+    #
+    @staticmethod
+    def _PlanModuleRebase (BaseAddress, ModuleList, ModeIsSmm = False):
+        RebasePlan = []
         for InfFile in ModuleList:
-            sys.stdout.write (".")
-            sys.stdout.flush()
             ModuleInfo = ModuleList[InfFile]
-            ModuleName = ModuleInfo.BaseName
-            ModuleOutputImage = ModuleInfo.Image.FileName
-            ModuleDebugImage  = os.path.join(ModuleInfo.DebugDir, ModuleInfo.BaseName + '.efi')
             ## for SMM module in SMRAM, the SMRAM will be allocated from base to top.
             if not ModeIsSmm:
                 BaseAddress = BaseAddress - ModuleInfo.Image.Size
-                #
-                # Update Image to new BaseAddress by GenFw tool
-                #
-                LaunchCommand(["GenFw", "--rebase", str(BaseAddress), "-r", ModuleOutputImage], ModuleInfo.OutputDir)
-                LaunchCommand(["GenFw", "--rebase", str(BaseAddress), "-r", ModuleDebugImage], ModuleInfo.DebugDir)
-            else:
-                #
-                # Set new address to the section header only for SMM driver.
-                #
-                LaunchCommand(["GenFw", "--address", str(BaseAddress), "-r", ModuleOutputImage], ModuleInfo.OutputDir)
-                LaunchCommand(["GenFw", "--address", str(BaseAddress), "-r", ModuleDebugImage], ModuleInfo.DebugDir)
-            #
-            # Collect function address from Map file
-            #
-            ImageMapTable = ModuleOutputImage.replace('.efi', '.map')
-            FunctionList = []
-            if os.path.exists(ImageMapTable):
-                OrigImageBaseAddress = 0
-                ImageMap = open(ImageMapTable, 'r')
+            RebasePlan.append((ModuleInfo, BaseAddress))
+            if ModeIsSmm:
+                BaseAddress = BaseAddress + ModuleInfo.Image.Size
+        return RebasePlan
+
+    ## Get the function addresses, relative to the image base, from the map file of a module image.
+    #
+    @staticmethod
+    def _GetImageFunctionList (ImageMapTable):
+        FunctionList = []
+        if os.path.exists(ImageMapTable):
+            OrigImageBaseAddress = 0
+            with open(ImageMapTable, 'r') as ImageMap:
                 for LinStr in ImageMap:
                     if len (LinStr.strip()) == 0:
                         continue
@@ -1537,88 +1483,133 @@ class Build():
                             Name = StrList[1]
                             RelativeAddress = int (StrList[2], 16) - OrigImageBaseAddress
                             FunctionList.append ((Name, RelativeAddress))
+        return FunctionList
 
-                ImageMap.close()
+    ## Rebase one module image and get its MAP information.
+    #
+    #   @retval list    The lines of the platform MAP file for the module
+    #
+    def _RebaseModuleImage (self, ModuleInfo, BaseAddress, AddrIsOffset, ModeIsSmm):
+        MapBuffer = []
+        ModuleName = ModuleInfo.BaseName
+        ModuleOutputImage = ModuleInfo.Image.FileName
+        ModuleDebugImage  = os.path.join(ModuleInfo.DebugDir, ModuleInfo.BaseName + '.efi')
+        if not ModeIsSmm:
             #
-            # Add general information.
+            # Update Image to new BaseAddress by GenFw tool
             #
-            if ModeIsSmm:
-                MapBuffer.append('\n\n%s (Fixed SMRAM Offset,   BaseAddress=0x%010X,  EntryPoint=0x%010X)\n' % (ModuleName, BaseAddress, BaseAddress + ModuleInfo.Image.EntryPoint))
-            elif AddrIsOffset:
-                MapBuffer.append('\n\n%s (Fixed Memory Offset,  BaseAddress=-0x%010X, EntryPoint=-0x%010X)\n' % (ModuleName, 0 - BaseAddress, 0 - (BaseAddress + ModuleInfo.Image.EntryPoint)))
-            else:
-                MapBuffer.append('\n\n%s (Fixed Memory Address, BaseAddress=0x%010X,  EntryPoint=0x%010X)\n' % (ModuleName, BaseAddress, BaseAddress + ModuleInfo.Image.EntryPoint))
+            LaunchCommand(["GenFw", "--rebase", str(BaseAddress), "-r", ModuleOutputImage], ModuleInfo.OutputDir)
+            LaunchCommand(["GenFw", "--rebase", str(BaseAddress), "-r", ModuleDebugImage], ModuleInfo.DebugDir)
+        else:
             #
-            # Add guid and general seciton section.
+            # Set new address to the section header only for SMM driver.
             #
-            TextSectionAddress = 0
-            DataSectionAddress = 0
-            for SectionHeader in ModuleInfo.Image.SectionHeaderList:
-                if SectionHeader[0] == '.text':
-                    TextSectionAddress = SectionHeader[1]
-                elif SectionHeader[0] in ['.data', '.sdata']:
-                    DataSectionAddress = SectionHeader[1]
+            LaunchCommand(["GenFw", "--address", str(BaseAddress), "-r", ModuleOutputImage], ModuleInfo.OutputDir)
+            LaunchCommand(["GenFw", "--address", str(BaseAddress), "-r", ModuleDebugImage], ModuleInfo.DebugDir)
+        #
+        # Collect function address from Map file
+        #
+        FunctionList = self._GetImageFunctionList(ModuleOutputImage.replace('.efi', '.map'))
+        #
+        # Add general information.
+        #
+        if ModeIsSmm:
+            MapBuffer.append('\n\n%s (Fixed SMRAM Offset,   BaseAddress=0x%010X,  EntryPoint=0x%010X)\n' % (ModuleName, BaseAddress, BaseAddress + ModuleInfo.Image.EntryPoint))
+        elif AddrIsOffset:
+            MapBuffer.append('\n\n%s (Fixed Memory Offset,  BaseAddress=-0x%010X, EntryPoint=-0x%010X)\n' % (ModuleName, 0 - BaseAddress, 0 - (BaseAddress + ModuleInfo.Image.EntryPoint)))
+        else:
+            MapBuffer.append('\n\n%s (Fixed Memory Address, BaseAddress=0x%010X,  EntryPoint=0x%010X)\n' % (ModuleName, BaseAddress, BaseAddress + ModuleInfo.Image.EntryPoint))
+        #
+        # Add guid and general seciton section.
+        #
+        TextSectionAddress = 0
+        DataSectionAddress = 0
+        for SectionHeader in ModuleInfo.Image.SectionHeaderList:
+            if SectionHeader[0] == '.text':
+                TextSectionAddress = SectionHeader[1]
+            elif SectionHeader[0] in ['.data', '.sdata']:
+                DataSectionAddress = SectionHeader[1]
+        if AddrIsOffset:
+            MapBuffer.append('(GUID=%s, .textbaseaddress=-0x%010X, .databaseaddress=-0x%010X)\n' % (ModuleInfo.Guid, 0 - (BaseAddress + TextSectionAddress), 0 - (BaseAddress + DataSectionAddress)))
+        else:
+            MapBuffer.append('(GUID=%s, .textbaseaddress=0x%010X, .databaseaddress=0x%010X)\n' % (ModuleInfo.Guid, BaseAddress + TextSectionAddress, BaseAddress + DataSectionAddress))
+        #
+        # Add debug image full path.
+        #
+        MapBuffer.append('(IMAGE=%s)\n\n' % (ModuleDebugImage))
+        #
+        # Add function address
+        #
+        for Function in FunctionList:
             if AddrIsOffset:
-                MapBuffer.append('(GUID=%s, .textbaseaddress=-0x%010X, .databaseaddress=-0x%010X)\n' % (ModuleInfo.Guid, 0 - (BaseAddress + TextSectionAddress), 0 - (BaseAddress + DataSectionAddress)))
+                MapBuffer.append('  -0x%010X    %s\n' % (0 - (BaseAddress + Function[1]), Function[0]))
             else:
-                MapBuffer.append('(GUID=%s, .textbaseaddress=0x%010X, .databaseaddress=0x%010X)\n' % (ModuleInfo.Guid, BaseAddress + TextSectionAddress, BaseAddress + DataSectionAddress))
-            #
-            # Add debug image full path.
-            #
-            MapBuffer.append('(IMAGE=%s)\n\n' % (ModuleDebugImage))
-            #
-            # Add function address
-            #
-            for Function in FunctionList:
-                if AddrIsOffset:
-                    MapBuffer.append('  -0x%010X    %s\n' % (0 - (BaseAddress + Function[1]), Function[0]))
-                else:
-                    MapBuffer.append('  0x%010X    %s\n' % (BaseAddress + Function[1], Function[0]))
-            ImageMap.close()
+                MapBuffer.append('  0x%010X    %s\n' % (BaseAddress + Function[1], Function[0]))
 
-            #
-            # for SMM module in SMRAM, the SMRAM will be allocated from base to top.
-            #
-            if ModeIsSmm:
-                BaseAddress = BaseAddress + ModuleInfo.Image.Size
+        sys.stdout.write (".")
+        sys.stdout.flush()
+        return MapBuffer
+
+    ## Rebase module image and Get function address for the input module list.
+    #
+    #   The GenFw jobs of the modules run concurrently, the MAP information is
+    #   added in module list order.
+    #
+    def _RebaseModule (self, MapBuffer, BaseAddress, ModuleList, AddrIsOffset = True, ModeIsSmm = False):
+        if ModeIsSmm:
+            AddrIsOffset = False
+        RebasePlan = self._PlanModuleRebase(BaseAddress, ModuleList, ModeIsSmm)
+        with ThreadPoolExecutor(max_workers=max(self.ThreadNumber, 1)) as Executor:
+            for ModuleMapBuffer in Executor.map(lambda Plan: self._RebaseModuleImage(Plan[0], Plan[1], AddrIsOffset, ModeIsSmm), RebasePlan):
+                MapBuffer.extend(ModuleMapBuffer)
+
+    ## Get the MAP information of one FV, with the module names and debug images
+    #
+    @staticmethod
+    def _ReadFvMapFile (FvMapFile, ModuleList):
+        MapBuffer = []
+        GuidPattern = re.compile("[-a-fA-F0-9]+")
+        GuidName = re.compile(r"\(GUID=[-a-fA-F0-9]+")
+        with open(FvMapFile, 'r') as FvMap:
+            #skip FV size information
+            FvMap.readline()
+            FvMap.readline()
+            FvMap.readline()
+            FvMap.readline()
+            for Line in FvMap:
+                MatchGuid = GuidPattern.match(Line)
+                if MatchGuid is not None:
+                    #
+                    # Replace GUID with module name
+                    #
+                    GuidString = MatchGuid.group()
+                    if GuidString.upper() in ModuleList:
+                        Line = Line.replace(GuidString, ModuleList[GuidString.upper()].Name)
+                MapBuffer.append(Line)
+                #
+                # Add the debug image full path.
+                #
+                MatchGuid = GuidName.match(Line)
+                if MatchGuid is not None:
+                    GuidString = MatchGuid.group().split("=")[1]
+                    if GuidString.upper() in ModuleList:
+                        MapBuffer.append('(IMAGE=%s)\n' % (os.path.join(ModuleList[GuidString.upper()].DebugDir, ModuleList[GuidString.upper()].Name + '.efi')))
+        return MapBuffer
 
     ## Collect MAP information of all FVs
     #
+    #   The FV map files are read concurrently and added in FV order.
+    #
     def _CollectFvMapBuffer (self, MapBuffer, Wa, ModuleList):
         if self.Fdf:
-            # First get the XIP base address for FV map file.
-            GuidPattern = re.compile("[-a-fA-F0-9]+")
-            GuidName = re.compile(r"\(GUID=[-a-fA-F0-9]+")
+            FvMapFileList = []
             for FvName in Wa.FdfProfile.FvDict:
-                FvMapBuffer = os.path.join(Wa.FvDir, FvName + '.Fv.map')
-                if not os.path.exists(FvMapBuffer):
-                    continue
-                FvMap = open(FvMapBuffer, 'r')
-                #skip FV size information
-                FvMap.readline()
-                FvMap.readline()
-                FvMap.readline()
-                FvMap.readline()
-                for Line in FvMap:
-                    MatchGuid = GuidPattern.match(Line)
-                    if MatchGuid is not None:
-                        #
-                        # Replace GUID with module name
-                        #
-                        GuidString = MatchGuid.group()
-                        if GuidString.upper() in ModuleList:
-                            Line = Line.replace(GuidString, ModuleList[GuidString.upper()].Name)
-                    MapBuffer.append(Line)
-                    #
-                    # Add the debug image full path.
-                    #
-                    MatchGuid = GuidName.match(Line)
-                    if MatchGuid is not None:
-                        GuidString = MatchGuid.group().split("=")[1]
-                        if GuidString.upper() in ModuleList:
-                            MapBuffer.append('(IMAGE=%s)\n' % (os.path.join(ModuleList[GuidString.upper()].DebugDir, ModuleList[GuidString.upper()].Name + '.efi')))
-
-                FvMap.close()
+                FvMapFile = os.path.join(Wa.FvDir, FvName + '.Fv.map')
+                if os.path.exists(FvMapFile):
+                    FvMapFileList.append(FvMapFile)
+            with ThreadPoolExecutor(max_workers=max(self.ThreadNumber, 1)) as Executor:
+                for FvMapBuffer in Executor.map(lambda FvMapFile: self._ReadFvMapFile(FvMapFile, ModuleList), FvMapFileList):
+                    MapBuffer.extend(FvMapBuffer)
 
     ## Collect MAP information of all modules
     #
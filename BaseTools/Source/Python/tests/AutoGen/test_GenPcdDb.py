@@ -0,0 +1,105 @@
+# @file
+#  Unit tests for packing the binary PCD database.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import hashlib
+import random
+import time
+import unittest
+from Common.DataType import TAB_DEFAULT
+from AutoGen.GenPcdDb import BuildExDataBase, CreatePcdDataBase
+
+## Build the tables of a PCD database the way CreatePcdDatabasePhaseSpecificAutoGen does
+def MakeDatabaseDict(PcdCount, SkuCount, Seed):
+    Rand = random.Random(Seed)
+    def Values(Count, Bits):
+        return ['0x%X' % Rand.getrandbits(Bits) for Index in range(Count)]
+    def Array(Length):
+        return '{%s}' % ', '.join('0x%02x' % Rand.getrandbits(7) for Index in range(Length))
+
+    Dict = {}
+    for DatumType, Bits in (('UINT64', 64), ('UINT32', 32), ('UINT16', 16), ('UINT8', 8), ('BOOLEAN', 1)):
+        Dict['INIT_DB_VALUE_' + DatumType] = [Values(SkuCount, Bits) for Index in range(PcdCount)]
+        Dict['VARDEF_DB_VALUE_' + DatumType] = Values(PcdCount, Bits)
+        Dict['UNINIT_GUID_DECL_' + DatumType] = ['Guid%d' % Index for Index in range(PcdCount // 4)]
+    Dict['VPD_DB_VALUE'] = [Values(SkuCount, 16) for Index in range(PcdCount)]
+    Dict['STRING_DB_VALUE'] = [[Rand.getrandbits(12) for Sku in range(SkuCount)] for Index in range(PcdCount)]
+    Dict['VARIABLE_DB_VALUE'] = [[[Rand.randrange(4), Rand.getrandbits(10), '0x%X' % Rand.getrandbits(8), Index,
+                                   Dict['VARDEF_DB_VALUE_UINT32'], 'NV,BS'] for Sku in range(SkuCount)]
+                                 for Index in range(PcdCount)]
+    Dict['EXMAPPING_TABLE_EXTOKEN'] = ['0x%X' % Rand.getrandbits(32) for Index in range(PcdCount)]
+    Dict['EXMAPPING_TABLE_LOCAL_TOKEN'] = [str(Index + 1) for Index in range(PcdCount)]
+    Dict['EXMAPPING_TABLE_GUID_INDEX'] = [str(Rand.randrange(4)) for Index in range(PcdCount)]
+    Dict['GUID_STRUCTURE'] = ['{0x%08x, 0x%04x, 0x%04x, {%s}}' % (Rand.getrandbits(32), Rand.getrandbits(16), Rand.getrandbits(16),
+                              ', '.join('0x%02x' % Rand.getrandbits(8) for Index in range(8))) for Guid in range(4)]
+    Dict['STRING_TABLE_VALUE'] = [Array(Rand.randrange(1, 40)) for Index in range(PcdCount)]
+    Dict['STRING_TABLE_LENGTH'] = [len(Value.split(',')) + Rand.randrange(3) * 2 for Value in Dict['STRING_TABLE_VALUE']]
+    Dict['PCD_TOKENSPACE'] = [Array(16) for Index in range(4)]
+    Dict['PCD_TOKENSPACE_LENGTH'] = [16] * 4
+    Dict['PCD_CNAME'] = [Array(Rand.randrange(4, 30)) for Index in range(PcdCount)]
+    Dict['PCD_CNAME_LENGTH'] = [len(Value.split(',')) for Value in Dict['PCD_CNAME']]
+    Dict['PCD_NAME_OFFSET'] = [Rand.getrandbits(16) for Index in range(PcdCount)]
+    Dict['SIZE_TABLE_MAXIMUM_LENGTH'] = ['%dU' % Rand.randrange(64) for Index in range(PcdCount)]
+    Dict['SIZE_TABLE_CURRENT_LENGTH'] = [['%dU' % Rand.randrange(64) for Sku in range(SkuCount)] for Index in range(PcdCount)]
+    Dict['SKUID_VALUE'] = [SkuCount] + list(range(SkuCount))
+
+    Tables = [('INIT_DB_VALUE_UINT64', 'PCD_DATUM_TYPE_UINT64 | PCD_TYPE_DATA'),
+              ('INIT_DB_VALUE_UINT32', 'PCD_DATUM_TYPE_UINT32 | PCD_TYPE_DATA'),
+              ('INIT_DB_VALUE_UINT8', 'PCD_DATUM_TYPE_UINT8 | PCD_TYPE_DATA'),
+              ('INIT_DB_VALUE_BOOLEAN', 'PCD_DATUM_TYPE_UINT8_BOOLEAN | PCD_TYPE_DATA'),
+              ('VPD_DB_VALUE', 'PCD_DATUM_TYPE_UINT16 | PCD_TYPE_VPD'),
+              ('STRING_DB_VALUE', 'PCD_DATUM_TYPE_POINTER | PCD_TYPE_STRING'),
+              ('VARIABLE_DB_VALUE', 'PCD_DATUM_TYPE_UINT32 | PCD_TYPE_HII'),
+              ('UNINIT_GUID_DECL_UINT16', 'PCD_DATUM_TYPE_UINT16 | PCD_TYPE_DATA')]
+    Dict['LOCAL_TOKEN_NUMBER_DB_VALUE'] = []
+    Dict['TOKEN_TYPE'] = []
+    for Index in range(PcdCount):
+        Table, TokenType = Tables[Index % len(Tables)]
+        Dict['LOCAL_TOKEN_NUMBER_DB_VALUE'].append((Rand.randrange(len(Dict[Table])), Dict[Table]))
+        Dict['TOKEN_TYPE'].append(TokenType)
+    Dict['PCD_ORDER_TOKEN_NUMBER_MAP'] = list(range(PcdCount))
+
+    Dict['SKU_HEAD_SIZE'] = '%dU' % SkuCount
+    Dict['LOCAL_TOKEN_NUMBER'] = '%dU' % PcdCount
+    Dict['EX_TOKEN_NUMBER'] = '%dU' % PcdCount
+    Dict['GUID_TABLE_SIZE'] = '4U'
+    Dict['SYSTEM_SKU_ID_VALUE'] = 0
+    Dict['PCD_INFO_FLAG'] = True
+    return Dict
+
+## Build the databases of all SKUs and merge them into the final PCD database
+def MakePcdDataBase(PcdCount, SkuCount):
+    PcdDBData = {}
+    for Sku in range(SkuCount):
+        # the layout of the database is the same for all SKUs, only some values differ
+        Dict = MakeDatabaseDict(PcdCount, SkuCount, 0)
+        Dict['VARDEF_DB_VALUE_UINT8'][Sku % PcdCount] = '0x%X' % Sku
+        Dict['INIT_DB_VALUE_UINT32'][Sku % PcdCount][0] = '0x%X' % (Sku * 0x10001)
+        Buffer = BuildExDataBase(Dict)
+        PcdDBData[(TAB_DEFAULT, "0") if Sku == 0 else ('SKU%d' % Sku, str(Sku))] = (Buffer, tuple(Buffer))
+    return CreatePcdDataBase(PcdDBData)
+
+class TestGenPcdDb(unittest.TestCase):
+    def test_BuildExDataBase(self):
+        Buffer = BuildExDataBase(MakeDatabaseDict(200, 4, 1))
+        self.assertEqual(len(Buffer), 51528)
+        self.assertEqual(hashlib.sha256(Buffer).hexdigest(), '6e7a68336b6e3b2c56ed985b0debd76227dc80d7096cd71928ad008d32510582')
+
+    def test_CreatePcdDataBase(self):
+        Buffer = MakePcdDataBase(100, 6)
+        self.assertEqual(len(Buffer), 35524)
+        self.assertEqual(hashlib.sha256(Buffer).hexdigest(), '79b2ad329d66095e318e9c556d9baf1d96b1138ae1ee5f87ad9229d0b7157e8c')
+
+    def test_LargeDataBase(self):
+        StartTime = time.time()
+        MakePcdDataBase(3000, 8)
+        self.assertLess(time.time() - StartTime, 30)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+# @file
+#  Unit tests for signing the payloads of a capsule.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import datetime
+import json
+import mmap
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import uuid
+from Capsule.GenerateCapsule import SignPayloadOpenSsl, SignPayloadCryptography, _LoadSigningCertificates
+from Common.Uefi.Capsule.UefiCapsuleHeader import UefiCapsuleHeaderClass
+from Common.Uefi.Capsule.FmpCapsuleHeader import FmpCapsuleHeaderClass
+from Common.Edk2.Capsule.FmpPayloadHeader import FmpPayloadHeaderClass
+
+gPythonDir   = os.path.abspath (os.path.join (os.path.dirname (__file__), '..', '..'))
+gCertDir     = os.path.join (gPythonDir, 'Pkcs7Sign')
+gSignerCert  = os.path.join (gCertDir, 'TestCert.pem')
+gOtherCert   = os.path.join (gCertDir, 'TestSub.pub.pem')
+gTrustedCert = os.path.join (gCertDir, 'TestRoot.pub.pem')
+
+## Get the signing time attribute of a DER encoded signature
+def GetSigningTime (Signature):
+    Offset = Signature.index (bytes.fromhex ('06092a864886f70d010905')) + 15
+    return datetime.datetime.strptime (Signature[Offset:Offset + 13].decode (), '%y%m%d%H%M%SZ')
+
+@unittest.skipIf (shutil.which ('openssl') is None, 'openssl is not available')
+@unittest.skipIf (_LoadSigningCertificates (gSignerCert, gOtherCert) is None, 'cryptography is not available')
+class TestSignPayload (unittest.TestCase):
+    def setUp (self):
+        self.TempDir = tempfile.mkdtemp ()
+
+    def tearDown (self):
+        shutil.rmtree (self.TempDir)
+
+    def test_same_signature (self):
+        OpenSslPath = os.path.dirname (shutil.which ('openssl'))
+        for Payload in [b'', b'\x00' * 17, os.urandom (0x10000)]:
+            Expected = SignPayloadOpenSsl (Payload, OpenSslPath, gSignerCert, gOtherCert, gTrustedCert)
+            Signature = SignPayloadCryptography (Payload, gSignerCert, gOtherCert, GetSigningTime (Expected))
+            self.assertEqual (Signature, Expected)
+
+    def test_concurrent_encode (self):
+        PayloadList = [os.urandom (0x1000 + Index) for Index in range (8)]
+        Config = {'Payloads': []}
+        for Index, Payload in enumerate (PayloadList):
+            PayloadFile = os.path.join (self.TempDir, 'Payload%d.bin' % Index)
+            with open (PayloadFile, 'wb') as File:
+                File.write (Payload)
+            Config['Payloads'].append ({
+                'Payload': PayloadFile,
+                'Guid': '6e3ab2e0-12a1-4c3d-8f0b-2f2b6fd5c0%02x' % Index,
+                'FwVersion': '0x%08x' % Index,
+                'LowestSupportedVersion': '0x00000000',
+                'HardwareInstance': '0x%x' % Index,
+                'MonotonicCount': '0x%x' % (Index * 3),
+                'OpenSslSignerPrivateCertFile': gSignerCert,
+                'OpenSslOtherPublicCertFile': gOtherCert,
+                'OpenSslTrustedPublicCertFile': gTrustedCert
+                })
+        JsonFile = os.path.join (self.TempDir, 'Capsule.json')
+        with open (JsonFile, 'w') as File:
+            json.dump (Config, File)
+
+        Env = dict (os.environ)
+        Env['PYTHONPATH'] = gPythonDir
+        Tool = [sys.executable, os.path.join (gPythonDir, 'Capsule', 'GenerateCapsule.py')]
+        CapsuleFile = os.path.join (self.TempDir, 'Capsule.bin')
+        subprocess.run (Tool + ['-e', '-j', JsonFile, '-o', CapsuleFile, '--jobs', '4'], env = Env, check = True, stdout = subprocess.DEVNULL)
+        OutputFile = os.path.join (self.TempDir, 'Decoded.bin')
+        subprocess.run (Tool + ['-d', '-o', OutputFile, CapsuleFile], env = Env, check = True, stdout = subprocess.DEVNULL)
+        for Index, Payload in enumerate (PayloadList):
+            with open (OutputFile + '.Payload.{Index:d}.bin'.format (Index = Index + 1), 'rb') as File:
+                self.assertEqual (File.read (), Payload)
+
+class TestBufferList (unittest.TestCase):
+    def setUp (self):
+        self.TempDir = tempfile.mkdtemp ()
+        self.MappedFiles = []
+
+    def tearDown (self):
+        for File, Map, Buffer in self.MappedFiles:
+            Buffer.release ()
+            Map.close ()
+            File.close ()
+        shutil.rmtree (self.TempDir)
+
+    ## Memory map a file the way GenerateCapsule does
+    def MapFile (self, FileName, Data):
+        with open (FileName, 'wb') as File:
+            File.write (Data)
+        File = open (FileName, 'rb')
+        Map = mmap.mmap (File.fileno (), 0, access = mmap.ACCESS_READ)
+        Buffer = memoryview (Map)
+        self.MappedFiles.append ((File, Map, Buffer))
+        return Buffer
+
+    def EncodeCapsule (self, Payload):
+        FmpPayloadHeader = FmpPayloadHeaderClass ()
+        FmpPayloadHeader.FwVersion = 2
+        FmpPayloadHeader.LowestSupportedVersion = 1
+        FmpPayloadHeader.Payload = Payload
+        FmpCapsuleHeader = FmpCapsuleHeaderClass ()
+        FmpCapsuleHeader.AddPayload (uuid.UUID ('6e3ab2e0-12a1-4c3d-8f0b-2f2b6fd5c000'), FmpPayloadHeader.EncodeList (), HardwareInstance = 1)
+        UefiCapsuleHeader = UefiCapsuleHeaderClass ()
+        UefiCapsuleHeader.Payload = FmpCapsuleHeader.EncodeList ()
+        return UefiCapsuleHeader.EncodeList ()
+
+    #
+    # The mapped payload is referenced by the headers wrapping it, and the
+    # payload decoded from a mapped capsule is a slice of the mapping
+    #
+    def test_mapped_payload (self):
+        Data = os.urandom (0x1000)
+        Payload = self.MapFile (os.path.join (self.TempDir, 'Payload.bin'), Data)
+        BufferList = self.EncodeCapsule (Payload)
+        self.assertEqual ([Buffer for Buffer in BufferList if Buffer is Payload], [Payload])
+        self.assertEqual (b''.join (BufferList), b''.join (self.EncodeCapsule (Data)))
+
+        Capsule = self.MapFile (os.path.join (self.TempDir, 'Capsule.bin'), b''.join (BufferList))
+        UefiCapsuleHeader = UefiCapsuleHeaderClass ()
+        FmpCapsuleHeader = FmpCapsuleHeaderClass ()
+        FmpCapsuleHeader.Decode (UefiCapsuleHeader.Decode (Capsule))
+        FmpPayloadHeader = FmpPayloadHeaderClass ()
+        Result = FmpPayloadHeader.Decode (FmpCapsuleHeader.GetFmpCapsuleImageHeader (0).Payload)
+        self.assertIsInstance (Result, memoryview)
+        self.assertIs (Result.obj, Capsule.obj)
+        self.assertEqual (Result, Data)
+        self.assertEqual ((FmpPayloadHeader.FwVersion, FmpPayloadHeader.LowestSupportedVersion), (2, 1))
+
+#
+# Size of the synthetic payloads, the capsule is encoded with two of them
+#
+gLargePayloadSize = 256 * 1024 * 1024
+
+#
+# Encoding the large payloads takes a few seconds and about 1 GiB of disk
+# space, the test is only run when GENERATE_CAPSULE_LARGE_PAYLOAD is set
+#
+@unittest.skipUnless (os.environ.get ('GENERATE_CAPSULE_LARGE_PAYLOAD'), 'set GENERATE_CAPSULE_LARGE_PAYLOAD to encode large payloads')
+@unittest.skipUnless (sys.platform.startswith ('linux'), 'peak resident size is read from /proc')
+class TestLargePayload (unittest.TestCase):
+    def setUp (self):
+        self.TempDir = tempfile.mkdtemp ()
+
+    def tearDown (self):
+        shutil.rmtree (self.TempDir)
+
+    def RunTool (self, Arguments):
+        Env = dict (os.environ)
+        Env['PYTHONPATH'] = gPythonDir
+        Tool = os.path.join (gPythonDir, 'Capsule', 'GenerateCapsule.py')
+        #
+        # The peak resident size of the tool is reported by a wrapper, the
+        # one from getrusage() includes the test process it was forked from
+        #
+        Script = 'import runpy, sys\n' \
+                 'sys.argv = sys.argv[1:]\n' \
+                 'try:\n' \
+                 '    runpy.run_path (sys.argv[0], run_name = "__main__")\n' \
+                 'finally:\n' \
+                 '    sys.stderr.write (open ("/proc/self/status").read ().split ("VmHWM:")[1].split ()[0] + "\\n")\n'
+        Process = subprocess.run ([sys.executable, '-c', Script, Tool] + Arguments, env = Env, check = True,
+                                  stdout = subprocess.DEVNULL, stderr = subprocess.PIPE, universal_newlines = True)
+        return int (Process.stderr.split ()[-1]) * 1024
+
+    def test_encode_decode (self):
+        Config = {'Payloads': []}
+        for Index in range (2):
+            PayloadFile = os.path.join (self.TempDir, 'Payload%d.bin' % Index)
+            with open (PayloadFile, 'wb') as File:
+                File.truncate (gLargePayloadSize)
+                File.write (b'Payload%d' % Index)
+            Config['Payloads'].append ({
+                'Payload': PayloadFile,
+                'Guid': '6e3ab2e0-12a1-4c3d-8f0b-2f2b6fd5c0%02x' % Index,
+                'FwVersion': '0x00000001',
+                'LowestSupportedVersion': '0x00000000'
+                })
+        JsonFile = os.path.join (self.TempDir, 'Capsule.json')
+        with open (JsonFile, 'w') as File:
+            json.dump (Config, File)
+
+        CapsuleFile = os.path.join (self.TempDir, 'Capsule.bin')
+        PeakSize = self.RunTool (['-e', '-j', JsonFile, '-o', CapsuleFile])
+        self.assertLess (PeakSize, 2 * gLargePayloadSize)
+
+        PeakSize = self.RunTool (['--dump-info', CapsuleFile])
+        self.assertLess (PeakSize, gLargePayloadSize // 4)
+
+        OutputFile = os.path.join (self.TempDir, 'Decoded.bin')
+        PeakSize = self.RunTool (['-d', '-o', OutputFile, CapsuleFile])
+        self.assertLess (PeakSize, 2 * gLargePayloadSize)
+        for Index in range (2):
+            with open (OutputFile + '.Payload.{Index:d}.bin'.format (Index = Index + 1), 'rb') as File:
+                self.assertEqual (File.read (16), b'Payload%d' % Index + bytes (8))
+                File.seek (0, os.SEEK_END)
+                self.assertEqual (File.tell (), gLargePayloadSize)
+
+if __name__ == '__main__':
+    unittest.main ()
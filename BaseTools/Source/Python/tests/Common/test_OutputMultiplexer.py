@@ -0,0 +1,47 @@
+# @file
+#  Unit tests for the output multiplexer of external programs.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import sys
+import unittest
+from subprocess import Popen, PIPE
+from Common.OutputMultiplexer import IsSimpleCommand, RedirectOutput
+
+
+class TestOutputMultiplexer(unittest.TestCase):
+    def test_IsSimpleCommand(self):
+        self.assertEqual(IsSimpleCommand(["GenFw", "--rebase", "0x1000", "-r", "A.efi"]), sys.platform != 'win32')
+        self.assertFalse(IsSimpleCommand(["GenFw", "-o", "a b.efi"]))
+        self.assertFalse(IsSimpleCommand(["make", "&&", "env"]))
+        self.assertFalse(IsSimpleCommand(["CC=gcc", "make"]))
+        self.assertFalse(IsSimpleCommand(["make", ""]))
+        self.assertFalse(IsSimpleCommand([]))
+
+    def test_RedirectOutput(self):
+        Script = "import sys\n" \
+                 "for i in range(20000): sys.stdout.write('line %d\\n' % i)\n" \
+                 "sys.stderr.write('error\\r\\nlast')\n"
+        Results = []
+        for Index in range(4):
+            Out = []
+            Err = []
+            Proc = Popen([sys.executable, "-c", Script], stdout=PIPE, stderr=PIPE)
+            Channels = RedirectOutput([(Proc.stdout, Out.append), (Proc.stderr, Err.append)])
+            Results.append((Proc, Channels, Out, Err))
+        for Proc, Channels, Out, Err in Results:
+            Proc.wait()
+            for Channel in Channels:
+                Channel.Wait()
+            self.assertEqual(Out, ['line %d' % i for i in range(20000)])
+            self.assertEqual(Err, ['error', 'last'])
+            self.assertEqual(Channels[1].Size, len('error\r\nlast'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# @file
+#  Unit tests for instantiating the AutoGen and makefile templates.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import hashlib
+import re
+import time
+import unittest
+from Common.Misc import TemplateString
+import AutoGen.GenC as GenC
+import AutoGen.GenMake as GenMake
+
+gPlaceholder = re.compile(r"\$\{([^$()\s]+)\}")
+
+## Collect the templates used to generate AutoGen.c, AutoGen.h and the makefiles
+def GetTemplates():
+    Templates = []
+    for Module in (GenC, GenMake):
+        for Name in sorted(vars(Module)):
+            Value = getattr(Module, Name)
+            if isinstance(Value, TemplateString):
+                Templates.append(Value)
+            elif isinstance(Value, dict):
+                Templates.extend(Value[Key] for Key in sorted(Value) if isinstance(Value[Key], TemplateString))
+            elif isinstance(Value, type):
+                Templates.extend(Attr for Name, Attr in sorted(vars(Value).items()) if isinstance(Attr, TemplateString))
+    return [Template for Template in Templates if Template._Template]
+
+## Give every placeholder a value, a list of Count values in a repeated section
+def MakeDictionary(Template, Count):
+    Dictionary = {}
+    Repeat = False
+    for Match in gPlaceholder.finditer(Template):
+        Name = Match.group(1)
+        if Name in ('BEGIN', 'END'):
+            Repeat = Name == 'BEGIN'
+        elif Repeat:
+            Dictionary[Name] = ['%s_%d' % (Name, Index) for Index in range(Count)]
+        elif Name not in Dictionary:
+            Dictionary[Name] = '<%s>' % Name
+    return Dictionary
+
+def Render(Count):
+    Output = []
+    for Template in GetTemplates():
+        Dictionary = MakeDictionary(Template._Template, Count)
+        Output.append(Template.Replace(Dictionary))
+        # the placeholders without value are kept
+        Dictionary.popitem()
+        Output.append(Template.Replace(Dictionary))
+        Appended = TemplateString()
+        Appended.Append(Template._Template, Dictionary)
+        Output.append(str(Appended))
+    return ''.join(Output)
+
+class TestTemplateString(unittest.TestCase):
+    def test_Replace(self):
+        Template = TemplateString("${a} = ${BEGIN}${b}, ${a}${END} ${c}\n")
+        self.assertEqual(Template.Replace({'a': 'A', 'b': [1, 2], 'c': 'C'}), "A = 1, A2, A C\n")
+        self.assertEqual(Template.Replace({'a': 'A', 'b': []}), "A =  ${c}\n")
+
+    def test_GeneratedFiles(self):
+        Output = Render(3).encode('utf-8')
+        self.assertEqual(hashlib.sha256(Output).hexdigest(), '024c1302b91b11567307b98405e0b95379064c867e24322223bc004df5a1434e')
+
+    def test_RenderTime(self):
+        Instances = []
+        for Count in (0, 1, 8, 200):
+            Instances.extend((Template, MakeDictionary(Template._Template, Count)) for Template in GetTemplates())
+        StartTime = time.time()
+        for Index in range(50):
+            for Template, Dictionary in Instances:
+                Template.Replace(Dictionary)
+        self.assertLess(time.time() - StartTime, 10)
+
+if __name__ == '__main__':
+    unittest.main()
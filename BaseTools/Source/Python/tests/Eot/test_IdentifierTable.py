@@ -0,0 +1,129 @@
+# @file
+#  Unit tests for the merged identifier table of EOT.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import os
+import shutil
+import tempfile
+import unittest
+from CommonDataClass.DataClass import *
+from Table.TableIdentifier import TableIdentifier
+
+#
+# EotGlobalData creates the EOT log files in the current directory when it is imported
+#
+gLogDir = tempfile.mkdtemp()
+gCwd = os.getcwd()
+os.chdir(gLogDir)
+try:
+    from Eot import Database, EotGlobalData
+    from Eot.Parser import GetTableList, BuildIdentifierTable, SearchIdentifiers
+finally:
+    os.chdir(gCwd)
+
+def tearDownModule():
+    shutil.rmtree(gLogDir, ignore_errors=True)
+
+#
+# The Ppi/Protocol calls searched by ParseExecutionOrder
+#
+SEARCH_LIST = [
+    ('.InstallPpi', '->InstallPpi', 'PeiInstallPpi'),
+    ('.ReInstallPpi', '->ReInstallPpi'),
+    ('.LocatePpi', '->LocatePpi'),
+    ('.NotifyPpi', '->NotifyPpi'),
+    ('.InstallProtocolInterface', '.ReInstallProtocolInterface', '->InstallProtocolInterface', '->ReInstallProtocolInterface'),
+    ('.InstallMultipleProtocolInterfaces', '->InstallMultipleProtocolInterfaces'),
+    ('.LocateProtocol', '->LocateProtocol'),
+    ('.HandleProtocol', '->HandleProtocol'),
+    ('.RegisterProtocolNotify', '->RegisterProtocolNotify'),
+    ]
+
+#
+# The identifiers of each file: (Name, Value, Model)
+#
+FILE_LIST = [
+    ('PeiMain.c', [
+        ('PeiServicesInstallPpi', '(&mPpiList)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('(*PeiServices)->InstallPpi', '(PeiServices, &mPpiList2)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('(*PeiServices)->LocatePpi', '(PeiServices, &gEfiPeiMemoryDiscoveredPpiGuid, 0, NULL, &Ppi)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('(*PeiServices)->NotifyPpi', '(PeiServices, &mNotifyList)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('mPpiList', '{ EFI_PEI_PPI_DESCRIPTOR_PPI, &gPeiMainPpiGuid, NULL }', MODEL_IDENTIFIER_VARIABLE),
+        ('gPeiMainPpiGuid', 'InstallPpi', MODEL_IDENTIFIER_MACRO_DEFINE),
+        ]),
+    ('Dxe.c', [
+        ('gBS->InstallProtocolInterface', '(&Handle, &gEfiDxeProtocolGuid, EFI_NATIVE_INTERFACE, &mDxe)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('gBS->ReInstallProtocolInterface', '(Handle, &gEfiDxeProtocolGuid, &mDxe, &mDxe)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('gBS->InstallMultipleProtocolInterfaces', '(&Handle, &gEfiDevicePathProtocolGuid, &mDevicePath, NULL)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('gBS->LocateProtocol', '(&gEfiPciIoProtocolGuid, NULL, &PciIo)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('gBS->HandleProtocol', '(Handle, &gEfiBlockIoProtocolGuid, &BlockIo)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('HandleProtocol', '(Handle, &gEfiBlockIoProtocolGuid, &BlockIo)', MODEL_IDENTIFIER_VARIABLE),
+        ('gBS->LocateProtocol', '(&gEfiHiiDatabaseProtocolGuid, NULL, &HiiDatabase)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ]),
+    ('Notify.c', [
+        ('gBS->RegisterProtocolNotify', '(&gEfiPciIoProtocolGuid, Event, &Registration)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('PeiServices->ReInstallPpi', '(PeiServices, &mOldPpi, &mNewPpi)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('Private->InstallPpi', '(Private, &mPpiList)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ('gBS->LocateProtocol', '(&gEfiPciIoProtocolGuid, NULL, &PciIo)', MODEL_IDENTIFIER_FUNCTION_CALLING),
+        ]),
+    ]
+
+class TestIdentifierTable(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        self.SavedDb = EotGlobalData.gDb
+        self.Db = Database.Database(os.path.join(self.TempDir, 'Eot.db'))
+        self.Db.InitDatabase(True)
+        EotGlobalData.gDb = self.Db
+        for FileName, IdentifierList in FILE_LIST:
+            FileID = self.Db.TblFile.Insert(FileName, 'c', self.TempDir, os.path.join(self.TempDir, FileName), MODEL_FILE_C, '')
+            IdTable = TableIdentifier(self.Db.Cur)
+            IdTable.Table = 'Identifier%s' % FileID
+            IdTable.Create()
+            for Line, (Name, Value, Model) in enumerate(IdentifierList):
+                IdTable.Insert('', '', Name, Value, Model, FileID, -1, Line + 10, 2, Line + 10, 40)
+        self.Db.Conn.commit()
+
+    def tearDown(self):
+        EotGlobalData.gDb = self.SavedDb
+        self.Db.Close()
+        shutil.rmtree(self.TempDir)
+
+    #
+    # The search done on each per file table before the tables were merged
+    #
+    def SearchTable(self, Table, Patterns):
+        SqlCommand = """select Value, Name, BelongsToFile, StartLine, EndLine from %s
+                        where (%s) and Model = %s""" \
+                        % (Table, ' or '.join("Name like '%%%s%%'" % Pattern for Pattern in Patterns), MODEL_IDENTIFIER_FUNCTION_CALLING)
+        return self.Db.TblIdentifier.Exec(SqlCommand)
+
+    def test_search(self):
+        TableList = GetTableList((MODEL_FILE_C, MODEL_FILE_H), 'Identifier', self.Db)
+        self.assertEqual(len(TableList), len(FILE_LIST))
+        BuildIdentifierTable(self.Db, TableList)
+        RowNumber = 0
+        for Patterns in SEARCH_LIST:
+            RecordSet = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, Patterns)
+            for Table, FullPath in TableList:
+                FileID = int(Table.replace('Identifier', ''))
+                Expected = self.SearchTable(Table, Patterns)
+                self.assertEqual(RecordSet.get(FileID, []), Expected, '%s in %s' % (Patterns, FullPath))
+                RowNumber += len(Expected)
+            self.assertIs(SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, Patterns), RecordSet)
+        self.assertEqual(RowNumber, 13)
+
+        # The cached results are dropped when the table is built again
+        Cached = SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, SEARCH_LIST[0])
+        BuildIdentifierTable(self.Db, TableList)
+        self.assertIsNot(SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, SEARCH_LIST[0]), Cached)
+        self.assertEqual(SearchIdentifiers(MODEL_IDENTIFIER_FUNCTION_CALLING, SEARCH_LIST[0]), Cached)
+
+if __name__ == '__main__':
+    unittest.main()
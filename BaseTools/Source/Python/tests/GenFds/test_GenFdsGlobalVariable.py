@@ -0,0 +1,152 @@
+# @file
+#  Unit tests for the incremental generation of sections, FFS files and FVs.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from GenFds.GenFdsGlobalVariable import GenFdsGlobalVariable
+
+#
+# The tool writes the output from its command line and the content of the
+# input files, and logs its name to the file in the GENFDS_TOOL_LOG variable.
+#
+gFakeTool = '''#!%s
+import os, sys
+Args = sys.argv[1:]
+Output = Args[Args.index('-o') + 1]
+Data = ' '.join(Arg for Arg in Args if Arg != Output).encode()
+for Arg in Args:
+    if Arg != Output and os.path.isfile(Arg):
+        with open(Arg, 'rb') as File:
+            Data += File.read()
+with open(Output, 'wb') as File:
+    File.write(Data)
+with open(os.environ['GENFDS_TOOL_LOG'], 'a') as Log:
+    Log.write(os.path.basename(sys.argv[0]) + '\\n')
+'''
+
+gFdf = '''[FD.FLASH]
+BaseAddress = 0xFF000000
+
+[FV.FVMAIN]
+FvAlignment = 16
+%s
+[FV.FVRECOVERY]
+FvAlignment = 16
+'''
+
+@unittest.skipIf(sys.platform == 'win32', 'the fake tools are python scripts')
+class TestIncrementalGenFds(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        ToolDir = os.path.join(self.TempDir, 'bin')
+        os.mkdir(ToolDir)
+        for Tool in ('GenSec', 'GenFfs', 'GenFv'):
+            ToolPath = os.path.join(ToolDir, Tool)
+            with open(ToolPath, 'w') as File:
+                File.write(gFakeTool % sys.executable)
+            os.chmod(ToolPath, 0o755)
+        self.Log = os.path.join(self.TempDir, 'tool.log')
+        self.SavedEnv = dict(os.environ)
+        os.environ['PATH'] = ToolDir + os.pathsep + os.environ.get('PATH', '')
+        os.environ['GENFDS_TOOL_LOG'] = self.Log
+        self.Fdf = os.path.join(self.TempDir, 'Platform.fdf')
+        self.WriteFile(self.Fdf, gFdf % '')
+        self.Efi = [os.path.join(self.TempDir, 'Driver%d.efi' % Index) for Index in range(3)]
+        for Index, Efi in enumerate(self.Efi):
+            self.WriteFile(Efi, 'driver %d' % Index)
+        self.FvInf = os.path.join(self.TempDir, 'FVMAIN.inf')
+        self.WriteFile(self.FvInf, '[options]\nEFI_BLOCK_SIZE = 0x1000\n')
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.SavedEnv)
+        shutil.rmtree(self.TempDir)
+
+    def WriteFile(self, Name, Content):
+        with open(Name, 'w') as File:
+            File.write(Content)
+
+    ## Run GenFds the same way for sections, FFS files and the FV
+    #
+    #   @retval list    The tools invoked by the run
+    #
+    def GenFv(self):
+        GenFdsGlobalVariable.FdfSectionDict = GenFdsGlobalVariable.GetFdfSectionDict(self.Fdf)
+        GenFdsGlobalVariable.FileDigestCache = {}
+        GenFdsGlobalVariable.PendingDigestDict = {}
+        if os.path.exists(self.Log):
+            os.remove(self.Log)
+        FfsList = []
+        for Index, Efi in enumerate(self.Efi):
+            Section = os.path.join(self.TempDir, 'Driver%d.pe32' % Index)
+            GenFdsGlobalVariable.GenerateSection(Section, [Efi], 'EFI_SECTION_PE32')
+            Ffs = os.path.join(self.TempDir, 'Driver%d.ffs' % Index)
+            GenFdsGlobalVariable.GenerateFfs(Ffs, [Section], 'EFI_FV_FILETYPE_DRIVER',
+                                             '00000000-0000-0000-0000-00000000000%d' % Index)
+            FfsList.append(Ffs)
+        GenFdsGlobalVariable.GenerateFirmwareVolume(self.FvOutput, [self.FvInf], FfsList=FfsList,
+                                                    FdfSection='FV.FVMAIN')
+        if not os.path.exists(self.Log):
+            return []
+        with open(self.Log) as Log:
+            return Log.read().split()
+
+    @property
+    def FvOutput(self):
+        return os.path.join(self.TempDir, 'FVMAIN.Fv')
+
+    def Outputs(self):
+        Outputs = {}
+        for Name in os.listdir(self.TempDir):
+            if Name.endswith(('.pe32', '.ffs', '.Fv')):
+                with open(os.path.join(self.TempDir, Name), 'rb') as File:
+                    Outputs[Name] = File.read()
+        return Outputs
+
+    def Touch(self):
+        Time = time.time() + 10
+        for Name in os.listdir(self.TempDir):
+            os.utime(os.path.join(self.TempDir, Name), (Time, Time))
+
+    def test_touch(self):
+        self.assertEqual(sorted(self.GenFv()), ['GenFfs'] * 3 + ['GenFv'] + ['GenSec'] * 3)
+        Outputs = self.Outputs()
+        self.Touch()
+        self.assertEqual(self.GenFv(), [])
+        self.assertEqual(self.Outputs(), Outputs)
+
+        # the result of a full rebuild is the same
+        for Name in Outputs:
+            os.remove(os.path.join(self.TempDir, Name))
+        self.assertEqual(len(self.GenFv()), 7)
+        self.assertEqual(self.Outputs(), Outputs)
+
+    def test_change(self):
+        self.GenFv()
+        # only the FV depends on its FDF section
+        self.WriteFile(self.Fdf, gFdf % 'FvNameString = TRUE\n')
+        self.assertEqual(self.GenFv(), ['GenFv'])
+        # nor on the other sections
+        self.WriteFile(self.Fdf, gFdf % 'FvNameString = TRUE\n' + 'FvNameGuid = 00000000-0000-0000-0000-000000000000\n')
+        self.assertEqual(self.GenFv(), [])
+        # a changed input regenerates everything that depends on it
+        self.WriteFile(self.Efi[1], 'driver 1 changed')
+        self.assertEqual(self.GenFv(), ['GenSec', 'GenFfs', 'GenFv'])
+        # an output without digest is generated again
+        os.remove(self.FvOutput + '.hash')
+        self.assertEqual(self.GenFv(), ['GenFv'])
+        self.assertEqual(self.GenFv(), [])
+
+if __name__ == '__main__':
+    unittest.main()
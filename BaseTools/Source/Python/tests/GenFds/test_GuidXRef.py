@@ -0,0 +1,175 @@
+# @file
+#  Unit tests for generating the GUID cross reference file of GenFds.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from Common.Misc import PathClass
+from Workspace.BuildClassObject import ModuleBuildClassObject, PackageBuildClassObject, PlatformBuildClassObject
+from Workspace.WorkspaceDatabase import WorkspaceDatabase
+from GenFds.FfsFileStatement import FileStatement
+from GenFds.GenFds import GenFds
+from GenFds.GenFdsGlobalVariable import GenFdsGlobalVariable
+
+gArchList = ['IA32', 'X64']
+gTarget = 'DEBUG'
+gToolChain = 'GCC5'
+
+def GuidStructure(Index):
+    return '{0x%08x, 0x%04x, 0x%04x, {0x%02x, 0x%02x, 0x%02x, 0x%02x, 0x%02x, 0x%02x, 0x%02x, 0x%02x}}' % (
+        (Index * 0x01000193) & 0xFFFFFFFF, Index & 0xFFFF, 0x4000 | (Index % 0x1000), 0x80, 0, 1, 2, 3, 4, 5, Index & 0xFF)
+
+def GuidString(Index):
+    return '%08X-%04X-%04X-8000-0102030405%02X' % ((Index * 0x01000193) & 0xFFFFFFFF, Index & 0xFFFF,
+                                                    0x4000 | (Index % 0x1000), Index & 0xFF)
+
+class FakeBuildDb(object):
+    GetPackageList = WorkspaceDatabase.GetPackageList
+
+    def __init__(self):
+        self.BuildObject = {}
+
+## Build a workspace of 4 packages and 70 modules, the modules of IA32 and X64
+#  are overlapping and the FDF refers to modules of both and to FILE statements
+def MakeWorkspace(WorkspaceDir):
+    def WriteFile(Name, Content):
+        Name = os.path.join(WorkspaceDir, Name)
+        if not os.path.isdir(os.path.dirname(Name)):
+            os.makedirs(os.path.dirname(Name))
+        with open(Name, 'w') as File:
+            File.write(Content)
+        return Name
+
+    Db = FakeBuildDb()
+    Packages = []
+    for Index in range(4):
+        Package = PackageBuildClassObject()
+        Package.MetaFile = PathClass(WriteFile('Pkg%d/Pkg%d.dec' % (Index, Index), 'Pkg%d\n' % Index))
+        Package.Guids = {'gPkg%dVariableGuid%d' % (Index, Item): GuidStructure(1000 + Index * 10 + Item) for Item in range(8)}
+        Packages.append(Package)
+
+    Modules = {}
+    for Index in range(70):
+        Name = 'Mod%d' % Index
+        if Index == 7:
+            # the FILE_GUID of the module is overridden in the DSC
+            Name = GuidString(7)
+        MetaFile = PathClass(WriteFile('Pkg%d/Mod%d/%s.inf' % (Index % 4, Index, Name), 'Mod%d\n' % Index))
+        for Arch in gArchList:
+            Module = ModuleBuildClassObject()
+            Module.MetaFile = MetaFile
+            Module.BaseName = 'Mod%d%s' % (Index, Arch)
+            Module.Guid = GuidString(Index).lower()
+            Module.Protocols = {'gProtocol%d' % (Index % 23): GuidStructure(2000 + Index % 23)}
+            Module.Guids = {'gGuid%d' % Item: GuidStructure(3000 + Item) for Item in range(Index % 5, Index % 5 + 3)}
+            Module.Ppis = {'gPpi%d%s' % (Index % 11, Arch): GuidStructure(4000 + Index % 11)}
+            Module.Packages = [Packages[Index % 4], Packages[(Index + 1) % 4]]
+            Db.BuildObject[str(MetaFile), Arch, gTarget, gToolChain] = Module
+        Modules[Index] = MetaFile
+
+    Platform = PathClass(WriteFile('Platform.dsc', 'Platform\n'))
+    for Arch in gArchList:
+        PlatformData = PlatformBuildClassObject()
+        PlatformData.MetaFile = Platform
+        PlatformData._RawData = SimpleNamespace(IncludedFiles=set())
+        Range = range(0, 30) if Arch == 'IA32' else range(20, 60)
+        PlatformData.Modules = {Modules[Index]: None for Index in Range}
+        PlatformData.LibraryInstances = []
+        PlatformData.Packages = Packages[:1]
+        PlatformData.Pcds = {}
+        for Index in range(12):
+            Sku = SimpleNamespace(VariableGuid='gPkg%dVariableGuid%d' % (Index % 4, Index % 8))
+            PlatformData.Pcds['PcdVariable%d' % Index, 'gTokenSpaceGuid'] = SimpleNamespace(
+                Type='DynamicHii' if Index % 3 else 'FixedAtBuild', SkuInfoList={'DEFAULT': Sku})
+        Db.BuildObject[str(Platform), Arch, gTarget, gToolChain] = PlatformData
+
+    FfsList = [SimpleNamespace(InfFileName=os.path.relpath(str(Modules[Index]), WorkspaceDir)) for Index in range(10, 70, 3)]
+    for Index, FileName in enumerate(('%s.ui', '%sSEC1.pe32.txt', None)):
+        FileObj = FileStatement()
+        FileObj.NameGuid = GuidString(5000 + Index)
+        FfsList.append(FileObj)
+        if FileName == '%s.ui':
+            UiData = b'\0\0\0\x15' + ('File%d' % Index).encode('utf-16-le') + b'\0\0'
+            FfsDir = os.path.join(WorkspaceDir, 'FV', 'Ffs', FileObj.NameGuid + 'File')
+            os.makedirs(FfsDir)
+            with open(os.path.join(FfsDir, FileName % FileObj.NameGuid), 'wb') as File:
+                File.write(UiData)
+        elif FileName:
+            WriteFile(os.path.join('FV', 'Ffs', FileObj.NameGuid, FileName % FileObj.NameGuid),
+                      'GenSec -s EFI_SECTION_PE32 -o Out File%d.efi' % Index)
+    Fdf = WriteFile('Platform.fdf', 'Platform\n')
+    FdfParserObj = SimpleNamespace(Profile=SimpleNamespace(FvDict={'FVMAIN': SimpleNamespace(FfsList=FfsList)}),
+                                   GetAllIncludedFile=lambda: [])
+    return Db, Platform, Fdf, FdfParserObj
+
+class TestGuidXRef(unittest.TestCase):
+    def setUp(self):
+        self.WorkspaceDir = tempfile.mkdtemp()
+        self.Db, Platform, Fdf, self.FdfParserObj = MakeWorkspace(self.WorkspaceDir)
+        GenFdsGlobalVariable.WorkSpace = self.Db
+        GenFdsGlobalVariable.WorkSpaceDir = self.WorkspaceDir
+        GenFdsGlobalVariable.ActivePlatform = Platform
+        GenFdsGlobalVariable.FdfFile = Fdf
+        GenFdsGlobalVariable.TargetName = gTarget
+        GenFdsGlobalVariable.ToolChainTag = gToolChain
+        GenFdsGlobalVariable.FvDir = os.path.join(self.WorkspaceDir, 'FV')
+        GenFdsGlobalVariable.FileDigestCache = {}
+        GenFdsGlobalVariable.PendingDigestDict = {}
+        self.XRefFile = os.path.join(GenFdsGlobalVariable.FvDir, 'Guid.xref')
+
+    def tearDown(self):
+        shutil.rmtree(self.WorkspaceDir)
+
+    def GenerateGuidXRef(self):
+        GenFdsGlobalVariable.FileDigestCache = {}
+        GenFds.GenerateGuidXRefFile(self.Db, gArchList, self.FdfParserObj)
+        with open(self.XRefFile) as File:
+            return File.read()
+
+    def test_content(self):
+        XRef = self.GenerateGuidXRef()
+        # the file generated by the implementation with lists
+        self.assertEqual(len(XRef), 5864)
+        self.assertEqual(hashlib.sha256(XRef.encode()).hexdigest(),
+                         '5d8f3b51eb5427d454b539baa7eb2d09891d88fd239cf680a26271628f5e60da')
+        self.assertIn('%s File0\n' % GuidString(5000), XRef)
+        self.assertIn('%s File1.efi\n' % GuidString(5001), XRef)
+        self.assertIn('%s Mod7IA32\n' % GuidString(7), XRef)
+
+    def test_unchanged(self):
+        XRef = self.GenerateGuidXRef()
+        # the database is not used again while the meta files are not changed
+        for Value in self.Db.BuildObject.values():
+            if isinstance(Value, ModuleBuildClassObject):
+                Value.Guids = {'gChangedGuid': GuidStructure(9999)}
+        self.assertEqual(self.GenerateGuidXRef(), XRef)
+        InfFile = self.FdfParserObj.Profile.FvDict['FVMAIN'].FfsList[0].InfFileName
+        with open(os.path.join(self.WorkspaceDir, InfFile), 'a') as File:
+            File.write('# changed\n')
+        self.assertIn('gChangedGuid', self.GenerateGuidXRef())
+
+    def test_arch_guids(self):
+        # the package objects of X64 have GUIDs which are not in the IA32 ones
+        Platform = self.Db.BuildObject[str(GenFdsGlobalVariable.ActivePlatform), 'X64', gTarget, gToolChain]
+        Package = PackageBuildClassObject()
+        Package.MetaFile = Platform.Packages[0].MetaFile
+        Package.Guids = dict(Platform.Packages[0].Guids, gPkg0X64VariableGuid=GuidStructure(1100))
+        for (MetaFile, Arch, Target, ToolChain), Value in self.Db.BuildObject.items():
+            if Arch == 'X64':
+                Value.Packages = [Package if P == Package else P for P in Value.Packages]
+        Sku = SimpleNamespace(VariableGuid='gPkg0X64VariableGuid')
+        Platform.Pcds['PcdX64Variable', 'gTokenSpaceGuid'] = SimpleNamespace(Type='DynamicHii', SkuInfoList={'DEFAULT': Sku})
+        self.assertIn('%s gPkg0X64VariableGuid\n' % GuidString(1100), self.GenerateGuidXRef())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+# @file
+#  Unit tests for the map of the modules loaded at fixed addresses.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+#
+# The build module gets the thread number from the command line when it is imported
+#
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'build'))
+gArgv = sys.argv
+sys.argv = ['build', '-n', '1']
+try:
+    import build.build as BuildModule
+finally:
+    sys.argv = gArgv
+
+MODULE_NUMBER = 40
+
+def MakeGuid(Index):
+    return '%08X-0000-4000-8000-%012X' % (0x1000 + Index, Index)
+
+## Write the map file of a module image with a few functions
+def WriteImageMap(ImageFile, Index):
+    os.makedirs(os.path.dirname(ImageFile))
+    with open(ImageFile.replace('.efi', '.map'), 'w') as Map:
+        Map.write(' Module%d\n\n Preferred load address is 0000000000000240\n\n' % Index)
+        for Function in range(Index % 4 + 1):
+            Map.write(' 0001:%08x       Function%d_%d          %016x f   Module%d.obj\n' %
+                      (Function * 0x20, Index, Function, 0x240 + 0x20 * Function + Index, Index))
+
+class TestFixAddressMap(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        self.CommandList = []
+        self.Lock = threading.Lock()
+        self.DelayDict = {}
+        self.SavedLaunchCommand = BuildModule.LaunchCommand
+        BuildModule.LaunchCommand = self.LaunchCommand
+
+    def tearDown(self):
+        BuildModule.LaunchCommand = self.SavedLaunchCommand
+        shutil.rmtree(self.TempDir)
+
+    #
+    # GenFw is not run, the jobs are recorded and complete in a shuffled order
+    #
+    def LaunchCommand(self, Command, WorkingDir, ModuleAuto = None):
+        time.sleep(self.DelayDict.get(Command[-1], 0))
+        with self.Lock:
+            self.CommandList.append((tuple(Command), WorkingDir))
+
+    def ShuffleDelays(self, FileList, Seed):
+        Delays = [Index * 0.0005 for Index in range(len(FileList))]
+        random.Random(Seed).shuffle(Delays)
+        self.DelayDict = dict(zip(FileList, Delays))
+
+    def MakeModuleList(self, Prefix):
+        ModuleList = {}
+        for Index in range(MODULE_NUMBER):
+            Name = '%sModule%d' % (Prefix, Index)
+            OutputDir = os.path.join(self.TempDir, Name, 'OUTPUT')
+            DebugDir = os.path.join(self.TempDir, Name, 'DEBUG')
+            Image = SimpleNamespace(Size = 0x1000 * (Index % 3) + 0x240 * Index, EntryPoint = 0x240 + Index,
+                                    FileName = os.path.join(OutputDir, Name + '.efi'),
+                                    SectionHeaderList = [('.text', 0x240), ('.data', 0x2000 + Index * 0x20)])
+            if Index % 5:
+                WriteImageMap(Image.FileName, Index)
+            ModuleList[Name + '.inf'] = BuildModule.PeImageInfo(Name, MakeGuid(Index), 'X64', OutputDir, DebugDir, Image)
+        return ModuleList
+
+    def MakeBuild(self, ThreadNumber):
+        Build = BuildModule.Build.__new__(BuildModule.Build)
+        Build.ThreadNumber = ThreadNumber
+        Build.Fdf = 'Platform.fdf'
+        return Build
+
+    def RebaseModules(self, ThreadNumber, ModuleLists):
+        MapBuffer = []
+        self.CommandList = []
+        Build = self.MakeBuild(ThreadNumber)
+        with contextlib.redirect_stdout(io.StringIO()):
+            Build._RebaseModule(MapBuffer, 0, ModuleLists[0], True)
+            Build._RebaseModule(MapBuffer, 0xF0000000, ModuleLists[1], False)
+            Build._RebaseModule(MapBuffer, 0x1000, ModuleLists[2], AddrIsOffset = False, ModeIsSmm = True)
+        return MapBuffer, self.CommandList
+
+    def test_plan(self):
+        ModuleList = self.MakeModuleList('Plan')
+        BaseAddress = 0x100000
+        SmmAddress = 0x1000
+        Plan = BuildModule.Build._PlanModuleRebase(0x100000, ModuleList)
+        SmmPlan = BuildModule.Build._PlanModuleRebase(0x1000, ModuleList, True)
+        for Index, InfFile in enumerate(ModuleList):
+            BaseAddress -= ModuleList[InfFile].Image.Size
+            self.assertEqual(Plan[Index], (ModuleList[InfFile], BaseAddress))
+            self.assertEqual(SmmPlan[Index], (ModuleList[InfFile], SmmAddress))
+            SmmAddress += ModuleList[InfFile].Image.Size
+
+    def test_rebase(self):
+        ModuleLists = [self.MakeModuleList(Prefix) for Prefix in ('Pei', 'Dxe', 'Smm')]
+        ExpectedMap, ExpectedCommands = self.RebaseModules(1, ModuleLists)
+        self.assertEqual(len(ExpectedCommands), 3 * 2 * MODULE_NUMBER)
+        # the second PEI module is at -0x3000, its second function at offset 0x21
+        self.assertIn('  -0x0000002FDF    Function1_1\n', ExpectedMap)
+
+        FileList = [Command[-1] for Command, WorkingDir in ExpectedCommands]
+        for Seed in range(3):
+            self.ShuffleDelays(FileList, Seed)
+            Map, Commands = self.RebaseModules(8, ModuleLists)
+            self.assertEqual(''.join(Map), ''.join(ExpectedMap))
+            self.assertNotEqual(Commands, ExpectedCommands)
+            self.assertEqual(sorted(Commands), sorted(ExpectedCommands))
+            #
+            # The debug image of a module is rebased after its output image
+            #
+            for Command, WorkingDir in Commands:
+                if WorkingDir.endswith('DEBUG'):
+                    OutputCommand = (Command[:-1] + (Command[-1].replace('DEBUG', 'OUTPUT'),), WorkingDir.replace('DEBUG', 'OUTPUT'))
+                    self.assertLess(Commands.index(OutputCommand), Commands.index((Command, WorkingDir)))
+
+    def test_fv_map(self):
+        FvDir = os.path.join(self.TempDir, 'FV')
+        os.makedirs(FvDir)
+        ModuleList = {}
+        FvDict = {}
+        for FvIndex in range(8):
+            FvName = 'FV%d' % FvIndex
+            FvDict[FvName] = None
+            if FvIndex == 3:
+                # no map file for this FV
+                continue
+            with open(os.path.join(FvDir, FvName + '.Fv.map'), 'w') as FvMap:
+                FvMap.write('EFI_FV_TOTAL_SIZE = 0x%x\nEFI_FV_TAKEN_SIZE = 0x1000\nEFI_FV_SPACE_SIZE = 0x0\n\n' % (FvIndex * 0x1000))
+                for Index in range(FvIndex * 10, FvIndex * 10 + 10):
+                    Guid = MakeGuid(Index)
+                    if Index % 4 == 0:
+                        Guid = Guid.lower()
+                    FvMap.write('%s (Fixed Flash Address, BaseAddress=0x%010x, EntryPoint=0x%010x)\n' % (Guid, Index * 0x1000, Index * 0x1000 + 0x240))
+                    FvMap.write('(GUID=%s .textbaseaddress=0x%010x .databaseaddress=0x%010x)\n\n' % (Guid, Index * 0x1000 + 0x240, Index * 0x1000 + 0x2000))
+                    if Index % 7:
+                        ModuleList[MakeGuid(Index)] = SimpleNamespace(Name = 'Module%d' % Index, DebugDir = os.path.join(self.TempDir, 'Module%d' % Index))
+        Wa = SimpleNamespace(FvDir = FvDir, FdfProfile = SimpleNamespace(FvDict = FvDict))
+
+        Expected = []
+        for FvName in FvDict:
+            FvMapFile = os.path.join(FvDir, FvName + '.Fv.map')
+            if os.path.exists(FvMapFile):
+                Expected.extend(BuildModule.Build._ReadFvMapFile(FvMapFile, ModuleList))
+        self.assertIn('Module9 (Fixed Flash Address, BaseAddress=0x0000009000, EntryPoint=0x0000009240)\n', Expected)
+        self.assertIn('(IMAGE=%s)\n' % os.path.join(self.TempDir, 'Module8', 'Module8.efi'), Expected)
+
+        MapBuffer = []
+        self.MakeBuild(1)._CollectFvMapBuffer(MapBuffer, Wa, ModuleList)
+        self.assertEqual(MapBuffer, Expected)
+
+        SavedReadFvMapFile = BuildModule.Build._ReadFvMapFile
+        Delays = [FvIndex * 0.01 for FvIndex in range(8)]
+        random.Random(0).shuffle(Delays)
+        def ReadFvMapFile(FvMapFile, ModuleList):
+            time.sleep(Delays[int(os.path.basename(FvMapFile)[2])])
+            return SavedReadFvMapFile(FvMapFile, ModuleList)
+        BuildModule.Build._ReadFvMapFile = staticmethod(ReadFvMapFile)
+        try:
+            MapBuffer = []
+            self.MakeBuild(8)._CollectFvMapBuffer(MapBuffer, Wa, ModuleList)
+        finally:
+            BuildModule.Build._ReadFvMapFile = staticmethod(SavedReadFvMapFile)
+        self.assertEqual(MapBuffer, Expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+## @file
+#  Unit tests for checking the import time of Python based BaseTools
+#
+#  Each tool is imported the same way its BinWrappers script runs it, with
+#  "-X importtime", and the cumulative import time of the entry module is
+#  checked against a per tool budget.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+
+##
+# Import Modules
+#
+import os
+import subprocess
+import sys
+import unittest
+
+import TestTools
+
+#
+# Tool name : (module to import, run as package module, budget in ms)
+#
+gImportTimeBudget = {
+    'Trim'             : ('Trim',             False, 100),
+    'PatchPcdValue'    : ('PatchPcdValue',    False, 100),
+    'Split'            : ('Split',            False, 100),
+    'TargetTool'       : ('TargetTool',       False, 150),
+    'GenPatchPcdTable' : ('GenPatchPcdTable', False, 200),
+    'BPDG'             : ('BPDG.BPDG',        True,  200),
+    'FMMT'             : ('FMMT.FMMT',        True,  200),
+    'GenFds'           : ('GenFds.GenFds',    True,  400),
+    'build'            : ('build',            False, 500),
+    }
+
+## Number of measured runs, the fastest one is compared with the budget
+gImportTimeRuns = 3
+
+class Tests(TestTools.BaseToolsTest):
+
+    def setUp(self):
+        TestTools.BaseToolsTest.setUp(self)
+
+    def GetImportTime(self, Tool, Module, IsPackage):
+        Env = dict(os.environ)
+        Env.pop('PYTHONDONTWRITEBYTECODE', None)
+        Env.setdefault('WORKSPACE', os.path.dirname(TestTools.BaseToolsDir))
+        PythonPath = [TestTools.PythonSourceDir]
+        if IsPackage:
+            Cwd = self.testDir
+            PythonPath.append(os.path.join(TestTools.PythonSourceDir, Tool))
+        else:
+            Cwd = os.path.join(TestTools.PythonSourceDir, Tool)
+        Env['PYTHONPATH'] = os.pathsep.join(PythonPath)
+        Command = [sys.executable, '-X', 'importtime', '-c', 'import %s' % Module]
+
+        #
+        # The first run compiles the byte code, the same as the first build does
+        #
+        subprocess.run(Command, cwd=Cwd, env=Env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        Best = None
+        for Index in range(gImportTimeRuns):
+            Proc = subprocess.run(Command, cwd=Cwd, env=Env, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.PIPE, universal_newlines=True)
+            if Proc.returncode != 0:
+                self.fail('import of %s failed:\n%s' % (Module, Proc.stderr))
+            Cumulative = None
+            for Line in Proc.stderr.splitlines():
+                Fields = Line.split('|')
+                if len(Fields) == 3 and Fields[2].strip() == Module:
+                    Cumulative = int(Fields[1])
+            self.assertTrue(Cumulative is not None, 'no importtime data for %s' % Module)
+            if Best is None or Cumulative < Best:
+                Best = Cumulative
+        return Best / 1000.0
+
+    def SingleToolTest(self, Tool):
+        Module, IsPackage, Budget = gImportTimeBudget[Tool]
+        Elapsed = self.GetImportTime(Tool, Module, IsPackage)
+        self.assertTrue(Elapsed <= Budget,
+                        '%s imports in %.1f ms, budget is %d ms' % (Tool, Elapsed, Budget))
+
+def MakePythonImportTimeTests():
+    def MakeNewTest(Tool):
+        newmethod = lambda self: self.SingleToolTest(Tool)
+        setattr(
+            Tests,
+            'test' + Tool,
+            newmethod
+            )
+
+    for Tool in gImportTimeBudget:
+        MakeNewTest(Tool)
+
+MakePythonImportTimeTests()
+del MakePythonImportTimeTests
+
+TheTestSuite = TestTools.MakeTheTestSuite(locals())
+
+if __name__ == '__main__':
+    allTests = TheTestSuite()
+    unittest.TextTestRunner().run(allTests)
+
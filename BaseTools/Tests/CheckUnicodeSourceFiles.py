@@ -17,7 +17,9 @@ import codecs
 import TestTools
 
 from Common.Misc import PathClass
+import Common.GlobalData as GlobalData
 import AutoGen.UniClassObject as BtUni
+import AutoGen.StrGather as BtStrGather
 
 from Common import EdkLogger
 EdkLogger.InitializeForUnitTest()
@@ -168,6 +170,119 @@ class Tests(TestTools.BaseToolsTest):
 
         self.CheckFile(encoding=None, shouldPass=False, string=data)
 
+    def testIncludeChangeWithCachedFile(self):
+        self.WriteTmpFile('strings.uni', u'''
+            #langdef en-US "English"
+            #include "common.uni"
+        '''.encode('utf_8'))
+        for Value in ('First', 'Second'):
+            self.WriteTmpFile('common.uni', (u'#string STR_A #language en-US "%s"\n' % Value).encode('utf_8'))
+            Uni = BtUni.UniFileClassObject([PathClass(self.GetTmpFilePath('strings.uni'))])
+            self.assertEqual(Uni.FindStringValue('STR_A', 'en-US').StringValue, Value + BtUni.NULL)
+
+    def testSharedCacheDirectory(self):
+        SavedDatabasePath = GlobalData.gDatabasePath
+        GlobalData.gDatabasePath = os.path.join(os.path.abspath(self.testDir), '.cache', 'build.db')
+        try:
+            Path = self.EncodeToFile('utf_8', self.SampleData + u'  #string STR_B #language en-US "B"\n')
+            Source = os.path.join(self.testDir, 'Source.c')
+            with open(Source, 'w') as File:
+                File.write('Print (STRING_TOKEN (STR_B));\n')
+            BtUni.gUniLinesCache.clear()
+            BtUni.gUniStringsCache.clear()
+            BtStrGather.gStringTokenCache.clear()
+            Uni = BtStrGather.SearchString(BtUni.UniFileClassObject([Path]), [Source], False)
+            self.assertTrue(Uni.FindStringValue('STR_B', 'en-US').Referenced)
+            self.assertFalse(Uni.FindStringValue('STR_A', 'en-US').Referenced)
+
+            #
+            # Another build process only reads the entries written by the first one
+            #
+            BtUni.gUniLinesCache.clear()
+            BtUni.gUniStringsCache.clear()
+            BtStrGather.gStringTokenCache.clear()
+            SavedPreProcessContent = BtUni.UniFileClassObject.PreProcessContent
+            SavedParseUniLines = BtUni.UniFileClassObject.ParseUniLines
+            SavedGetStringTokens = BtStrGather.GetStringTokens
+            BtUni.UniFileClassObject.PreProcessContent = None
+            BtUni.UniFileClassObject.ParseUniLines = None
+            BtStrGather.GetStringTokens = None
+            try:
+                Uni = BtStrGather.SearchString(BtUni.UniFileClassObject([Path]), [Source], False)
+            finally:
+                BtUni.UniFileClassObject.PreProcessContent = SavedPreProcessContent
+                BtUni.UniFileClassObject.ParseUniLines = SavedParseUniLines
+                BtStrGather.GetStringTokens = SavedGetStringTokens
+            self.assertTrue(Uni.FindStringValue('STR_B', 'en-US').Referenced)
+        finally:
+            GlobalData.gDatabasePath = SavedDatabasePath
+            BtUni.gUniLinesCache.clear()
+            BtUni.gUniStringsCache.clear()
+            BtStrGather.gStringTokenCache.clear()
+
+    def testCacheDirectoryPruned(self):
+        SavedDatabasePath = GlobalData.gDatabasePath
+        GlobalData.gDatabasePath = os.path.join(os.path.abspath(self.testDir), '.cache', 'build.db')
+        try:
+            Path = self.EncodeToFile('utf_8', self.SampleData)
+            Source = os.path.join(self.testDir, 'Source.c')
+            for Index in range(5):
+                with open(Path.Path, 'a') as File:
+                    File.write('#string STR_C%d #language en-US "C"\n' % Index)
+                with open(Source, 'a') as File:
+                    File.write('Print (STRING_TOKEN (STR_C%d));\n' % Index)
+                Uni = BtStrGather.SearchString(BtUni.UniFileClassObject([Path]), [Source], False)
+                self.assertTrue(Uni.FindStringValue('STR_C%d' % Index, 'en-US').Referenced)
+            #
+            # Only the entry of the latest content of each file is kept
+            #
+            for Name in ('UniCache', 'UniStringCache', 'StringTokenCache'):
+                CacheDir = os.path.join(self.testDir, '.cache', Name)
+                self.assertEqual([len(os.listdir(os.path.join(CacheDir, Dir))) for Dir in os.listdir(CacheDir)], [1])
+        finally:
+            GlobalData.gDatabasePath = SavedDatabasePath
+            BtUni.gUniLinesCache.clear()
+            BtUni.gUniStringsCache.clear()
+            BtStrGather.gStringTokenCache.clear()
+
+    def GetStringLists(self, Uni):
+        return Uni.LanguageDef, dict((Lang, [(Item.StringName, Item.StringValue, Item.Token, Item.Referenced, Item.UseOtherLangDef) for Item in List])
+                                     for Lang, List in Uni.OrderedStringList.items())
+
+    def testParsedStringsCached(self):
+        Path = self.EncodeToFile('utf_8', u'''
+            #langdef en-US "English"
+            #langdef fr-FR "Francais"
+            #string STR_A #language en-US "A"
+            #string STR_A #language fr-FR "A-fr"
+            #string STR_C #language en-US "C"
+            #string STR_B
+            #language en-US
+            B
+        ''')
+        BtUni.gUniLinesCache.clear()
+        BtUni.gUniStringsCache.clear()
+        try:
+            First = BtUni.UniFileClassObject([Path])
+            Expected = self.GetStringLists(First)
+            self.assertEqual(First.FindStringValue('STR_A', 'en-US').StringValue, u'A' + BtUni.NULL)
+
+            #
+            # Another module adds the cached definitions to its own string lists
+            #
+            First.SetStringReferenced('STR_A')
+            SavedParseUniLines = BtUni.UniFileClassObject.ParseUniLines
+            BtUni.UniFileClassObject.ParseUniLines = None
+            try:
+                Second = BtUni.UniFileClassObject([Path])
+            finally:
+                BtUni.UniFileClassObject.ParseUniLines = SavedParseUniLines
+            self.assertEqual(self.GetStringLists(Second), Expected)
+            self.assertFalse(Second.FindStringValue('STR_A', 'en-US').Referenced)
+        finally:
+            BtUni.gUniLinesCache.clear()
+            BtUni.gUniStringsCache.clear()
+
 TheTestSuite = TestTools.MakeTheTestSuite(locals())
 
 if __name__ == '__main__':
@@ -0,0 +1,173 @@
+## @file
+# Unit tests for the debugger independent code in Scripts/efi_debugging.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from ctypes import sizeof
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'Scripts'))
+
+from efi_debugging import EFI_IMAGE_DOS_HEADER, EFI_IMAGE_NT_HEADERS64
+from efi_debugging import EFI_IMAGE_OPTIONAL_HEADER64, EFI_IMAGE_SECTION_HEADER
+from efi_debugging import EFI_IMAGE_DEBUG_DIRECTORY_ENTRY
+from efi_debugging import EfiMemoryFile, PeTeImage, PeTeImageCache
+from efi_debugging import GuidNames
+
+MEMORY_BASE = 0x800000
+
+def MakePeImage(Pdb, Size=0x4000):
+    Image = bytearray(Size)
+    DosHdr = EFI_IMAGE_DOS_HEADER.from_buffer(Image, 0)
+    DosHdr.e_magic = int.from_bytes(b'MZ', 'little')
+    DosHdr.e_lfanew = 0x80
+    PeHdr = EFI_IMAGE_NT_HEADERS64.from_buffer(Image, 0x80)
+    PeHdr.Signature = int.from_bytes(b'PE\0\0', 'little')
+    PeHdr.FileHeader.Machine = 0x8664
+    PeHdr.FileHeader.NumberOfSections = 1
+    PeHdr.FileHeader.SizeOfOptionalHeader = sizeof(EFI_IMAGE_OPTIONAL_HEADER64)
+    PeHdr.OptionalHeader.Magic = 0x20b
+    PeHdr.OptionalHeader.Subsystem = 11
+    PeHdr.OptionalHeader.NumberOfRvaAndSizes = 16
+    PeHdr.OptionalHeader.DataDirectory[6].VirtualAddress = 0x300
+    PeHdr.OptionalHeader.DataDirectory[6].Size = sizeof(EFI_IMAGE_DEBUG_DIRECTORY_ENTRY)
+    Section = EFI_IMAGE_SECTION_HEADER.from_buffer(Image, 0x80 + sizeof(EFI_IMAGE_NT_HEADERS64))
+    Section.Name = b'.text'
+    Section.VirtualAddress = 0x1000
+    Section.VirtualSize = Size - 0x1000
+    Entry = EFI_IMAGE_DEBUG_DIRECTORY_ENTRY.from_buffer(Image, 0x300)
+    CodeView = b'RSDS' + bytes(range(16)) + bytes(4) + Pdb.encode('utf-8') + b'\0'
+    Entry.Type = 2
+    Entry.RVA = 0x340
+    Entry.SizeOfData = len(CodeView)
+    Image[0x340:0x340 + len(CodeView)] = CodeView
+    return Image
+
+class TestPcToPeCoff(unittest.TestCase):
+    def setUp(self):
+        self.Memory = bytearray(0x200000)
+        self.Images = {0x10000: 'PeiCore.dll', 0x150000: 'DxeCore.dll'}
+        for Offset, Pdb in self.Images.items():
+            Image = MakePeImage(Pdb)
+            self.Memory[Offset:Offset + len(Image)] = Image
+        # signatures which are not images, aligned and unaligned
+        self.Memory[0x120000:0x120002] = b'MZ'
+        self.Memory[0x12F001:0x12F003] = b'VZ'
+        self.File = EfiMemoryFile(io.BytesIO(bytes(self.Memory)), MEMORY_BASE)
+
+    def Lookup(self, Address, **Options):
+        PeCoff = PeTeImage(self.File, None)
+        if PeCoff.pcToPeCoff(Address, **Options):
+            return PeCoff
+        return None
+
+    def test_block_search(self):
+        for Offset, Pdb in self.Images.items():
+            Reads = self.File.reads
+            PeCoff = self.Lookup(MEMORY_BASE + Offset + 0x2345, step=4, max_range=0x40000)
+            self.assertEqual(PeCoff.CodeViewPdb, Pdb)
+            self.assertEqual(PeCoff.LoadAddress, MEMORY_BASE + Offset)
+            self.assertEqual(PeCoff.TextAddress, MEMORY_BASE + Offset + 0x1000)
+            self.assertTrue(self.File.reads - Reads < 20)
+
+    def test_same_result_as_single_probes(self):
+        Single = self.Lookup(MEMORY_BASE + 0x150000 + 0x3000, step=4, max_range=0x100000)
+        self.File.reads = 0
+        Probed = PeTeImage(self.File, None)
+        Probed.search_window = 4
+        self.assertTrue(Probed.pcToPeCoff(MEMORY_BASE + 0x150000 + 0x3000, step=4, max_range=0x100000))
+        self.assertTrue(self.File.reads > 0x3000 // 4)
+        self.assertEqual(Single.LoadAddress, Probed.LoadAddress)
+        self.assertEqual(Single.EndLoadAddress, Probed.EndLoadAddress)
+        self.assertEqual(Single.CodeViewPdb, Probed.CodeViewPdb)
+
+    def test_not_found(self):
+        self.assertIsNone(self.Lookup(MEMORY_BASE + 0x130000, step=0x1000, max_range=0x10000))
+        self.assertIsNone(self.Lookup(MEMORY_BASE + 0x130000, step=4, max_range=0x20000))
+
+    def test_cache(self):
+        Cache = PeTeImageCache()
+        for Offset in self.Images:
+            self.Lookup(MEMORY_BASE + Offset + 0x1800, cache=Cache)
+        self.assertEqual(len(Cache), 2)
+        self.File.reads = 0
+        PeCoff = self.Lookup(MEMORY_BASE + 0x150000 + 0x3FFF, cache=Cache)
+        self.assertEqual(self.File.reads, 0)
+        self.assertEqual(PeCoff.CodeViewPdb, 'DxeCore.dll')
+        self.assertIsNone(Cache.find(MEMORY_BASE + 0x154000))
+        self.assertIsNone(Cache.find(MEMORY_BASE))
+        self.assertEqual(Cache.remove(MEMORY_BASE + 0x10000).CodeViewPdb, 'PeiCore.dll')
+        self.assertIsNone(Cache.find(MEMORY_BASE + 0x10000))
+
+class TestGuidNames(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        self.Saved = {Name: getattr(GuidNames, Name) for Name in
+                      ('_dict_', '_names_', '_aliases_', 'guid_files', '_pending_files')}
+        GuidNames._dict_ = dict(GuidNames._dict_)
+        GuidNames._names_ = None
+        GuidNames._aliases_ = {}
+        GuidNames.guid_files = []
+        GuidNames._pending_files = []
+
+    def tearDown(self):
+        for Name, Value in self.Saved.items():
+            setattr(GuidNames, Name, Value)
+        shutil.rmtree(self.TempDir)
+
+    def MakeBuild(self, Platform, Lines):
+        FvDir = os.path.join(self.TempDir, 'Build', Platform, 'DEBUG_GCC5', 'FV')
+        os.makedirs(FvDir)
+        with open(os.path.join(FvDir, 'Guid.xref'), 'w') as File:
+            File.write(''.join(Line + '\n' for Line in Lines))
+        return os.path.join(self.TempDir, 'Build', Platform, 'DEBUG_GCC5', 'X64', 'DxeCore.dll')
+
+    def test_merge_and_index(self):
+        PeiModule = self.MakeBuild('PeiPlatform', [
+            '52c05b14-0b98-496c-bc3b-04b50211d680 PeiCore',
+            'a0c98b77-cba5-4bb8-993b-4f87fc8a1f9f gEfiEventReadyToBootGuid',
+            'a single-word-line-with-dashes'])
+        DxeModule = self.MakeBuild('DxePlatform', [
+            'D6A2CB7F-6A18-4E2F-B43B-9920A733700A DxeCore',
+            'a0c98b77-cba5-4bb8-993b-4f87fc8a1f9f gReadyToBootGuid'])
+        self.assertTrue(GuidNames.add_build_guid_file(PeiModule))
+        self.assertTrue(GuidNames.add_build_guid_file(DxeModule))
+        self.assertTrue(GuidNames.add_build_guid_file(DxeModule))
+        self.assertFalse(GuidNames.add_build_guid_file(os.path.join(self.TempDir, 'Other.dll')))
+        self.assertEqual(len(GuidNames._pending_files), 2)
+
+        self.assertEqual(GuidNames.to_name('52C05B14-0B98-496C-BC3B-04B50211D680'), 'PeiCore')
+        self.assertEqual(GuidNames.to_guid('DxeCore'), 'D6A2CB7F-6A18-4E2F-B43B-9920A733700A')
+        self.assertEqual(GuidNames.to_guid('gEfiHobListGuid'), '7739F24C-93D7-11D4-9A3A-0090273FC14D')
+        self.assertEqual(GuidNames.to_names('A0C98B77-CBA5-4BB8-993B-4F87FC8A1F9F'),
+                         ['gEfiEventReadyToBootGuid', 'gReadyToBootGuid'])
+        # the name replaced by the later Guid.xref is still known
+        self.assertEqual(GuidNames.to_name('A0C98B77-CBA5-4BB8-993B-4F87FC8A1F9F'), 'gReadyToBootGuid')
+        self.assertEqual(GuidNames.to_guid('gReadyToBootGuid'), 'A0C98B77-CBA5-4BB8-993B-4F87FC8A1F9F')
+        self.assertEqual(GuidNames.to_guid('gEfiEventReadyToBootGuid'), 'A0C98B77-CBA5-4BB8-993B-4F87FC8A1F9F')
+        self.assertRaises(KeyError, GuidNames.to_guid, 'gUnknownGuid')
+
+    def test_cache(self):
+        Module = self.MakeBuild('Platform', ['52c05b14-0b98-496c-bc3b-04b50211d680 PeiCore'])
+        GuidNames.add_build_guid_file(Module)
+        GuidNames._load_pending_files()
+        Xref = GuidNames.guid_files[0]
+        self.assertTrue(os.path.isfile(Xref + '.json'))
+        # the pre-parsed file is used while the Guid.xref is unchanged
+        with open(Xref + '.json') as File:
+            Content = File.read()
+        with open(Xref + '.json', 'w') as File:
+            File.write(Content.replace('PeiCore', 'CachedCore'))
+        self.assertEqual(GuidNames._read_guid_file(Xref), [['52C05B14-0B98-496C-BC3B-04B50211D680', 'CachedCore']])
+        with open(Xref, 'a') as File:
+            File.write('D6A2CB7F-6A18-4E2F-B43B-9920A733700A DxeCore\n')
+        self.assertEqual(len(GuidNames._read_guid_file(Xref)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+## @file
+# Unit tests for the section lookup of Scripts/GetMaintainer.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import contextlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'Scripts'))
+
+#
+# GetMaintainer.py exits when gitpython cannot be imported
+#
+HAS_GITPYTHON = importlib.util.find_spec('git') is not None
+if HAS_GITPYTHON:
+    from GetMaintainer import SectionIndex, get_maintainers, get_maintainers_batch, parse_maintainers_file, path_in_section
+
+WORKSPACE = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..'))
+
+#
+# Paths which are not in the tree, some of them fall back to <default>
+#
+EXTRA_PATHS = [
+    '<default>',
+    'NoSuchPkg/NoSuchFile.c',
+    'MdePkg/NoSuchDir/NoSuchFile.c',
+    'BaseTools/Source/C/NoSuchFile.c',
+    'Maintainers.txt',
+    'README.md',
+    ]
+
+def GetTreePaths():
+    try:
+        Output = subprocess.check_output(['git', 'ls-files'], cwd=WORKSPACE)
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return Output.decode('utf-8').splitlines()
+
+@unittest.skipUnless(HAS_GITPYTHON, 'gitpython is not installed')
+class TestGetMaintainer(unittest.TestCase):
+    def setUp(self):
+        self.Sections = parse_maintainers_file(os.path.join(WORKSPACE, 'Maintainers.txt'))
+        self.Paths = GetTreePaths()
+        if not self.Paths:
+            self.skipTest('the workspace is not a git tree')
+        self.Paths += EXTRA_PATHS
+
+    #
+    # The sections found in the index are the ones of a scan of all sections
+    #
+    def test_section_index(self):
+        Start = time.time()
+        Expected = [[Section for Section in self.Sections if path_in_section(Path, Section)] for Path in self.Paths]
+        ScanTime = time.time() - Start
+
+        Start = time.time()
+        Index = SectionIndex(self.Sections)
+        Result = [Index.sections_for(Path) for Path in self.Paths]
+        IndexTime = time.time() - Start
+
+        for Path, Sections, ExpectedSections in zip(self.Paths, Result, Expected):
+            self.assertEqual(Sections, ExpectedSections, Path)
+        print('\n%d paths: path_in_section %.2fs, SectionIndex %.2fs' % (len(self.Paths), ScanTime, IndexTime))
+
+    #
+    # The batch gives the addresses and the messages of one lookup per path
+    #
+    def test_batch(self):
+        Paths = self.Paths[::25] + EXTRA_PATHS
+        Expected = []
+        for Path in Paths:
+            Output = io.StringIO()
+            with contextlib.redirect_stdout(Output):
+                Addresses = get_maintainers(Path, self.Sections)
+            Expected.append((Path, Addresses, Output.getvalue()))
+
+        Result = []
+        Output = io.StringIO()
+        with contextlib.redirect_stdout(Output):
+            for Path, Addresses in get_maintainers_batch(Paths, self.Sections):
+                Result.append((Path, Addresses))
+        self.assertEqual(Result, [(Path, Addresses) for Path, Addresses, Messages in Expected])
+        self.assertEqual(Output.getvalue(), ''.join(Messages for Path, Addresses, Messages in Expected))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+## @file
+# Unit tests for checking git commits with Scripts/PatchCheck.py
+#
+# Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+# SPDX-License-Identifier: BSD-2-Clause-Patent
+
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'Scripts'))
+
+from PatchCheck import CheckGitCommits, CheckOnePatch, EmailAddressCheck, Verbose
+
+COMMIT_NUMBER = 200
+
+class TestCheckGitCommits(unittest.TestCase):
+    def setUp(self):
+        self.Cwd = os.getcwd()
+        self.Level = Verbose.level
+        self.Repo = tempfile.mkdtemp()
+        os.chdir(self.Repo)
+        self.Git('init', '-q')
+        self.Git('config', 'user.name', 'Committer Name')
+        self.Git('config', 'user.email', 'committer@example.com')
+        self.Git('config', 'core.autocrlf', 'false')
+        for Index in range(COMMIT_NUMBER):
+            Kind = Index % 5
+            File = 'Pkg%d/File%d.c' % (Index % 7, Index)
+            Content = 'int\r\nFunction%d (\r\n  VOID\r\n  );\r\n' % Index
+            Message = 'Pkg%d: Add Function%d\n\nAdd the declaration of Function%d.\n' % (Index % 7, Index, Index)
+            if Kind == 1:
+                Content += '\tint Tab;\n'
+            elif Kind == 2:
+                Message = 'Pkg: Add a function with a subject line which is much too long for the checks\n'
+            elif Kind == 3:
+                Message += '\nFrom 0123456789012345678901234567890123456789 Mon Sep 17 00:00:00 2001\n'
+                Message = Message.replace('Add the', 'Ajoute la déclaration, add the')
+            if Kind != 2:
+                Message += '\nSigned-off-by: Author Name <author@example.com>\n'
+            os.makedirs(os.path.dirname(File), exist_ok=True)
+            with open(File, 'wb') as Handle:
+                Handle.write(Content.encode('utf-8'))
+            self.Git('add', File)
+            self.Git('commit', '-q', '--author', 'Author Name <author@example.com>', '-m', Message)
+        self.Git('checkout', '-q', '-b', 'topic', 'HEAD~3')
+        self.Git('commit', '-q', '--allow-empty', '-m', 'Pkg: Empty commit\n\nSigned-off-by: Author Name <author@example.com>')
+        self.Git('checkout', '-q', '-')
+        self.Git('merge', '-q', '--no-ff', '-m', 'Merge topic', 'topic')
+
+    def tearDown(self):
+        Verbose.level = self.Level
+        os.chdir(self.Cwd)
+        shutil.rmtree(self.Repo, ignore_errors=True)
+
+    def Git(self, *Args):
+        return subprocess.check_output(('git',) + Args).decode('utf-8')
+
+    #
+    # The commits checked one at a time, with two git processes each
+    #
+    def CheckOneByOne(self, RevSpec):
+        Output = io.StringIO()
+        Ok = True
+        with contextlib.redirect_stdout(Output):
+            Commits = self.Git('rev-list', '--abbrev-commit', '--no-walk', RevSpec).split()
+            Names = Commits if len(Commits) > 1 or Verbose.level <= Verbose.ONELINE else [RevSpec]
+            for Index, Commit in enumerate(Commits):
+                if Verbose.level > Verbose.ONELINE:
+                    if Index:
+                        print()
+                    print('Checking git commit:', Names[Index])
+                Email = self.Git('show', '--pretty=%cn <%ce>', '--no-patch', '--no-use-mailmap', Commit)
+                Ok &= EmailAddressCheck(Email, 'Committer').ok
+                Patch = self.Git('show', '--pretty=email', '--no-textconv', '--no-use-mailmap', Commit)
+                Ok &= CheckOnePatch(Names[Index], Patch).ok
+        return Ok, Output.getvalue()
+
+    def CheckBatch(self, RevSpec, MaxCount=None, Jobs=None):
+        Output = io.StringIO()
+        with contextlib.redirect_stdout(Output):
+            Ok = CheckGitCommits(RevSpec, MaxCount, Jobs).ok
+        return Ok, Output.getvalue()
+
+    def test_patches(self):
+        Commits = self.Git('rev-list', '--abbrev-commit', 'HEAD').split()
+        Patches = list(CheckGitCommits.__new__(CheckGitCommits).read_patches_from_git(Commits))
+        self.assertEqual(len(Patches), len(Commits))
+        for Commit, Patch in zip(Commits[::17], Patches[::17]):
+            self.assertEqual(Patch, self.Git('show', '--pretty=email', '--no-textconv', '--no-use-mailmap', Commit))
+
+    def test_same_result(self):
+        for Level in (Verbose.NORMAL, Verbose.ONELINE):
+            Verbose.level = Level
+            for RevSpec in ('HEAD', 'HEAD~1', 'HEAD~10..HEAD', 'HEAD^2'):
+                self.assertEqual(self.CheckBatch(RevSpec), self.CheckOneByOne(RevSpec))
+            Start = time.time()
+            Expected = self.CheckOneByOne('HEAD~%d..HEAD' % COMMIT_NUMBER)
+            OneByOneTime = time.time() - Start
+            Start = time.time()
+            Result = self.CheckBatch('HEAD~%d..HEAD' % COMMIT_NUMBER)
+            BatchTime = time.time() - Start
+            self.assertEqual(Result, Expected)
+            self.assertFalse(Result[0])
+            self.assertEqual(self.CheckBatch('HEAD~%d..HEAD' % COMMIT_NUMBER, Jobs=1), Expected)
+        print('\n%d commits: one by one %.2fs, batch %.2fs' % (COMMIT_NUMBER, OneByOneTime, BatchTime))
+
+    def test_max_count(self):
+        Verbose.level = Verbose.ONELINE
+        Ok, Output = self.CheckBatch('HEAD', MaxCount=4)
+        Commits = self.Git('rev-list', '--abbrev-commit', '--max-count=4', 'HEAD').split()
+        self.assertEqual([Line.split()[0] for Line in Output.splitlines()[1::2]], Commits)
+
+    def test_not_found(self):
+        Ok, Output = self.CheckBatch('NoSuchCommit')
+        self.assertTrue(Ok)
+        self.assertEqual(Output, "Couldn't find commit matching: 'NoSuchCommit'\n")
+
+class TestOptions(unittest.TestCase):
+    def test_jobs(self):
+        Script = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'Scripts', 'PatchCheck.py')
+        for Jobs in ('0', '-1'):
+            Process = subprocess.run([sys.executable, Script, '-j', Jobs, 'HEAD'], stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, universal_newlines=True)
+            self.assertEqual(Process.returncode, 2)
+            self.assertIn('argument -j/--jobs: must be at least 1', Process.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
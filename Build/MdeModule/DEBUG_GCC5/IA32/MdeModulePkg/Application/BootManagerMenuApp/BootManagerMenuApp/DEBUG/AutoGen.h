@@ -0,0 +1,203 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_EEC25BDC_67F2_4D95_B1D5_F81B2039D11D
+#define _AUTOGENH_EEC25BDC_67F2_4D95_B1D5_F81B2039D11D
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Uefi.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0xEEC25BDC, 0x67F2, 0x4D95, {0xB1, 0xD5, 0xF8, 0x1B, 0x20, 0x39, 0xD1, 0x1D}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+extern EFI_GUID gEfiEventReadyToBootGuid;
+extern EFI_GUID gEfiEventLegacyBootGuid;
+extern EFI_GUID gEfiGlobalVariableGuid;
+extern EFI_GUID gEfiAcpi20TableGuid;
+extern EFI_GUID gEfiAcpi10TableGuid;
+extern EFI_GUID gEfiFileInfoGuid;
+extern EFI_GUID gEfiDxeServicesTableGuid;
+extern EFI_GUID gEfiHobListGuid;
+extern EFI_GUID gEdkiiIfrBitVarstoreGuid;
+extern EFI_GUID gEfiMemoryTypeInformationGuid;
+extern EFI_GUID gEdkiiStatusCodeDataTypeVariableGuid;
+extern EFI_GUID gEfiDiskInfoAhciInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoIdeInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoScsiInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoSdMmcInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoUfsInterfaceGuid;
+
+// Protocols
+extern EFI_GUID gEfiBootLogoProtocolGuid;
+extern EFI_GUID gEfiLoadedImageDevicePathProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+extern EFI_GUID gEfiDriverBindingProtocolGuid;
+extern EFI_GUID gEfiSimpleTextOutProtocolGuid;
+extern EFI_GUID gEfiGraphicsOutputProtocolGuid;
+extern EFI_GUID gEfiHiiFontProtocolGuid;
+extern EFI_GUID gEfiSimpleFileSystemProtocolGuid;
+extern EFI_GUID gEfiUgaDrawProtocolGuid;
+extern EFI_GUID gEfiComponentNameProtocolGuid;
+extern EFI_GUID gEfiComponentName2ProtocolGuid;
+extern EFI_GUID gEfiDriverConfigurationProtocolGuid;
+extern EFI_GUID gEfiDriverConfiguration2ProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnosticsProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnostics2ProtocolGuid;
+extern EFI_GUID gEfiHiiStringProtocolGuid;
+extern EFI_GUID gEfiHiiImageProtocolGuid;
+extern EFI_GUID gEfiHiiDatabaseProtocolGuid;
+extern EFI_GUID gEfiHiiConfigRoutingProtocolGuid;
+extern EFI_GUID gEfiFirmwareVolume2ProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+extern EFI_GUID gEfiLoadFileProtocolGuid;
+extern EFI_GUID gEfiLoadFile2ProtocolGuid;
+extern EFI_GUID gEfiFormBrowser2ProtocolGuid;
+extern EFI_GUID gEfiPciRootBridgeIoProtocolGuid;
+extern EFI_GUID gEfiPciIoProtocolGuid;
+extern EFI_GUID gEfiSimpleNetworkProtocolGuid;
+extern EFI_GUID gEfiSimpleTextInProtocolGuid;
+extern EFI_GUID gEfiBlockIoProtocolGuid;
+extern EFI_GUID gEfiSimpleTextInputExProtocolGuid;
+extern EFI_GUID gEdkiiVariablePolicyProtocolGuid;
+extern EFI_GUID gEfiUsbIoProtocolGuid;
+extern EFI_GUID gEfiNvmExpressPassThruProtocolGuid;
+extern EFI_GUID gEfiDiskInfoProtocolGuid;
+extern EFI_GUID gEfiDriverHealthProtocolGuid;
+extern EFI_GUID gEfiRamDiskProtocolGuid;
+extern EFI_GUID gEfiDeferredImageLoadProtocolGuid;
+extern EFI_GUID gEdkiiPlatformBootManagerProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in this module
+
+#define _PCD_TOKEN_PcdConOutRow  0U
+#define _PCD_PATCHABLE_VALUE_PcdConOutRow  ((UINT32)25U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdConOutRow;
+#define _PCD_GET_MODE_32_PcdConOutRow  _gPcd_BinaryPatch_PcdConOutRow
+#define _PCD_PATCHABLE_PcdConOutRow_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdConOutRow  _gPcd_BinaryPatch_Size_PcdConOutRow 
+extern UINTN _gPcd_BinaryPatch_Size_PcdConOutRow; 
+#define _PCD_SET_MODE_32_PcdConOutRow(Value)  (_gPcd_BinaryPatch_PcdConOutRow = (Value))
+#define _PCD_SET_MODE_32_S_PcdConOutRow(Value)  ((_gPcd_BinaryPatch_PcdConOutRow = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdConOutColumn  0U
+#define _PCD_PATCHABLE_VALUE_PcdConOutColumn  ((UINT32)80U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdConOutColumn;
+#define _PCD_GET_MODE_32_PcdConOutColumn  _gPcd_BinaryPatch_PcdConOutColumn
+#define _PCD_PATCHABLE_PcdConOutColumn_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdConOutColumn  _gPcd_BinaryPatch_Size_PcdConOutColumn 
+extern UINTN _gPcd_BinaryPatch_Size_PcdConOutColumn; 
+#define _PCD_SET_MODE_32_PcdConOutColumn(Value)  (_gPcd_BinaryPatch_PcdConOutColumn = (Value))
+#define _PCD_SET_MODE_32_S_PcdConOutColumn(Value)  ((_gPcd_BinaryPatch_PcdConOutColumn = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdVideoHorizontalResolution  0U
+#define _PCD_PATCHABLE_VALUE_PcdVideoHorizontalResolution  ((UINT32)800U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdVideoHorizontalResolution;
+#define _PCD_GET_MODE_32_PcdVideoHorizontalResolution  _gPcd_BinaryPatch_PcdVideoHorizontalResolution
+#define _PCD_PATCHABLE_PcdVideoHorizontalResolution_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdVideoHorizontalResolution  _gPcd_BinaryPatch_Size_PcdVideoHorizontalResolution 
+extern UINTN _gPcd_BinaryPatch_Size_PcdVideoHorizontalResolution; 
+#define _PCD_SET_MODE_32_PcdVideoHorizontalResolution(Value)  (_gPcd_BinaryPatch_PcdVideoHorizontalResolution = (Value))
+#define _PCD_SET_MODE_32_S_PcdVideoHorizontalResolution(Value)  ((_gPcd_BinaryPatch_PcdVideoHorizontalResolution = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdVideoVerticalResolution  0U
+#define _PCD_PATCHABLE_VALUE_PcdVideoVerticalResolution  ((UINT32)600U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdVideoVerticalResolution;
+#define _PCD_GET_MODE_32_PcdVideoVerticalResolution  _gPcd_BinaryPatch_PcdVideoVerticalResolution
+#define _PCD_PATCHABLE_PcdVideoVerticalResolution_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdVideoVerticalResolution  _gPcd_BinaryPatch_Size_PcdVideoVerticalResolution 
+extern UINTN _gPcd_BinaryPatch_Size_PcdVideoVerticalResolution; 
+#define _PCD_SET_MODE_32_PcdVideoVerticalResolution(Value)  (_gPcd_BinaryPatch_PcdVideoVerticalResolution = (Value))
+#define _PCD_SET_MODE_32_S_PcdVideoVerticalResolution(Value)  ((_gPcd_BinaryPatch_PcdVideoVerticalResolution = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdSetupConOutColumn  0U
+#define _PCD_PATCHABLE_VALUE_PcdSetupConOutColumn  ((UINT32)80U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdSetupConOutColumn;
+#define _PCD_GET_MODE_32_PcdSetupConOutColumn  _gPcd_BinaryPatch_PcdSetupConOutColumn
+#define _PCD_PATCHABLE_PcdSetupConOutColumn_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdSetupConOutColumn  _gPcd_BinaryPatch_Size_PcdSetupConOutColumn 
+extern UINTN _gPcd_BinaryPatch_Size_PcdSetupConOutColumn; 
+#define _PCD_SET_MODE_32_PcdSetupConOutColumn(Value)  (_gPcd_BinaryPatch_PcdSetupConOutColumn = (Value))
+#define _PCD_SET_MODE_32_S_PcdSetupConOutColumn(Value)  ((_gPcd_BinaryPatch_PcdSetupConOutColumn = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdSetupConOutRow  0U
+#define _PCD_PATCHABLE_VALUE_PcdSetupConOutRow  ((UINT32)25U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdSetupConOutRow;
+#define _PCD_GET_MODE_32_PcdSetupConOutRow  _gPcd_BinaryPatch_PcdSetupConOutRow
+#define _PCD_PATCHABLE_PcdSetupConOutRow_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdSetupConOutRow  _gPcd_BinaryPatch_Size_PcdSetupConOutRow 
+extern UINTN _gPcd_BinaryPatch_Size_PcdSetupConOutRow; 
+#define _PCD_SET_MODE_32_PcdSetupConOutRow(Value)  (_gPcd_BinaryPatch_PcdSetupConOutRow = (Value))
+#define _PCD_SET_MODE_32_S_PcdSetupConOutRow(Value)  ((_gPcd_BinaryPatch_PcdSetupConOutRow = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdSetupVideoHorizontalResolution  0U
+#define _PCD_PATCHABLE_VALUE_PcdSetupVideoHorizontalResolution  ((UINT32)800U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdSetupVideoHorizontalResolution;
+#define _PCD_GET_MODE_32_PcdSetupVideoHorizontalResolution  _gPcd_BinaryPatch_PcdSetupVideoHorizontalResolution
+#define _PCD_PATCHABLE_PcdSetupVideoHorizontalResolution_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdSetupVideoHorizontalResolution  _gPcd_BinaryPatch_Size_PcdSetupVideoHorizontalResolution 
+extern UINTN _gPcd_BinaryPatch_Size_PcdSetupVideoHorizontalResolution; 
+#define _PCD_SET_MODE_32_PcdSetupVideoHorizontalResolution(Value)  (_gPcd_BinaryPatch_PcdSetupVideoHorizontalResolution = (Value))
+#define _PCD_SET_MODE_32_S_PcdSetupVideoHorizontalResolution(Value)  ((_gPcd_BinaryPatch_PcdSetupVideoHorizontalResolution = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdSetupVideoVerticalResolution  0U
+#define _PCD_PATCHABLE_VALUE_PcdSetupVideoVerticalResolution  ((UINT32)600U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdSetupVideoVerticalResolution;
+#define _PCD_GET_MODE_32_PcdSetupVideoVerticalResolution  _gPcd_BinaryPatch_PcdSetupVideoVerticalResolution
+#define _PCD_PATCHABLE_PcdSetupVideoVerticalResolution_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdSetupVideoVerticalResolution  _gPcd_BinaryPatch_Size_PcdSetupVideoVerticalResolution 
+extern UINTN _gPcd_BinaryPatch_Size_PcdSetupVideoVerticalResolution; 
+#define _PCD_SET_MODE_32_PcdSetupVideoVerticalResolution(Value)  (_gPcd_BinaryPatch_PcdSetupVideoVerticalResolution = (Value))
+#define _PCD_SET_MODE_32_S_PcdSetupVideoVerticalResolution(Value)  ((_gPcd_BinaryPatch_PcdSetupVideoVerticalResolution = (Value)), RETURN_SUCCESS) 
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+BootManagerMenuEntry (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+
+#include "BootManagerMenuAppStrDefs.h"
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
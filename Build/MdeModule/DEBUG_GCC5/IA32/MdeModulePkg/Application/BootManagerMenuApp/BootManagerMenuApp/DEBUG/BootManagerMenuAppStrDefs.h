@@ -0,0 +1,60 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    BootManagerMenuAppStrDefs.h
+  Abstract:       Auto-generated BootManagerMenuAppStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_EEC25BDC_67F2_4D95_B1D5_F81B2039D11D
+#define _STRDEFS_EEC25BDC_67F2_4D95_B1D5_F81B2039D11D
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_BOOT_POPUP_MENU_TITLE_STRING                     0x0002
+#define STR_BOOT_POPUP_MENU_HELP1_STRING                     0x0003
+#define STR_BOOT_POPUP_MENU_HELP2_STRING                     0x0004
+#define STR_BOOT_POPUP_MENU_HELP3_STRING                     0x0005
+
+extern unsigned char BootManagerMenuAppStrings[];
+
+
+#define STRING_ARRAY_NAME BootManagerMenuAppStrings
+
+#ifdef VFRCOMPILE
+#define gEfiMdePkgTokenSpaceGuid { 0x914AEBE7, 0x4635, 0x459b, { 0xAA, 0x1C, 0x11, 0xE2, 0x19, 0xB0, 0x3A, 0x10 }}
+#define gEfiVTUTF8Guid { 0xAD15A0D6, 0x8BEC, 0x4ACF, { 0xA0, 0x73, 0xD0, 0x1D, 0xE7, 0x7E, 0x2D, 0x88 }}
+#define gEfiVT100Guid { 0xDFA66065, 0xB419, 0x11D3, { 0x9A, 0x2D, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiVT100PlusGuid { 0x7BAEC70B, 0x57E0, 0x4C76, { 0x8E, 0x87, 0x2F, 0x9E, 0x28, 0x08, 0x83, 0x43 }}
+#define gEfiPcAnsiGuid { 0xE0C14753, 0xF9BE, 0x11D2, { 0x9A, 0x0C, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiUartDevicePathGuid { 0x37499a9d, 0x542f, 0x4c89, { 0xa0, 0x26, 0x35, 0xda, 0x14, 0x20, 0x94, 0xe4 }}
+#define gEfiSasDevicePathGuid { 0xd487ddb4, 0x008b, 0x11d9, { 0xaf, 0xdc, 0x00, 0x10, 0x83, 0xff, 0xca, 0x4d }}
+#define gEfiVirtualDiskGuid { 0x77AB535A, 0x45FC, 0x624B, {0x55, 0x60, 0xF7, 0xB2, 0x81, 0xD1, 0xF9, 0x6E }}
+#define gEfiVirtualCdGuid { 0x3D5ABD30, 0x4175, 0x87CE, {0x6D, 0x64, 0xD2, 0xAD, 0xE5, 0x23, 0xC4, 0xBB }}
+#define gEfiPersistentVirtualDiskGuid { 0x5CEA02C9, 0x4D07, 0x69D3, {0x26, 0x9F ,0x44, 0x96, 0xFB, 0xE0, 0x96, 0xF9 }}
+#define gEfiPersistentVirtualCdGuid { 0x08018188, 0x42CD, 0xBB48, {0x10, 0x0F, 0x53, 0x87, 0xD5, 0x3D, 0xED, 0x3D }}
+#define gEfiEventReadyToBootGuid { 0x7CE88FB3, 0x4BD7, 0x4679, { 0x87, 0xA8, 0xA8, 0xD8, 0xDE, 0xE5, 0x0D, 0x2B }}
+#define gEfiEventLegacyBootGuid { 0x2A571201, 0x4966, 0x47F6, { 0x8B, 0x86, 0xF3, 0x1E, 0x41, 0xF3, 0x2F, 0x10 }}
+#define gEfiGlobalVariableGuid { 0x8BE4DF61, 0x93CA, 0x11D2, { 0xAA, 0x0D, 0x00, 0xE0, 0x98, 0x03, 0x2B, 0x8C }}
+#define gEfiAcpi20TableGuid { 0x8868E871, 0xE4F1, 0x11D3, { 0xBC, 0x22, 0x00, 0x80, 0xC7, 0x3C, 0x88, 0x81 }}
+#define gEfiAcpi10TableGuid { 0xEB9D2D30, 0x2D88, 0x11D3, { 0x9A, 0x16, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiFileInfoGuid { 0x09576E92, 0x6D3F, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiDxeServicesTableGuid { 0x05AD34BA, 0x6F02, 0x4214, { 0x95, 0x2E, 0x4D, 0xA0, 0x39, 0x8E, 0x2B, 0xB9 }}
+#define gEfiHobListGuid { 0x7739F24C, 0x93D7, 0x11D4, { 0x9A, 0x3A, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEdkiiIfrBitVarstoreGuid {0x82DDD68B, 0x9163, 0x4187, {0x9B, 0x27, 0x20, 0xA8, 0xFD, 0x60,0xA7, 0x1D}}
+#define gEfiMemoryTypeInformationGuid { 0x4C19049F, 0x4137, 0x4DD3, { 0x9C, 0x10, 0x8B, 0x97, 0xA8, 0x3F, 0xFD, 0xFA }}
+#define gEdkiiStatusCodeDataTypeVariableGuid { 0xf6ee6dbb, 0xd67f, 0x4ea0, { 0x8b, 0x96, 0x6a, 0x71, 0xb1, 0x9d, 0x84, 0xad }}
+#define gEfiDiskInfoAhciInterfaceGuid { 0x9e498932, 0x4abc, 0x45af, { 0xa3, 0x4d, 0x02, 0x47, 0x78, 0x7b, 0xe7, 0xc6 }}
+#define gEfiDiskInfoIdeInterfaceGuid { 0x5E948FE3, 0x26D3, 0x42B5, { 0xAF, 0x17, 0x61, 0x02, 0x87, 0x18, 0x8D, 0xEC }}
+#define gEfiDiskInfoScsiInterfaceGuid { 0x08F74BAA, 0xEA36, 0x41D9, { 0x95, 0x21, 0x21, 0xA7, 0x0F, 0x87, 0x80, 0xBC }}
+#define gEfiDiskInfoSdMmcInterfaceGuid { 0x8deec992, 0xd39c, 0x4a5c, { 0xab, 0x6b, 0x98, 0x6e, 0x14, 0x24, 0x2b, 0x9d }}
+#define gEfiDiskInfoUfsInterfaceGuid { 0x4b3029cc, 0x6b98, 0x47fb, { 0xbc, 0x96, 0x76, 0xdc, 0xb8, 0x4, 0x41, 0xf0 }}
+#define gEfiBootLogoProtocolGuid { 0xcdea2bd3, 0xfc25, 0x4c1c, { 0xb9, 0x7c, 0xb3, 0x11, 0x86, 0x6, 0x49, 0x90 } }
+#define gEfiLoadedImageDevicePathProtocolGuid { 0xbc62157e, 0x3e33, 0x4fec, {0x99, 0x20, 0x2d, 0x3b, 0x36, 0xd7, 0x50, 0xdf }}
+#endif
+
+#endif
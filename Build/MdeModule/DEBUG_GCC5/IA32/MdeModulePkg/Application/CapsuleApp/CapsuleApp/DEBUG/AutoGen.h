@@ -0,0 +1,127 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_4CEF31DA_8682_4274_9CC4_AEE7516A5E7B
+#define _AUTOGENH_4CEF31DA_8682_4274_9CC4_AEE7516A5E7B
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Uefi.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0x4CEF31DA, 0x8682, 0x4274, {0x9C, 0xC4, 0xAE, 0xE7, 0x51, 0x6A, 0x5E, 0x7B}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiGlobalVariableGuid;
+extern EFI_GUID gEfiCapsuleReportGuid;
+extern EFI_GUID gEfiFmpCapsuleGuid;
+extern EFI_GUID gWindowsUxCapsuleGuid;
+extern EFI_GUID gEfiSystemResourceTableGuid;
+extern EFI_GUID gEfiCapsuleVendorGuid;
+extern EFI_GUID gEfiPartTypeSystemPartGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+extern EFI_GUID gEfiEventReadyToBootGuid;
+extern EFI_GUID gEfiEventLegacyBootGuid;
+extern EFI_GUID gEfiAcpi20TableGuid;
+extern EFI_GUID gEfiAcpi10TableGuid;
+extern EFI_GUID gEdkiiIfrBitVarstoreGuid;
+extern EFI_GUID gEfiFileInfoGuid;
+extern EFI_GUID gEfiDxeServicesTableGuid;
+extern EFI_GUID gEfiHobListGuid;
+extern EFI_GUID gEfiMemoryTypeInformationGuid;
+extern EFI_GUID gEdkiiStatusCodeDataTypeVariableGuid;
+extern EFI_GUID gEfiDiskInfoAhciInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoIdeInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoScsiInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoSdMmcInterfaceGuid;
+extern EFI_GUID gEfiDiskInfoUfsInterfaceGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+
+// Protocols
+extern EFI_GUID gEfiGraphicsOutputProtocolGuid;
+extern EFI_GUID gEfiFirmwareManagementProtocolGuid;
+extern EFI_GUID gEfiShellParametersProtocolGuid;
+extern EFI_GUID gEfiShellProtocolGuid;
+extern EFI_GUID gEfiSimpleFileSystemProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+extern EFI_GUID gEfiHiiFontProtocolGuid;
+extern EFI_GUID gEfiHiiStringProtocolGuid;
+extern EFI_GUID gEfiHiiImageProtocolGuid;
+extern EFI_GUID gEfiHiiDatabaseProtocolGuid;
+extern EFI_GUID gEfiHiiConfigRoutingProtocolGuid;
+extern EFI_GUID gEfiDriverBindingProtocolGuid;
+extern EFI_GUID gEfiSimpleTextOutProtocolGuid;
+extern EFI_GUID gEfiUgaDrawProtocolGuid;
+extern EFI_GUID gEfiComponentNameProtocolGuid;
+extern EFI_GUID gEfiComponentName2ProtocolGuid;
+extern EFI_GUID gEfiDriverConfigurationProtocolGuid;
+extern EFI_GUID gEfiDriverConfiguration2ProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnosticsProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnostics2ProtocolGuid;
+extern EFI_GUID gEfiFormBrowser2ProtocolGuid;
+extern EFI_GUID gEfiFirmwareVolume2ProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+extern EFI_GUID gEfiLoadFileProtocolGuid;
+extern EFI_GUID gEfiLoadFile2ProtocolGuid;
+extern EFI_GUID gEfiPciRootBridgeIoProtocolGuid;
+extern EFI_GUID gEfiPciIoProtocolGuid;
+extern EFI_GUID gEfiSimpleNetworkProtocolGuid;
+extern EFI_GUID gEfiSimpleTextInProtocolGuid;
+extern EFI_GUID gEfiBlockIoProtocolGuid;
+extern EFI_GUID gEfiBootLogoProtocolGuid;
+extern EFI_GUID gEfiSimpleTextInputExProtocolGuid;
+extern EFI_GUID gEdkiiVariablePolicyProtocolGuid;
+extern EFI_GUID gEfiUsbIoProtocolGuid;
+extern EFI_GUID gEfiNvmExpressPassThruProtocolGuid;
+extern EFI_GUID gEfiDiskInfoProtocolGuid;
+extern EFI_GUID gEfiDriverHealthProtocolGuid;
+extern EFI_GUID gEfiRamDiskProtocolGuid;
+extern EFI_GUID gEfiDeferredImageLoadProtocolGuid;
+extern EFI_GUID gEdkiiPlatformBootManagerProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+UefiMain (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
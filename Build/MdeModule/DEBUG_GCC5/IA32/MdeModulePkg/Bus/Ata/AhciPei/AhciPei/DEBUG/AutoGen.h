@@ -0,0 +1,87 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_79E5CA15_7A2D_4F37_A63B_D1C7BBCA47AD
+#define _AUTOGENH_79E5CA15_7A2D_4F37_A63B_D1C7BBCA47AD
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiPei.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0x79E5CA15, 0x7A2D, 0x4F37, {0xA6, 0x3B, 0xD1, 0xC7, 0xBB, 0xCA, 0x47, 0xAD}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gS3StorageDeviceInitListGuid;
+extern EFI_GUID gEfiHobMemoryAllocStackGuid;
+extern EFI_GUID gEfiHobMemoryAllocBspStoreGuid;
+extern EFI_GUID gEfiHobMemoryAllocModuleGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiFirmwareFileSystem2Guid;
+extern EFI_GUID gEfiSmmLockBoxCommunicationGuid;
+extern EFI_GUID gEfiAcpiVariableGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+
+// Protocols
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+
+// PPIs
+extern EFI_GUID gEdkiiPeiAtaAhciHostControllerPpiGuid;
+extern EFI_GUID gEdkiiIoMmuPpiGuid;
+extern EFI_GUID gEfiEndOfPeiSignalPpiGuid;
+extern EFI_GUID gEdkiiPeiPciDevicePpiGuid;
+extern EFI_GUID gEdkiiPeiAtaPassThruPpiGuid;
+extern EFI_GUID gEfiPeiVirtualBlockIoPpiGuid;
+extern EFI_GUID gEfiPeiVirtualBlockIo2PpiGuid;
+extern EFI_GUID gEdkiiPeiStorageSecurityCommandPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfoPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfo2PpiGuid;
+extern EFI_GUID gEfiPeiSmmCommunicationPpiGuid;
+extern EFI_GUID gPeiSmmAccessPpiGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+AtaAhciPeimEntry (
+  IN       EFI_PEI_FILE_HANDLE  FileHandle,
+  IN CONST EFI_PEI_SERVICES     **PeiServices
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
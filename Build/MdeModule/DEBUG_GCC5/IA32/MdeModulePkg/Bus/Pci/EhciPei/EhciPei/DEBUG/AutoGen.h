@@ -0,0 +1,63 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_BAB4F20F_0981_4b5f_A047_6EF83BEEAB3C
+#define _AUTOGENH_BAB4F20F_0981_4b5f_A047_6EF83BEEAB3C
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiPei.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0xBAB4F20F, 0x0981, 0x4b5f, {0xA0, 0x47, 0x6E, 0xF8, 0x3B, 0xEE, 0xAB, 0x3C}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiHobMemoryAllocStackGuid;
+extern EFI_GUID gEfiHobMemoryAllocBspStoreGuid;
+extern EFI_GUID gEfiHobMemoryAllocModuleGuid;
+extern EFI_GUID gEfiFirmwareFileSystem2Guid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+
+// PPIs
+extern EFI_GUID gPeiUsb2HostControllerPpiGuid;
+extern EFI_GUID gPeiUsbControllerPpiGuid;
+extern EFI_GUID gEdkiiIoMmuPpiGuid;
+extern EFI_GUID gEfiEndOfPeiSignalPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfoPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfo2PpiGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+EhcPeimEntry (
+  IN       EFI_PEI_FILE_HANDLE  FileHandle,
+  IN CONST EFI_PEI_SERVICES     **PeiServices
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
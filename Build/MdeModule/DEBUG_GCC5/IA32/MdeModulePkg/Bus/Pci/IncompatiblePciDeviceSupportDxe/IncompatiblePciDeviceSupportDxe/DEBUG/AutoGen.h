@@ -0,0 +1,55 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_AD70855E_0CC5_4abf_8979_BE762A949EA3
+#define _AUTOGENH_AD70855E_0CC5_4abf_8979_BE762A949EA3
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0xAD70855E, 0x0CC5, 0x4abf, {0x89, 0x79, 0xBE, 0x76, 0x2A, 0x94, 0x9E, 0xA3}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+
+// Protocols
+extern EFI_GUID gEfiIncompatiblePciDeviceSupportProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+IncompatiblePciDeviceSupportEntryPoint (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,146 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_E2775B47_D453_4EE3_ADA7_391A1B05AC17
+#define _AUTOGENH_E2775B47_D453_4EE3_ADA7_391A1B05AC17
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Uefi.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0xE2775B47, 0xD453, 0x4EE3, {0xAD, 0xA7, 0x39, 0x1A, 0x1B, 0x05, 0xAC, 0x17}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+extern EFI_GUID gEfiEventReadyToBootGuid;
+extern EFI_GUID gEfiEventLegacyBootGuid;
+extern EFI_GUID gEfiGlobalVariableGuid;
+extern EFI_GUID gEfiAcpi20TableGuid;
+extern EFI_GUID gEfiAcpi10TableGuid;
+
+// Protocols
+extern EFI_GUID gEfiSioProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiPciIoProtocolGuid;
+extern EFI_GUID gEfiSerialIoProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+extern EFI_GUID gEfiDriverBindingProtocolGuid;
+extern EFI_GUID gEfiSimpleTextOutProtocolGuid;
+extern EFI_GUID gEfiGraphicsOutputProtocolGuid;
+extern EFI_GUID gEfiHiiFontProtocolGuid;
+extern EFI_GUID gEfiSimpleFileSystemProtocolGuid;
+extern EFI_GUID gEfiUgaDrawProtocolGuid;
+extern EFI_GUID gEfiComponentNameProtocolGuid;
+extern EFI_GUID gEfiComponentName2ProtocolGuid;
+extern EFI_GUID gEfiDriverConfigurationProtocolGuid;
+extern EFI_GUID gEfiDriverConfiguration2ProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnosticsProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnostics2ProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in this module
+
+#define _PCD_TOKEN_PcdSerialUseHalfHandshake  0U
+#define _PCD_SIZE_PcdSerialUseHalfHandshake 1
+#define _PCD_GET_MODE_SIZE_PcdSerialUseHalfHandshake  _PCD_SIZE_PcdSerialUseHalfHandshake 
+#define _PCD_VALUE_PcdSerialUseHalfHandshake  ((BOOLEAN)0U)
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdSerialUseHalfHandshake;
+#define _PCD_GET_MODE_BOOL_PcdSerialUseHalfHandshake  _gPcd_FixedAtBuild_PcdSerialUseHalfHandshake
+//#define _PCD_SET_MODE_BOOL_PcdSerialUseHalfHandshake  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUartDefaultBaudRate  0U
+#define _PCD_SIZE_PcdUartDefaultBaudRate 8
+#define _PCD_GET_MODE_SIZE_PcdUartDefaultBaudRate  _PCD_SIZE_PcdUartDefaultBaudRate 
+#define _PCD_VALUE_PcdUartDefaultBaudRate  115200ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdUartDefaultBaudRate;
+#define _PCD_GET_MODE_64_PcdUartDefaultBaudRate  _gPcd_FixedAtBuild_PcdUartDefaultBaudRate
+//#define _PCD_SET_MODE_64_PcdUartDefaultBaudRate  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUartDefaultDataBits  0U
+#define _PCD_SIZE_PcdUartDefaultDataBits 1
+#define _PCD_GET_MODE_SIZE_PcdUartDefaultDataBits  _PCD_SIZE_PcdUartDefaultDataBits 
+#define _PCD_VALUE_PcdUartDefaultDataBits  8U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdUartDefaultDataBits;
+#define _PCD_GET_MODE_8_PcdUartDefaultDataBits  _gPcd_FixedAtBuild_PcdUartDefaultDataBits
+//#define _PCD_SET_MODE_8_PcdUartDefaultDataBits  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUartDefaultParity  0U
+#define _PCD_SIZE_PcdUartDefaultParity 1
+#define _PCD_GET_MODE_SIZE_PcdUartDefaultParity  _PCD_SIZE_PcdUartDefaultParity 
+#define _PCD_VALUE_PcdUartDefaultParity  1U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdUartDefaultParity;
+#define _PCD_GET_MODE_8_PcdUartDefaultParity  _gPcd_FixedAtBuild_PcdUartDefaultParity
+//#define _PCD_SET_MODE_8_PcdUartDefaultParity  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUartDefaultStopBits  0U
+#define _PCD_SIZE_PcdUartDefaultStopBits 1
+#define _PCD_GET_MODE_SIZE_PcdUartDefaultStopBits  _PCD_SIZE_PcdUartDefaultStopBits 
+#define _PCD_VALUE_PcdUartDefaultStopBits  1U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdUartDefaultStopBits;
+#define _PCD_GET_MODE_8_PcdUartDefaultStopBits  _gPcd_FixedAtBuild_PcdUartDefaultStopBits
+//#define _PCD_SET_MODE_8_PcdUartDefaultStopBits  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdSerialClockRate  0U
+#define _PCD_SIZE_PcdSerialClockRate 4
+#define _PCD_GET_MODE_SIZE_PcdSerialClockRate  _PCD_SIZE_PcdSerialClockRate 
+#define _PCD_VALUE_PcdSerialClockRate  1843200U
+extern const  UINT32  _gPcd_FixedAtBuild_PcdSerialClockRate;
+#define _PCD_GET_MODE_32_PcdSerialClockRate  _gPcd_FixedAtBuild_PcdSerialClockRate
+//#define _PCD_SET_MODE_32_PcdSerialClockRate  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdPciSerialParameters  0U
+#define _PCD_VALUE_PcdPciSerialParameters  (VOID *)_gPcd_FixedAtBuild_PcdPciSerialParameters
+extern const UINT8 _gPcd_FixedAtBuild_PcdPciSerialParameters[2];
+#define _PCD_GET_MODE_PTR_PcdPciSerialParameters  (VOID *)_gPcd_FixedAtBuild_PcdPciSerialParameters
+#define _PCD_SIZE_PcdPciSerialParameters 2
+#define _PCD_GET_MODE_SIZE_PcdPciSerialParameters  _PCD_SIZE_PcdPciSerialParameters 
+//#define _PCD_SET_MODE_PTR_PcdPciSerialParameters  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+InitializePciSioSerial (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
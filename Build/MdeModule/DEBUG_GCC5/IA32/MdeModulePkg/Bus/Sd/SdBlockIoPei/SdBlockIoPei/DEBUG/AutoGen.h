@@ -0,0 +1,64 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_17851FBF_45C4_4ff7_A2A0_C3B12D63C27E
+#define _AUTOGENH_17851FBF_45C4_4ff7_A2A0_C3B12D63C27E
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiPei.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0x17851FBF, 0x45C4, 0x4ff7, {0xA2, 0xA0, 0xC3, 0xB1, 0x2D, 0x63, 0xC2, 0x7E}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiHobMemoryAllocStackGuid;
+extern EFI_GUID gEfiHobMemoryAllocBspStoreGuid;
+extern EFI_GUID gEfiHobMemoryAllocModuleGuid;
+extern EFI_GUID gEfiFirmwareFileSystem2Guid;
+
+// PPIs
+extern EFI_GUID gEfiPeiVirtualBlockIoPpiGuid;
+extern EFI_GUID gEfiPeiVirtualBlockIo2PpiGuid;
+extern EFI_GUID gEdkiiPeiSdMmcHostControllerPpiGuid;
+extern EFI_GUID gEdkiiIoMmuPpiGuid;
+extern EFI_GUID gEfiEndOfPeiSignalPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfoPpiGuid;
+extern EFI_GUID gEfiPeiFirmwareVolumeInfo2PpiGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+InitializeSdBlockIoPeim (
+  IN       EFI_PEI_FILE_HANDLE  FileHandle,
+  IN CONST EFI_PEI_SERVICES     **PeiServices
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,31 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_CF5F650B_C208_409A_B889_0755172E2B0C
+#define _AUTOGENH_CF5F650B_C208_409A_B889_0755172E2B0C
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,31 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_a89dea6f_c9a0_40be_903c_7cac2ef8a0e7
+#define _AUTOGENH_a89dea6f_c9a0_40be_903c_7cac2ef8a0e7
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,31 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_fd56f5d6_f194_448f_be69_c0cbb0c281af
+#define _AUTOGENH_fd56f5d6_f194_448f_be69_c0cbb0c281af
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,31 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_667A8B1C_9C97_4b2a_AE7E_568772FE45F3
+#define _AUTOGENH_667A8B1C_9C97_4b2a_AE7E_568772FE45F3
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,127 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_9E7C00CF_355A_4d4e_BF60_0428CFF95540
+#define _AUTOGENH_9E7C00CF_355A_4d4e_BF60_0428CFF95540
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern GUID gEfiMdeModulePkgTokenSpaceGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// PCD definitions
+#define _PCD_TOKEN_PcdSerialRegisterAccessWidth  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdSerialRegisterAccessWidth;
+#define _PCD_GET_MODE_8_PcdSerialRegisterAccessWidth  _gPcd_FixedAtBuild_PcdSerialRegisterAccessWidth
+//#define _PCD_SET_MODE_8_PcdSerialRegisterAccessWidth  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialRegisterAccessWidth 8
+#define _PCD_SIZE_PcdSerialRegisterAccessWidth 1
+#define _PCD_GET_MODE_SIZE_PcdSerialRegisterAccessWidth _PCD_SIZE_PcdSerialRegisterAccessWidth
+#define _PCD_TOKEN_PcdSerialUseMmio  0U
+extern const BOOLEAN _gPcd_FixedAtBuild_PcdSerialUseMmio;
+#define _PCD_GET_MODE_BOOL_PcdSerialUseMmio  _gPcd_FixedAtBuild_PcdSerialUseMmio
+//#define _PCD_SET_MODE_BOOL_PcdSerialUseMmio  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialUseMmio 0
+#define _PCD_SIZE_PcdSerialUseMmio 1
+#define _PCD_GET_MODE_SIZE_PcdSerialUseMmio _PCD_SIZE_PcdSerialUseMmio
+#define _PCD_TOKEN_PcdSerialUseHardwareFlowControl  0U
+extern const BOOLEAN _gPcd_FixedAtBuild_PcdSerialUseHardwareFlowControl;
+#define _PCD_GET_MODE_BOOL_PcdSerialUseHardwareFlowControl  _gPcd_FixedAtBuild_PcdSerialUseHardwareFlowControl
+//#define _PCD_SET_MODE_BOOL_PcdSerialUseHardwareFlowControl  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialUseHardwareFlowControl 0
+#define _PCD_SIZE_PcdSerialUseHardwareFlowControl 1
+#define _PCD_GET_MODE_SIZE_PcdSerialUseHardwareFlowControl _PCD_SIZE_PcdSerialUseHardwareFlowControl
+#define _PCD_TOKEN_PcdSerialDetectCable  0U
+extern const BOOLEAN _gPcd_FixedAtBuild_PcdSerialDetectCable;
+#define _PCD_GET_MODE_BOOL_PcdSerialDetectCable  _gPcd_FixedAtBuild_PcdSerialDetectCable
+//#define _PCD_SET_MODE_BOOL_PcdSerialDetectCable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialDetectCable 0
+#define _PCD_SIZE_PcdSerialDetectCable 1
+#define _PCD_GET_MODE_SIZE_PcdSerialDetectCable _PCD_SIZE_PcdSerialDetectCable
+#define _PCD_TOKEN_PcdSerialRegisterBase  0U
+extern const UINT64 _gPcd_FixedAtBuild_PcdSerialRegisterBase;
+#define _PCD_GET_MODE_64_PcdSerialRegisterBase  _gPcd_FixedAtBuild_PcdSerialRegisterBase
+//#define _PCD_SET_MODE_64_PcdSerialRegisterBase  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialRegisterBase 0x03F8
+#define _PCD_SIZE_PcdSerialRegisterBase 8
+#define _PCD_GET_MODE_SIZE_PcdSerialRegisterBase _PCD_SIZE_PcdSerialRegisterBase
+#define _PCD_TOKEN_PcdSerialBaudRate  0U
+extern const UINT32 _gPcd_FixedAtBuild_PcdSerialBaudRate;
+#define _PCD_GET_MODE_32_PcdSerialBaudRate  _gPcd_FixedAtBuild_PcdSerialBaudRate
+//#define _PCD_SET_MODE_32_PcdSerialBaudRate  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialBaudRate 115200
+#define _PCD_SIZE_PcdSerialBaudRate 4
+#define _PCD_GET_MODE_SIZE_PcdSerialBaudRate _PCD_SIZE_PcdSerialBaudRate
+#define _PCD_TOKEN_PcdSerialLineControl  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdSerialLineControl;
+#define _PCD_GET_MODE_8_PcdSerialLineControl  _gPcd_FixedAtBuild_PcdSerialLineControl
+//#define _PCD_SET_MODE_8_PcdSerialLineControl  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialLineControl 0x03
+#define _PCD_SIZE_PcdSerialLineControl 1
+#define _PCD_GET_MODE_SIZE_PcdSerialLineControl _PCD_SIZE_PcdSerialLineControl
+#define _PCD_TOKEN_PcdSerialFifoControl  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdSerialFifoControl;
+#define _PCD_GET_MODE_8_PcdSerialFifoControl  _gPcd_FixedAtBuild_PcdSerialFifoControl
+//#define _PCD_SET_MODE_8_PcdSerialFifoControl  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialFifoControl 0x07
+#define _PCD_SIZE_PcdSerialFifoControl 1
+#define _PCD_GET_MODE_SIZE_PcdSerialFifoControl _PCD_SIZE_PcdSerialFifoControl
+#define _PCD_TOKEN_PcdSerialClockRate  0U
+extern const UINT32 _gPcd_FixedAtBuild_PcdSerialClockRate;
+#define _PCD_GET_MODE_32_PcdSerialClockRate  _gPcd_FixedAtBuild_PcdSerialClockRate
+//#define _PCD_SET_MODE_32_PcdSerialClockRate  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialClockRate 1843200
+#define _PCD_SIZE_PcdSerialClockRate 4
+#define _PCD_GET_MODE_SIZE_PcdSerialClockRate _PCD_SIZE_PcdSerialClockRate
+#define _PCD_TOKEN_PcdSerialPciDeviceInfo  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdSerialPciDeviceInfo[];
+#define _PCD_GET_MODE_PTR_PcdSerialPciDeviceInfo  (VOID *)_gPcd_FixedAtBuild_PcdSerialPciDeviceInfo
+//#define _PCD_SET_MODE_PTR_PcdSerialPciDeviceInfo  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialPciDeviceInfo (VOID *)_gPcd_FixedAtBuild_PcdSerialPciDeviceInfo
+#define _PCD_SIZE_PcdSerialPciDeviceInfo 1
+#define _PCD_GET_MODE_SIZE_PcdSerialPciDeviceInfo _PCD_SIZE_PcdSerialPciDeviceInfo
+#define _PCD_TOKEN_PcdSerialExtendedTxFifoSize  0U
+extern const UINT32 _gPcd_FixedAtBuild_PcdSerialExtendedTxFifoSize;
+#define _PCD_GET_MODE_32_PcdSerialExtendedTxFifoSize  _gPcd_FixedAtBuild_PcdSerialExtendedTxFifoSize
+//#define _PCD_SET_MODE_32_PcdSerialExtendedTxFifoSize  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialExtendedTxFifoSize 64
+#define _PCD_SIZE_PcdSerialExtendedTxFifoSize 4
+#define _PCD_GET_MODE_SIZE_PcdSerialExtendedTxFifoSize _PCD_SIZE_PcdSerialExtendedTxFifoSize
+#define _PCD_TOKEN_PcdSerialRegisterStride  0U
+extern const UINT32 _gPcd_FixedAtBuild_PcdSerialRegisterStride;
+#define _PCD_GET_MODE_32_PcdSerialRegisterStride  _gPcd_FixedAtBuild_PcdSerialRegisterStride
+//#define _PCD_SET_MODE_32_PcdSerialRegisterStride  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdSerialRegisterStride 1
+#define _PCD_SIZE_PcdSerialRegisterStride 4
+#define _PCD_GET_MODE_SIZE_PcdSerialRegisterStride _PCD_SIZE_PcdSerialRegisterStride
+
+RETURN_STATUS
+EFIAPI
+BaseSerialPortLib16550 (
+  VOID
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,41 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char BootDiscoveryPolicyUiLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0xE2,  0x00,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0xDE,  0x00,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_FORM_BDP_MAIN_TITLE:0x0002
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x44,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x79,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x63,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0003: STR_FORM_BDP_CONN_MIN:0x0003
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x00,  
+  0x00,
+// 0x0004: STR_FORM_BDP_CONN_NET:0x0004
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x65,  0x00,  0x74,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x20,  
+  0x00,  0x44,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  
+  0x00,
+// 0x0005: STR_FORM_BDP_CONN_ALL:0x0005
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+  0x00,
+
+};
+
@@ -0,0 +1,178 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    BootMaintenanceManagerUiLibStrDefs.h
+  Abstract:       Auto-generated BootMaintenanceManagerUiLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_CA9E4824_4198_4715_AA22_E2935E703A07
+#define _STRDEFS_CA9E4824_4198_4715_AA22_E2935E703A07
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_NULL_STRING                                      0x0002
+#define STR_NONE                                             0x0003
+#define STR_MISSING_STRING                                   0x0004
+#define STR_FORM_MAIN_TITLE                                  0x0005
+#define STR_FORM_BOOT_SETUP_TITLE                            0x0006
+#define STR_BOOT_MAINT_MANAGER_HELP                          0x0007
+#define STR_FORM_BOOT_SETUP_HELP                             0x0008
+#define STR_FORM_DRIVER_SETUP_TITLE                          0x0009
+#define STR_FORM_DRIVER_SETUP_HELP                           0x000A
+#define STR_FORM_BOOT_ADD_TITLE                              0x000B
+#define STR_FORM_BOOT_ADD_HELP                               0x000C
+#define STR_FORM_BOOT_DEL_TITLE                              0x000D
+#define STR_FORM_BOOT_IMMEDIATE_HELP                         0x000E
+#define STR_FORM_BOOT_CHG_TITLE                              0x000F
+#define STR_FORM_DRV_ADD_TITLE                               0x0010
+#define STR_FORM_DRV_ADD_HELP                                0x0011
+#define STR_FORM_DRV_DEL_TITLE                               0x0012
+#define STR_FORM_DRV_CHG_TITLE                               0x0013
+#define STR_FORM_NEXT_BOOT_HELP                              0x0014
+#define STR_FORM_CON_MAIN_TITLE                              0x0015
+#define STR_FORM_CON_MAIN_HELP                               0x0016
+#define STR_FORM_CON_IN_TITLE                                0x0017
+#define STR_FORM_CON_IN_HELP                                 0x0018
+#define STR_FORM_CON_OUT_TITLE                               0x0019
+#define STR_FORM_CON_OUT_HELP                                0x001A
+#define STR_FORM_STD_ERR_TITLE                               0x001B
+#define STR_FORM_STD_ERR_HELP                                0x001C
+#define STR_FORM_MODE_TITLE                                  0x001D
+#define STR_FORM_MODE_HELP                                   0x001E
+#define STR_FORM_COM_TITLE                                   0x001F
+#define STR_FORM_COM_HELP                                    0x0020
+#define STR_FORM_DRV_ADD_FILE_TITLE                          0x0021
+#define STR_FORM_DRV_ADD_HANDLE_TITLE                        0x0022
+#define STR_FORM_BOOT_ADD_DESC_TITLE                         0x0023
+#define STR_FORM_DRV_ADD_DESC_TITLE                          0x0024
+#define STR_NUM_AUTO_BOOT                                    0x0025
+#define STR_HLP_AUTO_BOOT                                    0x0026
+#define STR_BOOT_NEXT                                        0x0027
+#define STR_BOOT_NEXT_HELP                                   0x0028
+#define STR_LOAD_OPTION_DESC                                 0x0029
+#define STR_LOAD_OPTION_FORCE_RECON                          0x002A
+#define STR_SAVE_AND_EXIT                                    0x002B
+#define STR_NO_SAVE_AND_EXIT                                 0x002C
+#define STR_CON_MODE_SETUP                                   0x002D
+#define STR_CON_COM_SETUP                                    0x002E
+#define STR_COM_TERMI_TYPE                                   0x002F
+#define STR_COM_FLOW_CONTROL                                 0x0030
+#define STR_COM_BAUD_RATE                                    0x0031
+#define STR_COM_DATA_BITS                                    0x0032
+#define STR_COM_PARITY                                       0x0033
+#define STR_COM_STOP_BITS                                    0x0034
+#define STR_COM_BAUD_RATE_0                                  0x0035
+#define STR_COM_BAUD_RATE_1                                  0x0036
+#define STR_COM_BAUD_RATE_2                                  0x0037
+#define STR_COM_BAUD_RATE_3                                  0x0038
+#define STR_COM_BAUD_RATE_4                                  0x0039
+#define STR_COM_BAUD_RATE_5                                  0x003A
+#define STR_COM_BAUD_RATE_6                                  0x003B
+#define STR_COM_BAUD_RATE_7                                  0x003C
+#define STR_COM_BAUD_RATE_8                                  0x003D
+#define STR_COM_BAUD_RATE_9                                  0x003E
+#define STR_COM_BAUD_RATE_10                                 0x003F
+#define STR_COM_BAUD_RATE_11                                 0x0040
+#define STR_COM_BAUD_RATE_12                                 0x0041
+#define STR_COM_BAUD_RATE_13                                 0x0042
+#define STR_COM_BAUD_RATE_14                                 0x0043
+#define STR_COM_BAUD_RATE_15                                 0x0044
+#define STR_COM_BAUD_RATE_16                                 0x0045
+#define STR_COM_BAUD_RATE_17                                 0x0046
+#define STR_COM_BAUD_RATE_18                                 0x0047
+#define STR_COM_DATA_BITS_0                                  0x0048
+#define STR_COM_DATA_BITS_1                                  0x0049
+#define STR_COM_DATA_BITS_2                                  0x004A
+#define STR_COM_DATA_BITS_3                                  0x004B
+#define STR_COM_PAR_0                                        0x004C
+#define STR_COM_PAR_1                                        0x004D
+#define STR_COM_PAR_2                                        0x004E
+#define STR_COM_PAR_3                                        0x004F
+#define STR_COM_PAR_4                                        0x0050
+#define STR_COM_STOP_BITS_0                                  0x0051
+#define STR_COM_STOP_BITS_1                                  0x0052
+#define STR_COM_STOP_BITS_2                                  0x0053
+#define STR_COM_TYPE_0                                       0x0054
+#define STR_COM_TYPE_1                                       0x0055
+#define STR_COM_TYPE_2                                       0x0056
+#define STR_COM_TYPE_3                                       0x0057
+#define STR_COM_TYPE_4                                       0x0058
+#define STR_COM_TYPE_5                                       0x0059
+#define STR_COM_TYPE_6                                       0x005A
+#define STR_COM_TYPE_7                                       0x005B
+#define STR_COM_TYPE_8                                       0x005C
+#define STR_FORM_GOTO_MAIN                                   0x005D
+#define STR_BOOT_FROM_FILE                                   0x005E
+#define STR_BOOT_FROM_FILE_HELP                              0x005F
+#define STR_OPTIONAL_DATA                                    0x0060
+#define STR_CHANGE_ORDER                                     0x0061
+#define STR_HARDWARE_FLOW_CONTROL                            0x0062
+#define STR_NONE_FLOW_CONTROL                                0x0063
+// #define STR_FORM_BOOT_NEXT_TITLE                             0x0064 // not referenced
+// #define STR_FORM_BOOT_NEXT_HELP                              0x0065 // not referenced
+// #define STR_FORM_TIME_OUT_TITLE                              0x0066 // not referenced
+// #define STR_FORM_TIME_OUT_HELP                               0x0067 // not referenced
+// #define STR_FORM_MEMORY_CHECK_TITLE                          0x0068 // not referenced
+// #define STR_FORM_MEMORY_CHECK_HELP                           0x0069 // not referenced
+// #define STR_FORM_UEFI_OPTIMIZED_BOOT_TITLE                   0x006A // not referenced
+// #define STR_FORM_UEFI_OPTIMIZED_BOOT_HELP                    0x006B // not referenced
+// #define UEFI_OPTIMIZED_BOOT_DESCRIPTION                      0x006C // not referenced
+// #define UEFI_OPTIMIZED_BOOT_HELP                             0x006D // not referenced
+// #define STR_FORM_SET_FD_ORDER_TITLE                          0x006E // not referenced
+// #define STR_FORM_SET_HD_ORDER_TITLE                          0x006F // not referenced
+// #define STR_FORM_SET_CD_ORDER_TITLE                          0x0070 // not referenced
+// #define STR_FORM_SET_NET_ORDER_TITLE                         0x0071 // not referenced
+// #define STR_FORM_SET_BEV_ORDER_TITLE                         0x0072 // not referenced
+// #define STR_FORM_GOTO_SETTING                                0x0073 // not referenced
+// #define STR_COM1                                             0x0074 // not referenced
+// #define STR_COM2                                             0x0075 // not referenced
+// #define STR_COM_AS_CONSOLE_OPTION                            0x0076 // not referenced
+// #define STR_LOAD_OPTION_DEVPATH                              0x0077 // not referenced
+// #define STR_LOAD_OPTION_ACTIVE                               0x0078 // not referenced
+// #define STR_CON_IN_SETUP                                     0x0079 // not referenced
+// #define STR_CON_OUT_SETUP                                    0x007A // not referenced
+// #define STR_CON_ERR_SETUP                                    0x007B // not referenced
+// #define STR_RESET                                            0x007C // not referenced
+// #define STR_BOOT_LEGACY                                      0x007D // not referenced
+// #define STR_BOOT_LEGACY_HELP                                 0x007E // not referenced
+// #define STR_BOOT_LEGACY_FLOPPY                               0x007F // not referenced
+// #define STR_BOOT_LEGACY_HARDDRIVE                            0x0080 // not referenced
+// #define STR_BOOT_LEGACY_CDROM                                0x0081 // not referenced
+// #define STR_BOOT_LEGACY_PCMCIA                               0x0082 // not referenced
+// #define STR_BOOT_LEGACY_USB                                  0x0083 // not referenced
+// #define STR_BOOT_LEGACY_NETWORK                              0x0084 // not referenced
+// #define STR_DISABLE_LEGACY_DEVICE                            0x0085 // not referenced
+// #define STR_FILE_EXPLORER_TITLE                              0x0086 // not referenced
+// #define STR_OUT_OF_BAND_PORT                                 0x0087 // not referenced
+
+extern unsigned char BootMaintenanceManagerUiLibStrings[];
+
+
+#define STRING_ARRAY_NAME BootMaintenanceManagerUiLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiGlobalVariableGuid { 0x8BE4DF61, 0x93CA, 0x11D2, { 0xAA, 0x0D, 0x00, 0xE0, 0x98, 0x03, 0x2B, 0x8C }}
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gEfiIfrFrontPageGuid { 0xe58809f8, 0xfbc1, 0x48e2, { 0x88, 0x3a, 0xa3, 0x0f, 0xdc, 0x4b, 0x44, 0x1e } }
+#define gEfiIfrBootMaintenanceGuid { 0xb2dedc91, 0xd59f, 0x48d2, { 0x89, 0x8a, 0x12, 0x49, 0xc, 0x74, 0xa4, 0xe0 }}
+#define gEfiSimpleFileSystemProtocolGuid { 0x964E5B22, 0x6459, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiLoadFileProtocolGuid { 0x56EC3091, 0x954C, 0x11D2, { 0x8E, 0x3F, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#define gEfiSerialIoProtocolGuid { 0xBB25CF6F, 0xF1D4, 0x11D2, { 0x9A, 0x0C, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0xFD }}
+#define gEfiDevicePathToTextProtocolGuid { 0x8B843E20, 0x8132, 0x4852, { 0x90, 0xCC, 0x55, 0x1A, 0x4E, 0x4A, 0x7F, 0x1C }}
+#define gEdkiiFormBrowserEx2ProtocolGuid { 0xa770c357, 0xb693, 0x4e6d, { 0xa6, 0xcf, 0xd2, 0x1c, 0x72, 0x8e, 0x55, 0xb } }
+#define FixedPcdGetBool(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet8(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet16(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet32(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet64(TokenName) _PCD_VALUE_##TokenName
+#define FeaturePcdGet(TokenName) _PCD_VALUE_##TokenName
+#define _PCD_VALUE_PcdPlatformBootTimeOut 0xffff
+#endif
+
+#endif
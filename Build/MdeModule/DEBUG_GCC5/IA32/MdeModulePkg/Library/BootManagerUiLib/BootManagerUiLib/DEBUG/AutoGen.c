@@ -0,0 +1,115 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char BootManagerUiLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0x34,  0x04,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x40,  0x02,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_BM_BANNER:0x0002
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0003: STR_BOOT_MANAGER_HELP:0x0003
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6B,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0004: STR_HELP_FOOTER:0x0004
+  0x14,  0x55,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x3C,  0x00,  0x91,  0x21,  0x3E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x3C,  0x00,  0x93,  0x21,  0x3E,  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x3C,  0x00,  0x45,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x3E,  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  
+  0x00,  0x79,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x3C,  0x00,  0x45,  0x00,  0x73,  0x00,  0x63,  0x00,  0x3E,  
+  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0005: STR_BOOT_OPTION_BANNER:0x0005
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x00,  0x00,
+// 0x0006: STR_ANY_KEY_CONTINUE:0x0006
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x79,  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x2E,  0x00,  0x2E,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0007: STR_LAST_STRING:0x0007
+  0x14,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0xF0,  0x01,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0xE7,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: STR_BM_BANNER:0x0002
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0003: STR_BOOT_MANAGER_HELP:0x0003
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6B,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0004: STR_HELP_FOOTER:0x0004
+  0x14,  0x3C,  0x00,  0x91,  0x21,  0x3E,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x3C,  0x00,  0x93,  0x21,  0x3E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x27,  0x00,  0x6F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x3C,  
+  0x00,  0x45,  0x00,  0x4E,  0x00,  0x54,  0x00,  0x52,  0x00,  0x45,  0x00,  0x52,  0x00,  0x3E,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x3C,  0x00,  0x45,  0x00,  0x53,  0x00,  0x43,  
+  0x00,  0x3E,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x69,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0005: STR_BOOT_OPTION_BANNER:0x0005
+  0x14,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x27,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0006: STR_ANY_KEY_CONTINUE:0x0006
+  0x14,  0x41,  0x00,  0x70,  0x00,  0x70,  0x00,  0x75,  0x00,  0x69,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x27,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x65,  0x00,  0x72,  0x00,  0x2E,  0x00,  0x2E,  
+  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0007: STR_LAST_STRING:0x0007
+  0x14,  0x00,  0x00,
+  0x00,
+
+};
+
@@ -0,0 +1,40 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_69EC7DB2_B0DD_493A_963A_C5F330131BAA
+#define _AUTOGENH_69EC7DB2_B0DD_493A_963A_C5F330131BAA
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern GUID gBrotliCustomDecompressGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+RETURN_STATUS
+EFIAPI
+BrotliDecompressLibConstructor (
+  VOID
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,31 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_3175E6B9_4B01_496a_9A2B_64AF02D87E34
+#define _AUTOGENH_3175E6B9_4B01_496a_9A2B_64AF02D87E34
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiPei.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
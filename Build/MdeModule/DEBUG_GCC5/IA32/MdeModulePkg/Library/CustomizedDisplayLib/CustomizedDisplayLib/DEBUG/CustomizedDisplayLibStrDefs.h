@@ -0,0 +1,46 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    CustomizedDisplayLibStrDefs.h
+  Abstract:       Auto-generated CustomizedDisplayLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_80B92017_EC64_4923_938D_94FAEE85832E
+#define _STRDEFS_80B92017_EC64_4923_938D_94FAEE85832E
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define ENTER_STRING                                         0x0002
+#define ENTER_COMMIT_STRING                                  0x0003
+#define ENTER_ESCAPE_STRING                                  0x0004
+#define ESCAPE_STRING                                        0x0005
+#define ADJUST_NUMBER                                        0x0006
+#define PLUS_STRING                                          0x0007
+#define MINUS_STRING                                         0x0008
+#define MOVE_HIGHLIGHT                                       0x0009
+#define DEC_NUMERIC_INPUT                                    0x000A
+#define HEX_NUMERIC_INPUT                                    0x000B
+#define TOGGLE_CHECK_BOX                                     0x000C
+#define NV_UPDATE_MESSAGE                                    0x000D
+#define INPUT_ERROR_MESSAGE                                  0x000E
+#define EMPTY_STRING                                         0x000F
+#define ARE_YOU_SURE_YES                                     0x0010
+#define ARE_YOU_SURE_NO                                      0x0011
+#define SAVE_CHANGES                                         0x0012
+#define ARE_YOU_SURE                                         0x0013
+
+extern unsigned char CustomizedDisplayLibStrings[];
+
+
+#define STRING_ARRAY_NAME CustomizedDisplayLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#endif
+
+#endif
@@ -0,0 +1,51 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    DeviceManagerUiLibStrDefs.h
+  Abstract:       Auto-generated DeviceManagerUiLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_75EBDC2E_5323_4F31_A41D_FD1A7A9FC65E
+#define _STRDEFS_75EBDC2E_5323_4F31_A41D_FD1A7A9FC65E
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_EDKII_MENU_TITLE                                 0x0002
+#define STR_EDKII_MENU_HELP                                  0x0003
+#define STR_DEVICES_LIST                                     0x0004
+#define STR_MISSING_STRING                                   0x0005
+#define STR_EMPTY_STRING                                     0x0006
+#define STR_EXIT_STRING                                      0x0007
+#define STR_FORM_NETWORK_DEVICE_TITLE_HEAD                   0x0008
+#define STR_FORM_NETWORK_DEVICE_TITLE                        0x0009
+#define STR_NETWORK_DEVICE_STRING                            0x000A
+#define STR_FORM_NETWORK_DEVICE_LIST_HELP                    0x000B
+#define STR_FORM_NETWORK_DEVICE_LIST_TITLE                   0x000C
+#define STR_NETWORK_DEVICE_LIST_STRING                       0x000D
+#define STR_NETWORK_DEVICE_HELP                              0x000E
+// #define STR_DISK_DEVICE                                      0x000F // not referenced
+// #define STR_VIDEO_DEVICE                                     0x0010 // not referenced
+// #define STR_NETWORK_DEVICE                                   0x0011 // not referenced
+// #define STR_INPUT_DEVICE                                     0x0012 // not referenced
+// #define STR_ON_BOARD_DEVICE                                  0x0013 // not referenced
+// #define STR_OTHER_DEVICE                                     0x0014 // not referenced
+// #define STR_FORM_NETWORK_DEVICE_HELP                         0x0015 // not referenced
+
+extern unsigned char DeviceManagerUiLibStrings[];
+
+
+#define STRING_ARRAY_NAME DeviceManagerUiLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiHiiPlatformSetupFormsetGuid { 0x93039971, 0x8545, 0x4b04, { 0xb4, 0x5e, 0x32, 0xeb, 0x83, 0x26, 0x04, 0x0e }}
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gEfiIfrFrontPageGuid { 0xe58809f8, 0xfbc1, 0x48e2, { 0x88, 0x3a, 0xa3, 0x0f, 0xdc, 0x4b, 0x44, 0x1e } }
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#endif
+
+#endif
@@ -0,0 +1,61 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_9C9623EB_4EF3_44e0_A931_F3A340D1A0F9
+#define _AUTOGENH_9C9623EB_4EF3_44e0_A931_F3A340D1A0F9
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gEfiIfrTianoGuid;
+extern EFI_GUID gEdkiiVarErrorFlagGuid;
+extern EFI_GUID gEfiEndOfDxeEventGroupGuid;
+extern EFI_GUID gEfiCertPkcs7Guid;
+extern EFI_GUID gEfiCertTypeRsa2048Sha256Guid;
+
+// Protocols
+extern EFI_GUID gEfiVariableArchProtocolGuid;
+extern EFI_GUID gEdkiiVarCheckProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiFormBrowser2ProtocolGuid;
+extern EFI_GUID gEfiHiiConfigAccessProtocolGuid;
+extern EFI_GUID gEfiHiiConfigRoutingProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+EFI_STATUS
+EFIAPI
+PlatformVarCleanupLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+PlatformVarCleanupLibDestructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+#include "PlatformVarCleanupLibStrDefs.h"
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
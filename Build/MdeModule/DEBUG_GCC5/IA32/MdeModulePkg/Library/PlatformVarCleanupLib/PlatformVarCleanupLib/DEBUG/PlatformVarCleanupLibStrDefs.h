@@ -0,0 +1,46 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    PlatformVarCleanupLibStrDefs.h
+  Abstract:       Auto-generated PlatformVarCleanupLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_9C9623EB_4EF3_44e0_A931_F3A340D1A0F9
+#define _STRDEFS_9C9623EB_4EF3_44e0_A931_F3A340D1A0F9
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_ENTRY_TITLE                                      0x0002
+#define STR_TITLE                                            0x0003
+#define STR_TITLE_HELP                                       0x0004
+#define STR_SELECT_ALL_PROMPT                                0x0005
+#define STR_SELECT_ALL_HELP                                  0x0006
+#define STR_NULL_STRING                                      0x0007
+#define STR_SAVE_AND_EXIT                                    0x0008
+#define STR_NO_SAVE_AND_EXIT                                 0x0009
+
+extern unsigned char PlatformVarCleanupLibStrings[];
+
+
+#define STRING_ARRAY_NAME PlatformVarCleanupLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gEdkiiVarErrorFlagGuid { 0x4b37fe8, 0xf6ae, 0x480b, { 0xbd, 0xd5, 0x37, 0xd9, 0x8c, 0x5e, 0x89, 0xaa } }
+#define gEfiEndOfDxeEventGroupGuid { 0x2ce967a, 0xdd7e, 0x4ffc, { 0x9e, 0xe7, 0x81, 0xc, 0xf0, 0x47, 0x8, 0x80 }}
+#define gEfiCertPkcs7Guid { 0x4aafd29d, 0x68df, 0x49ee, {0x8a, 0xa9, 0x34, 0x7d, 0x37, 0x56, 0x65, 0xa7 }}
+#define gEfiCertTypeRsa2048Sha256Guid { 0xa7717414, 0xc616, 0x4977, {0x94, 0x20, 0x84, 0x47, 0x12, 0xa7, 0x35, 0xbf }}
+#define gEfiVariableArchProtocolGuid { 0x1E5668E2, 0x8481, 0x11D4, { 0xBC, 0xF1, 0x00, 0x80, 0xC7, 0x3C, 0x88, 0x81 }}
+#define gEdkiiVarCheckProtocolGuid { 0xaf23b340, 0x97b4, 0x4685, { 0x8d, 0x4f, 0xa3, 0xf2, 0x81, 0x69, 0xb2, 0x1d } }
+#define gEfiDevicePathProtocolGuid { 0x09576E91, 0x6D3F, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiFormBrowser2ProtocolGuid {0xb9d4c360, 0xbcfb, 0x4f9b, {0x92, 0x98, 0x53, 0xc1, 0x36, 0x98, 0x22, 0x58}}
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#define gEfiHiiConfigRoutingProtocolGuid {0x587e72d7, 0xcc50, 0x4f79, {0x82, 0x09, 0xca, 0x29, 0x1f, 0xc1, 0xa1, 0x0f}}
+#endif
+
+#endif
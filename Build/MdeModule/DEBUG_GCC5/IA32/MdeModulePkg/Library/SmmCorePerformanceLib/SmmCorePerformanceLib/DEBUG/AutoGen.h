@@ -0,0 +1,66 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_36290D10_0F47_42c1_BBCE_E191C7928DCF
+#define _AUTOGENH_36290D10_0F47_42c1_BBCE_E191C7928DCF
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gPerformanceProtocolGuid;
+extern EFI_GUID gZeroGuid;
+extern EFI_GUID gEdkiiSmmPerformanceMeasurementProtocolGuid;
+extern EFI_GUID gEfiFirmwarePerformanceGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+
+// Protocols
+extern EFI_GUID gEfiSmmBase2ProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// PCD definitions
+#define _PCD_TOKEN_PcdPerformanceLibraryPropertyMask  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdPerformanceLibraryPropertyMask;
+#define _PCD_GET_MODE_8_PcdPerformanceLibraryPropertyMask  _gPcd_FixedAtBuild_PcdPerformanceLibraryPropertyMask
+//#define _PCD_SET_MODE_8_PcdPerformanceLibraryPropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdPerformanceLibraryPropertyMask 0
+#define _PCD_SIZE_PcdPerformanceLibraryPropertyMask 1
+#define _PCD_GET_MODE_SIZE_PcdPerformanceLibraryPropertyMask _PCD_SIZE_PcdPerformanceLibraryPropertyMask
+#define _PCD_TOKEN_PcdEdkiiFpdtStringRecordEnableOnly  0U
+extern const BOOLEAN _gPcd_FixedAtBuild_PcdEdkiiFpdtStringRecordEnableOnly;
+#define _PCD_GET_MODE_BOOL_PcdEdkiiFpdtStringRecordEnableOnly  _gPcd_FixedAtBuild_PcdEdkiiFpdtStringRecordEnableOnly
+//#define _PCD_SET_MODE_BOOL_PcdEdkiiFpdtStringRecordEnableOnly  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdEdkiiFpdtStringRecordEnableOnly 0
+#define _PCD_SIZE_PcdEdkiiFpdtStringRecordEnableOnly 1
+#define _PCD_GET_MODE_SIZE_PcdEdkiiFpdtStringRecordEnableOnly _PCD_SIZE_PcdEdkiiFpdtStringRecordEnableOnly
+
+EFI_STATUS
+EFIAPI
+SmmCorePerformanceLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
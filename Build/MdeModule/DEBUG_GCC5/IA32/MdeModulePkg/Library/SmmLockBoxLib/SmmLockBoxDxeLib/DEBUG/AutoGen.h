@@ -0,0 +1,38 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_4A0054B4_3CA8_4e1b_9339_9B58D5FBB7D2
+#define _AUTOGENH_4A0054B4_3CA8_4e1b_9339_9B58D5FBB7D2
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gEfiSmmLockBoxCommunicationGuid;
+extern EFI_GUID gEdkiiPiSmmCommunicationRegionTableGuid;
+
+// Protocols
+extern EFI_GUID gEfiSmmCommunicationProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
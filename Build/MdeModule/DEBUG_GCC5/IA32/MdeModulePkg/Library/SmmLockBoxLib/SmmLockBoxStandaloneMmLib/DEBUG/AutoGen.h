@@ -0,0 +1,54 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_3C05978B_30CA_4544_9C5A_AB99265EFC31
+#define _AUTOGENH_3C05978B_30CA_4544_9C5A_AB99265EFC31
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiMm.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gEfiSmmLockBoxCommunicationGuid;
+extern EFI_GUID gEdkiiEndOfS3ResumeGuid;
+
+// Protocols
+extern EFI_GUID gEfiMmReadyToLockProtocolGuid;
+extern EFI_GUID gEfiMmEndOfDxeProtocolGuid;
+extern EFI_GUID gEfiMmSxDispatchProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+EFI_STATUS
+EFIAPI
+SmmLockBoxStandaloneMmConstructor (
+  IN EFI_HANDLE            ImageHandle,
+  IN EFI_MM_SYSTEM_TABLE   *MmSystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+SmmLockBoxStandaloneMmDestructor (
+  IN EFI_HANDLE            ImageHandle,
+  IN EFI_MM_SYSTEM_TABLE   *MmSystemTable
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
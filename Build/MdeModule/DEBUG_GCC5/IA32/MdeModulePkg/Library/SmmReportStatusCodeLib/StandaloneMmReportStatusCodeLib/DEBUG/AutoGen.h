@@ -0,0 +1,49 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_17C7FC8C_8C5D_497E_9C0E_C21255B30E04
+#define _AUTOGENH_17C7FC8C_8C5D_497E_9C0E_C21255B30E04
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiMm.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gEfiStatusCodeSpecificDataGuid;
+extern EFI_GUID gEfiStatusCodeDataTypeDebugGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+
+// Protocols
+extern EFI_GUID gEfiMmStatusCodeProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// PCD definitions
+#define _PCD_TOKEN_PcdReportStatusCodePropertyMask  0U
+extern const UINT8 _gPcd_FixedAtBuild_PcdReportStatusCodePropertyMask;
+#define _PCD_GET_MODE_8_PcdReportStatusCodePropertyMask  _gPcd_FixedAtBuild_PcdReportStatusCodePropertyMask
+//#define _PCD_SET_MODE_8_PcdReportStatusCodePropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+#define _PCD_VALUE_PcdReportStatusCodePropertyMask 0x06
+#define _PCD_SIZE_PcdReportStatusCodePropertyMask 1
+#define _PCD_GET_MODE_SIZE_PcdReportStatusCodePropertyMask _PCD_SIZE_PcdReportStatusCodePropertyMask
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
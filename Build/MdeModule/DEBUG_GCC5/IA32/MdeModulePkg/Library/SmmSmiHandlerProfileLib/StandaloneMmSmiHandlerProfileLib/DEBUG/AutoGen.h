@@ -0,0 +1,41 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_1F2ED27B_A01D_4867_B993_9B710E5926C5
+#define _AUTOGENH_1F2ED27B_A01D_4867_B993_9B710E5926C5
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiMm.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gSmiHandlerProfileGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+EFI_STATUS
+EFIAPI
+StandaloneMmSmiHandlerProfileLibConstructor (
+  IN EFI_HANDLE            ImageHandle,
+  IN EFI_MM_SYSTEM_TABLE   *MmSystemTable
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,906 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.c
+  Abstract:       Auto-generated AutoGen.c for building module or library.
+**/
+#include <PiDxe.h>
+#include <Library/BaseLib.h>
+#include <Library/DebugLib.h>
+#include <Library/UefiBootServicesTableLib.h>
+#include <Library/UefiDriverEntryPoint.h>
+
+GLOBAL_REMOVE_IF_UNREFERENCED GUID gEfiCallerIdGuid = {0xE660EA85, 0x058E, 0x4b55, {0xA5, 0x4B, 0xF0, 0x2F, 0x83, 0xA2, 0x47, 0x07}};
+
+GLOBAL_REMOVE_IF_UNREFERENCED GUID gEdkiiDscPlatformGuid = {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}};
+
+GLOBAL_REMOVE_IF_UNREFERENCED CHAR8 *gEfiCallerBaseName = "DisplayEngine";
+
+// Guids
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiMdeModulePkgTokenSpaceGuid = { 0xA1AFF049, 0xFDEB, 0x442a, { 0xB3, 0x20, 0x13, 0xAB, 0x4C, 0xB7, 0x2B, 0xBC }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiMdePkgTokenSpaceGuid = { 0x914AEBE7, 0x4635, 0x459b, { 0xAA, 0x1C, 0x11, 0xE2, 0x19, 0xB0, 0x3A, 0x10 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVTUTF8Guid = { 0xAD15A0D6, 0x8BEC, 0x4ACF, { 0xA0, 0x73, 0xD0, 0x1D, 0xE7, 0x7E, 0x2D, 0x88 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVT100Guid = { 0xDFA66065, 0xB419, 0x11D3, { 0x9A, 0x2D, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVT100PlusGuid = { 0x7BAEC70B, 0x57E0, 0x4C76, { 0x8E, 0x87, 0x2F, 0x9E, 0x28, 0x08, 0x83, 0x43 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPcAnsiGuid = { 0xE0C14753, 0xF9BE, 0x11D2, { 0x9A, 0x0C, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiUartDevicePathGuid = { 0x37499a9d, 0x542f, 0x4c89, { 0xa0, 0x26, 0x35, 0xda, 0x14, 0x20, 0x94, 0xe4 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSasDevicePathGuid = { 0xd487ddb4, 0x008b, 0x11d9, { 0xaf, 0xdc, 0x00, 0x10, 0x83, 0xff, 0xca, 0x4d }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVirtualDiskGuid = { 0x77AB535A, 0x45FC, 0x624B, {0x55, 0x60, 0xF7, 0xB2, 0x81, 0xD1, 0xF9, 0x6E }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVirtualCdGuid = { 0x3D5ABD30, 0x4175, 0x87CE, {0x6D, 0x64, 0xD2, 0xAD, 0xE5, 0x23, 0xC4, 0xBB }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPersistentVirtualDiskGuid = { 0x5CEA02C9, 0x4D07, 0x69D3, {0x26, 0x9F ,0x44, 0x96, 0xFB, 0xE0, 0x96, 0xF9 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPersistentVirtualCdGuid = { 0x08018188, 0x42CD, 0xBB48, {0x10, 0x0F, 0x53, 0x87, 0xD5, 0x3D, 0xED, 0x3D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiEventReadyToBootGuid = { 0x7CE88FB3, 0x4BD7, 0x4679, { 0x87, 0xA8, 0xA8, 0xD8, 0xDE, 0xE5, 0x0D, 0x2B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiEventLegacyBootGuid = { 0x2A571201, 0x4966, 0x47F6, { 0x8B, 0x86, 0xF3, 0x1E, 0x41, 0xF3, 0x2F, 0x10 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiGlobalVariableGuid = { 0x8BE4DF61, 0x93CA, 0x11D2, { 0xAA, 0x0D, 0x00, 0xE0, 0x98, 0x03, 0x2B, 0x8C }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiAcpi20TableGuid = { 0x8868E871, 0xE4F1, 0x11D3, { 0xBC, 0x22, 0x00, 0x80, 0xC7, 0x3C, 0x88, 0x81 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiAcpi10TableGuid = { 0xEB9D2D30, 0x2D88, 0x11D3, { 0x9A, 0x16, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEdkiiIfrBitVarstoreGuid = {0x82DDD68B, 0x9163, 0x4187, {0x9B, 0x27, 0x20, 0xA8, 0xFD, 0x60,0xA7, 0x1D}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiIfrTianoGuid = { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }};
+
+// Protocols
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEdkiiFormDisplayEngineProtocolGuid = { 0x9bbe29e9, 0xfda1, 0x41ec, { 0xad, 0x52, 0x45, 0x22, 0x13, 0x74, 0x2d, 0x2e } };
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEdkiiFormBrowserEx2ProtocolGuid = { 0xa770c357, 0xb693, 0x4e6d, { 0xa6, 0xcf, 0xd2, 0x1c, 0x72, 0x8e, 0x55, 0xb } };
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiPopupProtocolGuid = { 0x4311edc0, 0x6054, 0x46d4, { 0x9e, 0x40, 0x89, 0x3e, 0xa9, 0x52, 0xfc, 0xcc }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDevicePathProtocolGuid = { 0x09576E91, 0x6D3F, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDebugPortProtocolGuid = { 0xEBA4E8D2, 0x3858, 0x41EC, { 0xA2, 0x81, 0x26, 0x47, 0xBA, 0x96, 0x60, 0xD0 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiFontProtocolGuid = {0xe9ca4775, 0x8657, 0x47fc, {0x97, 0xe7, 0x7e, 0xd6, 0x5a, 0x08, 0x43, 0x24}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiStringProtocolGuid = {0x0fd96974, 0x23aa, 0x4cdc, {0xb9, 0xcb, 0x98, 0xd1, 0x77, 0x50, 0x32, 0x2a}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiImageProtocolGuid = {0x31a6406a, 0x6bdf, 0x4e46, {0xb2, 0xa2, 0xeb, 0xaa, 0x89, 0xc4, 0x09, 0x20}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiDatabaseProtocolGuid = {0xef9fc172, 0xa1b2, 0x4693, {0xb3, 0x27, 0x6d, 0x32, 0xfc, 0x41, 0x60, 0x42}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiConfigRoutingProtocolGuid = {0x587e72d7, 0xcc50, 0x4f79, {0x82, 0x09, 0xca, 0x29, 0x1f, 0xc1, 0xa1, 0x0f}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverBindingProtocolGuid = { 0x18A031AB, 0xB443, 0x4D1A, { 0xA5, 0xC0, 0x0C, 0x09, 0x26, 0x1E, 0x9F, 0x71 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSimpleTextOutProtocolGuid = { 0x387477C2, 0x69C7, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiGraphicsOutputProtocolGuid = { 0x9042A9DE, 0x23DC, 0x4A38, { 0x96, 0xFB, 0x7A, 0xDE, 0xD0, 0x80, 0x51, 0x6A }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSimpleFileSystemProtocolGuid = { 0x964E5B22, 0x6459, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiUgaDrawProtocolGuid = { 0x982C298B, 0xF4FA, 0x41CB, { 0xB8, 0x38, 0x77, 0xAA, 0x68, 0x8F, 0xB8, 0x39 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiComponentNameProtocolGuid = { 0x107A772C, 0xD5E1, 0x11D4, { 0x9A, 0x46, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiComponentName2ProtocolGuid = { 0x6A7A5CFF, 0xE8D9, 0x4F70, { 0xBA, 0xDA, 0x75, 0xAB, 0x30, 0x25, 0xCE, 0x14 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverConfigurationProtocolGuid = { 0x107A772B, 0xD5E1, 0x11D4, { 0x9A, 0x46, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverConfiguration2ProtocolGuid = { 0xBFD7DC1D, 0x24F1, 0x40D9, { 0x82, 0xE7, 0x2E, 0x09, 0xBB, 0x6B, 0x4E, 0xBE }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverDiagnosticsProtocolGuid = { 0x0784924F, 0xE296, 0x11D4, { 0x9A, 0x49, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverDiagnostics2ProtocolGuid = { 0x4D330321, 0x025F, 0x4AAC, { 0x90, 0xD8, 0x5E, 0xD9, 0x00, 0x17, 0x3B, 0x63 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiFormBrowser2ProtocolGuid = {0xb9d4c360, 0xbcfb, 0x4f9b, {0x92, 0x98, 0x53, 0xc1, 0x36, 0x98, 0x22, 0x58}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiLoadedImageProtocolGuid = { 0x5B1B31A1, 0x9562, 0x11D2, { 0x8E, 0x3F, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+
+// Definition of SkuId Array
+GLOBAL_REMOVE_IF_UNREFERENCED UINT64 _gPcd_SkuId_Array[] = {0x0};
+
+// Definition of PCDs used in this module
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdBrowserGrayOutTextStatement = _PCD_VALUE_PcdBrowserGrayOutTextStatement;
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdBrowerGrayOutReadOnlyMenu = _PCD_VALUE_PcdBrowerGrayOutReadOnlyMenu;
+
+// Definition of PCDs used in libraries
+
+#define _PCD_TOKEN_PcdVerifyNodeInList  0U
+#define _PCD_SIZE_PcdVerifyNodeInList 1
+#define _PCD_GET_MODE_SIZE_PcdVerifyNodeInList  _PCD_SIZE_PcdVerifyNodeInList 
+#define _PCD_VALUE_PcdVerifyNodeInList  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdVerifyNodeInList = _PCD_VALUE_PcdVerifyNodeInList;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdVerifyNodeInList;
+#define _PCD_GET_MODE_BOOL_PcdVerifyNodeInList  _gPcd_FixedAtBuild_PcdVerifyNodeInList
+//#define _PCD_SET_MODE_BOOL_PcdVerifyNodeInList  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumLinkedListLength  0U
+#define _PCD_SIZE_PcdMaximumLinkedListLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumLinkedListLength  _PCD_SIZE_PcdMaximumLinkedListLength 
+#define _PCD_VALUE_PcdMaximumLinkedListLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumLinkedListLength = _PCD_VALUE_PcdMaximumLinkedListLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumLinkedListLength;
+#define _PCD_GET_MODE_32_PcdMaximumLinkedListLength  _gPcd_FixedAtBuild_PcdMaximumLinkedListLength
+//#define _PCD_SET_MODE_32_PcdMaximumLinkedListLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumAsciiStringLength  0U
+#define _PCD_SIZE_PcdMaximumAsciiStringLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumAsciiStringLength  _PCD_SIZE_PcdMaximumAsciiStringLength 
+#define _PCD_VALUE_PcdMaximumAsciiStringLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength = _PCD_VALUE_PcdMaximumAsciiStringLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength;
+#define _PCD_GET_MODE_32_PcdMaximumAsciiStringLength  _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength
+//#define _PCD_SET_MODE_32_PcdMaximumAsciiStringLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumUnicodeStringLength  0U
+#define _PCD_SIZE_PcdMaximumUnicodeStringLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumUnicodeStringLength  _PCD_SIZE_PcdMaximumUnicodeStringLength 
+#define _PCD_VALUE_PcdMaximumUnicodeStringLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength = _PCD_VALUE_PcdMaximumUnicodeStringLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength;
+#define _PCD_GET_MODE_32_PcdMaximumUnicodeStringLength  _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength
+//#define _PCD_SET_MODE_32_PcdMaximumUnicodeStringLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdControlFlowEnforcementPropertyMask  0U
+#define _PCD_SIZE_PcdControlFlowEnforcementPropertyMask 4
+#define _PCD_GET_MODE_SIZE_PcdControlFlowEnforcementPropertyMask  _PCD_SIZE_PcdControlFlowEnforcementPropertyMask 
+#define _PCD_VALUE_PcdControlFlowEnforcementPropertyMask  0x0U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask = _PCD_VALUE_PcdControlFlowEnforcementPropertyMask;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask;
+#define _PCD_GET_MODE_32_PcdControlFlowEnforcementPropertyMask  _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask
+//#define _PCD_SET_MODE_32_PcdControlFlowEnforcementPropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdSpeculationBarrierType  0U
+#define _PCD_SIZE_PcdSpeculationBarrierType 1
+#define _PCD_GET_MODE_SIZE_PcdSpeculationBarrierType  _PCD_SIZE_PcdSpeculationBarrierType 
+#define _PCD_VALUE_PcdSpeculationBarrierType  0x01U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdSpeculationBarrierType = _PCD_VALUE_PcdSpeculationBarrierType;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdSpeculationBarrierType;
+#define _PCD_GET_MODE_8_PcdSpeculationBarrierType  _gPcd_FixedAtBuild_PcdSpeculationBarrierType
+//#define _PCD_SET_MODE_8_PcdSpeculationBarrierType  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumDevicePathNodeCount  0U
+#define _PCD_SIZE_PcdMaximumDevicePathNodeCount 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumDevicePathNodeCount  _PCD_SIZE_PcdMaximumDevicePathNodeCount 
+#define _PCD_VALUE_PcdMaximumDevicePathNodeCount  0U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount = _PCD_VALUE_PcdMaximumDevicePathNodeCount;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount;
+#define _PCD_GET_MODE_32_PcdMaximumDevicePathNodeCount  _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount
+//#define _PCD_SET_MODE_32_PcdMaximumDevicePathNodeCount  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdDriverDiagnosticsDisable  0U
+#define _PCD_SIZE_PcdDriverDiagnosticsDisable 1
+#define _PCD_GET_MODE_SIZE_PcdDriverDiagnosticsDisable  _PCD_SIZE_PcdDriverDiagnosticsDisable 
+#define _PCD_VALUE_PcdDriverDiagnosticsDisable  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable = _PCD_VALUE_PcdDriverDiagnosticsDisable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable;
+#define _PCD_GET_MODE_BOOL_PcdDriverDiagnosticsDisable  _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable
+//#define _PCD_SET_MODE_BOOL_PcdDriverDiagnosticsDisable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdComponentNameDisable  0U
+#define _PCD_SIZE_PcdComponentNameDisable 1
+#define _PCD_GET_MODE_SIZE_PcdComponentNameDisable  _PCD_SIZE_PcdComponentNameDisable 
+#define _PCD_VALUE_PcdComponentNameDisable  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdComponentNameDisable = _PCD_VALUE_PcdComponentNameDisable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdComponentNameDisable;
+#define _PCD_GET_MODE_BOOL_PcdComponentNameDisable  _gPcd_FixedAtBuild_PcdComponentNameDisable
+//#define _PCD_SET_MODE_BOOL_PcdComponentNameDisable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdDriverDiagnostics2Disable  0U
+#define _PCD_SIZE_PcdDriverDiagnostics2Disable 1
+#define _PCD_GET_MODE_SIZE_PcdDriverDiagnostics2Disable  _PCD_SIZE_PcdDriverDiagnostics2Disable 
+#define _PCD_VALUE_PcdDriverDiagnostics2Disable  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable = _PCD_VALUE_PcdDriverDiagnostics2Disable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable;
+#define _PCD_GET_MODE_BOOL_PcdDriverDiagnostics2Disable  _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable
+//#define _PCD_SET_MODE_BOOL_PcdDriverDiagnostics2Disable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdComponentName2Disable  0U
+#define _PCD_SIZE_PcdComponentName2Disable 1
+#define _PCD_GET_MODE_SIZE_PcdComponentName2Disable  _PCD_SIZE_PcdComponentName2Disable 
+#define _PCD_VALUE_PcdComponentName2Disable  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdComponentName2Disable = _PCD_VALUE_PcdComponentName2Disable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdComponentName2Disable;
+#define _PCD_GET_MODE_BOOL_PcdComponentName2Disable  _gPcd_FixedAtBuild_PcdComponentName2Disable
+//#define _PCD_SET_MODE_BOOL_PcdComponentName2Disable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUgaConsumeSupport  0U
+#define _PCD_SIZE_PcdUgaConsumeSupport 1
+#define _PCD_GET_MODE_SIZE_PcdUgaConsumeSupport  _PCD_SIZE_PcdUgaConsumeSupport 
+#define _PCD_VALUE_PcdUgaConsumeSupport  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdUgaConsumeSupport = _PCD_VALUE_PcdUgaConsumeSupport;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdUgaConsumeSupport;
+#define _PCD_GET_MODE_BOOL_PcdUgaConsumeSupport  _gPcd_FixedAtBuild_PcdUgaConsumeSupport
+//#define _PCD_SET_MODE_BOOL_PcdUgaConsumeSupport  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUefiLibMaxPrintBufferSize  0U
+#define _PCD_SIZE_PcdUefiLibMaxPrintBufferSize 4
+#define _PCD_GET_MODE_SIZE_PcdUefiLibMaxPrintBufferSize  _PCD_SIZE_PcdUefiLibMaxPrintBufferSize 
+#define _PCD_VALUE_PcdUefiLibMaxPrintBufferSize  320U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize = _PCD_VALUE_PcdUefiLibMaxPrintBufferSize;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize;
+#define _PCD_GET_MODE_32_PcdUefiLibMaxPrintBufferSize  _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize
+//#define _PCD_SET_MODE_32_PcdUefiLibMaxPrintBufferSize  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdBrowserSubtitleTextColor  0U
+#define _PCD_SIZE_PcdBrowserSubtitleTextColor 1
+#define _PCD_GET_MODE_SIZE_PcdBrowserSubtitleTextColor  _PCD_SIZE_PcdBrowserSubtitleTextColor 
+#define _PCD_VALUE_PcdBrowserSubtitleTextColor  0x01U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdBrowserSubtitleTextColor = _PCD_VALUE_PcdBrowserSubtitleTextColor;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdBrowserSubtitleTextColor;
+#define _PCD_GET_MODE_8_PcdBrowserSubtitleTextColor  _gPcd_FixedAtBuild_PcdBrowserSubtitleTextColor
+//#define _PCD_SET_MODE_8_PcdBrowserSubtitleTextColor  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdBrowserFieldTextColor  0U
+#define _PCD_SIZE_PcdBrowserFieldTextColor 1
+#define _PCD_GET_MODE_SIZE_PcdBrowserFieldTextColor  _PCD_SIZE_PcdBrowserFieldTextColor 
+#define _PCD_VALUE_PcdBrowserFieldTextColor  0x00U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdBrowserFieldTextColor = _PCD_VALUE_PcdBrowserFieldTextColor;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdBrowserFieldTextColor;
+#define _PCD_GET_MODE_8_PcdBrowserFieldTextColor  _gPcd_FixedAtBuild_PcdBrowserFieldTextColor
+//#define _PCD_SET_MODE_8_PcdBrowserFieldTextColor  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdBrowserFieldTextHighlightColor  0U
+#define _PCD_SIZE_PcdBrowserFieldTextHighlightColor 1
+#define _PCD_GET_MODE_SIZE_PcdBrowserFieldTextHighlightColor  _PCD_SIZE_PcdBrowserFieldTextHighlightColor 
+#define _PCD_VALUE_PcdBrowserFieldTextHighlightColor  0x07U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdBrowserFieldTextHighlightColor = _PCD_VALUE_PcdBrowserFieldTextHighlightColor;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdBrowserFieldTextHighlightColor;
+#define _PCD_GET_MODE_8_PcdBrowserFieldTextHighlightColor  _gPcd_FixedAtBuild_PcdBrowserFieldTextHighlightColor
+//#define _PCD_SET_MODE_8_PcdBrowserFieldTextHighlightColor  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdBrowserFieldBackgroundHighlightColor  0U
+#define _PCD_SIZE_PcdBrowserFieldBackgroundHighlightColor 1
+#define _PCD_GET_MODE_SIZE_PcdBrowserFieldBackgroundHighlightColor  _PCD_SIZE_PcdBrowserFieldBackgroundHighlightColor 
+#define _PCD_VALUE_PcdBrowserFieldBackgroundHighlightColor  0x00U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdBrowserFieldBackgroundHighlightColor = _PCD_VALUE_PcdBrowserFieldBackgroundHighlightColor;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdBrowserFieldBackgroundHighlightColor;
+#define _PCD_GET_MODE_8_PcdBrowserFieldBackgroundHighlightColor  _gPcd_FixedAtBuild_PcdBrowserFieldBackgroundHighlightColor
+//#define _PCD_SET_MODE_8_PcdBrowserFieldBackgroundHighlightColor  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdFrontPageFormSetGuid  0U
+#define _PCD_VALUE_PcdFrontPageFormSetGuid  (VOID *)_gPcd_FixedAtBuild_PcdFrontPageFormSetGuid
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdFrontPageFormSetGuid[16] = { 0xbc, 0x30, 0x0c, 0x9e,0x06, 0x3f, 0xa6, 0x4b, 0x82, 0x88, 0x9, 0x17, 0x9b, 0x85, 0x5d, 0xbe };
+extern const UINT8 _gPcd_FixedAtBuild_PcdFrontPageFormSetGuid[16];
+#define _PCD_GET_MODE_PTR_PcdFrontPageFormSetGuid  (VOID *)_gPcd_FixedAtBuild_PcdFrontPageFormSetGuid
+#define _PCD_SIZE_PcdFrontPageFormSetGuid 16
+#define _PCD_GET_MODE_SIZE_PcdFrontPageFormSetGuid  _PCD_SIZE_PcdFrontPageFormSetGuid 
+GLOBAL_REMOVE_IF_UNREFERENCED const UINTN _gPcd_FixedAtBuild_Size_PcdFrontPageFormSetGuid = 16;
+//#define _PCD_SET_MODE_PTR_PcdFrontPageFormSetGuid  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+
+EFI_STATUS
+EFIAPI
+UefiBootServicesTableLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiRuntimeServicesTableLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiHiiServicesLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+CustomizedDisplayLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+VOID
+EFIAPI
+ProcessLibraryConstructorList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+{
+  EFI_STATUS  Status;
+
+  Status = UefiBootServicesTableLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiRuntimeServicesTableLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiHiiServicesLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = CustomizedDisplayLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+}
+
+
+EFI_STATUS
+EFIAPI
+CustomizedDisplayLibDestructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+VOID
+EFIAPI
+ProcessLibraryDestructorList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+{
+  EFI_STATUS  Status;
+
+  Status = CustomizedDisplayLibDestructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+}
+
+const UINT32 _gUefiDriverRevision = 0x00000000U;
+const UINT32 _gDxeRevision = 0x00000000U;
+
+
+EFI_STATUS
+EFIAPI
+ProcessModuleEntryPointList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+
+{
+  return InitializeDisplayEngine (ImageHandle, SystemTable);
+}
+
+VOID
+EFIAPI
+ExitDriver (
+  IN EFI_STATUS  Status
+  )
+{
+  if (EFI_ERROR (Status)) {
+    ProcessLibraryDestructorList (gImageHandle, gST);
+  }
+  gBS->Exit (gImageHandle, Status, 0, NULL);
+}
+
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gDriverUnloadImageCount = 1U;
+
+
+EFI_STATUS
+EFIAPI
+ProcessModuleUnloadList (
+  IN EFI_HANDLE        ImageHandle
+  )
+{
+  return UnloadDisplayEngine (ImageHandle);
+}
+
+
+//
+//Unicode String Pack Definition
+//
+unsigned char DisplayEngineStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0xC6,  0x15,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x88,  0x0A,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: UNKNOWN_STRING:0x0002
+  0x14,  0x21,  0x00,  0x00,  0x00,
+// 0x0003: STATUS_BROWSER_ERROR:0x0003
+  0x14,  0x42,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0004: STATUS_BROWSER_FORM_NOT_FOUND:0x0004
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0005: STATUS_BROWSER_NO_SUBMIT_IF:0x0005
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0006: FUNCTION_NINE_STRING:0x0006
+  0x14,  0x46,  0x00,  0x39,  0x00,  0x3D,  0x00,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0007: FUNCTION_TEN_STRING:0x0007
+  0x14,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x3D,  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0008: SAVE_FAILED:0x0008
+  0x14,  0x46,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0009: NO_SUBMIT_IF_CHECK_FAILED:0x0009
+  0x14,  0x4E,  0x00,  0x4F,  0x00,  0x5F,  0x00,  0x53,  0x00,  0x55,  0x00,  0x42,  0x00,  0x4D,  0x00,  0x49,  
+  0x00,  0x54,  0x00,  0x5F,  0x00,  0x49,  0x00,  0x46,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2E,  
+  0x00,  0x00,  0x00,
+// 0x000A: ADJUST_HELP_PAGE_DOWN:0x000A
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x44,  0x00,  0x2F,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x000B: ADJUST_HELP_PAGE_UP:0x000B
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x55,  0x00,  0x2F,  
+  0x00,  0x75,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x000C: PROMPT_FOR_PASSWORD:0x000C
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x000D: PROMPT_FOR_NEW_PASSWORD:0x000D
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x00,  0x00,
+// 0x000E: CONFIRM_PASSWORD:0x000E
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x00,  0x00,
+// 0x000F: CONFIRM_ERROR:0x000F
+  0x14,  0x50,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0010: PASSWORD_INVALID:0x0010
+  0x14,  0x49,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x77,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0011: PRESS_ENTER:0x0011
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x45,  0x00,  0x4E,  
+  0x00,  0x54,  0x00,  0x45,  0x00,  0x52,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0012: PROMPT_FOR_DATA:0x0012
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  
+  0x00,  0x00,  0x00,
+// 0x0013: EMPTY_STRING:0x0013
+  0x14,  0x00,  0x00,
+// 0x0014: MINI_STRING:0x0014
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0015: OPTION_MISMATCH:0x0015
+  0x14,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0016: FORM_SUPPRESSED:0x0016
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x79,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0017: PROTOCOL_NOT_FOUND:0x0017
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x27,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0018: DISCARD_OR_JUMP:0x0018
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x28,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x47,  0x00,  0x28,  0x00,  0x67,  0x00,  0x29,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0019: DISCARD_OR_JUMP_DISCARD:0x0019
+  0x14,  0x44,  0x00,  0x20,  0x00,  0x28,  0x00,  0x64,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001A: DISCARD_OR_JUMP_JUMP:0x001A
+  0x14,  0x47,  0x00,  0x20,  0x00,  0x28,  0x00,  0x67,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001B: DISCARD_OR_CHECK:0x001B
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x28,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x43,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x001C: DISCARD_OR_CHECK_CHECK:0x001C
+  0x14,  0x43,  0x00,  0x20,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001D: CONFIRM_DISCARD_MESSAGE:0x001D
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x001E: CONFIRM_DEFAULT_MESSAGE:0x001E
+  0x14,  0x4C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x001F: CONFIRM_DEFAULT_MESSAGE_2ND:0x001F
+  0x14,  0x6C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0020: CONFIRM_SUBMIT_MESSAGE:0x0020
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0021: CONFIRM_SUBMIT_MESSAGE_2ND:0x0021
+  0x14,  0x73,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0022: CONFIRM_RESET_MESSAGE:0x0022
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0023: CONFIRM_RESET_MESSAGE_2ND:0x0023
+  0x14,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0024: CONFIRM_EXIT_MESSAGE:0x0024
+  0x14,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0025: CONFIRM_EXIT_MESSAGE_2ND:0x0025
+  0x14,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0026: CONFIRM_OPTION:0x0026
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x27,  0x00,  0x59,  
+  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  
+  0x00,  0x27,  0x00,  0x2F,  0x00,  0x27,  0x00,  0x45,  0x00,  0x53,  0x00,  0x43,  0x00,  0x27,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x69,  0x00,  0x67,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0027: CONFIRM_OPTION_YES:0x0027
+  0x14,  0x59,  0x00,  0x20,  0x00,  0x28,  0x00,  0x79,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0028: CONFIRM_OPTION_NO:0x0028
+  0x14,  0x4E,  0x00,  0x20,  0x00,  0x28,  0x00,  0x6E,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0029: CONFIRM_OPTION_OK:0x0029
+  0x14,  0x4F,  0x00,  0x20,  0x00,  0x28,  0x00,  0x6F,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x002A: CONFIRM_OPTION_CANCEL:0x002A
+  0x14,  0x43,  0x00,  0x20,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x002B: CONFIRM_OPTION_CONNECT:0x002B
+  0x14,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x00,  0x00,
+// 0x002C: CONFIRM_OPTION_END:0x002C
+  0x14,  0x3F,  0x00,  0x00,  0x00,
+// 0x002D: RECONNECT_FAILED:0x002D
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x64,  0x00,  0x21,  
+  0x00,  0x00,  0x00,
+// 0x002E: RECONNECT_CONFIRM_CHANGES:0x002E
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002F: RECONNECT_CHANGES_OPTIONS:0x002F
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x27,  0x00,  0x59,  
+  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0030: RECONNECT_REQUIRED:0x0030
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0031: GET_TIME_FAIL:0x0031
+  0x14,  0x20,  0x00,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x2F,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x79,  0x00,  0x20,  0x00,  0x3F,  0x00,  0x3F,  0x00,  0x2E,  
+  0x00,  0x00,  0x00,
+// 0x0032: PASSWORD_NOT_SUPPORTED:0x0032
+  0x14,  0x55,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x21,  0x00,  0x20,  0x00,  0x42,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x41,  0x00,  0x63,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0033: OK_SELECTABLE_OPTION:0x0033
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  0x00,
+// 0x0034: CANCEL_SELECTABLE_OPTION:0x0034
+  0x14,  0x5B,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x5D,  
+  0x00,  0x00,  0x00,
+// 0x0035: YES_SELECTABLE_OPTION:0x0035
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x59,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  
+  0x00,
+// 0x0036: NO_SELECTABLE_OPTION:0x0036
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  0x00,
+// 0x0037: ERROR_POPUP_STRING:0x0037
+  0x14,  0x45,  0x00,  0x52,  0x00,  0x52,  0x00,  0x4F,  0x00,  0x52,  0x00,  0x00,  0x00,
+// 0x0038: WARNING_POPUP_STRING:0x0038
+  0x14,  0x57,  0x00,  0x41,  0x00,  0x52,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x47,  0x00,  0x00,  
+  0x00,
+// 0x0039: INFO_POPUP_STRING:0x0039
+  0x14,  0x49,  0x00,  0x4E,  0x00,  0x46,  0x00,  0x4F,  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0x3A,  0x0B,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0xE7,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: UNKNOWN_STRING:0x0002
+  0x14,  0x21,  0x00,  0x00,  0x00,
+// 0x0003: STATUS_BROWSER_ERROR:0x0003
+  0x14,  0x42,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0004: STATUS_BROWSER_FORM_NOT_FOUND:0x0004
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0005: STATUS_BROWSER_NO_SUBMIT_IF:0x0005
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x6E,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0006: FUNCTION_NINE_STRING:0x0006
+  0x14,  0x46,  0x00,  0x39,  0x00,  0x3D,  0x00,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0xE0,  0x00,  0x20,  0x00,  0x44,  0x00,  0xE9,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  
+  0x00,  0x74,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0007: FUNCTION_TEN_STRING:0x0007
+  0x14,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x3D,  0x00,  0xC9,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0008: SAVE_FAILED:0x0008
+  0x14,  0xC9,  0x00,  0x63,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0xE0,  0x00,  0x20,  0x00,  0xE9,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0009: NO_SUBMIT_IF_CHECK_FAILED:0x0009
+  0x14,  0x4E,  0x00,  0x4F,  0x00,  0x5F,  0x00,  0x53,  0x00,  0x55,  0x00,  0x42,  0x00,  0x4D,  0x00,  0x49,  
+  0x00,  0x54,  0x00,  0x5F,  0x00,  0x49,  0x00,  0x46,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2E,  
+  0x00,  0x00,  0x00,
+// 0x000A: ADJUST_HELP_PAGE_DOWN:0x000A
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x44,  0x00,  0x2F,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x000B: ADJUST_HELP_PAGE_UP:0x000B
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x55,  0x00,  0x2F,  
+  0x00,  0x75,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x000C: PROMPT_FOR_PASSWORD:0x000C
+  0x14,  0x53,  0x00,  0x27,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0xEE,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x61,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x000D: PROMPT_FOR_NEW_PASSWORD:0x000D
+  0x14,  0x53,  0x00,  0x27,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0xEE,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x61,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x000E: CONFIRM_PASSWORD:0x000E
+  0x14,  0x53,  0x00,  0x27,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0xEE,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x76,  0x00,  0x65,  0x00,  0x61,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000F: CONFIRM_ERROR:0x000F
+  0x14,  0x4C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0010: PASSWORD_INVALID:0x0010
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x75,  0x00,  0x76,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0011: PRESS_ENTER:0x0011
+  0x14,  0x4C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x45,  0x00,  0x4E,  0x00,  0x54,  0x00,  0x52,  0x00,  0x45,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0012: PROMPT_FOR_DATA:0x0012
+  0x14,  0x53,  0x00,  0x27,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0xEE,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x61,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x6F,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0xE9,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0013: EMPTY_STRING:0x0013
+  0x14,  0x00,  0x00,
+// 0x0014: MINI_STRING:0x0014
+  0x14,  0x56,  0x00,  0x65,  0x00,  0x75,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x7A,  
+  0x00,  0x20,  0x00,  0xE9,  0x00,  0x63,  0x00,  0x72,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x7A,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0xE8,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0015: OPTION_MISMATCH:0x0015
+  0x14,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x75,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0xE9,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x63,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x27,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x75,  0x00,  0x72,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0016: FORM_SUPPRESSED:0x0016
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x79,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0017: PROTOCOL_NOT_FOUND:0x0017
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x27,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0018: DISCARD_OR_JUMP:0x0018
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x28,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x47,  0x00,  0x28,  0x00,  0x67,  0x00,  0x29,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0019: DISCARD_OR_JUMP_DISCARD:0x0019
+  0x14,  0x44,  0x00,  0x20,  0x00,  0x28,  0x00,  0x64,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001A: DISCARD_OR_JUMP_JUMP:0x001A
+  0x14,  0x47,  0x00,  0x20,  0x00,  0x28,  0x00,  0x67,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001B: DISCARD_OR_CHECK:0x001B
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x28,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x43,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x001C: DISCARD_OR_CHECK_CHECK:0x001C
+  0x14,  0x43,  0x00,  0x20,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x001D: CONFIRM_DISCARD_MESSAGE:0x001D
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x001E: CONFIRM_DEFAULT_MESSAGE:0x001E
+  0x14,  0x4C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x001F: CONFIRM_DEFAULT_MESSAGE_2ND:0x001F
+  0x14,  0x6C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0020: CONFIRM_SUBMIT_MESSAGE:0x0020
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0021: CONFIRM_SUBMIT_MESSAGE_2ND:0x0021
+  0x14,  0x73,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0022: CONFIRM_RESET_MESSAGE:0x0022
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0023: CONFIRM_RESET_MESSAGE_2ND:0x0023
+  0x14,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0024: CONFIRM_EXIT_MESSAGE:0x0024
+  0x14,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0025: CONFIRM_EXIT_MESSAGE_2ND:0x0025
+  0x14,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0026: CONFIRM_OPTION:0x0026
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x27,  0x00,  0x59,  
+  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  
+  0x00,  0x27,  0x00,  0x2F,  0x00,  0x27,  0x00,  0x45,  0x00,  0x53,  0x00,  0x43,  0x00,  0x27,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x69,  0x00,  0x67,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0027: CONFIRM_OPTION_YES:0x0027
+  0x14,  0x59,  0x00,  0x20,  0x00,  0x28,  0x00,  0x79,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0028: CONFIRM_OPTION_NO:0x0028
+  0x14,  0x4E,  0x00,  0x20,  0x00,  0x28,  0x00,  0x6E,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0029: CONFIRM_OPTION_OK:0x0029
+  0x14,  0x4F,  0x00,  0x20,  0x00,  0x28,  0x00,  0x6F,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x002A: CONFIRM_OPTION_CANCEL:0x002A
+  0x14,  0x43,  0x00,  0x20,  0x00,  0x28,  0x00,  0x63,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x002B: CONFIRM_OPTION_CONNECT:0x002B
+  0x14,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x00,  0x00,
+// 0x002C: CONFIRM_OPTION_END:0x002C
+  0x14,  0x3F,  0x00,  0x00,  0x00,
+// 0x002D: RECONNECT_FAILED:0x002D
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x64,  0x00,  0x21,  
+  0x00,  0x00,  0x00,
+// 0x002E: RECONNECT_CONFIRM_CHANGES:0x002E
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002F: RECONNECT_CHANGES_OPTIONS:0x002F
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x27,  0x00,  0x59,  
+  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0030: RECONNECT_REQUIRED:0x0030
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0031: GET_TIME_FAIL:0x0031
+  0x14,  0x20,  0x00,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x61,  0x00,  0x2F,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x79,  0x00,  0x20,  0x00,  0x3F,  0x00,  0x3F,  0x00,  0x2E,  
+  0x00,  0x00,  0x00,
+// 0x0032: PASSWORD_NOT_SUPPORTED:0x0032
+  0x14,  0x55,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x21,  0x00,  0x20,  0x00,  0x42,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x41,  0x00,  0x63,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0033: OK_SELECTABLE_OPTION:0x0033
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  0x00,
+// 0x0034: CANCEL_SELECTABLE_OPTION:0x0034
+  0x14,  0x5B,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x5D,  
+  0x00,  0x00,  0x00,
+// 0x0035: YES_SELECTABLE_OPTION:0x0035
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x59,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  
+  0x00,
+// 0x0036: NO_SELECTABLE_OPTION:0x0036
+  0x14,  0x5B,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x5D,  0x00,  0x00,  0x00,
+// 0x0037: ERROR_POPUP_STRING:0x0037
+  0x14,  0x45,  0x00,  0x52,  0x00,  0x52,  0x00,  0x4F,  0x00,  0x52,  0x00,  0x00,  0x00,
+// 0x0038: WARNING_POPUP_STRING:0x0038
+  0x14,  0x57,  0x00,  0x41,  0x00,  0x52,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x47,  0x00,  0x00,  
+  0x00,
+// 0x0039: INFO_POPUP_STRING:0x0039
+  0x14,  0x49,  0x00,  0x4E,  0x00,  0x46,  0x00,  0x4F,  0x00,  0x00,  0x00,
+  0x00,
+
+};
+
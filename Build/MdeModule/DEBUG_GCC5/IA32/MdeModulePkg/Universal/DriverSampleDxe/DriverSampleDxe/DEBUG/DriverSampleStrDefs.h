@@ -0,0 +1,269 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    DriverSampleStrDefs.h
+  Abstract:       Auto-generated DriverSampleStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_FE3542FE_C1D3_4EF8_657C_8048606FF671
+#define _STRDEFS_FE3542FE_C1D3_4EF8_657C_8048606FF671
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_INV_FORM_SET_TITLE                               0x0002
+#define STR_INV_FORM_SET_HELP                                0x0003
+#define STR_INV_FORM1_TITLE                                  0x0004
+#define STR_INV_VERSION_TEXT                                 0x0005
+#define STR_INV_VERSION_HELP                                 0x0006
+#define STR_INV_VERSION_TEXT2                                0x0007
+#define STR_INV_VERSION_TEXT3                                0x0008
+#define STR_INV_VERSION_TEXT4                                0x0009
+#define STR_INV_VERSION_TEXT5                                0x000A
+#define STR_INV_VERSION_TEXT6                                0x000B
+#define STR_INV_VERSION_TEXT7                                0x000C
+#define STR_INV_VERSION_TEXT8                                0x000D
+#define STR_INV_VERSION_TEXT9                                0x000E
+#define STR_INV_VERSION_TEXT10                               0x000F
+#define STR_INV_VERSION_TEXT11                               0x0010
+#define STR_INV_VERSION_TEXT12                               0x0011
+#define STR_INV_EMPTY_STRING                                 0x0012
+#define STR_FORM_SET_TITLE                                   0x0013
+#define STR_FORM_SET_TITLE_HELP                              0x0014
+#define STR_FORM1_TITLE                                      0x0015
+#define STR_FORM2_TITLE                                      0x0016
+#define STR_FORM3_TITLE                                      0x0017
+#define STR_FORM6_TITLE                                      0x0018
+#define STR_DYNAMIC_TITLE                                    0x0019
+#define STR_SUBTITLE_TEXT                                    0x001A
+#define STR_SUBTITLE_TEXT2                                   0x001B
+#define STR_CPU_STRING                                       0x001C
+#define STR_CPU_STRING2                                      0x001D
+#define STR_NUMERIC_NUM_HELP                                 0x001E
+#define STR_ONE_OF_PROMPT                                    0x001F
+#define STR_ONE_OF_PROMPT_KEYWORD                            0x0020
+#define STR_CHECK_KEYWORD_SUPPORT                            0x0021
+#define STR_ONE_OF_PROMPT_X_UEFI                             0x0022
+#define STR_ONE_OF_PROMPT_X_UEFI_HELP                        0x0023
+#define STR_ONE_OF_PROMPT_NON_X_UEFI                         0x0024
+#define STR_ONE_OF_PROMPT_NON_X_UEFI_HELP                    0x0025
+#define STR_ONE_OF_HELP                                      0x0026
+#define STR_ONE_OF_TEXT1                                     0x0027
+#define STR_ONE_OF_TEXT2                                     0x0028
+#define STR_ONE_OF_TEXT3                                     0x0029
+#define STR_ONE_OF_TEXT4                                     0x002A
+#define STR_ONE_OF_TEXT5                                     0x002B
+#define STR_ONE_OF_TEXT6                                     0x002C
+#define STR_BOOT_ORDER1                                      0x002D
+#define STR_BOOT_ORDER2                                      0x002E
+#define STR_CHECK_BOX_PROMPT                                 0x002F
+#define STR_CHECK_BOX_HELP                                   0x0030
+#define STR_NUMERIC_STEP_PROMPT                              0x0031
+#define STR_NUMERIC_READONLY_PROMPT                          0x0032
+#define STR_NUMERIC_MANUAL_PROMPT                            0x0033
+#define STR_TALL_HEX_PROMPT                                  0x0034
+#define STR_NUMERIC_HELP0                                    0x0035
+#define STR_NUMERIC_HELP1                                    0x0036
+#define STR_NUMERIC_HELP2                                    0x0037
+#define STR_TEXT_SECRUITY_TEST_TEXT                          0x0038
+#define STR_TEXT_SECRUITY_TEST_HELP                          0x0039
+#define STR_GOTO_FORM1                                       0x003A
+#define STR_GOTO_FORM2                                       0x003B
+#define STR_GOTO_FORM3                                       0x003C
+#define STR_GOTO_FORM4                                       0x003D
+#define STR_GOTO_FORM6                                       0x003E
+#define STR_GOTO_FORM5                                       0x003F
+#define STR_GOTO_FORM5_HELP                                  0x0040
+#define STR_GOTO_DYNAMIC                                     0x0041
+#define STR_GOTO_DYNAMIC2                                    0x0042
+#define STR_GOTO_DYNAMIC3                                    0x0043
+#define STR_GOTO_DYNAMIC4                                    0x0044
+#define STR_GOTO_DYNAMIC3_HELP                               0x0045
+#define STR_GOTO_DYNAMIC4_HELP                               0x0046
+#define STR_ERROR_POPUP                                      0x0047
+#define STR_MY_STRING_PROMPT2                                0x0048
+#define STR_MY_STRING_HELP2                                  0x0049
+#define STR_TEXT_TEXT_1                                      0x004A
+#define STR_TEXT_TEXT_2                                      0x004B
+#define STR_DATE_PROMPT                                      0x004C
+#define STR_DATE_HELP                                        0x004D
+#define STR_TIME_PROMPT                                      0x004E
+#define STR_TIME_HELP                                        0x004F
+#define STR_TEXT_HELP                                        0x0050
+#define STR_GOTO_HELP                                        0x0051
+#define STR_TEST_OPCODE                                      0x0052
+#define STR_TEST_OPCODE2                                     0x0053
+#define STR_EXIT_TEXT                                        0x0054
+#define STR_SAVE_TEXT                                        0x0055
+#define STR_DISCARD_CURRENT                                  0x0056
+#define STR_SAVE_CURRENT                                     0x0057
+#define STR_DISCARD_CURRENT_AND_EXIT                         0x0058
+#define STR_SAVE_CURRENT_AND_EXIT                            0x0059
+#define STR_NULL_STRING                                      0x005A
+#define STR_STANDARD_DEFAULT_PROMPT                          0x005B
+#define STR_STANDARD_DEFAULT_HELP                            0x005C
+#define STR_MANUFACTURE_DEFAULT_PROMPT                       0x005D
+#define STR_MANUFACTURE_DEFAULT_HELP                         0x005E
+#define STR_NAME_VALUE_VAR_NAME0_HELP                        0x005F
+#define STR_NAME_VALUE_VAR_NAME1_HELP                        0x0060
+#define STR_NAME_VALUE_VAR_NAME2_HELP                        0x0061
+#define STR_STRING_CHECK                                     0x0062
+#define STR_STRING_CHECK_ERROR_POPUP                         0x0063
+#define STR_TEXT_REFRESH_GUID                                0x0064
+#define STR_TEXT_REFRESH_GUID_COUNT                          0x0065
+#define STR_MODAL_FORM_TITLE                                 0x0066
+#define STR_DEFAULT_VALUE_FROM_CALLBACK_PROMPT               0x0067
+#define STR_DEFAULT_VALUE_FROM_CALLBACK_HELP                 0x0068
+#define STR_DEFAULT_VALUE_FROM_ACCESS_PROMPT                 0x0069
+#define STR_DEFAULT_VALUE_FROM_ACCESS_HELP                   0x006A
+#define STR_GOTO_ANOTHER_FORMSET                             0x006B
+#define STR_GOTO_ANOTHER_FORMSET_HELP                        0x006C
+#define STR_DEVICE_PATH                                      0x006D
+#define STR_SUBMITTED_CALLBACK_TEST_PROMPT                   0x006E
+#define STR_SUBMITTED_CALLBACK_TEST_HELP                     0x006F
+#define STR_POPUP_TEST_PROMPT                                0x0070
+#define STR_POPUP_TEST_HELP                                  0x0071
+#define STR_POPUP_STRING                                     0x0072
+#define STR_FORM7_TITLE                                      0x0073
+#define STR_GOTO_FORM7                                       0x0074
+#define STR_GOTO_FORM7_HELP                                  0x0075
+#define STR_NEST_BIT_EFI_VARSTORE                            0x0076
+#define STR_BIT_EFI_VARSTORE                                 0x0077
+#define STR_NEST_BIT_VARSTORE                                0x0078
+#define STR_BIT_VARSTORE                                     0x0079
+#define STR_UNION_EFI_VARSTORE                               0x007A
+#define STR_BIT_NEST_CHECK_BOX_PROMPT                        0x007B
+#define STR_BIT_NEST_CHECK_BOX_HELP                          0x007C
+#define STR_ONE_OF_BIT_NEST_PROMPT                           0x007D
+#define STR_ONE_OF_BIT_NEST_HELP                             0x007E
+#define STR_BIT_NEST_NUMERIC_PROMPT                          0x007F
+#define STR_BIT_NEST_NUMERIC_HELP                            0x0080
+#define BYTE_QUESTION_NEST_BIT_PROMPT                        0x0081
+#define BYTE_QUESTION_NEST_BIT_HELP                          0x0082
+#define STR_BIT_NEST_NUMERIC_DEFAULT_HELP                    0x0083
+#define STR_BIT_CHECK_BOX_PROMPT                             0x0084
+#define STR_BIT_CHECK_BOX_HELP                               0x0085
+#define STR_ONE_OF_BIT_PROMPT                                0x0086
+#define STR_ONE_OF_BIT_HELP                                  0x0087
+#define STR_BIT_NUMERIC_PROMPT                               0x0088
+#define STR_BIT_NUMERIC_HELP                                 0x0089
+#define STR_BUFFER_BIT_NUMERIC_HELP                          0x008A
+#define STR_UNION_BYTE_NUMERIC_PROMPT                        0x008B
+#define STR_UNION_BYTE_NUMERIC_HELP                          0x008C
+#define STR_BOOT_OPTIONS                                     0x008D
+#define STR_BOOT_OPTION1                                     0x008E
+#define STR_BOOT_OPTION2                                     0x008F
+#define STR_BOOT_OPTION3                                     0x0090
+#define STR_BOOT_OPTION4                                     0x0091
+#define STR_NAME_VALUE_VAR_NAME0                             0x0092
+#define STR_NAME_VALUE_VAR_NAME1                             0x0093
+#define STR_NAME_VALUE_VAR_NAME2                             0x0094
+#define STR_SAMPL_MAP_METHOD                                 0x0095
+#define STR_STANDARD_MAP_METHOD                              0x0096
+#define STR_SERIAL_PORT                                      0x0097
+#define STR_SERIAL_PORT_DISABLE                              0x0098
+#define STR_SERIAL_PORT1                                     0x0099
+#define STR_SERIAL_PORT2                                     0x009A
+#define STR_SERIAL_PORT3                                     0x009B
+#define STR_SERIAL_PORT4                                     0x009C
+#define STR_SERIAL_PORT_STATUS                               0x009D
+#define STR_SERIAL_PORT_IO_ADDRESS                           0x009E
+#define STR_SERIAL_PORT_IRQ                                  0x009F
+#define STR_SERIAL_PORT1_IOADDR                              0x00A0
+#define STR_SERIAL_PORT2_IOADDR                              0x00A1
+#define STR_SERIAL_PORT3_IOADDR                              0x00A2
+#define STR_SERIAL_PORT4_IOADDR                              0x00A3
+#define STR_SERIAL_PORT13_IRQ                                0x00A4
+#define STR_SERIAL_PORT24_IRQ                                0x00A5
+#define STR_TEXT_SAMPLE_HELP                                 0x00A6
+#define STR_TEXT_SAMPLE_STRING                               0x00A7
+#define STR_DATE_SAMPLE_HELP                                 0x00A8
+#define STR_TIME_SAMPLE_HELP                                 0x00A9
+#define FUNCTION_NINE_STRING                                 0x00AA
+#define FUNCTION_TEN_STRING                                  0x00AB
+#define STR_WARNING_POPUP                                    0x00AC
+#define STR_MATCH2_PROMPT                                    0x00AD
+#define STR_MATCH2_HELP                                      0x00AE
+#define STR_STRING                                           0x00AF
+#define STR_PATTERN                                          0x00B0
+// #define STR_NUMERIC_NUM_PROMPT                               0x00B1 // not referenced
+// #define STR_CHECK_DYNAMIC_PROMPT                             0x00B2 // not referenced
+// #define STR_CHECK_DYNAMIC_HELP                               0x00B3 // not referenced
+// #define STR_NUMERIC_PROMPT                                   0x00B4 // not referenced
+// #define STR_NUMERIC_PROMPT1                                  0x00B5 // not referenced
+// #define STR_MYIFRNVDATA2_HEX_PROMPT                          0x00B6 // not referenced
+// #define STR_MYIFRNVDATA2_HEX_HELP                            0x00B7 // not referenced
+// #define STR_NUMERIC_HELP3                                    0x00B8 // not referenced
+// #define STR_PASSWORD_PROMPT                                  0x00B9 // not referenced
+// #define STR_ERROR_INCONSISTENT                               0x00BA // not referenced
+// #define STR_MY_STRING_DEFAULT                                0x00BB // not referenced
+// #define STR_RESTORE_DEFAULTS_PROMPT                          0x00BC // not referenced
+// #define STR_RESTORE_DEFAULTS_HELP                            0x00BD // not referenced
+// #define STR_SAVE_DEFAULTS_PROMPT                             0x00BE // not referenced
+// #define STR_SAVE_DEFAULTS_HELP                               0x00BF // not referenced
+// #define STR_BANNER_TITLE                                     0x00C0 // not referenced
+// #define STR_SUPPRESS_IF_TEXT1                                0x00C1 // not referenced
+// #define STR_SUPPRESS_IF_TEXT2                                0x00C2 // not referenced
+// #define STR_GRAYOUT_IF_TEXT1                                 0x00C3 // not referenced
+// #define STR_GRAYOUT_IF_TEXT2                                 0x00C4 // not referenced
+// #define STR_INVENTORY_HELP                                   0x00C5 // not referenced
+// #define STR_INVENTORY_TEXT1                                  0x00C6 // not referenced
+// #define STR_INVENTORY_TEXT2                                  0x00C7 // not referenced
+// #define STR_RESET_TEXT                                       0x00C8 // not referenced
+// #define STR_TEST_STRING                                      0x00C9 // not referenced
+// #define STR_GRAYOUT_TEST                                     0x00CA // not referenced
+// #define STR_SUPPRESS_TEST                                    0x00CB // not referenced
+// #define STR_CLEAR_TEST                                       0x00CC // not referenced
+// #define STR_EXIT_THROUGH_FORM_DISCARD_EXIT                   0x00CD // not referenced
+// #define STR_EXIT_THROUGH_FORM_SUBMIT_EXIT                    0x00CE // not referenced
+// #define BYTE_QUESTION_BIT_PROMPT                             0x00CF // not referenced
+// #define BYTE_QUESTION_BIT_HELP                               0x00D0 // not referenced
+// #define STR_BOOT_TITLE                                       0x00D1 // not referenced
+// #define STR_VAR_NAME                                         0x00D2 // not referenced
+// #define STR_DEFAULTSTORE_MFG                                 0x00D3 // not referenced
+// #define STR_DEFAULTSTORE_SAFE                                0x00D4 // not referenced
+
+extern unsigned char DriverSampleStrings[];
+
+
+#define STRING_ARRAY_NAME DriverSampleStrings
+
+#ifdef VFRCOMPILE
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gDriverSampleInventoryGuid { 0xb3f56470, 0x6141, 0x4621, { 0x8f, 0x19, 0x70, 0x4e, 0x57, 0x7a, 0xa9, 0xe8 }}
+#define gEfiIfrRefreshIdOpGuid { 0xF5E655D9, 0x02A6, 0x46f2, { 0x9E, 0x76, 0xB8, 0xBE, 0x8E, 0x60, 0xAB, 0x22 }}
+#define gDriverSampleFormSetGuid { 0xA04A27f4, 0xDF00, 0x4D42, { 0xB5, 0x52, 0x39, 0x51, 0x13, 0x02, 0x11, 0x3D }}
+#define gEfiMdePkgTokenSpaceGuid { 0x914AEBE7, 0x4635, 0x459b, { 0xAA, 0x1C, 0x11, 0xE2, 0x19, 0xB0, 0x3A, 0x10 }}
+#define gEfiVTUTF8Guid { 0xAD15A0D6, 0x8BEC, 0x4ACF, { 0xA0, 0x73, 0xD0, 0x1D, 0xE7, 0x7E, 0x2D, 0x88 }}
+#define gEfiVT100Guid { 0xDFA66065, 0xB419, 0x11D3, { 0x9A, 0x2D, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiVT100PlusGuid { 0x7BAEC70B, 0x57E0, 0x4C76, { 0x8E, 0x87, 0x2F, 0x9E, 0x28, 0x08, 0x83, 0x43 }}
+#define gEfiPcAnsiGuid { 0xE0C14753, 0xF9BE, 0x11D2, { 0x9A, 0x0C, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiUartDevicePathGuid { 0x37499a9d, 0x542f, 0x4c89, { 0xa0, 0x26, 0x35, 0xda, 0x14, 0x20, 0x94, 0xe4 }}
+#define gEfiSasDevicePathGuid { 0xd487ddb4, 0x008b, 0x11d9, { 0xaf, 0xdc, 0x00, 0x10, 0x83, 0xff, 0xca, 0x4d }}
+#define gEfiVirtualDiskGuid { 0x77AB535A, 0x45FC, 0x624B, {0x55, 0x60, 0xF7, 0xB2, 0x81, 0xD1, 0xF9, 0x6E }}
+#define gEfiVirtualCdGuid { 0x3D5ABD30, 0x4175, 0x87CE, {0x6D, 0x64, 0xD2, 0xAD, 0xE5, 0x23, 0xC4, 0xBB }}
+#define gEfiPersistentVirtualDiskGuid { 0x5CEA02C9, 0x4D07, 0x69D3, {0x26, 0x9F ,0x44, 0x96, 0xFB, 0xE0, 0x96, 0xF9 }}
+#define gEfiPersistentVirtualCdGuid { 0x08018188, 0x42CD, 0xBB48, {0x10, 0x0F, 0x53, 0x87, 0xD5, 0x3D, 0xED, 0x3D }}
+#define gEfiEventReadyToBootGuid { 0x7CE88FB3, 0x4BD7, 0x4679, { 0x87, 0xA8, 0xA8, 0xD8, 0xDE, 0xE5, 0x0D, 0x2B }}
+#define gEfiEventLegacyBootGuid { 0x2A571201, 0x4966, 0x47F6, { 0x8B, 0x86, 0xF3, 0x1E, 0x41, 0xF3, 0x2F, 0x10 }}
+#define gEfiGlobalVariableGuid { 0x8BE4DF61, 0x93CA, 0x11D2, { 0xAA, 0x0D, 0x00, 0xE0, 0x98, 0x03, 0x2B, 0x8C }}
+#define gEfiAcpi20TableGuid { 0x8868E871, 0xE4F1, 0x11D3, { 0xBC, 0x22, 0x00, 0x80, 0xC7, 0x3C, 0x88, 0x81 }}
+#define gEfiAcpi10TableGuid { 0xEB9D2D30, 0x2D88, 0x11D3, { 0x9A, 0x16, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEdkiiIfrBitVarstoreGuid {0x82DDD68B, 0x9163, 0x4187, {0x9B, 0x27, 0x20, 0xA8, 0xFD, 0x60,0xA7, 0x1D}}
+#define gEfiDevicePathProtocolGuid { 0x09576E91, 0x6D3F, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiHiiStringProtocolGuid {0x0fd96974, 0x23aa, 0x4cdc, {0xb9, 0xcb, 0x98, 0xd1, 0x77, 0x50, 0x32, 0x2a}}
+#define gEfiHiiConfigRoutingProtocolGuid {0x587e72d7, 0xcc50, 0x4f79, {0x82, 0x09, 0xca, 0x29, 0x1f, 0xc1, 0xa1, 0x0f}}
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#define gEfiFormBrowser2ProtocolGuid {0xb9d4c360, 0xbcfb, 0x4f9b, {0x92, 0x98, 0x53, 0xc1, 0x36, 0x98, 0x22, 0x58}}
+#define gEfiHiiDatabaseProtocolGuid {0xef9fc172, 0xa1b2, 0x4693, {0xb3, 0x27, 0x6d, 0x32, 0xfc, 0x41, 0x60, 0x42}}
+#define gEfiSimpleTextInputExProtocolGuid {0xdd9e7534, 0x7762, 0x4698, { 0x8c, 0x14, 0xf5, 0x85, 0x17, 0xa6, 0x25, 0xaa } }
+#define gEdkiiFormBrowserExProtocolGuid { 0x1f73b18d, 0x4630, 0x43c1, { 0xa1, 0xde, 0x6f, 0x80, 0x85, 0x5d, 0x7d, 0xa4 } }
+#define gEfiConfigKeywordHandlerProtocolGuid {0x0a8badd5, 0x03b8, 0x4d19, {0xb1, 0x28, 0x7b, 0x8f, 0x0e, 0xda, 0xa5, 0x96}}
+#define gEfiHiiPopupProtocolGuid { 0x4311edc0, 0x6054, 0x46d4, { 0x9e, 0x40, 0x89, 0x3e, 0xa9, 0x52, 0xfc, 0xcc }}
+#endif
+
+#endif
@@ -0,0 +1,34 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_5ca126c0_b598_4f4b_abb9_b6e7d077aea9
+#define _AUTOGENH_5ca126c0_b598_4f4b_abb9_b6e7d077aea9
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiMm.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Protocols
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
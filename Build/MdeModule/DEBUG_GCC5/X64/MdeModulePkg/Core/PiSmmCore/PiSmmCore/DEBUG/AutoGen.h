@@ -0,0 +1,203 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_E94F54CD_81EB_47ed_AEC3_856F5DC157A9
+#define _AUTOGENH_E94F54CD_81EB_47ed_AEC3_856F5DC157A9
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0xE94F54CD, 0x81EB, 0x47ed, {0xAE, 0xC3, 0x85, 0x6F, 0x5D, 0xC1, 0x57, 0xA9}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gAprioriGuid;
+extern EFI_GUID gEfiEventDxeDispatchGuid;
+extern EFI_GUID gEfiEventLegacyBootGuid;
+extern EFI_GUID gEfiEventExitBootServicesGuid;
+extern EFI_GUID gEfiEventReadyToBootGuid;
+extern EFI_GUID gEfiEndOfDxeEventGroupGuid;
+extern EFI_GUID gEdkiiMemoryProfileGuid;
+extern EFI_GUID gEdkiiSmmMemoryProfileGuid;
+extern EFI_GUID gEdkiiPiSmmMemoryAttributesTableGuid;
+extern EFI_GUID gLoadFixedAddressConfigurationTableGuid;
+extern EFI_GUID gSmiHandlerProfileGuid;
+extern EFI_GUID gEdkiiEndOfS3ResumeGuid;
+extern EFI_GUID gEdkiiS3SmmInitDoneGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+extern EFI_GUID gEfiGlobalVariableGuid;
+extern EFI_GUID gEfiAcpi20TableGuid;
+extern EFI_GUID gEfiAcpi10TableGuid;
+extern EFI_GUID gEfiDxeServicesTableGuid;
+extern EFI_GUID gEfiHobListGuid;
+extern EFI_GUID gEfiMemoryAttributesTableGuid;
+
+// Protocols
+extern EFI_GUID gEfiDxeSmmReadyToLockProtocolGuid;
+extern EFI_GUID gEfiSmmReadyToLockProtocolGuid;
+extern EFI_GUID gEfiSmmCpuIo2ProtocolGuid;
+extern EFI_GUID gEfiFirmwareVolume2ProtocolGuid;
+extern EFI_GUID gEfiSmmEndOfDxeProtocolGuid;
+extern EFI_GUID gEfiSecurityArchProtocolGuid;
+extern EFI_GUID gEfiSecurity2ArchProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEdkiiSmmExitBootServicesProtocolGuid;
+extern EFI_GUID gEdkiiSmmLegacyBootProtocolGuid;
+extern EFI_GUID gEdkiiSmmReadyToBootProtocolGuid;
+extern EFI_GUID gEfiSmmSwDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmSxDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmPowerButtonDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmStandbyButtonDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmPeriodicTimerDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmGpiDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmIoTrapDispatch2ProtocolGuid;
+extern EFI_GUID gEfiSmmUsbDispatch2ProtocolGuid;
+extern EFI_GUID gEdkiiSmmMemoryAttributeProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+extern EFI_GUID gEfiDriverBindingProtocolGuid;
+extern EFI_GUID gEfiSimpleTextOutProtocolGuid;
+extern EFI_GUID gEfiGraphicsOutputProtocolGuid;
+extern EFI_GUID gEfiHiiFontProtocolGuid;
+extern EFI_GUID gEfiSimpleFileSystemProtocolGuid;
+extern EFI_GUID gEfiUgaDrawProtocolGuid;
+extern EFI_GUID gEfiComponentNameProtocolGuid;
+extern EFI_GUID gEfiComponentName2ProtocolGuid;
+extern EFI_GUID gEfiDriverConfigurationProtocolGuid;
+extern EFI_GUID gEfiDriverConfiguration2ProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnosticsProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnostics2ProtocolGuid;
+extern EFI_GUID gEfiSmmAccess2ProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in this module
+
+#define _PCD_TOKEN_PcdLoadFixAddressSmmCodePageNumber  0U
+#define _PCD_PATCHABLE_VALUE_PcdLoadFixAddressSmmCodePageNumber  ((UINT32)0U)
+extern volatile   UINT32  _gPcd_BinaryPatch_PcdLoadFixAddressSmmCodePageNumber;
+#define _PCD_GET_MODE_32_PcdLoadFixAddressSmmCodePageNumber  _gPcd_BinaryPatch_PcdLoadFixAddressSmmCodePageNumber
+#define _PCD_PATCHABLE_PcdLoadFixAddressSmmCodePageNumber_SIZE 4
+#define _PCD_GET_MODE_SIZE_PcdLoadFixAddressSmmCodePageNumber  _gPcd_BinaryPatch_Size_PcdLoadFixAddressSmmCodePageNumber 
+extern UINTN _gPcd_BinaryPatch_Size_PcdLoadFixAddressSmmCodePageNumber; 
+#define _PCD_SET_MODE_32_PcdLoadFixAddressSmmCodePageNumber(Value)  (_gPcd_BinaryPatch_PcdLoadFixAddressSmmCodePageNumber = (Value))
+#define _PCD_SET_MODE_32_S_PcdLoadFixAddressSmmCodePageNumber(Value)  ((_gPcd_BinaryPatch_PcdLoadFixAddressSmmCodePageNumber = (Value)), RETURN_SUCCESS) 
+
+#define _PCD_TOKEN_PcdLoadModuleAtFixAddressEnable  0U
+#define _PCD_SIZE_PcdLoadModuleAtFixAddressEnable 8
+#define _PCD_GET_MODE_SIZE_PcdLoadModuleAtFixAddressEnable  _PCD_SIZE_PcdLoadModuleAtFixAddressEnable 
+#define _PCD_VALUE_PcdLoadModuleAtFixAddressEnable  0ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdLoadModuleAtFixAddressEnable;
+#define _PCD_GET_MODE_64_PcdLoadModuleAtFixAddressEnable  _gPcd_FixedAtBuild_PcdLoadModuleAtFixAddressEnable
+//#define _PCD_SET_MODE_64_PcdLoadModuleAtFixAddressEnable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMemoryProfileMemoryType  0U
+#define _PCD_SIZE_PcdMemoryProfileMemoryType 8
+#define _PCD_GET_MODE_SIZE_PcdMemoryProfileMemoryType  _PCD_SIZE_PcdMemoryProfileMemoryType 
+#define _PCD_VALUE_PcdMemoryProfileMemoryType  0x0ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdMemoryProfileMemoryType;
+#define _PCD_GET_MODE_64_PcdMemoryProfileMemoryType  _gPcd_FixedAtBuild_PcdMemoryProfileMemoryType
+//#define _PCD_SET_MODE_64_PcdMemoryProfileMemoryType  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMemoryProfilePropertyMask  0U
+#define _PCD_SIZE_PcdMemoryProfilePropertyMask 1
+#define _PCD_GET_MODE_SIZE_PcdMemoryProfilePropertyMask  _PCD_SIZE_PcdMemoryProfilePropertyMask 
+#define _PCD_VALUE_PcdMemoryProfilePropertyMask  0x0U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdMemoryProfilePropertyMask;
+#define _PCD_GET_MODE_8_PcdMemoryProfilePropertyMask  _gPcd_FixedAtBuild_PcdMemoryProfilePropertyMask
+//#define _PCD_SET_MODE_8_PcdMemoryProfilePropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMemoryProfileDriverPath  0U
+#define _PCD_VALUE_PcdMemoryProfileDriverPath  (VOID *)_gPcd_FixedAtBuild_PcdMemoryProfileDriverPath
+extern const UINT8 _gPcd_FixedAtBuild_PcdMemoryProfileDriverPath[1];
+#define _PCD_GET_MODE_PTR_PcdMemoryProfileDriverPath  (VOID *)_gPcd_FixedAtBuild_PcdMemoryProfileDriverPath
+#define _PCD_SIZE_PcdMemoryProfileDriverPath 1
+#define _PCD_GET_MODE_SIZE_PcdMemoryProfileDriverPath  _PCD_SIZE_PcdMemoryProfileDriverPath 
+//#define _PCD_SET_MODE_PTR_PcdMemoryProfileDriverPath  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdSmiHandlerProfilePropertyMask  0U
+#define _PCD_SIZE_PcdSmiHandlerProfilePropertyMask 1
+#define _PCD_GET_MODE_SIZE_PcdSmiHandlerProfilePropertyMask  _PCD_SIZE_PcdSmiHandlerProfilePropertyMask 
+#define _PCD_VALUE_PcdSmiHandlerProfilePropertyMask  0U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdSmiHandlerProfilePropertyMask;
+#define _PCD_GET_MODE_8_PcdSmiHandlerProfilePropertyMask  _gPcd_FixedAtBuild_PcdSmiHandlerProfilePropertyMask
+//#define _PCD_SET_MODE_8_PcdSmiHandlerProfilePropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdHeapGuardPageType  0U
+#define _PCD_SIZE_PcdHeapGuardPageType 8
+#define _PCD_GET_MODE_SIZE_PcdHeapGuardPageType  _PCD_SIZE_PcdHeapGuardPageType 
+#define _PCD_VALUE_PcdHeapGuardPageType  0x0ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdHeapGuardPageType;
+#define _PCD_GET_MODE_64_PcdHeapGuardPageType  _gPcd_FixedAtBuild_PcdHeapGuardPageType
+//#define _PCD_SET_MODE_64_PcdHeapGuardPageType  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdHeapGuardPoolType  0U
+#define _PCD_SIZE_PcdHeapGuardPoolType 8
+#define _PCD_GET_MODE_SIZE_PcdHeapGuardPoolType  _PCD_SIZE_PcdHeapGuardPoolType 
+#define _PCD_VALUE_PcdHeapGuardPoolType  0x0ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdHeapGuardPoolType;
+#define _PCD_GET_MODE_64_PcdHeapGuardPoolType  _gPcd_FixedAtBuild_PcdHeapGuardPoolType
+//#define _PCD_SET_MODE_64_PcdHeapGuardPoolType  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdHeapGuardPropertyMask  0U
+#define _PCD_SIZE_PcdHeapGuardPropertyMask 1
+#define _PCD_GET_MODE_SIZE_PcdHeapGuardPropertyMask  _PCD_SIZE_PcdHeapGuardPropertyMask 
+#define _PCD_VALUE_PcdHeapGuardPropertyMask  0x0U
+extern const  UINT8  _gPcd_FixedAtBuild_PcdHeapGuardPropertyMask;
+#define _PCD_GET_MODE_8_PcdHeapGuardPropertyMask  _gPcd_FixedAtBuild_PcdHeapGuardPropertyMask
+//#define _PCD_SET_MODE_8_PcdHeapGuardPropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiS3Enable  0U
+#define _PCD_SIZE_PcdAcpiS3Enable 1
+#define _PCD_GET_MODE_SIZE_PcdAcpiS3Enable  _PCD_SIZE_PcdAcpiS3Enable 
+#define _PCD_VALUE_PcdAcpiS3Enable  1U
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdAcpiS3Enable;
+#define _PCD_GET_MODE_BOOL_PcdAcpiS3Enable  _gPcd_FixedAtBuild_PcdAcpiS3Enable
+//#define _PCD_SET_MODE_BOOL_PcdAcpiS3Enable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+SmmMain (
+  IN EFI_HANDLE         ImageHandle,
+  IN EFI_SYSTEM_TABLE   *SystemTable
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
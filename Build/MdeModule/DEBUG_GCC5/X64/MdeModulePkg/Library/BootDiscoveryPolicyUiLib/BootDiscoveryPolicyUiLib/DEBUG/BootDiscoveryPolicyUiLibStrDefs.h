@@ -0,0 +1,38 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    BootDiscoveryPolicyUiLibStrDefs.h
+  Abstract:       Auto-generated BootDiscoveryPolicyUiLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_BE73105A_B13D_4B57_A41A_463DBD15FE10
+#define _STRDEFS_BE73105A_B13D_4B57_A41A_463DBD15FE10
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_FORM_BDP_MAIN_TITLE                              0x0002
+#define STR_FORM_BDP_CONN_MIN                                0x0003
+#define STR_FORM_BDP_CONN_NET                                0x0004
+#define STR_FORM_BDP_CONN_ALL                                0x0005
+
+extern unsigned char BootDiscoveryPolicyUiLibStrings[];
+
+
+#define STRING_ARRAY_NAME BootDiscoveryPolicyUiLibStrings
+
+#ifdef VFRCOMPILE
+#define gBootDiscoveryPolicyMgrFormsetGuid { 0x5b6f7107, 0xbb3c, 0x4660, { 0x92, 0xcd, 0x54, 0x26, 0x90, 0x28, 0x0b, 0xbd } }
+#define FixedPcdGetBool(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet8(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet16(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet32(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet64(TokenName) _PCD_VALUE_##TokenName
+#define FeaturePcdGet(TokenName) _PCD_VALUE_##TokenName
+#endif
+
+#endif
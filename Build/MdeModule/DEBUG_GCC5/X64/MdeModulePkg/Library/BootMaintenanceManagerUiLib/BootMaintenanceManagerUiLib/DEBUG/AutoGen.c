@@ -0,0 +1,762 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char BootMaintenanceManagerUiLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0xBE,  0x1B,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0xDC,  0x0D,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_NULL_STRING:0x0002
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x0003: STR_NONE:0x0003
+  0x14,  0x4E,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x00,  0x00,
+// 0x0004: STR_MISSING_STRING:0x0004
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x0005: STR_FORM_MAIN_TITLE:0x0005
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0006: STR_FORM_BOOT_SETUP_TITLE:0x0006
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0007: STR_BOOT_MAINT_MANAGER_HELP:0x0007
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6B,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0008: STR_FORM_BOOT_SETUP_HELP:0x0008
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0009: STR_FORM_DRIVER_SETUP_TITLE:0x0009
+  0x14,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000A: STR_FORM_DRIVER_SETUP_HELP:0x000A
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000B: STR_FORM_BOOT_ADD_TITLE:0x000B
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x000C: STR_FORM_BOOT_ADD_HELP:0x000C
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x52,  
+  0x00,  0x65,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x46,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x000D: STR_FORM_BOOT_DEL_TITLE:0x000D
+  0x14,  0x44,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x000E: STR_FORM_BOOT_IMMEDIATE_HELP:0x000E
+  0x14,  0x57,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6D,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x64,  0x00,  0x69,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x000F: STR_FORM_BOOT_CHG_TITLE:0x000F
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x72,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0010: STR_FORM_DRV_ADD_TITLE:0x0010
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0011: STR_FORM_DRV_ADD_HELP:0x0011
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x2E,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x00,  0x00,
+// 0x0012: STR_FORM_DRV_DEL_TITLE:0x0012
+  0x14,  0x44,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0013: STR_FORM_DRV_CHG_TITLE:0x0013
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x72,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0014: STR_FORM_NEXT_BOOT_HELP:0x0014
+  0x14,  0x57,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0015: STR_FORM_CON_MAIN_TITLE:0x0015
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  
+  0x00,
+// 0x0016: STR_FORM_CON_MAIN_HELP:0x0016
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0017: STR_FORM_CON_IN_TITLE:0x0017
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  
+  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0018: STR_FORM_CON_IN_HELP:0x0018
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0019: STR_FORM_CON_OUT_TITLE:0x0019
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001A: STR_FORM_CON_OUT_HELP:0x001A
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x001B: STR_FORM_STD_ERR_TITLE:0x001B
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001C: STR_FORM_STD_ERR_HELP:0x001C
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x64,  0x00,  0x45,  0x00,  0x72,  0x00,  0x72,  0x00,  0x00,  
+  0x00,
+// 0x001D: STR_FORM_MODE_TITLE:0x001D
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  
+  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001E: STR_FORM_MODE_HELP:0x001E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x38,  0x00,  0x30,  0x00,  0x78,  0x00,  0x32,  
+  0x00,  0x35,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x78,  0x00,  0x33,  
+  0x00,  0x31,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x65,  0x00,  0x74,  0x00,  0x63,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x001F: STR_FORM_COM_TITLE:0x001F
+  0x14,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  0x00,  0x41,  0x00,  0x74,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0020: STR_FORM_COM_HELP:0x0020
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x50,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x64,  0x00,  0x52,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  0x00,  0x73,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x42,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x73,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x79,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x54,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0021: STR_FORM_DRV_ADD_FILE_TITLE:0x0021
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x55,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0022: STR_FORM_DRV_ADD_HANDLE_TITLE:0x0022
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x55,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x48,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0023: STR_FORM_BOOT_ADD_DESC_TITLE:0x0023
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x73,  0x00,  0x63,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0024: STR_FORM_DRV_ADD_DESC_TITLE:0x0024
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x63,  0x00,  0x72,  0x00,  0x69,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x00,  0x00,
+// 0x0025: STR_NUM_AUTO_BOOT:0x0025
+  0x14,  0x41,  0x00,  0x75,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x54,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0026: STR_HLP_AUTO_BOOT:0x0026
+  0x14,  0x52,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x30,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x36,  0x00,  0x35,  0x00,  0x35,  0x00,  0x33,  
+  0x00,  0x35,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x77,  0x00,  0x61,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x36,  0x00,  0x35,  0x00,  0x35,  0x00,  0x33,  
+  0x00,  0x35,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x61,  0x00,  0x69,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x00,  
+  0x00,
+// 0x0027: STR_BOOT_NEXT:0x0027
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0028: STR_BOOT_NEXT_HELP:0x0028
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0029: STR_LOAD_OPTION_DESC:0x0029
+  0x14,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x63,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x002A: STR_LOAD_OPTION_FORCE_RECON:0x002A
+  0x14,  0x4C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002B: STR_SAVE_AND_EXIT:0x002B
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x002C: STR_NO_SAVE_AND_EXIT:0x002C
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x002D: STR_CON_MODE_SETUP:0x002D
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x002E: STR_CON_COM_SETUP:0x002E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x74,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x002F: STR_COM_TERMI_TYPE:0x002F
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0030: STR_COM_FLOW_CONTROL:0x0030
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0031: STR_COM_BAUD_RATE:0x0031
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x42,  0x00,  0x61,  0x00,  0x75,  0x00,  0x64,  0x00,  0x20,  0x00,  0x52,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0032: STR_COM_DATA_BITS:0x0032
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x20,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0033: STR_COM_PARITY:0x0033
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x74,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0034: STR_COM_STOP_BITS:0x0034
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x20,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0035: STR_COM_BAUD_RATE_0:0x0035
+  0x14,  0x31,  0x00,  0x31,  0x00,  0x35,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0036: STR_COM_BAUD_RATE_1:0x0036
+  0x14,  0x35,  0x00,  0x37,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0037: STR_COM_BAUD_RATE_2:0x0037
+  0x14,  0x33,  0x00,  0x38,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0038: STR_COM_BAUD_RATE_3:0x0038
+  0x14,  0x31,  0x00,  0x39,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0039: STR_COM_BAUD_RATE_4:0x0039
+  0x14,  0x39,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003A: STR_COM_BAUD_RATE_5:0x003A
+  0x14,  0x37,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003B: STR_COM_BAUD_RATE_6:0x003B
+  0x14,  0x34,  0x00,  0x38,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003C: STR_COM_BAUD_RATE_7:0x003C
+  0x14,  0x33,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003D: STR_COM_BAUD_RATE_8:0x003D
+  0x14,  0x32,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003E: STR_COM_BAUD_RATE_9:0x003E
+  0x14,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003F: STR_COM_BAUD_RATE_10:0x003F
+  0x14,  0x31,  0x00,  0x38,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0040: STR_COM_BAUD_RATE_11:0x0040
+  0x14,  0x31,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0041: STR_COM_BAUD_RATE_12:0x0041
+  0x14,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0042: STR_COM_BAUD_RATE_13:0x0042
+  0x14,  0x33,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0043: STR_COM_BAUD_RATE_14:0x0043
+  0x14,  0x31,  0x00,  0x35,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0044: STR_COM_BAUD_RATE_15:0x0044
+  0x14,  0x31,  0x00,  0x33,  0x00,  0x34,  0x00,  0x00,  0x00,
+// 0x0045: STR_COM_BAUD_RATE_16:0x0045
+  0x14,  0x31,  0x00,  0x31,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0046: STR_COM_BAUD_RATE_17:0x0046
+  0x14,  0x37,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x0047: STR_COM_BAUD_RATE_18:0x0047
+  0x14,  0x35,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0048: STR_COM_DATA_BITS_0:0x0048
+  0x14,  0x35,  0x00,  0x00,  0x00,
+// 0x0049: STR_COM_DATA_BITS_1:0x0049
+  0x14,  0x36,  0x00,  0x00,  0x00,
+// 0x004A: STR_COM_DATA_BITS_2:0x004A
+  0x14,  0x37,  0x00,  0x00,  0x00,
+// 0x004B: STR_COM_DATA_BITS_3:0x004B
+  0x14,  0x38,  0x00,  0x00,  0x00,
+// 0x004C: STR_COM_PAR_0:0x004C
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004D: STR_COM_PAR_1:0x004D
+  0x14,  0x45,  0x00,  0x76,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x004E: STR_COM_PAR_2:0x004E
+  0x14,  0x4F,  0x00,  0x64,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x004F: STR_COM_PAR_3:0x004F
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x00,  0x00,
+// 0x0050: STR_COM_PAR_4:0x0050
+  0x14,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0051: STR_COM_STOP_BITS_0:0x0051
+  0x14,  0x4F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0052: STR_COM_STOP_BITS_1:0x0052
+  0x14,  0x4F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x41,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x20,  0x00,  0x48,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x66,  0x00,  0x00,  0x00,
+// 0x0053: STR_COM_STOP_BITS_2:0x0053
+  0x14,  0x54,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x0054: STR_COM_TYPE_0:0x0054
+  0x14,  0x50,  0x00,  0x43,  0x00,  0x5F,  0x00,  0x41,  0x00,  0x4E,  0x00,  0x53,  0x00,  0x49,  0x00,  0x00,  
+  0x00,
+// 0x0055: STR_COM_TYPE_1:0x0055
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0056: STR_COM_TYPE_2:0x0056
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x5F,  0x00,  0x50,  
+  0x00,  0x4C,  0x00,  0x55,  0x00,  0x53,  0x00,  0x00,  0x00,
+// 0x0057: STR_COM_TYPE_3:0x0057
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x55,  0x00,  0x54,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  
+  0x00,
+// 0x0058: STR_COM_TYPE_4:0x0058
+  0x14,  0x54,  0x00,  0x54,  0x00,  0x59,  0x00,  0x5F,  0x00,  0x54,  0x00,  0x45,  0x00,  0x52,  0x00,  0x4D,  
+  0x00,  0x00,  0x00,
+// 0x0059: STR_COM_TYPE_5:0x0059
+  0x14,  0x4C,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x55,  0x00,  0x58,  0x00,  0x00,  0x00,
+// 0x005A: STR_COM_TYPE_6:0x005A
+  0x14,  0x58,  0x00,  0x54,  0x00,  0x45,  0x00,  0x52,  0x00,  0x4D,  0x00,  0x5F,  0x00,  0x52,  0x00,  0x36,  
+  0x00,  0x00,  0x00,
+// 0x005B: STR_COM_TYPE_7:0x005B
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x005C: STR_COM_TYPE_8:0x005C
+  0x14,  0x53,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x005D: STR_FORM_GOTO_MAIN:0x005D
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005E: STR_BOOT_FROM_FILE:0x005E
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x46,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005F: STR_BOOT_FROM_FILE_HELP:0x005F
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x79,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0060: STR_OPTIONAL_DATA:0x0060
+  0x14,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x0061: STR_CHANGE_ORDER:0x0061
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0062: STR_HARDWARE_FLOW_CONTROL:0x0062
+  0x14,  0x48,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0063: STR_NONE_FLOW_CONTROL:0x0063
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0xDE,  0x0D,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0xE7,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: STR_NULL_STRING:0x0002
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x0003: STR_NONE:0x0003
+  0x14,  0x4E,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x00,  0x00,
+// 0x0004: STR_MISSING_STRING:0x0004
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x0005: STR_FORM_MAIN_TITLE:0x0005
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0006: STR_FORM_BOOT_SETUP_TITLE:0x0006
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0007: STR_BOOT_MAINT_MANAGER_HELP:0x0007
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6B,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0008: STR_FORM_BOOT_SETUP_HELP:0x0008
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0009: STR_FORM_DRIVER_SETUP_TITLE:0x0009
+  0x14,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000A: STR_FORM_DRIVER_SETUP_HELP:0x000A
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000B: STR_FORM_BOOT_ADD_TITLE:0x000B
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x000C: STR_FORM_BOOT_ADD_HELP:0x000C
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x52,  
+  0x00,  0x65,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x46,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x000D: STR_FORM_BOOT_DEL_TITLE:0x000D
+  0x14,  0x44,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x000E: STR_FORM_BOOT_IMMEDIATE_HELP:0x000E
+  0x14,  0x57,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6D,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x64,  0x00,  0x69,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x000F: STR_FORM_BOOT_CHG_TITLE:0x000F
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x72,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0010: STR_FORM_DRV_ADD_TITLE:0x0010
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0011: STR_FORM_DRV_ADD_HELP:0x0011
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x2E,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x00,  0x00,
+// 0x0012: STR_FORM_DRV_DEL_TITLE:0x0012
+  0x14,  0x44,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0013: STR_FORM_DRV_CHG_TITLE:0x0013
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x72,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0014: STR_FORM_NEXT_BOOT_HELP:0x0014
+  0x14,  0x57,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0015: STR_FORM_CON_MAIN_TITLE:0x0015
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  
+  0x00,
+// 0x0016: STR_FORM_CON_MAIN_HELP:0x0016
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0017: STR_FORM_CON_IN_TITLE:0x0017
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  
+  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0018: STR_FORM_CON_IN_HELP:0x0018
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0019: STR_FORM_CON_OUT_TITLE:0x0019
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001A: STR_FORM_CON_OUT_HELP:0x001A
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x001B: STR_FORM_STD_ERR_TITLE:0x001B
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001C: STR_FORM_STD_ERR_HELP:0x001C
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x64,  0x00,  0x45,  0x00,  0x72,  0x00,  0x72,  0x00,  0x00,  
+  0x00,
+// 0x001D: STR_FORM_MODE_TITLE:0x001D
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  
+  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x001E: STR_FORM_MODE_HELP:0x001E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x38,  0x00,  0x30,  0x00,  0x78,  0x00,  0x32,  
+  0x00,  0x35,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x78,  0x00,  0x33,  
+  0x00,  0x31,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x65,  0x00,  0x74,  0x00,  0x63,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x001F: STR_FORM_COM_TITLE:0x001F
+  0x14,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  0x00,  0x41,  0x00,  0x74,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0020: STR_FORM_COM_HELP:0x0020
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x50,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x64,  0x00,  0x52,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  0x00,  0x73,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x42,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x73,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x79,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x54,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0021: STR_FORM_DRV_ADD_FILE_TITLE:0x0021
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x55,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0022: STR_FORM_DRV_ADD_HANDLE_TITLE:0x0022
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x44,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x55,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x48,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0023: STR_FORM_BOOT_ADD_DESC_TITLE:0x0023
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x73,  0x00,  0x63,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0024: STR_FORM_DRV_ADD_DESC_TITLE:0x0024
+  0x14,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x79,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x63,  0x00,  0x72,  0x00,  0x69,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x00,  0x00,
+// 0x0025: STR_NUM_AUTO_BOOT:0x0025
+  0x14,  0x41,  0x00,  0x75,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x54,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0026: STR_HLP_AUTO_BOOT:0x0026
+  0x14,  0x52,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x30,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x36,  0x00,  0x35,  0x00,  0x35,  0x00,  0x33,  
+  0x00,  0x35,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x77,  0x00,  0x61,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x36,  0x00,  0x35,  0x00,  0x35,  0x00,  0x33,  
+  0x00,  0x35,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x61,  0x00,  0x69,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x00,  
+  0x00,
+// 0x0027: STR_BOOT_NEXT:0x0027
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0028: STR_BOOT_NEXT_HELP:0x0028
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0029: STR_LOAD_OPTION_DESC:0x0029
+  0x14,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x63,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x002A: STR_LOAD_OPTION_FORCE_RECON:0x002A
+  0x14,  0x4C,  0x00,  0x6F,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002B: STR_SAVE_AND_EXIT:0x002B
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x002C: STR_NO_SAVE_AND_EXIT:0x002C
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x002D: STR_CON_MODE_SETUP:0x002D
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x70,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x002E: STR_CON_COM_SETUP:0x002E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x74,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x002F: STR_COM_TERMI_TYPE:0x002F
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0030: STR_COM_FLOW_CONTROL:0x0030
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0031: STR_COM_BAUD_RATE:0x0031
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x42,  0x00,  0x61,  0x00,  0x75,  0x00,  0x64,  0x00,  0x20,  0x00,  0x52,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0032: STR_COM_DATA_BITS:0x0032
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x20,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0033: STR_COM_PARITY:0x0033
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x74,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0034: STR_COM_STOP_BITS:0x0034
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4D,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x20,  0x00,  0x42,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0035: STR_COM_BAUD_RATE_0:0x0035
+  0x14,  0x31,  0x00,  0x31,  0x00,  0x35,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0036: STR_COM_BAUD_RATE_1:0x0036
+  0x14,  0x35,  0x00,  0x37,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0037: STR_COM_BAUD_RATE_2:0x0037
+  0x14,  0x33,  0x00,  0x38,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0038: STR_COM_BAUD_RATE_3:0x0038
+  0x14,  0x31,  0x00,  0x39,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0039: STR_COM_BAUD_RATE_4:0x0039
+  0x14,  0x39,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003A: STR_COM_BAUD_RATE_5:0x003A
+  0x14,  0x37,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003B: STR_COM_BAUD_RATE_6:0x003B
+  0x14,  0x34,  0x00,  0x38,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003C: STR_COM_BAUD_RATE_7:0x003C
+  0x14,  0x33,  0x00,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003D: STR_COM_BAUD_RATE_8:0x003D
+  0x14,  0x32,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003E: STR_COM_BAUD_RATE_9:0x003E
+  0x14,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x003F: STR_COM_BAUD_RATE_10:0x003F
+  0x14,  0x31,  0x00,  0x38,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0040: STR_COM_BAUD_RATE_11:0x0040
+  0x14,  0x31,  0x00,  0x32,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0041: STR_COM_BAUD_RATE_12:0x0041
+  0x14,  0x36,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0042: STR_COM_BAUD_RATE_13:0x0042
+  0x14,  0x33,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0043: STR_COM_BAUD_RATE_14:0x0043
+  0x14,  0x31,  0x00,  0x35,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0044: STR_COM_BAUD_RATE_15:0x0044
+  0x14,  0x31,  0x00,  0x33,  0x00,  0x34,  0x00,  0x00,  0x00,
+// 0x0045: STR_COM_BAUD_RATE_16:0x0045
+  0x14,  0x31,  0x00,  0x31,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0046: STR_COM_BAUD_RATE_17:0x0046
+  0x14,  0x37,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x0047: STR_COM_BAUD_RATE_18:0x0047
+  0x14,  0x35,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0048: STR_COM_DATA_BITS_0:0x0048
+  0x14,  0x35,  0x00,  0x00,  0x00,
+// 0x0049: STR_COM_DATA_BITS_1:0x0049
+  0x14,  0x36,  0x00,  0x00,  0x00,
+// 0x004A: STR_COM_DATA_BITS_2:0x004A
+  0x14,  0x37,  0x00,  0x00,  0x00,
+// 0x004B: STR_COM_DATA_BITS_3:0x004B
+  0x14,  0x38,  0x00,  0x00,  0x00,
+// 0x004C: STR_COM_PAR_0:0x004C
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004D: STR_COM_PAR_1:0x004D
+  0x14,  0x45,  0x00,  0x76,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x004E: STR_COM_PAR_2:0x004E
+  0x14,  0x4F,  0x00,  0x64,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x004F: STR_COM_PAR_3:0x004F
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x00,  0x00,
+// 0x0050: STR_COM_PAR_4:0x0050
+  0x14,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0051: STR_COM_STOP_BITS_0:0x0051
+  0x14,  0x4F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0052: STR_COM_STOP_BITS_1:0x0052
+  0x14,  0x4F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x41,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x41,  0x00,  0x20,  0x00,  0x48,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x66,  0x00,  0x00,  0x00,
+// 0x0053: STR_COM_STOP_BITS_2:0x0053
+  0x14,  0x54,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x0054: STR_COM_TYPE_0:0x0054
+  0x14,  0x50,  0x00,  0x43,  0x00,  0x5F,  0x00,  0x41,  0x00,  0x4E,  0x00,  0x53,  0x00,  0x49,  0x00,  0x00,  
+  0x00,
+// 0x0055: STR_COM_TYPE_1:0x0055
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0056: STR_COM_TYPE_2:0x0056
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  0x00,  0x5F,  0x00,  0x50,  
+  0x00,  0x4C,  0x00,  0x55,  0x00,  0x53,  0x00,  0x00,  0x00,
+// 0x0057: STR_COM_TYPE_3:0x0057
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x55,  0x00,  0x54,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  
+  0x00,
+// 0x0058: STR_COM_TYPE_4:0x0058
+  0x14,  0x54,  0x00,  0x54,  0x00,  0x59,  0x00,  0x5F,  0x00,  0x54,  0x00,  0x45,  0x00,  0x52,  0x00,  0x4D,  
+  0x00,  0x00,  0x00,
+// 0x0059: STR_COM_TYPE_5:0x0059
+  0x14,  0x4C,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x55,  0x00,  0x58,  0x00,  0x00,  0x00,
+// 0x005A: STR_COM_TYPE_6:0x005A
+  0x14,  0x58,  0x00,  0x54,  0x00,  0x45,  0x00,  0x52,  0x00,  0x4D,  0x00,  0x5F,  0x00,  0x52,  0x00,  0x36,  
+  0x00,  0x00,  0x00,
+// 0x005B: STR_COM_TYPE_7:0x005B
+  0x14,  0x56,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x34,  0x00,  0x30,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x005C: STR_COM_TYPE_8:0x005C
+  0x14,  0x53,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x005D: STR_FORM_GOTO_MAIN:0x005D
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005E: STR_BOOT_FROM_FILE:0x005E
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x46,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005F: STR_BOOT_FROM_FILE_HELP:0x005F
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x79,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0060: STR_OPTIONAL_DATA:0x0060
+  0x14,  0x49,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x0061: STR_CHANGE_ORDER:0x0061
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x00,  0x00,
+// 0x0062: STR_HARDWARE_FLOW_CONTROL:0x0062
+  0x14,  0x48,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0063: STR_NONE_FLOW_CONTROL:0x0063
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  0x00,
+  0x00,
+
+};
+
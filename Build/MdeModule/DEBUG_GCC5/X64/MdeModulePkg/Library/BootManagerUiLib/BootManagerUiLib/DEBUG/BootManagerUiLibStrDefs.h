@@ -0,0 +1,45 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    BootManagerUiLibStrDefs.h
+  Abstract:       Auto-generated BootManagerUiLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_CCB2DCE1_4FC8_41CB_88C5_D349E134C9FC
+#define _STRDEFS_CCB2DCE1_4FC8_41CB_88C5_D349E134C9FC
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_BM_BANNER                                        0x0002
+#define STR_BOOT_MANAGER_HELP                                0x0003
+#define STR_HELP_FOOTER                                      0x0004
+#define STR_BOOT_OPTION_BANNER                               0x0005
+#define STR_ANY_KEY_CONTINUE                                 0x0006
+#define STR_LAST_STRING                                      0x0007
+// #define STR_AND                                              0x0008 // not referenced
+
+extern unsigned char BootManagerUiLibStrings[];
+
+
+#define STRING_ARRAY_NAME BootManagerUiLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gEfiIfrFrontPageGuid { 0xe58809f8, 0xfbc1, 0x48e2, { 0x88, 0x3a, 0xa3, 0x0f, 0xdc, 0x4b, 0x44, 0x1e } }
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#define gEfiDevicePathToTextProtocolGuid { 0x8B843E20, 0x8132, 0x4852, { 0x90, 0xCC, 0x55, 0x1A, 0x4E, 0x4A, 0x7F, 0x1C }}
+#define gEdkiiFormBrowserEx2ProtocolGuid { 0xa770c357, 0xb693, 0x4e6d, { 0xa6, 0xcf, 0xd2, 0x1c, 0x72, 0x8e, 0x55, 0xb } }
+#define FixedPcdGetBool(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet8(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet16(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet32(TokenName) _PCD_VALUE_##TokenName
+#define FixedPcdGet64(TokenName) _PCD_VALUE_##TokenName
+#define FeaturePcdGet(TokenName) _PCD_VALUE_##TokenName
+#endif
+
+#endif
@@ -0,0 +1,194 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char CustomizedDisplayLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0xEA,  0x06,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x40,  0x03,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: ENTER_STRING:0x0002
+  0x14,  0x3C,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x3E,  0x00,  0x3D,  
+  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x45,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0003: ENTER_COMMIT_STRING:0x0003
+  0x14,  0x3C,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x3E,  0x00,  0x3D,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0004: ENTER_ESCAPE_STRING:0x0004
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x63,  0x00,  0x3D,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x79,  0x00,  0x00,  0x00,
+// 0x0005: ESCAPE_STRING:0x0005
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x63,  0x00,  0x3D,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x0006: ADJUST_NUMBER:0x0006
+  0x14,  0x2B,  0x00,  0x2F,  0x00,  0x2D,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x41,  0x00,  0x64,  0x00,  0x6A,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0007: PLUS_STRING:0x0007
+  0x14,  0x2B,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x55,  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0008: MINUS_STRING:0x0008
+  0x14,  0x2D,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0009: MOVE_HIGHLIGHT:0x0009
+  0x14,  0x3D,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x48,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x68,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x67,  0x00,  0x68,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x000A: DEC_NUMERIC_INPUT:0x000A
+  0x14,  0x30,  0x00,  0x31,  0x00,  0x32,  0x00,  0x33,  0x00,  0x34,  0x00,  0x35,  0x00,  0x36,  0x00,  0x37,  
+  0x00,  0x38,  0x00,  0x39,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x70,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000B: HEX_NUMERIC_INPUT:0x000B
+  0x14,  0x30,  0x00,  0x2D,  0x00,  0x39,  0x00,  0x20,  0x00,  0x61,  0x00,  0x2D,  0x00,  0x66,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x000C: TOGGLE_CHECK_BOX:0x000C
+  0x14,  0x3C,  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x3E,  0x00,  0x54,  0x00,  0x6F,  0x00,  0x67,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x000D: NV_UPDATE_MESSAGE:0x000D
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x000E: INPUT_ERROR_MESSAGE:0x000E
+  0x14,  0x21,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x000F: EMPTY_STRING:0x000F
+  0x14,  0x00,  0x00,
+// 0x0010: ARE_YOU_SURE_YES:0x0010
+  0x14,  0x59,  0x00,  0x00,  0x00,
+// 0x0011: ARE_YOU_SURE_NO:0x0011
+  0x14,  0x4E,  0x00,  0x00,  0x00,
+// 0x0012: SAVE_CHANGES:0x0012
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x68,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x3F,  0x00,  0x00,  0x00,
+// 0x0013: ARE_YOU_SURE:0x0013
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x27,  0x00,  0x59,  
+  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  0x00,  0x27,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x27,  0x00,  0x45,  0x00,  0x53,  
+  0x00,  0x43,  0x00,  0x27,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x63,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x2E,  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0xA6,  0x03,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0xE7,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: ENTER_STRING:0x0002
+  0x14,  0x3C,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x3E,  0x00,  0x3D,  
+  0x00,  0x43,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x27,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0xE9,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0003: ENTER_COMMIT_STRING:0x0003
+  0x14,  0x3C,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x3E,  0x00,  0x3D,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0xE9,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x27,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0xE9,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0004: ENTER_ESCAPE_STRING:0x0004
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x63,  0x00,  0x3D,  0x00,  0x53,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x27,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0xE9,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0005: ESCAPE_STRING:0x0005
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x63,  0x00,  0x3D,  0x00,  0x53,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0006: ADJUST_NUMBER:0x0006
+  0x14,  0x2B,  0x00,  0x2F,  0x00,  0x2D,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x41,  0x00,  0x6A,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x75,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0007: PLUS_STRING:0x0007
+  0x14,  0x2B,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x52,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x76,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x6F,  0x00,  0x69,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x0008: MINUS_STRING:0x0008
+  0x14,  0x2D,  0x00,  0x20,  0x00,  0x3D,  0x00,  0x41,  0x00,  0x62,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x68,  0x00,  0x6F,  0x00,  0x69,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x0009: MOVE_HIGHLIGHT:0x0009
+  0x14,  0x3D,  0x00,  0x45,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x76,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x000A: DEC_NUMERIC_INPUT:0x000A
+  0x14,  0x30,  0x00,  0x31,  0x00,  0x32,  0x00,  0x33,  0x00,  0x34,  0x00,  0x35,  0x00,  0x36,  0x00,  0x37,  
+  0x00,  0x38,  0x00,  0x39,  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  
+  0x00,  0xE9,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000B: HEX_NUMERIC_INPUT:0x000B
+  0x14,  0x30,  0x00,  0x2D,  0x00,  0x39,  0x00,  0x20,  0x00,  0x61,  0x00,  0x2D,  0x00,  0x66,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6E,  0x00,  0xE9,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x000C: TOGGLE_CHECK_BOX:0x000C
+  0x14,  0x3C,  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x3E,  0x00,  0x42,  0x00,  0x61,  0x00,  0x73,  0x00,  0x63,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000D: NV_UPDATE_MESSAGE:0x000D
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x000E: INPUT_ERROR_MESSAGE:0x000E
+  0x14,  0x21,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x000F: EMPTY_STRING:0x000F
+  0x14,  0x00,  0x00,
+// 0x0010: ARE_YOU_SURE_YES:0x0010
+  0x14,  0x59,  0x00,  0x00,  0x00,
+// 0x0011: ARE_YOU_SURE_NO:0x0011
+  0x14,  0x4E,  0x00,  0x00,  0x00,
+// 0x0012: SAVE_CHANGES:0x0012
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x72,  0x00,  0x65,  0x00,  0x67,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x69,  0x00,  0x66,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x3F,  0x00,  0x00,  0x00,
+// 0x0013: ARE_YOU_SURE:0x0013
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x65,  0x00,  0x7A,  0x00,  0x20,  
+  0x00,  0x27,  0x00,  0x59,  0x00,  0x27,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x75,  0x00,  0x76,  0x00,  0x65,  0x00,  0x67,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x71,  0x00,  0x75,  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x27,  0x00,  0x4E,  0x00,  0x27,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0xE9,  0x00,  0x66,  0x00,  0x61,  0x00,  0x69,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x69,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+  0x00,
+
+};
+
@@ -0,0 +1,206 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char FileExplorerLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0x1A,  0x08,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x0A,  0x04,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_NULL_STRING:0x0002
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x0003: STR_FILE_EXPLORER_TITLE:0x0003
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x70,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0004: STR_NEW_FILE:0x0004
+  0x14,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x57,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x49,  0x00,  0x4C,  0x00,  0x45,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x00,  0x00,
+// 0x0005: STR_NEW_FILE_HELP:0x0005
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x79,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0006: STR_ADD_NEW_FILE_TITLE:0x0006
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0007: STR_ADD_NEW_FOLDER_TITLE:0x0007
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0008: STR_NEW_FILE_NAME_PROMPT:0x0008
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0009: STR_NEW_FILE_NAME_HELP:0x0009
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000A: STR_CREATE_FILE_AND_EXIT:0x000A
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x000B: STR_NO_CREATE_FILE_AND_EXIT:0x000B
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x000C: STR_NEW_FOLDER:0x000C
+  0x14,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x57,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x4F,  0x00,  0x4C,  0x00,  0x44,  0x00,  0x45,  0x00,  0x52,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  
+  0x00,  0x00,  0x00,
+// 0x000D: STR_NEW_FOLDER_HELP:0x000D
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x000E: STR_NEW_FOLDER_NAME_PROMPT:0x000E
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000F: STR_NEW_FOLDER_NAME_HELP:0x000F
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0010: STR_CREATE_FOLDER_AND_EXIT:0x0010
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0011: STR_NO_CREATE_FOLDER_AND_EXIT:0x0011
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0x0C,  0x04,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0xE7,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: STR_NULL_STRING:0x0002
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x0003: STR_FILE_EXPLORER_TITLE:0x0003
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x70,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0004: STR_NEW_FILE:0x0004
+  0x14,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x57,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x49,  0x00,  0x4C,  0x00,  0x45,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x00,  0x00,
+// 0x0005: STR_NEW_FILE_HELP:0x0005
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x79,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0006: STR_ADD_NEW_FILE_TITLE:0x0006
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0007: STR_ADD_NEW_FOLDER_TITLE:0x0007
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0008: STR_NEW_FILE_NAME_PROMPT:0x0008
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0009: STR_NEW_FILE_NAME_HELP:0x0009
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000A: STR_CREATE_FILE_AND_EXIT:0x000A
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x000B: STR_NO_CREATE_FILE_AND_EXIT:0x000B
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x000C: STR_NEW_FOLDER:0x000C
+  0x14,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x57,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x4F,  0x00,  0x4C,  0x00,  0x44,  0x00,  0x45,  0x00,  0x52,  0x00,  0x2A,  0x00,  0x2A,  0x00,  0x2A,  
+  0x00,  0x00,  0x00,
+// 0x000D: STR_NEW_FOLDER_HELP:0x000D
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x63,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x000E: STR_NEW_FOLDER_NAME_PROMPT:0x000E
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x4E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000F: STR_NEW_FOLDER_NAME_HELP:0x000F
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0010: STR_CREATE_FOLDER_AND_EXIT:0x0010
+  0x14,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0011: STR_NO_CREATE_FOLDER_AND_EXIT:0x0011
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+  0x00,
+
+};
+
@@ -0,0 +1,49 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    FileExplorerLibStrDefs.h
+  Abstract:       Auto-generated FileExplorerLibStrDefs.h for building module or library.
+**/
+
+#ifndef _STRDEFS_4FC9C630_0F90_4053_8F13_264CBD22FC58
+#define _STRDEFS_4FC9C630_0F90_4053_8F13_264CBD22FC58
+
+
+//
+//Unicode String ID
+//
+// #define $LANGUAGE_NAME                                       0x0000 // not referenced
+// #define $PRINTABLE_LANGUAGE_NAME                             0x0001 // not referenced
+#define STR_NULL_STRING                                      0x0002
+#define STR_FILE_EXPLORER_TITLE                              0x0003
+#define STR_NEW_FILE                                         0x0004
+#define STR_NEW_FILE_HELP                                    0x0005
+#define STR_ADD_NEW_FILE_TITLE                               0x0006
+#define STR_ADD_NEW_FOLDER_TITLE                             0x0007
+#define STR_NEW_FILE_NAME_PROMPT                             0x0008
+#define STR_NEW_FILE_NAME_HELP                               0x0009
+#define STR_CREATE_FILE_AND_EXIT                             0x000A
+#define STR_NO_CREATE_FILE_AND_EXIT                          0x000B
+#define STR_NEW_FOLDER                                       0x000C
+#define STR_NEW_FOLDER_HELP                                  0x000D
+#define STR_NEW_FOLDER_NAME_PROMPT                           0x000E
+#define STR_NEW_FOLDER_NAME_HELP                             0x000F
+#define STR_CREATE_FOLDER_AND_EXIT                           0x0010
+#define STR_NO_CREATE_FOLDER_AND_EXIT                        0x0011
+
+extern unsigned char FileExplorerLibStrings[];
+
+
+#define STRING_ARRAY_NAME FileExplorerLibStrings
+
+#ifdef VFRCOMPILE
+#define gEfiFileSystemVolumeLabelInfoIdGuid { 0xDB47D7D3, 0xFE81, 0x11D3, { 0x9A, 0x35, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }}
+#define gEfiIfrTianoGuid { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }}
+#define gEfiSimpleFileSystemProtocolGuid { 0x964E5B22, 0x6459, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }}
+#define gEfiHiiConfigAccessProtocolGuid {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}}
+#define gEfiFormBrowser2ProtocolGuid {0xb9d4c360, 0xbcfb, 0x4f9b, {0x92, 0x98, 0x53, 0xc1, 0x36, 0x98, 0x22, 0x58}}
+#define gEfiDevicePathToTextProtocolGuid { 0x8B843E20, 0x8132, 0x4852, { 0x90, 0xCC, 0x55, 0x1A, 0x4E, 0x4A, 0x7F, 0x1C }}
+#endif
+
+#endif
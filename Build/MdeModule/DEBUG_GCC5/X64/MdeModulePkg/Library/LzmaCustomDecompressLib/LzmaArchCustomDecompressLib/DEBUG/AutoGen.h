@@ -0,0 +1,40 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_A853C1D2_E003_4cc4_9DD1_8824AD79FE48
+#define _AUTOGENH_A853C1D2_E003_4cc4_9DD1_8824AD79FE48
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <Base.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern GUID gLzmaF86CustomDecompressGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+RETURN_STATUS
+EFIAPI
+LzmaArchDecompressLibConstructor (
+  VOID
+  );
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
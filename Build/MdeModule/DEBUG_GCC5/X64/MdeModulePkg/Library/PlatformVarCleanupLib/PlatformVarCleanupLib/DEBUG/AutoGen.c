@@ -0,0 +1,130 @@
+
+//
+//Unicode String Pack Definition
+//
+unsigned char PlatformVarCleanupLibStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0xB8,  0x04,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x28,  0x02,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_ENTRY_TITLE:0x0002
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x74,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0003: STR_TITLE:0x0003
+  0x14,  0x50,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x74,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  
+  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0004: STR_TITLE_HELP:0x0004
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  
+  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0005: STR_SELECT_ALL_PROMPT:0x0005
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0006: STR_SELECT_ALL_HELP:0x0006
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0007: STR_NULL_STRING:0x0007
+  0x14,  0x00,  0x00,
+// 0x0008: STR_SAVE_AND_EXIT:0x0008
+  0x14,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x0009: STR_NO_SAVE_AND_EXIT:0x0009
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0x8C,  0x02,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: STR_ENTRY_TITLE:0x0002
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x74,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0003: STR_TITLE:0x0003
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x74,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x70,  
+  0x00,  0x00,  0x00,
+// 0x0004: STR_TITLE_HELP:0x0004
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x53,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x62,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0005: STR_SELECT_ALL_PROMPT:0x0005
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x53,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0006: STR_SELECT_ALL_HELP:0x0006
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x53,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x2E,  
+  0x00,  0x00,  0x00,
+// 0x0007: STR_NULL_STRING:0x0007
+  0x14,  0x00,  0x00,
+// 0x0008: STR_SAVE_AND_EXIT:0x0008
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0009: STR_NO_SAVE_AND_EXIT:0x0009
+  0x14,  0x66,  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+  0x00,
+
+};
+
@@ -0,0 +1,47 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_5F5E6140_E7BA_4bd6_B85F_236B5BCD8E1E
+#define _AUTOGENH_5F5E6140_E7BA_4bd6_B85F_236B5BCD8E1E
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiPei.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+
+// Guids
+extern EFI_GUID gEfiSmmLockBoxCommunicationGuid;
+extern EFI_GUID gEfiAcpiVariableGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+
+// PPIs
+extern EFI_GUID gEfiPeiSmmCommunicationPpiGuid;
+extern EFI_GUID gPeiSmmAccessPpiGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// PCD definitions
+#define _PCD_TOKEN_PcdDxeIplSwitchToLongMode  0U
+extern const BOOLEAN _gPcd_FixedAtBuild_PcdDxeIplSwitchToLongMode;
+#define _PCD_GET_MODE_BOOL_PcdDxeIplSwitchToLongMode  _gPcd_FixedAtBuild_PcdDxeIplSwitchToLongMode
+//#define _PCD_SET_MODE_BOOL_PcdDxeIplSwitchToLongMode  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,18 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    LogoDxeImgDefs.h
+  Abstract:       Auto-generated LogoDxeImgDefs.h for building module or library.
+**/
+
+#ifndef _IMAGEDEFS_F74D20EE_37E7_48FC_97F7_9B1047749C69
+#define _IMAGEDEFS_F74D20EE_37E7_48FC_97F7_9B1047749C69
+
+
+//
+//Image ID
+//
+#define IMG_LOGO                                             0x0001
+
+#endif
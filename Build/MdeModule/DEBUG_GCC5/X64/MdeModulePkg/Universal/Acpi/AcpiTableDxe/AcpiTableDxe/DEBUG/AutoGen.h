@@ -0,0 +1,148 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.h
+  Abstract:       Auto-generated AutoGen.h for building module or library.
+**/
+
+#ifndef _AUTOGENH_9622E42C_8E38_4a08_9E8F_54F784652F6B
+#define _AUTOGENH_9622E42C_8E38_4a08_9E8F_54F784652F6B
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <PiDxe.h>
+#include <Library/PcdLib.h>
+
+extern GUID  gEfiCallerIdGuid;
+extern GUID  gEdkiiDscPlatformGuid;
+extern CHAR8 *gEfiCallerBaseName;
+
+#define EFI_CALLER_ID_GUID \
+  {0x9622E42C, 0x8E38, 0x4a08, {0x9E, 0x8F, 0x54, 0xF7, 0x84, 0x65, 0x2F, 0x6B}}
+#define EDKII_DSC_PLATFORM_GUID \
+  {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}}
+
+// Guids
+extern EFI_GUID gEfiAcpi10TableGuid;
+extern EFI_GUID gEfiAcpiTableGuid;
+extern EFI_GUID gUniversalPayloadAcpiTableGuid;
+extern EFI_GUID gEfiMdeModulePkgTokenSpaceGuid;
+extern EFI_GUID gEfiMdePkgTokenSpaceGuid;
+extern EFI_GUID gEfiVTUTF8Guid;
+extern EFI_GUID gEfiVT100Guid;
+extern EFI_GUID gEfiVT100PlusGuid;
+extern EFI_GUID gEfiPcAnsiGuid;
+extern EFI_GUID gEfiUartDevicePathGuid;
+extern EFI_GUID gEfiSasDevicePathGuid;
+extern EFI_GUID gEfiVirtualDiskGuid;
+extern EFI_GUID gEfiVirtualCdGuid;
+extern EFI_GUID gEfiPersistentVirtualDiskGuid;
+extern EFI_GUID gEfiPersistentVirtualCdGuid;
+extern EFI_GUID gEfiEventReadyToBootGuid;
+extern EFI_GUID gEfiEventLegacyBootGuid;
+extern EFI_GUID gEfiGlobalVariableGuid;
+extern EFI_GUID gEfiAcpi20TableGuid;
+extern EFI_GUID gEfiHobListGuid;
+
+// Protocols
+extern EFI_GUID gEfiAcpiTableProtocolGuid;
+extern EFI_GUID gEfiAcpiSdtProtocolGuid;
+extern EFI_GUID gEfiDevicePathProtocolGuid;
+extern EFI_GUID gEfiDebugPortProtocolGuid;
+extern EFI_GUID gEfiDriverBindingProtocolGuid;
+extern EFI_GUID gEfiSimpleTextOutProtocolGuid;
+extern EFI_GUID gEfiGraphicsOutputProtocolGuid;
+extern EFI_GUID gEfiHiiFontProtocolGuid;
+extern EFI_GUID gEfiSimpleFileSystemProtocolGuid;
+extern EFI_GUID gEfiUgaDrawProtocolGuid;
+extern EFI_GUID gEfiComponentNameProtocolGuid;
+extern EFI_GUID gEfiComponentName2ProtocolGuid;
+extern EFI_GUID gEfiDriverConfigurationProtocolGuid;
+extern EFI_GUID gEfiDriverConfiguration2ProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnosticsProtocolGuid;
+extern EFI_GUID gEfiDriverDiagnostics2ProtocolGuid;
+extern EFI_GUID gEfiLoadedImageProtocolGuid;
+
+// Definition of SkuId Array
+extern UINT64 _gPcd_SkuId_Array[];
+
+// Definition of PCDs used in this module
+
+#define _PCD_TOKEN_PcdInstallAcpiSdtProtocol  0U
+#define _PCD_SIZE_PcdInstallAcpiSdtProtocol 1
+#define _PCD_GET_MODE_SIZE_PcdInstallAcpiSdtProtocol  _PCD_SIZE_PcdInstallAcpiSdtProtocol 
+#define _PCD_VALUE_PcdInstallAcpiSdtProtocol  ((BOOLEAN)1U)
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdInstallAcpiSdtProtocol;
+#define _PCD_GET_MODE_BOOL_PcdInstallAcpiSdtProtocol  _gPcd_FixedAtBuild_PcdInstallAcpiSdtProtocol
+//#define _PCD_SET_MODE_BOOL_PcdInstallAcpiSdtProtocol  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiDefaultOemId  0U
+#define _PCD_VALUE_PcdAcpiDefaultOemId  _gPcd_FixedAtBuild_PcdAcpiDefaultOemId
+extern const UINT8 _gPcd_FixedAtBuild_PcdAcpiDefaultOemId[7];
+#define _PCD_GET_MODE_PTR_PcdAcpiDefaultOemId  _gPcd_FixedAtBuild_PcdAcpiDefaultOemId
+#define _PCD_SIZE_PcdAcpiDefaultOemId 7
+#define _PCD_GET_MODE_SIZE_PcdAcpiDefaultOemId  _PCD_SIZE_PcdAcpiDefaultOemId 
+//#define _PCD_SET_MODE_PTR_PcdAcpiDefaultOemId  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiDefaultOemTableId  0U
+#define _PCD_SIZE_PcdAcpiDefaultOemTableId 8
+#define _PCD_GET_MODE_SIZE_PcdAcpiDefaultOemTableId  _PCD_SIZE_PcdAcpiDefaultOemTableId 
+#define _PCD_VALUE_PcdAcpiDefaultOemTableId  0x20202020324B4445ULL
+extern const  UINT64  _gPcd_FixedAtBuild_PcdAcpiDefaultOemTableId;
+#define _PCD_GET_MODE_64_PcdAcpiDefaultOemTableId  _gPcd_FixedAtBuild_PcdAcpiDefaultOemTableId
+//#define _PCD_SET_MODE_64_PcdAcpiDefaultOemTableId  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiDefaultOemRevision  0U
+#define _PCD_SIZE_PcdAcpiDefaultOemRevision 4
+#define _PCD_GET_MODE_SIZE_PcdAcpiDefaultOemRevision  _PCD_SIZE_PcdAcpiDefaultOemRevision 
+#define _PCD_VALUE_PcdAcpiDefaultOemRevision  0x00000002U
+extern const  UINT32  _gPcd_FixedAtBuild_PcdAcpiDefaultOemRevision;
+#define _PCD_GET_MODE_32_PcdAcpiDefaultOemRevision  _gPcd_FixedAtBuild_PcdAcpiDefaultOemRevision
+//#define _PCD_SET_MODE_32_PcdAcpiDefaultOemRevision  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiDefaultCreatorId  0U
+#define _PCD_SIZE_PcdAcpiDefaultCreatorId 4
+#define _PCD_GET_MODE_SIZE_PcdAcpiDefaultCreatorId  _PCD_SIZE_PcdAcpiDefaultCreatorId 
+#define _PCD_VALUE_PcdAcpiDefaultCreatorId  0x20202020U
+extern const  UINT32  _gPcd_FixedAtBuild_PcdAcpiDefaultCreatorId;
+#define _PCD_GET_MODE_32_PcdAcpiDefaultCreatorId  _gPcd_FixedAtBuild_PcdAcpiDefaultCreatorId
+//#define _PCD_SET_MODE_32_PcdAcpiDefaultCreatorId  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiDefaultCreatorRevision  0U
+#define _PCD_SIZE_PcdAcpiDefaultCreatorRevision 4
+#define _PCD_GET_MODE_SIZE_PcdAcpiDefaultCreatorRevision  _PCD_SIZE_PcdAcpiDefaultCreatorRevision 
+#define _PCD_VALUE_PcdAcpiDefaultCreatorRevision  0x01000013U
+extern const  UINT32  _gPcd_FixedAtBuild_PcdAcpiDefaultCreatorRevision;
+#define _PCD_GET_MODE_32_PcdAcpiDefaultCreatorRevision  _gPcd_FixedAtBuild_PcdAcpiDefaultCreatorRevision
+//#define _PCD_SET_MODE_32_PcdAcpiDefaultCreatorRevision  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdAcpiExposedTableVersions  0U
+#define _PCD_SIZE_PcdAcpiExposedTableVersions 4
+#define _PCD_GET_MODE_SIZE_PcdAcpiExposedTableVersions  _PCD_SIZE_PcdAcpiExposedTableVersions 
+#define _PCD_VALUE_PcdAcpiExposedTableVersions  0x3EU
+extern const  UINT32  _gPcd_FixedAtBuild_PcdAcpiExposedTableVersions;
+#define _PCD_GET_MODE_32_PcdAcpiExposedTableVersions  _gPcd_FixedAtBuild_PcdAcpiExposedTableVersions
+//#define _PCD_SET_MODE_32_PcdAcpiExposedTableVersions  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+// Definition of PCDs used in libraries is in AutoGen.c
+
+
+EFI_STATUS
+EFIAPI
+InitializeAcpiTableDxe (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+
+
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,2567 @@
+/**
+  DO NOT EDIT
+  FILE auto-generated
+  Module name:
+    AutoGen.c
+  Abstract:       Auto-generated AutoGen.c for building module or library.
+**/
+#include <PiDxe.h>
+#include <Library/BaseLib.h>
+#include <Library/DebugLib.h>
+#include <Library/UefiBootServicesTableLib.h>
+#include <Library/UefiDriverEntryPoint.h>
+
+GLOBAL_REMOVE_IF_UNREFERENCED GUID gEfiCallerIdGuid = {0xFE3542FE, 0xC1D3, 0x4EF8, {0x65, 0x7C, 0x80, 0x48, 0x60, 0x6F, 0xF6, 0x71}};
+
+GLOBAL_REMOVE_IF_UNREFERENCED GUID gEdkiiDscPlatformGuid = {0x587CE499, 0x6CBE, 0x43cd, {0x94, 0xE2, 0x18, 0x62, 0x18, 0x56, 0x94, 0x78}};
+
+GLOBAL_REMOVE_IF_UNREFERENCED CHAR8 *gEfiCallerBaseName = "DriverSample";
+
+// Guids
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiIfrTianoGuid = { 0xf0b1735, 0x87a0, 0x4193, {0xb2, 0x66, 0x53, 0x8c, 0x38, 0xaf, 0x48, 0xce }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gDriverSampleInventoryGuid = { 0xb3f56470, 0x6141, 0x4621, { 0x8f, 0x19, 0x70, 0x4e, 0x57, 0x7a, 0xa9, 0xe8 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiIfrRefreshIdOpGuid = { 0xF5E655D9, 0x02A6, 0x46f2, { 0x9E, 0x76, 0xB8, 0xBE, 0x8E, 0x60, 0xAB, 0x22 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gDriverSampleFormSetGuid = { 0xA04A27f4, 0xDF00, 0x4D42, { 0xB5, 0x52, 0x39, 0x51, 0x13, 0x02, 0x11, 0x3D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiMdePkgTokenSpaceGuid = { 0x914AEBE7, 0x4635, 0x459b, { 0xAA, 0x1C, 0x11, 0xE2, 0x19, 0xB0, 0x3A, 0x10 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVTUTF8Guid = { 0xAD15A0D6, 0x8BEC, 0x4ACF, { 0xA0, 0x73, 0xD0, 0x1D, 0xE7, 0x7E, 0x2D, 0x88 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVT100Guid = { 0xDFA66065, 0xB419, 0x11D3, { 0x9A, 0x2D, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVT100PlusGuid = { 0x7BAEC70B, 0x57E0, 0x4C76, { 0x8E, 0x87, 0x2F, 0x9E, 0x28, 0x08, 0x83, 0x43 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPcAnsiGuid = { 0xE0C14753, 0xF9BE, 0x11D2, { 0x9A, 0x0C, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiUartDevicePathGuid = { 0x37499a9d, 0x542f, 0x4c89, { 0xa0, 0x26, 0x35, 0xda, 0x14, 0x20, 0x94, 0xe4 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSasDevicePathGuid = { 0xd487ddb4, 0x008b, 0x11d9, { 0xaf, 0xdc, 0x00, 0x10, 0x83, 0xff, 0xca, 0x4d }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVirtualDiskGuid = { 0x77AB535A, 0x45FC, 0x624B, {0x55, 0x60, 0xF7, 0xB2, 0x81, 0xD1, 0xF9, 0x6E }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiVirtualCdGuid = { 0x3D5ABD30, 0x4175, 0x87CE, {0x6D, 0x64, 0xD2, 0xAD, 0xE5, 0x23, 0xC4, 0xBB }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPersistentVirtualDiskGuid = { 0x5CEA02C9, 0x4D07, 0x69D3, {0x26, 0x9F ,0x44, 0x96, 0xFB, 0xE0, 0x96, 0xF9 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiPersistentVirtualCdGuid = { 0x08018188, 0x42CD, 0xBB48, {0x10, 0x0F, 0x53, 0x87, 0xD5, 0x3D, 0xED, 0x3D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiEventReadyToBootGuid = { 0x7CE88FB3, 0x4BD7, 0x4679, { 0x87, 0xA8, 0xA8, 0xD8, 0xDE, 0xE5, 0x0D, 0x2B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiEventLegacyBootGuid = { 0x2A571201, 0x4966, 0x47F6, { 0x8B, 0x86, 0xF3, 0x1E, 0x41, 0xF3, 0x2F, 0x10 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiGlobalVariableGuid = { 0x8BE4DF61, 0x93CA, 0x11D2, { 0xAA, 0x0D, 0x00, 0xE0, 0x98, 0x03, 0x2B, 0x8C }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiAcpi20TableGuid = { 0x8868E871, 0xE4F1, 0x11D3, { 0xBC, 0x22, 0x00, 0x80, 0xC7, 0x3C, 0x88, 0x81 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiAcpi10TableGuid = { 0xEB9D2D30, 0x2D88, 0x11D3, { 0x9A, 0x16, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEdkiiIfrBitVarstoreGuid = {0x82DDD68B, 0x9163, 0x4187, {0x9B, 0x27, 0x20, 0xA8, 0xFD, 0x60,0xA7, 0x1D}};
+
+// Protocols
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDevicePathProtocolGuid = { 0x09576E91, 0x6D3F, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiStringProtocolGuid = {0x0fd96974, 0x23aa, 0x4cdc, {0xb9, 0xcb, 0x98, 0xd1, 0x77, 0x50, 0x32, 0x2a}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiConfigRoutingProtocolGuid = {0x587e72d7, 0xcc50, 0x4f79, {0x82, 0x09, 0xca, 0x29, 0x1f, 0xc1, 0xa1, 0x0f}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiConfigAccessProtocolGuid = {0x330d4706, 0xf2a0, 0x4e4f, {0xa3, 0x69, 0xb6, 0x6f, 0xa8, 0xd5, 0x43, 0x85}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiFormBrowser2ProtocolGuid = {0xb9d4c360, 0xbcfb, 0x4f9b, {0x92, 0x98, 0x53, 0xc1, 0x36, 0x98, 0x22, 0x58}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiDatabaseProtocolGuid = {0xef9fc172, 0xa1b2, 0x4693, {0xb3, 0x27, 0x6d, 0x32, 0xfc, 0x41, 0x60, 0x42}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSimpleTextInputExProtocolGuid = {0xdd9e7534, 0x7762, 0x4698, { 0x8c, 0x14, 0xf5, 0x85, 0x17, 0xa6, 0x25, 0xaa } };
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEdkiiFormBrowserExProtocolGuid = { 0x1f73b18d, 0x4630, 0x43c1, { 0xa1, 0xde, 0x6f, 0x80, 0x85, 0x5d, 0x7d, 0xa4 } };
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiConfigKeywordHandlerProtocolGuid = {0x0a8badd5, 0x03b8, 0x4d19, {0xb1, 0x28, 0x7b, 0x8f, 0x0e, 0xda, 0xa5, 0x96}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiPopupProtocolGuid = { 0x4311edc0, 0x6054, 0x46d4, { 0x9e, 0x40, 0x89, 0x3e, 0xa9, 0x52, 0xfc, 0xcc }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDebugPortProtocolGuid = { 0xEBA4E8D2, 0x3858, 0x41EC, { 0xA2, 0x81, 0x26, 0x47, 0xBA, 0x96, 0x60, 0xD0 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiFontProtocolGuid = {0xe9ca4775, 0x8657, 0x47fc, {0x97, 0xe7, 0x7e, 0xd6, 0x5a, 0x08, 0x43, 0x24}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiHiiImageProtocolGuid = {0x31a6406a, 0x6bdf, 0x4e46, {0xb2, 0xa2, 0xeb, 0xaa, 0x89, 0xc4, 0x09, 0x20}};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverBindingProtocolGuid = { 0x18A031AB, 0xB443, 0x4D1A, { 0xA5, 0xC0, 0x0C, 0x09, 0x26, 0x1E, 0x9F, 0x71 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSimpleTextOutProtocolGuid = { 0x387477C2, 0x69C7, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiGraphicsOutputProtocolGuid = { 0x9042A9DE, 0x23DC, 0x4A38, { 0x96, 0xFB, 0x7A, 0xDE, 0xD0, 0x80, 0x51, 0x6A }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiSimpleFileSystemProtocolGuid = { 0x964E5B22, 0x6459, 0x11D2, { 0x8E, 0x39, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiUgaDrawProtocolGuid = { 0x982C298B, 0xF4FA, 0x41CB, { 0xB8, 0x38, 0x77, 0xAA, 0x68, 0x8F, 0xB8, 0x39 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiComponentNameProtocolGuid = { 0x107A772C, 0xD5E1, 0x11D4, { 0x9A, 0x46, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiComponentName2ProtocolGuid = { 0x6A7A5CFF, 0xE8D9, 0x4F70, { 0xBA, 0xDA, 0x75, 0xAB, 0x30, 0x25, 0xCE, 0x14 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverConfigurationProtocolGuid = { 0x107A772B, 0xD5E1, 0x11D4, { 0x9A, 0x46, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverConfiguration2ProtocolGuid = { 0xBFD7DC1D, 0x24F1, 0x40D9, { 0x82, 0xE7, 0x2E, 0x09, 0xBB, 0x6B, 0x4E, 0xBE }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverDiagnosticsProtocolGuid = { 0x0784924F, 0xE296, 0x11D4, { 0x9A, 0x49, 0x00, 0x90, 0x27, 0x3F, 0xC1, 0x4D }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiDriverDiagnostics2ProtocolGuid = { 0x4D330321, 0x025F, 0x4AAC, { 0x90, 0xD8, 0x5E, 0xD9, 0x00, 0x17, 0x3B, 0x63 }};
+GLOBAL_REMOVE_IF_UNREFERENCED EFI_GUID gEfiLoadedImageProtocolGuid = { 0x5B1B31A1, 0x9562, 0x11D2, { 0x8E, 0x3F, 0x00, 0xA0, 0xC9, 0x69, 0x72, 0x3B }};
+
+// Definition of SkuId Array
+GLOBAL_REMOVE_IF_UNREFERENCED UINT64 _gPcd_SkuId_Array[] = {0x0};
+
+// Definition of PCDs used in libraries
+
+#define _PCD_TOKEN_PcdVerifyNodeInList  0U
+#define _PCD_SIZE_PcdVerifyNodeInList 1
+#define _PCD_GET_MODE_SIZE_PcdVerifyNodeInList  _PCD_SIZE_PcdVerifyNodeInList 
+#define _PCD_VALUE_PcdVerifyNodeInList  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdVerifyNodeInList = _PCD_VALUE_PcdVerifyNodeInList;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdVerifyNodeInList;
+#define _PCD_GET_MODE_BOOL_PcdVerifyNodeInList  _gPcd_FixedAtBuild_PcdVerifyNodeInList
+//#define _PCD_SET_MODE_BOOL_PcdVerifyNodeInList  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumLinkedListLength  0U
+#define _PCD_SIZE_PcdMaximumLinkedListLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumLinkedListLength  _PCD_SIZE_PcdMaximumLinkedListLength 
+#define _PCD_VALUE_PcdMaximumLinkedListLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumLinkedListLength = _PCD_VALUE_PcdMaximumLinkedListLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumLinkedListLength;
+#define _PCD_GET_MODE_32_PcdMaximumLinkedListLength  _gPcd_FixedAtBuild_PcdMaximumLinkedListLength
+//#define _PCD_SET_MODE_32_PcdMaximumLinkedListLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumAsciiStringLength  0U
+#define _PCD_SIZE_PcdMaximumAsciiStringLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumAsciiStringLength  _PCD_SIZE_PcdMaximumAsciiStringLength 
+#define _PCD_VALUE_PcdMaximumAsciiStringLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength = _PCD_VALUE_PcdMaximumAsciiStringLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength;
+#define _PCD_GET_MODE_32_PcdMaximumAsciiStringLength  _gPcd_FixedAtBuild_PcdMaximumAsciiStringLength
+//#define _PCD_SET_MODE_32_PcdMaximumAsciiStringLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumUnicodeStringLength  0U
+#define _PCD_SIZE_PcdMaximumUnicodeStringLength 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumUnicodeStringLength  _PCD_SIZE_PcdMaximumUnicodeStringLength 
+#define _PCD_VALUE_PcdMaximumUnicodeStringLength  1000000U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength = _PCD_VALUE_PcdMaximumUnicodeStringLength;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength;
+#define _PCD_GET_MODE_32_PcdMaximumUnicodeStringLength  _gPcd_FixedAtBuild_PcdMaximumUnicodeStringLength
+//#define _PCD_SET_MODE_32_PcdMaximumUnicodeStringLength  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdControlFlowEnforcementPropertyMask  0U
+#define _PCD_SIZE_PcdControlFlowEnforcementPropertyMask 4
+#define _PCD_GET_MODE_SIZE_PcdControlFlowEnforcementPropertyMask  _PCD_SIZE_PcdControlFlowEnforcementPropertyMask 
+#define _PCD_VALUE_PcdControlFlowEnforcementPropertyMask  0x0U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask = _PCD_VALUE_PcdControlFlowEnforcementPropertyMask;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask;
+#define _PCD_GET_MODE_32_PcdControlFlowEnforcementPropertyMask  _gPcd_FixedAtBuild_PcdControlFlowEnforcementPropertyMask
+//#define _PCD_SET_MODE_32_PcdControlFlowEnforcementPropertyMask  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdSpeculationBarrierType  0U
+#define _PCD_SIZE_PcdSpeculationBarrierType 1
+#define _PCD_GET_MODE_SIZE_PcdSpeculationBarrierType  _PCD_SIZE_PcdSpeculationBarrierType 
+#define _PCD_VALUE_PcdSpeculationBarrierType  0x01U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gPcd_FixedAtBuild_PcdSpeculationBarrierType = _PCD_VALUE_PcdSpeculationBarrierType;
+extern const  UINT8  _gPcd_FixedAtBuild_PcdSpeculationBarrierType;
+#define _PCD_GET_MODE_8_PcdSpeculationBarrierType  _gPcd_FixedAtBuild_PcdSpeculationBarrierType
+//#define _PCD_SET_MODE_8_PcdSpeculationBarrierType  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdMaximumDevicePathNodeCount  0U
+#define _PCD_SIZE_PcdMaximumDevicePathNodeCount 4
+#define _PCD_GET_MODE_SIZE_PcdMaximumDevicePathNodeCount  _PCD_SIZE_PcdMaximumDevicePathNodeCount 
+#define _PCD_VALUE_PcdMaximumDevicePathNodeCount  0U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount = _PCD_VALUE_PcdMaximumDevicePathNodeCount;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount;
+#define _PCD_GET_MODE_32_PcdMaximumDevicePathNodeCount  _gPcd_FixedAtBuild_PcdMaximumDevicePathNodeCount
+//#define _PCD_SET_MODE_32_PcdMaximumDevicePathNodeCount  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdDriverDiagnosticsDisable  0U
+#define _PCD_SIZE_PcdDriverDiagnosticsDisable 1
+#define _PCD_GET_MODE_SIZE_PcdDriverDiagnosticsDisable  _PCD_SIZE_PcdDriverDiagnosticsDisable 
+#define _PCD_VALUE_PcdDriverDiagnosticsDisable  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable = _PCD_VALUE_PcdDriverDiagnosticsDisable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable;
+#define _PCD_GET_MODE_BOOL_PcdDriverDiagnosticsDisable  _gPcd_FixedAtBuild_PcdDriverDiagnosticsDisable
+//#define _PCD_SET_MODE_BOOL_PcdDriverDiagnosticsDisable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdComponentNameDisable  0U
+#define _PCD_SIZE_PcdComponentNameDisable 1
+#define _PCD_GET_MODE_SIZE_PcdComponentNameDisable  _PCD_SIZE_PcdComponentNameDisable 
+#define _PCD_VALUE_PcdComponentNameDisable  ((BOOLEAN)0U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdComponentNameDisable = _PCD_VALUE_PcdComponentNameDisable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdComponentNameDisable;
+#define _PCD_GET_MODE_BOOL_PcdComponentNameDisable  _gPcd_FixedAtBuild_PcdComponentNameDisable
+//#define _PCD_SET_MODE_BOOL_PcdComponentNameDisable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdDriverDiagnostics2Disable  0U
+#define _PCD_SIZE_PcdDriverDiagnostics2Disable 1
+#define _PCD_GET_MODE_SIZE_PcdDriverDiagnostics2Disable  _PCD_SIZE_PcdDriverDiagnostics2Disable 
+#define _PCD_VALUE_PcdDriverDiagnostics2Disable  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable = _PCD_VALUE_PcdDriverDiagnostics2Disable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable;
+#define _PCD_GET_MODE_BOOL_PcdDriverDiagnostics2Disable  _gPcd_FixedAtBuild_PcdDriverDiagnostics2Disable
+//#define _PCD_SET_MODE_BOOL_PcdDriverDiagnostics2Disable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdComponentName2Disable  0U
+#define _PCD_SIZE_PcdComponentName2Disable 1
+#define _PCD_GET_MODE_SIZE_PcdComponentName2Disable  _PCD_SIZE_PcdComponentName2Disable 
+#define _PCD_VALUE_PcdComponentName2Disable  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdComponentName2Disable = _PCD_VALUE_PcdComponentName2Disable;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdComponentName2Disable;
+#define _PCD_GET_MODE_BOOL_PcdComponentName2Disable  _gPcd_FixedAtBuild_PcdComponentName2Disable
+//#define _PCD_SET_MODE_BOOL_PcdComponentName2Disable  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUgaConsumeSupport  0U
+#define _PCD_SIZE_PcdUgaConsumeSupport 1
+#define _PCD_GET_MODE_SIZE_PcdUgaConsumeSupport  _PCD_SIZE_PcdUgaConsumeSupport 
+#define _PCD_VALUE_PcdUgaConsumeSupport  ((BOOLEAN)1U)
+GLOBAL_REMOVE_IF_UNREFERENCED const BOOLEAN _gPcd_FixedAtBuild_PcdUgaConsumeSupport = _PCD_VALUE_PcdUgaConsumeSupport;
+extern const  BOOLEAN  _gPcd_FixedAtBuild_PcdUgaConsumeSupport;
+#define _PCD_GET_MODE_BOOL_PcdUgaConsumeSupport  _gPcd_FixedAtBuild_PcdUgaConsumeSupport
+//#define _PCD_SET_MODE_BOOL_PcdUgaConsumeSupport  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+#define _PCD_TOKEN_PcdUefiLibMaxPrintBufferSize  0U
+#define _PCD_SIZE_PcdUefiLibMaxPrintBufferSize 4
+#define _PCD_GET_MODE_SIZE_PcdUefiLibMaxPrintBufferSize  _PCD_SIZE_PcdUefiLibMaxPrintBufferSize 
+#define _PCD_VALUE_PcdUefiLibMaxPrintBufferSize  320U
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT32 _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize = _PCD_VALUE_PcdUefiLibMaxPrintBufferSize;
+extern const  UINT32  _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize;
+#define _PCD_GET_MODE_32_PcdUefiLibMaxPrintBufferSize  _gPcd_FixedAtBuild_PcdUefiLibMaxPrintBufferSize
+//#define _PCD_SET_MODE_32_PcdUefiLibMaxPrintBufferSize  ASSERT(FALSE)  // It is not allowed to set value for a FIXED_AT_BUILD PCD
+
+
+EFI_STATUS
+EFIAPI
+UefiBootServicesTableLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiRuntimeServicesTableLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiHiiServicesLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+EFI_STATUS
+EFIAPI
+UefiLibConstructor (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  );
+
+
+VOID
+EFIAPI
+ProcessLibraryConstructorList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+{
+  EFI_STATUS  Status;
+
+  Status = UefiBootServicesTableLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiRuntimeServicesTableLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiHiiServicesLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+  Status = UefiLibConstructor (ImageHandle, SystemTable);
+  ASSERT_EFI_ERROR (Status);
+
+}
+
+
+
+VOID
+EFIAPI
+ProcessLibraryDestructorList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+{
+
+}
+
+const UINT32 _gUefiDriverRevision = 0x00000000U;
+const UINT32 _gDxeRevision = 0x00000000U;
+
+
+EFI_STATUS
+EFIAPI
+ProcessModuleEntryPointList (
+  IN EFI_HANDLE        ImageHandle,
+  IN EFI_SYSTEM_TABLE  *SystemTable
+  )
+
+{
+  return DriverSampleInit (ImageHandle, SystemTable);
+}
+
+VOID
+EFIAPI
+ExitDriver (
+  IN EFI_STATUS  Status
+  )
+{
+  if (EFI_ERROR (Status)) {
+    ProcessLibraryDestructorList (gImageHandle, gST);
+  }
+  gBS->Exit (gImageHandle, Status, 0, NULL);
+}
+
+GLOBAL_REMOVE_IF_UNREFERENCED const UINT8 _gDriverUnloadImageCount = 1U;
+
+
+EFI_STATUS
+EFIAPI
+ProcessModuleUnloadList (
+  IN EFI_HANDLE        ImageHandle
+  )
+{
+  return DriverSampleUnload (ImageHandle);
+}
+
+
+//
+//Unicode String Pack Definition
+//
+unsigned char DriverSampleStrings[] = {
+
+// STRGATHER_OUTPUT_HEADER
+  0x91,  0x6B,  0x00,  0x00,
+
+// PACKAGE HEADER
+
+  0x89,  0x37,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x65,  0x6E,  
+  0x2D,  0x55,  0x53,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x0002: STR_INV_FORM_SET_TITLE:0x0002
+  0x14,  0x41,  0x00,  0x42,  0x00,  0x43,  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0003: STR_INV_FORM_SET_HELP:0x0003
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x41,  0x00,  0x42,  0x00,  0x43,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x65,  0x00,  0x74,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x68,  0x00,  0x69,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x63,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x63,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0004: STR_INV_FORM1_TITLE:0x0004
+  0x14,  0x41,  0x00,  0x42,  0x00,  0x43,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x65,  0x00,  0x74,  0x00,  0x77,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x56,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x0005: STR_INV_VERSION_TEXT:0x0005
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  
+  0x00,  0x30,  0x00,  0x32,  0x00,  0x2F,  0x00,  0x30,  0x00,  0x33,  0x00,  0x2F,  0x00,  0x32,  0x00,  0x30,  
+  0x00,  0x30,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0006: STR_INV_VERSION_HELP:0x0006
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0007: STR_INV_VERSION_TEXT2:0x0007
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x56,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x36,  
+  0x00,  0x2E,  0x00,  0x33,  0x00,  0x32,  0x00,  0x2E,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x0008: STR_INV_VERSION_TEXT3:0x0008
+  0x14,  0x50,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x56,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x31,  
+  0x00,  0x2E,  0x00,  0x30,  0x00,  0x32,  0x00,  0x2E,  0x00,  0x35,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x0009: STR_INV_VERSION_TEXT4:0x0009
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x63,  0x00,  0x73,  0x00,  0x3A,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x31,  0x00,  0x30,  0x00,  0x2F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x62,  0x00,  0x2F,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000A: STR_INV_VERSION_TEXT5:0x000A
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x2E,  0x00,  0x33,  0x00,  0x20,  0x00,  0x56,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000B: STR_INV_VERSION_TEXT6:0x000B
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x54,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x46,  0x00,  0x49,  
+  0x00,  0x46,  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x000C: STR_INV_VERSION_TEXT7:0x000C
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x65,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  0x00,  0x49,  0x00,  0x46,  
+  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x000D: STR_INV_VERSION_TEXT8:0x000D
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  0x00,  0x43,  0x00,  0x50,  0x00,  0x2F,  0x00,  0x55,  0x00,  0x44,  
+  0x00,  0x50,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x73,  
+  0x00,  0x75,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x6F,  
+  0x00,  0x61,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x000E: STR_INV_VERSION_TEXT9:0x000E
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x31,  0x00,  0x32,  0x00,  0x38,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  0x00,
+// 0x000F: STR_INV_VERSION_TEXT10:0x000F
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x32,  0x00,  0x2D,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x50,  0x00,  0x43,  0x00,  0x49,  0x00,  0x00,  0x00,
+// 0x0010: STR_INV_VERSION_TEXT11:0x0010
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6C,  0x00,  0xAE,  
+  0x00,  0x20,  0x00,  0x38,  0x00,  0x32,  0x00,  0x35,  0x00,  0x34,  0x00,  0x30,  0x00,  0x45,  0x00,  0x4D,  
+  0x00,  0x00,  0x00,
+// 0x0011: STR_INV_VERSION_TEXT12:0x0011
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x45,  0x00,  0x53,  
+  0x00,  0x43,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0012: STR_INV_EMPTY_STRING:0x0012
+  0x14,  0x00,  0x00,
+// 0x0013: STR_FORM_SET_TITLE:0x0013
+  0x14,  0x42,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0014: STR_FORM_SET_TITLE_HELP:0x0014
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x68,  0x00,  0x69,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x2D,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x73,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x79,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x48,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0xF1,  0xFF,  0x41,  0x00,  0x41,  0x00,  0x41,  
+  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0xF0,  0xFF,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0015: STR_FORM1_TITLE:0x0015
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0016: STR_FORM2_TITLE:0x0016
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0017: STR_FORM3_TITLE:0x0017
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0018: STR_FORM6_TITLE:0x0018
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x53,  0x00,  0x69,  0x00,  0x78,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0019: STR_DYNAMIC_TITLE:0x0019
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x44,  0x00,  0x79,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x001A: STR_SUBTITLE_TEXT:0x001A
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x62,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x001B: STR_SUBTITLE_TEXT2:0x001B
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x001C: STR_CPU_STRING:0x001C
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x43,  0x00,  0x50,  0x00,  0x55,  0x00,  0x20,  0x00,  0x53,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x00,  0x00,
+// 0x001D: STR_CPU_STRING2:0x001D
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x001E: STR_NUMERIC_NUM_HELP:0x001E
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x62,  0x00,  0x65,  0x00,  0x72,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x001F: STR_ONE_OF_PROMPT:0x001F
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x23,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0020: STR_ONE_OF_PROMPT_KEYWORD:0x0020
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x4B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x77,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x54,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0021: STR_CHECK_KEYWORD_SUPPORT:0x0021
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x69,  0x00,  0x53,  
+  0x00,  0x43,  0x00,  0x53,  0x00,  0x49,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0022: STR_ONE_OF_PROMPT_X_UEFI:0x0022
+  0x14,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x48,  
+  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0023: STR_ONE_OF_PROMPT_X_UEFI_HELP:0x0023
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x52,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x53,  0x00,  0x54,  0x00,  0x59,  
+  0x00,  0x4C,  0x00,  0x45,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  
+  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x55,  0x00,  0x4E,  0x00,  0x49,  
+  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x69,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  0x00,  0x65,  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x2D,  0x00,  0x62,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x64,  0x00,  0x6B,  0x00,  0x32,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2D,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x2D,  
+  0x00,  0x62,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x63,  
+  0x00,  0x68,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x76,  0x00,  0x69,  0x00,  0x63,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x5F,  
+  0x00,  0x4B,  0x00,  0x45,  0x00,  0x59,  0x00,  0x57,  0x00,  0x4F,  0x00,  0x52,  0x00,  0x44,  0x00,  0x5F,  
+  0x00,  0x48,  0x00,  0x41,  0x00,  0x4E,  0x00,  0x44,  0x00,  0x4C,  0x00,  0x45,  0x00,  0x52,  0x00,  0x5F,  
+  0x00,  0x50,  0x00,  0x52,  0x00,  0x4F,  0x00,  0x54,  0x00,  0x4F,  0x00,  0x43,  0x00,  0x4F,  0x00,  0x4C,  
+  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0024: STR_ONE_OF_PROMPT_NON_X_UEFI:0x0024
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  
+  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0025: STR_ONE_OF_PROMPT_NON_X_UEFI_HELP:0x0025
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x69,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x52,  
+  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x53,  0x00,  0x54,  0x00,  0x59,  0x00,  0x4C,  
+  0x00,  0x45,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x67,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x78,  
+  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x63,  
+  0x00,  0x69,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  0x00,  0x65,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x74,  0x00,  0x2D,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x2D,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x64,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x76,  0x00,  0x69,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x67,  
+  0x00,  0x68,  0x00,  0x20,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  
+  0x00,  0x49,  0x00,  0x20,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x52,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x6E,  0x00,  0x27,  0x00,  0x74,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0026: STR_ONE_OF_HELP:0x0026
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x63,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x62,  
+  0x00,  0x69,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x74,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x49,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x70,  0x00,  0x61,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x6C,  0x00,  0x69,  0x00,  0x74,  0x00,  0x69,  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0027: STR_ONE_OF_TEXT1:0x0027
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x23,  
+  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0028: STR_ONE_OF_TEXT2:0x0028
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x23,  
+  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0029: STR_ONE_OF_TEXT3:0x0029
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x23,  
+  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x002A: STR_ONE_OF_TEXT4:0x002A
+  0x14,  0x53,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x002B: STR_ONE_OF_TEXT5:0x002B
+  0x14,  0x47,  0x00,  0x72,  0x00,  0x61,  0x00,  0x79,  0x00,  0x4F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x002C: STR_ONE_OF_TEXT6:0x002C
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x43,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  
+  0x00,
+// 0x002D: STR_BOOT_ORDER1:0x002D
+  0x14,  0x53,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x4C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002E: STR_BOOT_ORDER2:0x002E
+  0x14,  0x4C,  0x00,  0x61,  0x00,  0x72,  0x00,  0x67,  0x00,  0x65,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x4C,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x002F: STR_CHECK_BOX_PROMPT:0x002F
+  0x14,  0x41,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  
+  0x00,
+// 0x0030: STR_CHECK_BOX_HELP:0x0030
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x7A,  0x00,  0x65,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  
+  0x00,  0x78,  0x00,  0x65,  0x00,  0x73,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x66,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x69,  0x00,  0x67,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0031: STR_NUMERIC_STEP_PROMPT:0x0031
+  0x14,  0x48,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x3F,  
+  0x00,  0x20,  0x00,  0x28,  0x00,  0x53,  0x00,  0x74,  0x00,  0x65,  0x00,  0x70,  0x00,  0x29,  0x00,  0x00,  
+  0x00,
+// 0x0032: STR_NUMERIC_READONLY_PROMPT:0x0032
+  0x14,  0x48,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x3F,  
+  0x00,  0x28,  0x00,  0x52,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6C,  
+  0x00,  0x79,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0033: STR_NUMERIC_MANUAL_PROMPT:0x0033
+  0x14,  0x48,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x3F,  
+  0x00,  0x20,  0x00,  0x28,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0034: STR_TALL_HEX_PROMPT:0x0034
+  0x14,  0x48,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  
+  0x00,  0x3F,  0x00,  0x20,  0x00,  0x28,  0x00,  0x48,  0x00,  0x65,  0x00,  0x78,  0x00,  0x29,  0x00,  0x00,  
+  0x00,
+// 0x0035: STR_NUMERIC_HELP0:0x0035
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  0x00,  0x34,  0x00,  0x30,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0036: STR_NUMERIC_HELP1:0x0036
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x79,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x67,  0x00,  0x68,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  0x00,  0x79,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  0x00,  0x35,  0x00,  0x30,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0037: STR_NUMERIC_HELP2:0x0037
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x41,  
+  0x00,  0x64,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  
+  0x00,  0x34,  0x00,  0x33,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x31,  0x00,  0x2E,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0038: STR_TEXT_SECRUITY_TEST_TEXT:0x0038
+  0x14,  0x41,  0x00,  0x63,  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x41,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x0039: STR_TEXT_SECRUITY_TEST_HELP:0x0039
+  0x14,  0x49,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x62,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x67,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x62,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x67,  0x00,  0x72,  0x00,  0x61,  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x003A: STR_GOTO_FORM1:0x003A
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x003B: STR_GOTO_FORM2:0x003B
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x003C: STR_GOTO_FORM3:0x003C
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x003D: STR_GOTO_FORM4:0x003D
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x34,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x003E: STR_GOTO_FORM6:0x003E
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x36,  0x00,  0x00,  0x00,
+// 0x003F: STR_GOTO_FORM5:0x003F
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x35,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0040: STR_GOTO_FORM5_HELP:0x0040
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x6D,  0x00,  0x75,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0041: STR_GOTO_DYNAMIC:0x0041
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x44,  0x00,  0x79,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x2B,  0x00,  0x00,  0x00,
+// 0x0042: STR_GOTO_DYNAMIC2:0x0042
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  0x00,  0x44,  0x00,  0x79,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0043: STR_GOTO_DYNAMIC3:0x0043
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0044: STR_GOTO_DYNAMIC4:0x0044
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x0045: STR_GOTO_DYNAMIC3_HELP:0x0045
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x22,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x22,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0046: STR_GOTO_DYNAMIC4_HELP:0x0046
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x22,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x22,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0047: STR_ERROR_POPUP:0x0047
+  0x14,  0x59,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x61,  0x00,  0x64,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0048: STR_MY_STRING_PROMPT2:0x0048
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x2D,  
+  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0049: STR_MY_STRING_HELP2:0x0049
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x20,  0x00,  0x2D,  
+  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004A: STR_TEXT_TEXT_1:0x004A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x31,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x004B: STR_TEXT_TEXT_2:0x004B
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x32,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x004C: STR_DATE_PROMPT:0x004C
+  0x14,  0x53,  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x44,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004D: STR_DATE_HELP:0x004D
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x6D,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x68,  0x00,  0x2F,  0x00,  0x64,  0x00,  0x61,  0x00,  0x79,  
+  0x00,  0x2F,  0x00,  0x79,  0x00,  0x65,  0x00,  0x61,  0x00,  0x72,  0x00,  0x29,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x28,  0x00,  0x45,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x67,  0x00,  0x61,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x2F,  0x00,  0x64,  0x00,  0x61,  0x00,  0x79,  0x00,  0x2F,  0x00,  0x79,  
+  0x00,  0x65,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x62,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  
+  0x00,  0x70,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  
+  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x004E: STR_TIME_PROMPT:0x004E
+  0x14,  0x53,  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004F: STR_TIME_HELP:0x004F
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x28,  0x00,  0x68,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x72,  0x00,  0x2F,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x75,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x73,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x29,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0050: STR_TEXT_HELP:0x0050
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0051: STR_GOTO_HELP:0x0051
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0052: STR_TEST_OPCODE:0x0052
+  0x14,  0x50,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0053: STR_TEST_OPCODE2:0x0053
+  0x14,  0x50,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0054: STR_EXIT_TEXT:0x0054
+  0x14,  0x45,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  
+  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0055: STR_SAVE_TEXT:0x0055
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  
+  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0056: STR_DISCARD_CURRENT:0x0056
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  
+  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0057: STR_SAVE_CURRENT:0x0057
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0058: STR_DISCARD_CURRENT_AND_EXIT:0x0058
+  0x14,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0059: STR_SAVE_CURRENT_AND_EXIT:0x0059
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x005A: STR_NULL_STRING:0x005A
+  0x14,  0x00,  0x00,
+// 0x005B: STR_STANDARD_DEFAULT_PROMPT:0x005B
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x005C: STR_STANDARD_DEFAULT_HELP:0x005C
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005D: STR_MANUFACTURE_DEFAULT_PROMPT:0x005D
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x005E: STR_MANUFACTURE_DEFAULT_HELP:0x005E
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005F: STR_NAME_VALUE_VAR_NAME0_HELP:0x005F
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x28,  0x00,  0x55,  0x00,  0x49,  0x00,  0x4E,  
+  0x00,  0x54,  0x00,  0x38,  0x00,  0x29,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0060: STR_NAME_VALUE_VAR_NAME1_HELP:0x0060
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x28,  0x00,  0x55,  0x00,  0x49,  0x00,  0x4E,  
+  0x00,  0x54,  0x00,  0x31,  0x00,  0x36,  0x00,  0x29,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0061: STR_NAME_VALUE_VAR_NAME2_HELP:0x0061
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0062: STR_STRING_CHECK:0x0062
+  0x14,  0x53,  0x00,  0x54,  0x00,  0x52,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x47,  0x00,  0x00,  0x00,
+// 0x0063: STR_STRING_CHECK_ERROR_POPUP:0x0063
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0064: STR_TEXT_REFRESH_GUID:0x0064
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x22,  0x00,  0x43,  
+  0x00,  0x74,  0x00,  0x72,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x2B,  0x00,  0x20,  0x00,  0x43,  0x00,  0x22,  
+  0x00,  0x00,  0x00,
+// 0x0065: STR_TEXT_REFRESH_GUID_COUNT:0x0065
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x66,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x0066: STR_MODAL_FORM_TITLE:0x0066
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x00,  0x00,
+// 0x0067: STR_DEFAULT_VALUE_FROM_CALLBACK_PROMPT:0x0067
+  0x14,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0068: STR_DEFAULT_VALUE_FROM_CALLBACK_HELP:0x0068
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x67,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0069: STR_DEFAULT_VALUE_FROM_ACCESS_PROMPT:0x0069
+  0x14,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x006A: STR_DEFAULT_VALUE_FROM_ACCESS_HELP:0x006A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x67,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x45,  0x00,  0x78,  0x00,  0x74,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x43,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  
+  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x006B: STR_GOTO_ANOTHER_FORMSET:0x006B
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x41,  0x00,  0x42,  0x00,  0x43,  
+  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x006C: STR_GOTO_ANOTHER_FORMSET_HELP:0x006C
+  0x14,  0x57,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x006D: STR_DEVICE_PATH:0x006D
+  0x14,  0x00,  0x00,
+// 0x006E: STR_SUBMITTED_CALLBACK_TEST_PROMPT:0x006E
+  0x14,  0x53,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x006F: STR_SUBMITTED_CALLBACK_TEST_HELP:0x006F
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x67,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x55,  0x00,  0x42,  0x00,  0x4D,  0x00,  0x49,  0x00,  0x54,  0x00,  0x54,  0x00,  0x45,  
+  0x00,  0x44,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x67,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0070: STR_POPUP_TEST_PROMPT:0x0070
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x76,  
+  0x00,  0x6F,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x20,  0x00,  0x48,  0x00,  0x69,  0x00,  0x69,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0071: STR_POPUP_TEST_HELP:0x0071
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x20,  0x00,  0x75,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x69,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0072: STR_POPUP_STRING:0x0072
+  0x14,  0x41,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x3F,  0x00,  0x00,  0x00,
+// 0x0073: STR_FORM7_TITLE:0x0073
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0074: STR_GOTO_FORM7:0x0074
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x0075: STR_GOTO_FORM7_HELP:0x0075
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0076: STR_NEST_BIT_EFI_VARSTORE:0x0076
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0077: STR_BIT_EFI_VARSTORE:0x0077
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0078: STR_NEST_BIT_VARSTORE:0x0078
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0079: STR_BIT_VARSTORE:0x0079
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  
+  0x00,  0x66,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x007A: STR_UNION_EFI_VARSTORE:0x007A
+  0x14,  0x55,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x007B: STR_BIT_NEST_CHECK_BOX_PROMPT:0x007B
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x007C: STR_BIT_NEST_CHECK_BOX_HELP:0x007C
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  
+  0x00,
+// 0x007D: STR_ONE_OF_BIT_NEST_PROMPT:0x007D
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x00,  
+  0x00,
+// 0x007E: STR_ONE_OF_BIT_NEST_HELP:0x007E
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x007F: STR_BIT_NEST_NUMERIC_PROMPT:0x007F
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x00,  0x00,
+// 0x0080: STR_BIT_NEST_NUMERIC_HELP:0x0080
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x36,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x0081: BYTE_QUESTION_NEST_BIT_PROMPT:0x0081
+  0x14,  0x55,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x75,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0082: BYTE_QUESTION_NEST_BIT_HELP:0x0082
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  
+  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x75,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0083: STR_BIT_NEST_NUMERIC_DEFAULT_HELP:0x0083
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  
+  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x00,  0x00,
+// 0x0084: STR_BIT_CHECK_BOX_PROMPT:0x0084
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x0085: STR_BIT_CHECK_BOX_HELP:0x0085
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x00,  0x00,
+// 0x0086: STR_ONE_OF_BIT_PROMPT:0x0086
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  
+  0x00,  0x6F,  0x00,  0x66,  0x00,  0x00,  0x00,
+// 0x0087: STR_ONE_OF_BIT_HELP:0x0087
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  
+  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0088: STR_BIT_NUMERIC_PROMPT:0x0088
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x00,  0x00,
+// 0x0089: STR_BIT_NUMERIC_HELP:0x0089
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x34,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x008A: STR_BUFFER_BIT_NUMERIC_HELP:0x008A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x31,  0x00,  0x36,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x31,  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x008B: STR_UNION_BYTE_NUMERIC_PROMPT:0x008B
+  0x14,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x20,  0x00,  0x45,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x00,  0x00,
+// 0x008C: STR_UNION_BYTE_NUMERIC_HELP:0x008C
+  0x14,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x37,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x008D: STR_BOOT_OPTIONS:0x008D
+  0x14,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x008E: STR_BOOT_OPTION1:0x008E
+  0x14,  0x49,  0x00,  0x44,  0x00,  0x45,  0x00,  0x20,  0x00,  0x48,  0x00,  0x44,  0x00,  0x44,  0x00,  0x00,  
+  0x00,
+// 0x008F: STR_BOOT_OPTION2:0x008F
+  0x14,  0x41,  0x00,  0x54,  0x00,  0x41,  0x00,  0x50,  0x00,  0x49,  0x00,  0x20,  0x00,  0x43,  0x00,  0x44,  
+  0x00,  0x00,  0x00,
+// 0x0090: STR_BOOT_OPTION3:0x0090
+  0x14,  0x50,  0x00,  0x58,  0x00,  0x45,  0x00,  0x00,  0x00,
+// 0x0091: STR_BOOT_OPTION4:0x0091
+  0x14,  0x55,  0x00,  0x53,  0x00,  0x42,  0x00,  0x00,  0x00,
+// 0x0092: STR_NAME_VALUE_VAR_NAME0:0x0092
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0093: STR_NAME_VALUE_VAR_NAME1:0x0093
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0094: STR_NAME_VALUE_VAR_NAME2:0x0094
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0095: STR_SAMPL_MAP_METHOD:0x0095
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4D,  
+  0x00,  0x61,  0x00,  0x70,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  
+  0x00,
+// 0x0096: STR_STANDARD_MAP_METHOD:0x0096
+  0x14,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0097: STR_SERIAL_PORT:0x0097
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0098: STR_SERIAL_PORT_DISABLE:0x0098
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0099: STR_SERIAL_PORT1:0x0099
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x009A: STR_SERIAL_PORT2:0x009A
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x009B: STR_SERIAL_PORT3:0x009B
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x009C: STR_SERIAL_PORT4:0x009C
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x34,  0x00,  0x00,  0x00,
+// 0x009D: STR_SERIAL_PORT_STATUS:0x009D
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x009E: STR_SERIAL_PORT_IO_ADDRESS:0x009E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x64,  0x00,  0x64,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x009F: STR_SERIAL_PORT_IRQ:0x009F
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x49,  0x00,  0x52,  0x00,  0x51,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A0: STR_SERIAL_PORT1_IOADDR:0x00A0
+  0x14,  0x33,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A1: STR_SERIAL_PORT2_IOADDR:0x00A1
+  0x14,  0x32,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A2: STR_SERIAL_PORT3_IOADDR:0x00A2
+  0x14,  0x33,  0x00,  0x45,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A3: STR_SERIAL_PORT4_IOADDR:0x00A3
+  0x14,  0x32,  0x00,  0x45,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A4: STR_SERIAL_PORT13_IRQ:0x00A4
+  0x14,  0x34,  0x00,  0x00,  0x00,
+// 0x00A5: STR_SERIAL_PORT24_IRQ:0x00A5
+  0x14,  0x33,  0x00,  0x00,  0x00,
+// 0x00A6: STR_TEXT_SAMPLE_HELP:0x00A6
+  0x14,  0x54,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x48,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x00A7: STR_TEXT_SAMPLE_STRING:0x00A7
+  0x14,  0x54,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A8: STR_DATE_SAMPLE_HELP:0x00A8
+  0x14,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A9: STR_TIME_SAMPLE_HELP:0x00A9
+  0x14,  0x54,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00AA: FUNCTION_NINE_STRING:0x00AA
+  0x14,  0x46,  0x00,  0x39,  0x00,  0x3D,  0x00,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x00AB: FUNCTION_TEN_STRING:0x00AB
+  0x14,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x3D,  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x00AC: STR_WARNING_POPUP:0x00AC
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x6D,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x00AD: STR_MATCH2_PROMPT:0x00AD
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x00AE: STR_MATCH2_HELP:0x00AE
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x00AF: STR_STRING:0x00AF
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x00B0: STR_PATTERN:0x00B0
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0x65,  0x33,  0x00,  0x04,  0x34,  0x00,  0x00,  0x00,  0x34,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x66,  0x72,  
+  0x2D,  0x46,  0x52,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x46,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x61,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x00,  0x00,
+// 0x0002: STR_INV_FORM_SET_TITLE:0x0002
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x73,  0x00,  0x70,  0x00,  0x61,  0x00,  0xF1,  0x00,  0x6F,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x67,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x0003: STR_INV_FORM_SET_HELP:0x0003
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x41,  0x00,  0x42,  0x00,  0x43,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x65,  0x00,  0x74,  0x00,  0x77,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6B,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x68,  0x00,  0x69,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x63,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x70,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x63,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0004: STR_INV_FORM1_TITLE:0x0004
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x41,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x67,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x50,  0x00,  0xE1,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x0005: STR_INV_VERSION_TEXT:0x0005
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x3A,  0x00,  0x20,  
+  0x00,  0x30,  0x00,  0x32,  0x00,  0x2F,  0x00,  0x30,  0x00,  0x33,  0x00,  0x2F,  0x00,  0x32,  0x00,  0x30,  
+  0x00,  0x30,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0006: STR_INV_VERSION_HELP:0x0006
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x76,  0x00,  0x69,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x77,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x75,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0007: STR_INV_VERSION_TEXT2:0x0007
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x56,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x36,  
+  0x00,  0x2E,  0x00,  0x33,  0x00,  0x32,  0x00,  0x2E,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x0008: STR_INV_VERSION_TEXT3:0x0008
+  0x14,  0x50,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x56,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x3A,  0x00,  0x20,  0x00,  0x31,  
+  0x00,  0x2E,  0x00,  0x30,  0x00,  0x32,  0x00,  0x2E,  0x00,  0x35,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x0009: STR_INV_VERSION_TEXT4:0x0009
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x63,  0x00,  0x73,  0x00,  0x3A,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x31,  0x00,  0x30,  0x00,  0x2F,  0x00,  0x31,  0x00,  0x30,  0x00,  0x30,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x62,  0x00,  0x2F,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x000A: STR_INV_VERSION_TEXT5:0x000A
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x2E,  0x00,  0x33,  0x00,  0x20,  0x00,  0x56,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x000B: STR_INV_VERSION_TEXT6:0x000B
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x54,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x73,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x46,  0x00,  0x49,  
+  0x00,  0x46,  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x000C: STR_INV_VERSION_TEXT7:0x000C
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x52,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x65,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  0x00,  0x49,  0x00,  0x46,  
+  0x00,  0x4F,  0x00,  0x00,  0x00,
+// 0x000D: STR_INV_VERSION_TEXT8:0x000D
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  0x00,  0x43,  0x00,  0x50,  0x00,  0x2F,  0x00,  0x55,  0x00,  0x44,  
+  0x00,  0x50,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x73,  
+  0x00,  0x75,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x66,  0x00,  0x6C,  0x00,  0x6F,  
+  0x00,  0x61,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x000E: STR_INV_VERSION_TEXT9:0x000E
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x31,  0x00,  0x32,  0x00,  0x38,  0x00,  0x4B,  0x00,  0x20,  0x00,  0x46,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  0x00,
+// 0x000F: STR_INV_VERSION_TEXT10:0x000F
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x33,  0x00,  0x32,  0x00,  0x2D,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x50,  0x00,  0x43,  0x00,  0x49,  0x00,  0x00,  0x00,
+// 0x0010: STR_INV_VERSION_TEXT11:0x0010
+  0x14,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6C,  0x00,  0xAE,  
+  0x00,  0x20,  0x00,  0x38,  0x00,  0x32,  0x00,  0x35,  0x00,  0x34,  0x00,  0x30,  0x00,  0x45,  0x00,  0x4D,  
+  0x00,  0x00,  0x00,
+// 0x0011: STR_INV_VERSION_TEXT12:0x0011
+  0x14,  0x50,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x45,  0x00,  0x53,  
+  0x00,  0x43,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0012: STR_INV_EMPTY_STRING:0x0012
+  0x14,  0x00,  0x00,
+// 0x0013: STR_FORM_SET_TITLE:0x0013
+  0x14,  0x42,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x54,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0014: STR_FORM_SET_TITLE_HELP:0x0014
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x20,  0x00,  0x73,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x72,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x77,  0x00,  0x68,  0x00,  0x69,  0x00,  0x63,  0x00,  0x68,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x2D,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x73,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x62,  0x00,  0x75,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x79,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x70,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x74,  
+  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x48,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0xF1,  0xFF,  0x41,  0x00,  0x41,  0x00,  0x41,  
+  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0xF0,  0xFF,  0x20,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x41,  0x00,  0x41,  0x00,  0x41,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x0015: STR_FORM1_TITLE:0x0015
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x41,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x67,  
+  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x50,  0x00,  0xE1,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x0016: STR_FORM2_TITLE:0x0016
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x67,  0x00,  0x75,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0xF3,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x73,  0x00,  0x69,  0x00,  0x63,  0x00,  0x69,  0x00,  0xF3,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x0017: STR_FORM3_TITLE:0x0017
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x54,  0x00,  0x65,  0x00,  0x72,  0x00,  0x63,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x61,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0xF3,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x73,  0x00,  0x69,  0x00,  0x63,  0x00,  0x69,  0x00,  0xF3,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x0018: STR_FORM6_TITLE:0x0018
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x53,  0x00,  0x69,  0x00,  0x78,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x20,  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0019: STR_DYNAMIC_TITLE:0x0019
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x44,  0x00,  0x79,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x73,  0x00,  0x68,  0x00,  0x00,  
+  0x00,
+// 0x001A: STR_SUBTITLE_TEXT:0x001A
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x62,  
+  0x00,  0x74,  0x00,  0xED,  0x00,  0x74,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x001B: STR_SUBTITLE_TEXT2:0x001B
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x001C: STR_CPU_STRING:0x001C
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x43,  0x00,  0x50,  0x00,  0x55,  0x00,  0x20,  0x00,  0x53,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x00,  0x00,
+// 0x001D: STR_CPU_STRING2:0x001D
+  0x14,  0x20,  0x00,  0x00,  0x00,
+// 0x001E: STR_NUMERIC_NUM_HELP:0x001E
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x70,  0x00,  0x75,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x62,  0x00,  0x65,  0x00,  0x72,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x001F: STR_ONE_OF_PROMPT:0x001F
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x67,  0x00,  0x75,  0x00,  0xED,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x23,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0020: STR_ONE_OF_PROMPT_KEYWORD:0x0020
+  0x14,  0x4D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x4B,  0x00,  0x65,  0x00,  0x79,  0x00,  0x77,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x20,  0x00,  0x54,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0021: STR_CHECK_KEYWORD_SUPPORT:0x0021
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x69,  0x00,  0x53,  
+  0x00,  0x43,  0x00,  0x53,  0x00,  0x49,  0x00,  0x20,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0022: STR_ONE_OF_PROMPT_X_UEFI:0x0022
+  0x14,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x48,  
+  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x00,  0x00,
+  0x21,  0x01,  0x00,
+// 0x0024: STR_ONE_OF_PROMPT_NON_X_UEFI:0x0024
+  0x14,  0x4E,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x78,  0x00,  0x2D,  0x00,  0x55,  0x00,  0x45,  
+  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x48,  0x00,  0x49,  0x00,  0x49,  0x00,  0x20,  0x00,  0x4F,  
+  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+  0x21,  0x01,  0x00,
+// 0x0026: STR_ONE_OF_HELP:0x0026
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0x79,  0x00,  0x75,  0x00,  0x64,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x67,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x62,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x63,  
+  0x00,  0x61,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0x64,  0x00,  0x61,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  
+  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0x64,  0x00,  0x61,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x73,  0x00,  0x61,  0x00,  0x72,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0027: STR_ONE_OF_TEXT1:0x0027
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0028: STR_ONE_OF_TEXT2:0x0028
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0029: STR_ONE_OF_TEXT3:0x0029
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x002A: STR_ONE_OF_TEXT4:0x002A
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x34,  0x00,  0x00,  0x00,
+// 0x002B: STR_ONE_OF_TEXT5:0x002B
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x002C: STR_ONE_OF_TEXT6:0x002C
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x36,  0x00,  0x00,  0x00,
+// 0x002D: STR_BOOT_ORDER1:0x002D
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x002E: STR_BOOT_ORDER2:0x002E
+  0x14,  0x4D,  0x00,  0x69,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x2D,  0x00,  0x20,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x23,  0x00,  0x20,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x002F: STR_CHECK_BOX_PROMPT:0x002F
+  0x14,  0x41,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4C,  
+  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x41,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x4E,  0x00,  0x75,  0x00,  0x63,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x0030: STR_CHECK_BOX_HELP:0x0030
+  0x14,  0xC9,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x6A,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x79,  0x00,  0x75,  0x00,  0x64,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x63,  0x00,  0x69,  0x00,  0xF3,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x63,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x61,  0x00,  0x72,  0x00,  0x2E,  
+  0x00,  0x20,  0x00,  0x43,  0x00,  0x75,  0x00,  0xE1,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x63,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x6F,  0x00,  0x62,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x6F,  0x00,  0x3F,  0x00,  0x00,  0x00,
+// 0x0031: STR_NUMERIC_STEP_PROMPT:0x0031
+  0x14,  0x43,  0x00,  0xF3,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x76,  0x00,  0x69,  0x00,  0x65,  
+  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x3F,  0x00,  0x28,  0x00,  0x53,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x70,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0032: STR_NUMERIC_READONLY_PROMPT:0x0032
+  0x14,  0x43,  0x00,  0xF3,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x76,  0x00,  0x69,  0x00,  0x65,  
+  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x3F,  0x00,  0x28,  0x00,  0x52,  0x00,  0x65,  0x00,  0x61,  
+  0x00,  0x64,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x6C,  0x00,  0x79,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0033: STR_NUMERIC_MANUAL_PROMPT:0x0033
+  0x14,  0x43,  0x00,  0xF3,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x76,  0x00,  0x69,  0x00,  0x65,  
+  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x3F,  0x00,  0x20,  0x00,  0x28,  0x00,  0x4D,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0034: STR_TALL_HEX_PROMPT:0x0034
+  0x14,  0x43,  0x00,  0xF3,  0x00,  0x6D,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x76,  0x00,  0x69,  0x00,  0x65,  
+  0x00,  0x6A,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x3F,  0x00,  0x20,  0x00,  0x28,  0x00,  0x48,  0x00,  0x65,  
+  0x00,  0x78,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0035: STR_NUMERIC_HELP0:0x0035
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  0x00,  0x34,  0x00,  0x30,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0036: STR_NUMERIC_HELP1:0x0036
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x20,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x79,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x67,  0x00,  0x68,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x54,  0x00,  0x79,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  0x00,  0x35,  0x00,  0x30,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0037: STR_NUMERIC_HELP2:0x0037
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x41,  
+  0x00,  0x64,  0x00,  0x6A,  0x00,  0x75,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x68,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x20,  0x00,  0x54,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x30,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x32,  
+  0x00,  0x34,  0x00,  0x33,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x70,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x31,  0x00,  0x2E,  
+  0x00,  0x20,  0x00,  0x20,  0x00,  0x4C,  0x00,  0x65,  0x00,  0x74,  0x00,  0x27,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x66,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x61,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x67,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0038: STR_TEXT_SECRUITY_TEST_TEXT:0x0038
+  0x14,  0x41,  0x00,  0x63,  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x6C,  0x00,  0x79,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x41,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x00,  
+  0x00,
+// 0x0039: STR_TEXT_SECRUITY_TEST_HELP:0x0039
+  0x14,  0x49,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x62,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x67,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x66,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x62,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x67,  0x00,  0x72,  0x00,  0x61,  0x00,  0x79,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x64,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x63,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x70,  0x00,  0x65,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x003A: STR_GOTO_FORM1:0x003A
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x31,  
+  0x00,  0x00,  0x00,
+// 0x003B: STR_GOTO_FORM2:0x003B
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x32,  
+  0x00,  0x00,  0x00,
+// 0x003C: STR_GOTO_FORM3:0x003C
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x33,  
+  0x00,  0x00,  0x00,
+// 0x003D: STR_GOTO_FORM4:0x003D
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x72,  0x00,  0x20,  0x00,  0x34,  
+  0x00,  0x00,  0x00,
+// 0x003E: STR_GOTO_FORM6:0x003E
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x36,  0x00,  0x00,  0x00,
+// 0x003F: STR_GOTO_FORM5:0x003F
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x35,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+// 0x0040: STR_GOTO_FORM5_HELP:0x0040
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  
+  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x6D,  0x00,  0x75,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0041: STR_GOTO_DYNAMIC:0x0041
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0xE1,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  0x00,  0x79,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x0042: STR_GOTO_DYNAMIC2:0x0042
+  0x14,  0x56,  0x00,  0x61,  0x00,  0x79,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0xE1,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  0x00,  0x79,  0x00,  0x6E,  
+  0x00,  0x61,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x00,  0x00,
+// 0x0043: STR_GOTO_DYNAMIC3:0x0043
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0044: STR_GOTO_DYNAMIC4:0x0044
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x0045: STR_GOTO_DYNAMIC3_HELP:0x0045
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x22,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x22,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x65,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  
+  0x00,
+// 0x0046: STR_GOTO_DYNAMIC4_HELP:0x0046
+  0x14,  0x55,  0x00,  0x70,  0x00,  0x64,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x67,  0x00,  0x68,  0x00,  0x20,  0x00,  0x22,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  
+  0x00,  0x22,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0047: STR_ERROR_POPUP:0x0047
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x75,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x6A,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x75,  0x00,  0x70,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0048: STR_MY_STRING_PROMPT2:0x0048
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x2D,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0049: STR_MY_STRING_HELP2:0x0049
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x20,  0x00,  0x2D,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x76,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x004A: STR_TEXT_TEXT_1:0x004A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x31,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x004B: STR_TEXT_TEXT_2:0x004B
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x32,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x61,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x49,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x00,  0x00,
+// 0x004C: STR_DATE_PROMPT:0x004C
+  0x14,  0x46,  0x00,  0x65,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x73,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x6D,  
+  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x004D: STR_DATE_HELP:0x004D
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x79,  0x00,  0x75,  0x00,  0x64,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x20,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x46,  0x00,  0x65,  0x00,  0x63,  0x00,  0x68,  0x00,  0x61,  0x00,  0x20,  0x00,  0x28,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x2F,  0x00,  0x64,  0x00,  0xED,  0x00,  0x61,  0x00,  0x2F,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x73,  0x00,  0x29,  0x00,  0x2E,  0x00,  0x20,  0x00,  0x28,  0x00,  0x56,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x66,  0x00,  0x69,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x72,  0x00,  0x72,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0xE1,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x76,  0x00,  0x65,  0x00,  0x7A,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x2F,  0x00,  0x64,  0x00,  0xED,  0x00,  0x61,  0x00,  0x2F,  0x00,  0x6C,  0x00,  0x61,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x62,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x61,  0x00,  0xF1,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x6F,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x2E,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x004E: STR_TIME_PROMPT:0x004E
+  0x14,  0x54,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x73,  0x00,  0x69,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x6D,  0x00,  0x61,  0x00,  0x00,  0x00,
+// 0x004F: STR_TIME_HELP:0x004F
+  0x14,  0x45,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6C,  0x00,  0x61,  0x00,  0x20,  0x00,  0x61,  0x00,  0x79,  0x00,  0x75,  0x00,  0x64,  0x00,  0x61,  
+  0x00,  0x20,  0x00,  0x70,  0x00,  0x61,  0x00,  0x72,  0x00,  0x61,  0x00,  0x20,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x54,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x28,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  0x00,  0x2F,  0x00,  0x6D,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x75,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x2F,  0x00,  0x73,  0x00,  0x65,  0x00,  0x67,  
+  0x00,  0x75,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x6F,  0x00,  0x29,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x0050: STR_TEXT_HELP:0x0050
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0051: STR_GOTO_HELP:0x0051
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x79,  0x00,  0x20,  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x0052: STR_TEST_OPCODE:0x0052
+  0x14,  0x50,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0053: STR_TEST_OPCODE2:0x0053
+  0x14,  0x50,  0x00,  0x69,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0054: STR_EXIT_TEXT:0x0054
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x61,  0x00,  0x68,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0055: STR_SAVE_TEXT:0x0055
+  0x14,  0x28,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x68,  0x00,  0x29,  
+  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  
+  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0056: STR_DISCARD_CURRENT:0x0056
+  0x14,  0x28,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x68,  0x00,  0x29,  
+  0x00,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  
+  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0057: STR_SAVE_CURRENT:0x0057
+  0x14,  0x28,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x68,  0x00,  0x29,  
+  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0058: STR_DISCARD_CURRENT_AND_EXIT:0x0058
+  0x14,  0x28,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x68,  0x00,  0x29,  
+  0x00,  0x44,  0x00,  0x69,  0x00,  0x73,  0x00,  0x63,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  
+  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0059: STR_SAVE_CURRENT_AND_EXIT:0x0059
+  0x14,  0x28,  0x00,  0x46,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x68,  0x00,  0x29,  
+  0x00,  0x53,  0x00,  0x61,  0x00,  0x76,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x21,  0x00,  0x00,  
+  0x00,
+// 0x005A: STR_NULL_STRING:0x005A
+  0x14,  0x00,  0x00,
+// 0x005B: STR_STANDARD_DEFAULT_PROMPT:0x005B
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x005C: STR_STANDARD_DEFAULT_HELP:0x005C
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005D: STR_MANUFACTURE_DEFAULT_PROMPT:0x005D
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  
+  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x44,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x005E: STR_MANUFACTURE_DEFAULT_HELP:0x005E
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x69,  0x00,  0x72,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x005F: STR_NAME_VALUE_VAR_NAME0_HELP:0x005F
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x28,  0x00,  0x55,  0x00,  0x49,  0x00,  0x4E,  
+  0x00,  0x54,  0x00,  0x38,  0x00,  0x29,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x30,  0x00,  0x00,  0x00,
+// 0x0060: STR_NAME_VALUE_VAR_NAME1_HELP:0x0060
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x28,  0x00,  0x55,  0x00,  0x49,  0x00,  0x4E,  
+  0x00,  0x54,  0x00,  0x31,  0x00,  0x36,  0x00,  0x29,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  
+  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  
+  0x00,  0x72,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x0061: STR_NAME_VALUE_VAR_NAME2_HELP:0x0061
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x2F,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  
+  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x0062: STR_STRING_CHECK:0x0062
+  0x14,  0x53,  0x00,  0x54,  0x00,  0x52,  0x00,  0x49,  0x00,  0x4E,  0x00,  0x47,  0x00,  0x00,  0x00,
+// 0x0063: STR_STRING_CHECK_ERROR_POPUP:0x0063
+  0x14,  0x53,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x79,  
+  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  0x00,  0x70,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x21,  0x00,  0x00,  0x00,
+// 0x0064: STR_TEXT_REFRESH_GUID:0x0064
+  0x14,  0x41,  0x00,  0x64,  0x00,  0x64,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x6D,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x20,  
+  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x22,  0x00,  0x43,  
+  0x00,  0x74,  0x00,  0x72,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x2B,  0x00,  0x20,  0x00,  0x43,  0x00,  0x22,  
+  0x00,  0x00,  0x00,
+// 0x0065: STR_TEXT_REFRESH_GUID_COUNT:0x0065
+  0x14,  0x52,  0x00,  0x65,  0x00,  0x66,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x68,  0x00,  0x20,  
+  0x00,  0x67,  0x00,  0x75,  0x00,  0x69,  0x00,  0x64,  0x00,  0x20,  0x00,  0x65,  0x00,  0x76,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x74,  
+  0x00,  0x00,  0x00,
+// 0x0066: STR_MODAL_FORM_TITLE:0x0066
+  0x14,  0x46,  0x00,  0x69,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x6F,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x00,  0x00,
+// 0x0067: STR_DEFAULT_VALUE_FROM_CALLBACK_PROMPT:0x0067
+  0x14,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  
+  0x00,  0x20,  0x00,  0x42,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0068: STR_DEFAULT_VALUE_FROM_CALLBACK_HELP:0x0068
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x67,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x62,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x0069: STR_DEFAULT_VALUE_FROM_ACCESS_PROMPT:0x0069
+  0x14,  0x47,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x45,  0x00,  0x78,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x43,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x006A: STR_DEFAULT_VALUE_FROM_ACCESS_HELP:0x006A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x20,  0x00,  0x67,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x20,  
+  0x00,  0x45,  0x00,  0x78,  0x00,  0x74,  0x00,  0x72,  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x43,  
+  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x69,  0x00,  0x67,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  
+  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+// 0x006B: STR_GOTO_ANOTHER_FORMSET:0x006B
+  0x14,  0x47,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x41,  0x00,  0x42,  0x00,  0x43,  
+  0x00,  0x20,  0x00,  0x49,  0x00,  0x6E,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x61,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x53,  0x00,  0x65,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x006C: STR_GOTO_ANOTHER_FORMSET_HELP:0x006C
+  0x14,  0x57,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x73,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x62,  0x00,  0x72,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x67,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  
+  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x006D: STR_DEVICE_PATH:0x006D
+  0x14,  0x00,  0x00,
+// 0x006E: STR_SUBMITTED_CALLBACK_TEST_PROMPT:0x006E
+  0x14,  0x53,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  
+  0x00,
+// 0x006F: STR_SUBMITTED_CALLBACK_TEST_HELP:0x006F
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x70,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x75,  0x00,  0x62,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6F,  0x00,  0x67,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x73,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x55,  0x00,  0x42,  0x00,  0x4D,  0x00,  0x49,  0x00,  0x54,  0x00,  0x54,  0x00,  0x45,  
+  0x00,  0x44,  0x00,  0x20,  0x00,  0x43,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x68,  0x00,  0x61,  0x00,  0x73,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x72,  0x00,  0x69,  0x00,  0x67,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x72,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0070: STR_POPUP_TEST_PROMPT:0x0070
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x76,  
+  0x00,  0x6F,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x20,  0x00,  0x48,  0x00,  0x69,  0x00,  0x69,  0x00,  0x20,  
+  0x00,  0x50,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x75,  0x00,  0x70,  0x00,  0x20,  0x00,  0x50,  0x00,  0x72,  
+  0x00,  0x6F,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6C,  0x00,  0x00,  0x00,
+// 0x0071: STR_POPUP_TEST_HELP:0x0071
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x63,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x77,  0x00,  0x69,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  0x00,  0x6F,  0x00,  0x70,  0x00,  0x20,  0x00,  0x75,  0x00,  0x70,  
+  0x00,  0x20,  0x00,  0x61,  0x00,  0x20,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x63,  0x00,  0x69,  0x00,  0x64,  0x00,  0x65,  0x00,  0x20,  0x00,  0x77,  0x00,  0x68,  0x00,  0x65,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x6F,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x0072: STR_POPUP_STRING:0x0072
+  0x14,  0x41,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x79,  0x00,  0x6F,  0x00,  0x75,  0x00,  0x20,  
+  0x00,  0x73,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x65,  0x00,  0x78,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x63,  0x00,  0x75,  0x00,  0x72,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x3F,  0x00,  0x00,  0x00,
+// 0x0073: STR_FORM7_TITLE:0x0073
+  0x14,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0074: STR_GOTO_FORM7:0x0074
+  0x14,  0x45,  0x00,  0x6E,  0x00,  0x74,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x50,  0x00,  0x61,  
+  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x0075: STR_GOTO_FORM7_HELP:0x0075
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x6D,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  
+  0x00,  0x53,  0x00,  0x68,  0x00,  0x6F,  0x00,  0x77,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x73,  0x00,  0x20,  0x00,  0x77,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x68,  0x00,  0x20,  0x00,  0x75,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0076: STR_NEST_BIT_EFI_VARSTORE:0x0076
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0077: STR_BIT_EFI_VARSTORE:0x0077
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0078: STR_NEST_BIT_VARSTORE:0x0078
+  0x14,  0x4E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x00,  0x00,
+// 0x0079: STR_BIT_VARSTORE:0x0079
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x64,  0x00,  0x73,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x62,  0x00,  0x75,  
+  0x00,  0x66,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x007A: STR_UNION_EFI_VARSTORE:0x007A
+  0x14,  0x55,  0x00,  0x6E,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  0x00,  0x72,  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x007B: STR_BIT_NEST_CHECK_BOX_PROMPT:0x007B
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x007C: STR_BIT_NEST_CHECK_BOX_HELP:0x007C
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x64,  0x00,  0x00,  
+  0x00,
+// 0x007D: STR_ONE_OF_BIT_NEST_PROMPT:0x007D
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  0x00,  0x6F,  0x00,  0x66,  0x00,  0x00,  
+  0x00,
+// 0x007E: STR_ONE_OF_BIT_NEST_HELP:0x007E
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x6F,  
+  0x00,  0x66,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  
+  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x007F: STR_BIT_NEST_NUMERIC_PROMPT:0x007F
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x00,  0x00,
+// 0x0080: STR_BIT_NEST_NUMERIC_HELP:0x0080
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x36,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x0081: BYTE_QUESTION_NEST_BIT_PROMPT:0x0081
+  0x14,  0x55,  0x00,  0x73,  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x6E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  
+  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  0x00,  0x75,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0082: BYTE_QUESTION_NEST_BIT_HELP:0x0082
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  
+  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  
+  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  
+  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x73,  0x00,  0x74,  0x00,  0x72,  
+  0x00,  0x75,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0083: STR_BIT_NEST_NUMERIC_DEFAULT_HELP:0x0083
+  0x14,  0x4E,  0x00,  0x45,  0x00,  0x53,  0x00,  0x54,  0x00,  0x5F,  0x00,  0x42,  0x00,  0x49,  0x00,  0x54,  
+  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  
+  0x00,  0x74,  0x00,  0x20,  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x20,  0x00,  0x63,  0x00,  0x61,  0x00,  0x6C,  
+  0x00,  0x6C,  0x00,  0x62,  0x00,  0x61,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x20,  0x00,  0x66,  0x00,  0x75,  
+  0x00,  0x6E,  0x00,  0x63,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x43,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x44,  0x00,  0x00,  0x00,
+// 0x0084: STR_BIT_CHECK_BOX_PROMPT:0x0084
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x00,  0x00,
+// 0x0085: STR_BIT_CHECK_BOX_HELP:0x0085
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  
+  0x00,  0x6B,  0x00,  0x20,  0x00,  0x62,  0x00,  0x6F,  0x00,  0x78,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  
+  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  
+  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x63,  0x00,  0x68,  0x00,  0x65,  0x00,  0x63,  0x00,  0x6B,  0x00,  0x65,  0x00,  0x64,  
+  0x00,  0x00,  0x00,
+// 0x0086: STR_ONE_OF_BIT_PROMPT:0x0086
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  
+  0x00,  0x6F,  0x00,  0x66,  0x00,  0x00,  0x00,
+// 0x0087: STR_ONE_OF_BIT_HELP:0x0087
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x65,  0x00,  0x2D,  
+  0x00,  0x6F,  0x00,  0x66,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  
+  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  0x00,  0x20,  
+  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x00,  0x00,
+// 0x0088: STR_BIT_NUMERIC_PROMPT:0x0088
+  0x14,  0x42,  0x00,  0x49,  0x00,  0x54,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x00,  0x00,
+// 0x0089: STR_BIT_NUMERIC_HELP:0x0089
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x34,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  
+  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  
+  0x00,  0x20,  0x00,  0x35,  0x00,  0x00,  0x00,
+// 0x008A: STR_BUFFER_BIT_NUMERIC_HELP:0x008A
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  
+  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x69,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0x66,  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x2C,  0x00,  0x20,  
+  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  
+  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x31,  0x00,  0x36,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x63,  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  
+  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  
+  0x00,  0x73,  0x00,  0x20,  0x00,  0x31,  0x00,  0x37,  0x00,  0x00,  0x00,
+// 0x008B: STR_UNION_BYTE_NUMERIC_PROMPT:0x008B
+  0x14,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x20,  0x00,  0x45,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x53,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  
+  0x00,  0x65,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6E,  
+  0x00,  0x75,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x63,  0x00,  0x00,  0x00,
+// 0x008C: STR_UNION_BYTE_NUMERIC_HELP:0x008C
+  0x14,  0x51,  0x00,  0x75,  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x66,  0x00,  0x65,  0x00,  0x72,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x6F,  0x00,  0x20,  0x00,  0x62,  0x00,  0x79,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x66,  
+  0x00,  0x69,  0x00,  0x65,  0x00,  0x6C,  0x00,  0x64,  0x00,  0x20,  0x00,  0x69,  0x00,  0x6E,  0x00,  0x20,  
+  0x00,  0x55,  0x00,  0x4E,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x4E,  0x00,  0x20,  0x00,  0x74,  0x00,  0x79,  
+  0x00,  0x70,  0x00,  0x65,  0x00,  0x20,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x76,  0x00,  0x61,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x65,  0x00,  0x2C,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x64,  
+  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  0x00,  0x61,  
+  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x37,  
+  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x66,  0x00,  0x61,  0x00,  0x63,  
+  0x00,  0x74,  0x00,  0x75,  0x00,  0x72,  0x00,  0x65,  0x00,  0x20,  0x00,  0x64,  0x00,  0x65,  0x00,  0x66,  
+  0x00,  0x61,  0x00,  0x75,  0x00,  0x6C,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  
+  0x00,  0x38,  0x00,  0x00,  0x00,
+  0x21,  0x05,  0x00,
+// 0x0092: STR_NAME_VALUE_VAR_NAME0:0x0092
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x30,  0x00,  0x20,  0x00,  0x28,  0x00,  0x66,  
+  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0093: STR_NAME_VALUE_VAR_NAME1:0x0093
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x31,  0x00,  0x20,  0x00,  0x28,  0x00,  0x66,  
+  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0094: STR_NAME_VALUE_VAR_NAME2:0x0094
+  0x14,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  
+  0x00,  0x65,  0x00,  0x56,  0x00,  0x61,  0x00,  0x72,  0x00,  0x32,  0x00,  0x20,  0x00,  0x28,  0x00,  0x66,  
+  0x00,  0x72,  0x00,  0x2D,  0x00,  0x46,  0x00,  0x52,  0x00,  0x29,  0x00,  0x00,  0x00,
+// 0x0095: STR_SAMPL_MAP_METHOD:0x0095
+  0x14,  0x53,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x20,  0x00,  0x4D,  
+  0x00,  0x61,  0x00,  0x70,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  
+  0x00,
+// 0x0096: STR_STANDARD_MAP_METHOD:0x0096
+  0x14,  0x55,  0x00,  0x45,  0x00,  0x46,  0x00,  0x49,  0x00,  0x20,  0x00,  0x53,  0x00,  0x74,  0x00,  0x61,  
+  0x00,  0x6E,  0x00,  0x64,  0x00,  0x61,  0x00,  0x72,  0x00,  0x64,  0x00,  0x20,  0x00,  0x4D,  0x00,  0x61,  
+  0x00,  0x70,  0x00,  0x20,  0x00,  0x46,  0x00,  0x6F,  0x00,  0x72,  0x00,  0x6D,  0x00,  0x00,  0x00,
+// 0x0097: STR_SERIAL_PORT:0x0097
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x6E,  0x00,  0x75,  0x00,  0x6D,  0x00,  0x62,  
+  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x0098: STR_SERIAL_PORT_DISABLE:0x0098
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x64,  0x00,  0x69,  0x00,  0x73,  0x00,  0x61,  
+  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x0099: STR_SERIAL_PORT1:0x0099
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x31,  0x00,  0x00,  0x00,
+// 0x009A: STR_SERIAL_PORT2:0x009A
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x32,  0x00,  0x00,  0x00,
+// 0x009B: STR_SERIAL_PORT3:0x009B
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x33,  0x00,  0x00,  0x00,
+// 0x009C: STR_SERIAL_PORT4:0x009C
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x34,  0x00,  0x00,  0x00,
+// 0x009D: STR_SERIAL_PORT_STATUS:0x009D
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x65,  
+  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x009E: STR_SERIAL_PORT_IO_ADDRESS:0x009E
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x49,  0x00,  0x4F,  0x00,  0x20,  0x00,  0x61,  
+  0x00,  0x64,  0x00,  0x64,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x009F: STR_SERIAL_PORT_IRQ:0x009F
+  0x14,  0x53,  0x00,  0x65,  0x00,  0x72,  0x00,  0x69,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x20,  0x00,  0x70,  
+  0x00,  0x6F,  0x00,  0x72,  0x00,  0x74,  0x00,  0x20,  0x00,  0x49,  0x00,  0x52,  0x00,  0x51,  0x00,  0x20,  
+  0x00,  0x76,  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A0: STR_SERIAL_PORT1_IOADDR:0x00A0
+  0x14,  0x33,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A1: STR_SERIAL_PORT2_IOADDR:0x00A1
+  0x14,  0x32,  0x00,  0x46,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A2: STR_SERIAL_PORT3_IOADDR:0x00A2
+  0x14,  0x33,  0x00,  0x45,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A3: STR_SERIAL_PORT4_IOADDR:0x00A3
+  0x14,  0x32,  0x00,  0x45,  0x00,  0x38,  0x00,  0x00,  0x00,
+// 0x00A4: STR_SERIAL_PORT13_IRQ:0x00A4
+  0x14,  0x34,  0x00,  0x00,  0x00,
+// 0x00A5: STR_SERIAL_PORT24_IRQ:0x00A5
+  0x14,  0x33,  0x00,  0x00,  0x00,
+// 0x00A6: STR_TEXT_SAMPLE_HELP:0x00A6
+  0x14,  0x54,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x48,  0x00,  0x65,  0x00,  0x6C,  
+  0x00,  0x70,  0x00,  0x00,  0x00,
+// 0x00A7: STR_TEXT_SAMPLE_STRING:0x00A7
+  0x14,  0x54,  0x00,  0x65,  0x00,  0x78,  0x00,  0x74,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A8: STR_DATE_SAMPLE_HELP:0x00A8
+  0x14,  0x44,  0x00,  0x61,  0x00,  0x74,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00A9: STR_TIME_SAMPLE_HELP:0x00A9
+  0x14,  0x54,  0x00,  0x69,  0x00,  0x6D,  0x00,  0x65,  0x00,  0x20,  0x00,  0x53,  0x00,  0x61,  0x00,  0x6D,  
+  0x00,  0x70,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  0x00,
+// 0x00AA: FUNCTION_NINE_STRING:0x00AA
+  0x14,  0x46,  0x00,  0x39,  0x00,  0x3D,  0x00,  0x52,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  
+  0x00,  0x20,  0x00,  0xE0,  0x00,  0x20,  0x00,  0x44,  0x00,  0xE9,  0x00,  0x66,  0x00,  0x61,  0x00,  0x75,  
+  0x00,  0x74,  0x00,  0x73,  0x00,  0x00,  0x00,
+// 0x00AB: FUNCTION_TEN_STRING:0x00AB
+  0x14,  0x46,  0x00,  0x31,  0x00,  0x30,  0x00,  0x3D,  0x00,  0xC9,  0x00,  0x63,  0x00,  0x6F,  0x00,  0x6E,  
+  0x00,  0x6F,  0x00,  0x6D,  0x00,  0x69,  0x00,  0x73,  0x00,  0x65,  0x00,  0x72,  0x00,  0x00,  0x00,
+// 0x00AC: STR_WARNING_POPUP:0x00AC
+  0x14,  0x43,  0x00,  0x68,  0x00,  0x61,  0x00,  0x6E,  0x00,  0x67,  0x00,  0x65,  0x00,  0x20,  0x00,  0x76,  
+  0x00,  0x61,  0x00,  0x6C,  0x00,  0x75,  0x00,  0x65,  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x71,  
+  0x00,  0x75,  0x00,  0x69,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  
+  0x00,  0x20,  0x00,  0x72,  0x00,  0x65,  0x00,  0x73,  0x00,  0x65,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  
+  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x73,  0x00,  0x79,  0x00,  0x73,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x6D,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x00AD: STR_MATCH2_PROMPT:0x00AD
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x00AE: STR_MATCH2_HELP:0x00AE
+  0x14,  0x54,  0x00,  0x68,  0x00,  0x69,  0x00,  0x73,  0x00,  0x20,  0x00,  0x71,  0x00,  0x75,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x20,  0x00,  0x75,  0x00,  0x73,  
+  0x00,  0x65,  0x00,  0x64,  0x00,  0x20,  0x00,  0x74,  0x00,  0x6F,  0x00,  0x20,  0x00,  0x74,  0x00,  0x65,  
+  0x00,  0x73,  0x00,  0x74,  0x00,  0x20,  0x00,  0x74,  0x00,  0x68,  0x00,  0x65,  0x00,  0x20,  0x00,  0x6D,  
+  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x6F,  0x00,  0x70,  
+  0x00,  0x63,  0x00,  0x6F,  0x00,  0x64,  0x00,  0x65,  0x00,  0x2E,  0x00,  0x00,  0x00,
+// 0x00AF: STR_STRING:0x00AF
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x20,  0x00,  0x54,  
+  0x00,  0x65,  0x00,  0x73,  0x00,  0x74,  0x00,  0x00,  0x00,
+// 0x00B0: STR_PATTERN:0x00B0
+  0x14,  0x4D,  0x00,  0x61,  0x00,  0x74,  0x00,  0x63,  0x00,  0x68,  0x00,  0x32,  0x00,  0x00,  0x00,
+  0x00,
+// PACKAGE HEADER
+
+  0x9F,  0x00,  0x00,  0x04,  0x38,  0x00,  0x00,  0x00,  0x38,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  
+  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x00,  0x01,  0x00,  0x78,  0x2D,  
+  0x55,  0x45,  0x46,  0x49,  0x2D,  0x6E,  0x73,  0x00,
+
+// PACKAGE DATA
+
+// 0x0001: $PRINTABLE_LANGUAGE_NAME:0x0001
+  0x14,  0x55,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x4E,  0x00,  0x61,  0x00,  0x6D,  0x00,  0x65,  
+  0x00,  0x53,  0x00,  0x70,  0x00,  0x61,  0x00,  0x63,  0x00,  0x65,  0x00,  0x00,  0x00,
+  0x21,  0x1E,  0x00,
+// 0x0020: STR_ONE_OF_PROMPT_KEYWORD:0x0020
+  0x14,  0x69,  0x00,  0x53,  0x00,  0x43,  0x00,  0x53,  0x00,  0x49,  0x00,  0x42,  0x00,  0x6F,  0x00,  0x6F,  
+  0x00,  0x74,  0x00,  0x45,  0x00,  0x6E,  0x00,  0x61,  0x00,  0x62,  0x00,  0x6C,  0x00,  0x65,  0x00,  0x00,  
+  0x00,
+  0x21,  0x01,  0x00,
+// 0x0022: STR_ONE_OF_PROMPT_X_UEFI:0x0022
+  0x14,  0x78,  0x00,  0x55,  0x00,  0x65,  0x00,  0x66,  0x00,  0x69,  0x00,  0x48,  0x00,  0x69,  0x00,  0x69,  
+  0x00,  0x4F,  0x00,  0x70,  0x00,  0x74,  0x00,  0x69,  0x00,  0x6F,  0x00,  0x6E,  0x00,  0x00,  0x00,
+  0x21,  0x8E,  0x00,
+  0x00,
+
+};
+
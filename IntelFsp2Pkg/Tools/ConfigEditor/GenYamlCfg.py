@@ -140,6 +140,11 @@ class ExpressionEval(ast.NodeVisitor):
         ast.USub:   op.neg
     }
 
+    # parsed expressions, by their text before any variable is resolved
+    expressions = {}
+
+    re_variable = re.compile(r'\$\(([_a-zA-Z][\w\.]*)\)|\$([_a-zA-Z][\w\.]*)')
+
     def __init__(self):
         self._debug = False
         self._expression = ''
@@ -154,8 +159,15 @@ class ExpressionEval(ast.NodeVisitor):
         else:
             self._namespace = {}
             self._get_variable = vars
-        node = ast.parse(self._expression, mode='eval')
-        result = self.visit(node.body)
+        node = ExpressionEval.expressions.get(expr)
+        if node is None:
+            # $(var) is parsed as a call resolving the variable when visited
+            text = ExpressionEval.re_variable.sub(
+                lambda match: "__var__('%s')" % (match.group(1) or match.group(2)),
+                expr)
+            node = ast.parse(text, mode='eval').body
+            ExpressionEval.expressions[expr] = node
+        result = self.visit(node)
         if self._debug:
             print('EVAL [ %s ] = %s' % (expr, str(result)))
         return result
@@ -215,6 +227,15 @@ class ExpressionEval(ast.NodeVisitor):
         elif node.func.id in ['offset', 'length']:
             if self._get_variable is not None:
                 return self._get_variable(node.args[0].s, node.func.id)
+        elif node.func.id == '__var__':
+            var = node.args[0].s
+            if self._get_variable is not None:
+                result = self._get_variable(var)
+            else:
+                result = self._namespace[var]
+            if result is None:
+                raise ValueError('Unknown variable $(%s) !' % var)
+            return op.index(result)
         else:
             raise ValueError("Unsupported function: " + repr(node))
 
@@ -597,6 +618,14 @@ class CGenYamlCfg:
         self._var_dict = {}
         self._def_dict = {}
         self._yaml_path = ''
+        self.clear_cache()
+
+    def clear_cache(self):
+        # flat index of the config tree nodes by path
+        self._cfg_index = None
+        # evaluated expressions with the variables they depend on
+        self._eval_cache = {}
+        self._eval_deps = None
 
     @staticmethod
     def deep_convert_dict(layer):
@@ -688,6 +717,9 @@ class CGenYamlCfg:
 
     def get_variable(self, var, attr='value'):
         if var in self._var_dict:
+            if self._eval_deps is not None:
+                self._eval_deps.append((self._var_dict, var,
+                                        self._var_dict[var]))
             var = self._var_dict[var]
             return var
 
@@ -707,25 +739,33 @@ class CGenYamlCfg:
             else:
                 raise ValueError("Unsupported variable attribute '%s' !" %
                                  attr)
+            if self._eval_deps is not None:
+                for key in (attr, 'length'):
+                    self._eval_deps.append((item, key, item[key]))
         return var
 
     def eval(self, expr):
-        def _handler(pattern):
-            if pattern.group(1):
-                target = 1
+        # reuse the result until one of the variables it depends on changes
+        cached = self._eval_cache.get(expr)
+        if cached is not None:
+            result, deps = cached
+            for obj, key, value in deps:
+                if key not in obj or obj[key] != value:
+                    break
             else:
-                target = 2
-            result = self.get_variable(pattern.group(target))
-            if result is None:
-                raise ValueError('Unknown variable $(%s) !' %
-                                 pattern.group(target))
-            return hex(result)
+                return result
+
+        self._eval_deps = []
+        try:
+            result = self.eval_expression(expr)
+            if type(result) in (int, bool):
+                self._eval_cache[expr] = (result, self._eval_deps)
+        finally:
+            self._eval_deps = None
+        return result
 
+    def eval_expression(self, expr):
         expr_eval = ExpressionEval()
-        if '$' in expr:
-            # replace known variable first
-            expr = re.sub(r'\$\(([_a-zA-Z][\w\.]*)\)|\$([_a-zA-Z][\w\.]*)',
-                          _handler, expr)
         return expr_eval.eval(expr, self.get_variable)
 
     def parse_macros(self, macro_def_str):
@@ -998,7 +1038,26 @@ option format '%s' !" % option)
         path = []
         return _locate_cfg_path(self._cfg_tree)
 
+    def get_cfg_index(self):
+        def _build_cfg_index(root, path):
+            for key in root:
+                if type(root[key]) is OrderedDict:
+                    node_path = path + '.' + key if path else key
+                    index[node_path] = root[key]
+                    _build_cfg_index(root[key], node_path)
+
+        # rebuild it if the config tree has been replaced
+        if self._cfg_index is None or self._cfg_index[0] is not self._cfg_tree:
+            index = {}
+            _build_cfg_index(self._cfg_tree, '')
+            self._cfg_index = (self._cfg_tree, index)
+        return self._cfg_index[1]
+
     def locate_cfg_item(self, path, allow_exp=True):
+        node = self.get_cfg_index().get(path)
+        if node is not None:
+            return node
+
         def _locate_cfg_item(root, path, level=0):
             if len(path) == level:
                 return root
@@ -1078,6 +1137,7 @@ option format '%s' !" % option)
                         'offset'] // 8
 
         self._var_dict = {}
+        self._eval_cache = {}
         self.traverse_cfg_tree(_build_var_dict)
         self._var_dict['_LENGTH_'] = self._cfg_tree[CGenYamlCfg.STRUCT][
             'length'] // 8
@@ -1259,6 +1319,8 @@ option format '%s' !" % option)
             top = self._cfg_tree
             info.clear()
             info = {'offset': 0}
+            # struct nodes are added to the tree
+            self.clear_cache()
 
         start = info['offset']
         is_leaf = True
@@ -1724,6 +1786,8 @@ for '%s' !" % (act_cfg['value'], act_cfg['path']))
                                                  old_data, new_data, full)
 
     def prepare_marshal(self, is_save):
+        # the caches refer to the config tree, they are not saved
+        self.clear_cache()
         if is_save:
             # Ordered dict is not marshallable, convert to list
             self._cfg_tree = CGenYamlCfg.deep_convert_dict(self._cfg_tree)
@@ -5,10 +5,13 @@
 #
 ##
 
+import io
 import os
 import re
 import sys
 import struct
+import hashlib
+import marshal
 from   datetime import date
 from functools import reduce
 
@@ -314,8 +317,9 @@ EndList
         self._DscLines    = []
         self._DscFile     = ''
 
+        self._DscIncludes = []
+
         self._MapVer      = 0
-        self._DscTime     = 0
 
     def ParseMacros (self, MacroDefStr):
         # ['-DABC=1', '-D', 'CFG_DEBUG=1', '-D', 'CFG_OUTDIR=Build']
@@ -482,20 +486,96 @@ EndList
         ConfigDict['value'] = newvalue
         return ""
 
+    def GetDscCacheKey (self, DscFile):
+        # The parsed items depend on the DSC content, the macros and PCDs given
+        # on the command line, where the included DSC files are looked up from,
+        # and on this script itself
+        Key = hashlib.sha256()
+        for File in [DscFile, os.path.realpath(__file__)]:
+            with open(File, "rb") as Fd:
+                Key.update(hashlib.sha256(Fd.read()).digest())
+        Key.update(repr((sys.version_info[:2], os.path.abspath(DscFile), os.getcwd(), os.getenv("PACKAGES_PATH"),
+                         sorted(self._MacroDict.items()), BuildOptionPcd)).encode())
+        return Key.hexdigest()
+
+    def GetDscIncludeHash (self, DscLines):
+        return hashlib.sha256(''.join(DscLines).encode()).hexdigest()
+
+    def GetDscCacheFile (self, DscFile, FvDir):
+        return os.path.join(FvDir, os.path.basename(DscFile) + '.cache')
+
+    def LoadDscCache (self, DscFile, FvDir, Key):
+        try:
+            with open(self.GetDscCacheFile(DscFile, FvDir), "rb") as Fd:
+                Cache = marshal.loads(Fd.read())
+            if Cache['Key'] != Key:
+                return False
+            # Any change of the included DSC files invalidates the cache too
+            for IncludeFile, IncludeHash in Cache['Includes']:
+                with open(IncludeFile, "r") as Fd:
+                    if self.GetDscIncludeHash(Fd.readlines()) != IncludeHash:
+                        return False
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            return False
+
+        self._CfgItemList = Cache['CfgItemList']
+        self._CfgPageDict = Cache['CfgPageDict']
+        self._CfgBlkDict  = Cache['CfgBlkDict']
+        self._DscLines    = Cache['DscLines']
+        self._BsfTempDict = Cache['BsfTempDict']
+        self._MacroDict   = Cache['MacroDict']
+        self._PcdsDict    = Cache['PcdsDict']
+        self._DscIncludes = Cache['Includes']
+        return True
+
+    def SaveDscCache (self, DscFile, FvDir, Key):
+        # marshal keeps the dictionaries shared between the items as they are
+        Cache = {
+            'Key'         : Key,
+            'Includes'    : self._DscIncludes,
+            'CfgItemList' : self._CfgItemList,
+            'CfgPageDict' : self._CfgPageDict,
+            'CfgBlkDict'  : self._CfgBlkDict,
+            'DscLines'    : self._DscLines,
+            'BsfTempDict' : self._BsfTempDict,
+            'MacroDict'   : self._MacroDict,
+            'PcdsDict'    : self._PcdsDict
+        }
+        try:
+            with open(self.GetDscCacheFile(DscFile, FvDir), "wb") as Fd:
+                Fd.write(marshal.dumps(Cache))
+        except (OSError, ValueError):
+            pass
+
     def ParseDscFile (self, DscFile, FvDir):
+        self._DscFile     = DscFile
+        self._FvDir       = FvDir
+
+        # DSC lines given directly are always parsed
+        if type(DscFile) is list:
+            return self.ParseDscLines (DscFile)
+
+        # Reuse the items parsed by a previous run when the DSC files and
+        # the macros are the same
+        Key = self.GetDscCacheKey (DscFile)
+        if self.LoadDscCache (DscFile, FvDir, Key):
+            return 0
+
+        Error = self.ParseDscLines (DscFile)
+        if Error == 0 and os.path.isdir(FvDir):
+            self.SaveDscCache (DscFile, FvDir, Key)
+        return Error
+
+    def ParseDscLines (self, DscFile):
         Hardcode = False
         AutoAlign = False
         self._CfgItemList = []
         self._CfgPageDict = {}
         self._CfgBlkDict  = {}
-        self._DscFile     = DscFile
-        self._FvDir       = FvDir
 
         self._DscLines    = []
         self._BsfTempDict = {}
-
-        # Initial DSC time is parent DSC time.
-        self._DscTime     = os.path.getmtime(DscFile)
+        self._DscIncludes = []
 
         CfgDict = {}
 
@@ -637,13 +717,11 @@ EndList
                                     print("ERROR: Cannot open file '%s'" % IncludeFilePath)
                                     raise SystemExit
 
-                                # Update DscTime when newer DSC time found.
-                                CurrentDscTime = os.path.getmtime(os.path.realpath(IncludeDsc.name))
-                                if CurrentDscTime > self._DscTime:
-                                    self._DscTime = CurrentDscTime
-
                                 NewDscLines = IncludeDsc.readlines()
                                 IncludeDsc.close()
+
+                                # Record the included DSC file to validate the cache
+                                self._DscIncludes.append ([os.path.realpath(IncludeDsc.name), self.GetDscIncludeHash(NewDscLines)])
                                 DscLines = NewDscLines + DscLines
                                 del self._DscLines[-1]
                                 Offset = 0
@@ -942,19 +1020,20 @@ EndList
                 SubItem['value'] = valuestr
         return Error
 
-    def NoDscFileChange (self, OutPutFile):
-        NoFileChange = True
-        if not os.path.exists(OutPutFile):
-            NoFileChange = False
-        else:
-            OutputTime = os.path.getmtime(OutPutFile)
-            if self._DscTime > OutputTime:
-                NoFileChange = False
-        return NoFileChange
+    def WriteOutputFile (self, OutPutFile, Content):
+        # Keep the output file and its time stamp when the content is the same
+        if os.path.exists(OutPutFile):
+            with open(OutPutFile, "r") as Fd:
+                if Fd.read() == Content:
+                    return False
+        with open(OutPutFile, "w") as Fd:
+            Fd.write(Content)
+        return True
 
     def CreateSplitUpdTxt (self, UpdTxtFile):
         GuidList = ['FSP_T_UPD_TOOL_GUID','FSP_M_UPD_TOOL_GUID','FSP_S_UPD_TOOL_GUID','FSP_I_UPD_TOOL_GUID']
         SignatureList = ['0x545F', '0x4D5F','0x535F','0x495F']        #  _T, _M, _S and _I signature for FSPT, FSPM, FSPS, FSPI
+        FileChange = False
         for Index in range(len(GuidList)):
             UpdTxtFile = ''
             FvDir = self._FvDir
@@ -970,13 +1049,7 @@ EndList
             if UpdTxtFile == '':
                 UpdTxtFile = os.path.join(FvDir, self._MacroDict[GuidList[Index]] + '.txt')
 
-            if (self.NoDscFileChange (UpdTxtFile)):
-                # DSC has not been modified yet
-                # So don't have to re-generate other files
-                self.Error = 'No DSC file change, skip to create UPD TXT file'
-                return 256
-
-            TxtFd = open(UpdTxtFile, "w")
+            TxtFd = io.StringIO()
             TxtFd.write("%s\n"   % (__copyright_txt__ % date.today().year))
 
             NextOffset = 0
@@ -1012,7 +1085,14 @@ EndList
                     SpaceIdx = SpaceIdx + 1
                 NextOffset = Offset + Item['length']
                 TxtFd.write("%s.%s|%s0x%04X|%s|%s\n" % (Item['space'],Item['cname'],Default,Item['offset'] - StartAddr,Item['length'],Item['value']))
-            TxtFd.close()
+            if self.WriteOutputFile (UpdTxtFile, TxtFd.getvalue()):
+                FileChange = True
+
+        if not FileChange:
+            # The UPD TXT files have the same content
+            # So don't have to re-generate other files
+            self.Error = 'No UPD TXT file change, skip to update UPD TXT file'
+            return 256
         return 0
 
     def CreateVarDict (self):
@@ -1277,12 +1357,7 @@ EndList
         HeaderFileName = 'FspUpd.h'
         HeaderFile = os.path.join(FvDir, HeaderFileName)
 
-        # Check if header needs to be recreated
-        if (self.NoDscFileChange (HeaderFile)):
-            # DSC has not been modified yet
-            # So don't have to re-generate other files
-            self.Error = 'No DSC file change, skip to create UPD header file'
-            return 256
+        FileChange = False
 
         TxtBody = []
         for Item in self._CfgItemList:
@@ -1421,18 +1496,19 @@ EndList
 
         for item in range(len(UpdRegionCheck)):
             if UpdRegionCheck[item] == 'FSPT':
-                HeaderFd = open(os.path.join(FvDir, HeaderTFileName), "w")
+                HeaderPath = os.path.join(FvDir, HeaderTFileName)
                 FileBase = os.path.basename(os.path.join(FvDir, HeaderTFileName))
             elif UpdRegionCheck[item] == 'FSPM':
-                HeaderFd = open(os.path.join(FvDir, HeaderMFileName), "w")
+                HeaderPath = os.path.join(FvDir, HeaderMFileName)
                 FileBase = os.path.basename(os.path.join(FvDir, HeaderMFileName))
             elif UpdRegionCheck[item] == 'FSPS':
-                HeaderFd = open(os.path.join(FvDir, HeaderSFileName), "w")
+                HeaderPath = os.path.join(FvDir, HeaderSFileName)
                 FileBase = os.path.basename(os.path.join(FvDir, HeaderSFileName))
             elif UpdRegionCheck[item] == 'FSPI':
-                HeaderFd = open(os.path.join(FvDir, HeaderIFileName), "w")
+                HeaderPath = os.path.join(FvDir, HeaderIFileName)
                 FileBase = os.path.basename(os.path.join(FvDir, HeaderIFileName))
             FileName = FileBase.replace(".", "_").upper()
+            HeaderFd = io.StringIO()
             HeaderFd.write("%s\n"   % (__copyright_h__ % date.today().year))
             HeaderFd.write("#ifndef __%s__\n"   % FileName)
             HeaderFd.write("#define __%s__\n\n" % FileName)
@@ -1487,9 +1563,10 @@ EndList
                         self.WriteLinesWithoutTailingSpace(HeaderFd, Line)
             HeaderFd.write("#pragma pack()\n\n")
             HeaderFd.write("#endif\n")
-            HeaderFd.close()
+            if self.WriteOutputFile (HeaderPath, HeaderFd.getvalue()):
+                FileChange = True
 
-        HeaderFd = open(HeaderFile, "w")
+        HeaderFd = io.StringIO()
         FileBase = os.path.basename(HeaderFile)
         FileName = FileBase.replace(".", "_").upper()
         HeaderFd.write("%s\n"   % (__copyright_h__ % date.today().year))
@@ -1532,8 +1609,14 @@ EndList
                         self.WriteLinesWithoutTailingSpace(HeaderFd, Line)
         HeaderFd.write("#pragma pack()\n\n")
         HeaderFd.write("#endif\n")
-        HeaderFd.close()
+        if self.WriteOutputFile (HeaderFile, HeaderFd.getvalue()):
+            FileChange = True
 
+        if not FileChange:
+            # The UPD header files have the same content
+            # So don't have to re-generate other files
+            self.Error = 'No UPD header file change, skip to update UPD header file'
+            return 256
         return 0
 
     def WriteBsfStruct  (self, BsfFd, Item):
@@ -1617,15 +1700,9 @@ EndList
             self.Error = "BSF output file '%s' is invalid" % BsfFile
             return 1
 
-        if (self.NoDscFileChange (BsfFile)):
-            # DSC has not been modified yet
-            # So don't have to re-generate other files
-            self.Error = 'No DSC file change, skip to create UPD BSF file'
-            return 256
-
         Error = 0
         OptionDict = {}
-        BsfFd      = open(BsfFile, "w")
+        BsfFd      = io.StringIO()
         BsfFd.write("%s\n" % (__copyright_bsf__ % date.today().year))
         BsfFd.write("%s\n" % self._GlobalDataDef)
         BsfFd.write("StructDef\n")
@@ -1703,7 +1780,11 @@ EndList
                 self.WriteBsfOption (BsfFd, Item)
             BsfFd.write("EndPage\n\n")
 
-        BsfFd.close()
+        if not self.WriteOutputFile (BsfFile, BsfFd.getvalue()):
+            # The UPD BSF file has the same content
+            # So don't have to re-generate other files
+            self.Error = 'No UPD BSF file change, skip to update UPD BSF file'
+            return 256
         return  Error
 
 
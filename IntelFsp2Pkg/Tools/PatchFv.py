@@ -8,6 +8,7 @@
 import os
 import re
 import sys
+import mmap
 
 #
 #  Read data from file
@@ -70,44 +71,92 @@ def IsFspHeaderValid (binfile):
     return True
 
 #
-#  Patch data in file
+#  Patch session of a FD file
 #
-#  param [in]  binfile     Binary file
-#  param [in]  offset      Offset
-#  param [in]  value       Patch value
-#  param [in]  len         Length
+#  The FD file is mapped once, the values are read and patched through a
+#  memoryview of the mapping, and the file is flushed when the session is
+#  closed.
 #
-#  retval      len         Length
-#
-def patchDataInFile (binfile, offset, value, len=1):
-    fd     = open(binfile, "r+b")
-    fsize  = os.path.getsize(binfile)
-    offval = offset & 0xFFFFFFFF
-    if (offval & 0x80000000):
-        offval = fsize - (0xFFFFFFFF - offval + 1)
-    bytearray = []
-    idx = 0
-    while  idx < len:
-        bytearray.append(value & 0xFF)
-        value          = value >> 8
-        idx            = idx + 1
-    fd.seek(offval)
-    if sys.version_info[0] < 3:
-        fd.write("".join(chr(b) for b in bytearray))
-    else:
-        fd.write(bytes(bytearray))
-    fd.close()
-    return len
+class PatchSession:
+    def __init__(self, binfile):
+        self.fd    = open(binfile, "r+b")
+        self.map   = mmap.mmap(self.fd.fileno(), 0)
+        self.data  = memoryview(self.map)
+        self.fsize = len(self.map)
+
+    #
+    #  Get the file offset of an offset, negative offsets are from the end
+    #
+    #  param [in]  offset      Offset
+    #  param [in]  len         Length
+    #
+    #  retval      offval      File offset
+    #
+    def getFileOffset (self, offset, len):
+        offval = offset & 0xFFFFFFFF
+        if (offval & 0x80000000):
+            offval = self.fsize - (0xFFFFFFFF - offval + 1)
+        if offval < 0 or offval + len > self.fsize:
+            raise Exception("Invalid file offset 0x%08x !" % offset)
+        return offval
+
+    #
+    #  Read data
+    #
+    #  param [in]  offset      Offset
+    #  param [in]  len         Length
+    #
+    #  retval      value       Value
+    #
+    def readData (self, offset, len=1):
+        offval = self.getFileOffset(offset, len)
+        return int.from_bytes(self.data[offval:offval + len], 'little')
+
+    #
+    #  Patch data
+    #
+    #  param [in]  offset      Offset
+    #  param [in]  value       Patch value
+    #  param [in]  len         Length
+    #
+    #  retval      len         Length
+    #
+    def patchData (self, offset, value, len=1):
+        offval = self.getFileOffset(offset, len)
+        self.data[offval:offval + len] = (value & ((1 << (len * 8)) - 1)).to_bytes(len, 'little')
+        return len
+
+    #
+    #  Find data
+    #
+    #  param [in]  data        Data to find
+    #
+    #  retval      offset      Offset of data, -1 if not found
+    #
+    def find (self, data):
+        return self.map.find(data)
+
+    #
+    #  Flush and close the FD file
+    #
+    def close (self):
+        self.data.release()
+        self.map.flush()
+        self.map.close()
+        self.fd.close()
 
 
 class Symbols:
     def __init__(self):
         self.dictSymbolAddress = {}
         self.dictGuidNameXref  = {}
+        self.dictNameGuidXref  = {}
+        self.dictFvOffset      = {}
         self.dictFfsOffset     = {}
         self.dictVariable      = {}
         self.dictModBase       = {}
         self.fdFile            = None
+        self.fdSession         = None
         self.string            = ""
         self.fdBase            = 0xFFFFFFFF
         self.fdSize            = 0
@@ -132,6 +181,22 @@ class Symbols:
     def getFdSize (self):
         return self.fdSize
 
+    #
+    #  Get FD patch session
+    #
+    #  retval      self.fdSession Retrieve the patch session of FD file
+    #
+    def getFdSession (self):
+        return self.fdSession
+
+    #
+    #  Close FD patch session
+    #
+    def closeFdSession (self):
+        if self.fdSession is not None:
+            self.fdSession.close()
+            self.fdSession = None
+
     def parseFvInfFile (self, infFile):
         fvInfo = {}
         fvFile            = infFile[0:-4] + ".Fv"
@@ -176,6 +241,7 @@ class Symbols:
         # Add GUID reference to dictionary
         #
         self.dictGuidNameXref  = {}
+        self.dictNameGuidXref  = {}
         self.parseGuidXrefFile(xrefFile)
 
         #
@@ -196,8 +262,11 @@ class Symbols:
         #
         # Get the size of the FD file
         #
+        self.closeFdSession()
         self.fdFile = fdFile
         self.fdSize = os.path.getsize(fdFile)
+        self.fdSession = PatchSession(fdFile)
+        self.dictFvOffset = {}
 
         #
         # If the INF file, which is the first element of fvList, is not existing, then raise an exception
@@ -271,16 +340,17 @@ class Symbols:
     #  retval      offset      Got FV offset successfully
     #
     def getFvOffsetInFd(self, fvFile):
+        if fvFile in self.dictFvOffset:
+            return self.dictFvOffset[fvFile]
         #
         # Check if the first 0x70 bytes of fvFile can be found in fdFile
         #
-        fvHandle = open(fvFile, "r+b")
-        fdHandle = open(self.fdFile, "r+b")
-        offset = fdHandle.read().find(fvHandle.read(0x70))
+        fvHandle = open(fvFile, "rb")
+        offset = self.fdSession.find(fvHandle.read(0x70))
         fvHandle.close()
-        fdHandle.close()
         if offset == -1:
             raise Exception("Could not locate FV file %s in FD!" % fvFile)
+        self.dictFvOffset[fvFile] = offset
         return offset
 
     #
@@ -706,10 +776,11 @@ class Symbols:
     #  retval      value
     #
     def getModGuid(self, var):
-        guid = (guid for guid,name in self.dictGuidNameXref.items() if name==var)
-        try:
-            value = guid.next()
-        except Exception:
+        if not self.dictNameGuidXref:
+            for guid, name in self.dictGuidNameXref.items():
+                self.dictNameGuidXref.setdefault(name, guid)
+        value = self.dictNameGuidXref.get(var, None)
+        if value == None:
             raise Exception("Unknown module name %s !" % var)
         return value
 
@@ -745,7 +816,7 @@ class Symbols:
     #  retval      value
     #
     def getContent(self, value):
-        return readDataFromFile (self.fdFile, self.toOffset(value), 4)
+        return self.fdSession.readData (self.toOffset(value), 4)
 
     #
     #  Change value to address
@@ -876,6 +947,7 @@ def main():
     #
     fdFile = symTables.getFdFile()
     fdSize = symTables.getFdSize()
+    fdSession = symTables.getFdSession()
 
     try:
         #
@@ -920,8 +992,8 @@ def main():
                 if len (params) == 2:
                     offset   = params[0]
                     value    = params[1]
-                    oldvalue = readDataFromFile(fdFile, offset, 4)
-                    ret = patchDataInFile (fdFile, offset, value, 4) - 4
+                    oldvalue = fdSession.readData(offset, 4)
+                    ret = fdSession.patchData (offset, value, 4) - 4
                 else:
                     raise Exception ("Patch command needs 2 parameters !")
 
@@ -939,8 +1011,8 @@ def main():
                     dest = symTables.toOffset(params[1])
                     clen = symTables.toOffset(params[2])
                     if (dest + clen <= fdSize) and (src + clen <= fdSize):
-                        oldvalue = readDataFromFile(fdFile, src, clen)
-                        ret = patchDataInFile (fdFile, dest, oldvalue, clen) - clen
+                        oldvalue = fdSession.readData(src, clen)
+                        ret = fdSession.patchData (dest, oldvalue, clen) - clen
                     else:
                         raise Exception ("Copy command OFFSET or LENGTH parameter is invalid !")
                 else:
@@ -958,5 +1030,8 @@ def main():
         print ("ERROR: %s" % ex)
         return 1
 
+    finally:
+        symTables.closeFdSession()
+
 if __name__ == '__main__':
     sys.exit(main())
@@ -11,6 +11,7 @@ import uuid
 import copy
 import struct
 import argparse
+from   array  import array
 from   ctypes import *
 from functools import reduce
 
@@ -346,6 +347,26 @@ def Bytes2Val (bytes):
 def Val2Bytes (value, blen):
     return [(value>>(i*8) & 0xff) for i in range(blen)]
 
+def ApplyFixups (fdbin, offsets, size, delta):
+    # Add delta to the little-endian values of size bytes at all offsets.
+    # The naturally aligned values are updated through a memoryview cast
+    # of the whole binary, the other ones are packed one by one.
+    mask   = (1 << (size * 8)) - 1
+    fmt    = '<I' if size == 4 else '<Q'
+    count  = len(fdbin) - len(fdbin) % size
+    with memoryview(fdbin) as view:
+        values = view[:count].cast(fmt[1])
+        if sys.byteorder == 'little' and values.itemsize == size:
+            unaligned = [offset for offset in offsets if offset % size or offset >= count]
+            for idx in [offset // size for offset in offsets if not offset % size and offset < count]:
+                values[idx] = (values[idx] + delta) & mask
+        else:
+            unaligned = offsets
+        values.release()
+        for offset in unaligned:
+            value = struct.unpack_from(fmt, fdbin, offset)[0]
+            struct.pack_into(fmt, fdbin, offset, (value + delta) & mask)
+
 def IsIntegerType (val):
     if sys.version_info[0] < 3:
         if type(val) in (int, long):
@@ -638,7 +659,7 @@ class PeTeImage:
     def IsTeImage(self):
         return  self.TeHdr is not None
 
-    def ParseReloc(self):
+    def GetRelocDir(self):
         if self.IsTeImage():
             rsize   = self.TeHdr.DataDirectoryBaseReloc.Size
             roffset = sizeof(self.TeHdr) - self.TeHdr.StrippedSize + self.TeHdr.DataDirectoryBaseReloc.VirtualAddress
@@ -649,7 +670,10 @@ class PeTeImage:
             if self.PeHdr.OptionalHeader.PePlusOptHdr.Magic == 0x20b: # PE32+ image
                 rsize   = self.PeHdr.OptionalHeader.PePlusOptHdr.DataDirectory[EFI_IMAGE_DIRECTORY_ENTRY.BASERELOC].Size
                 roffset = self.PeHdr.OptionalHeader.PePlusOptHdr.DataDirectory[EFI_IMAGE_DIRECTORY_ENTRY.BASERELOC].VirtualAddress
+        return (roffset, rsize)
 
+    def ParseReloc(self):
+        (roffset, rsize) = self.GetRelocDir()
         alignment = 4
         offset = roffset
         while offset < roffset + rsize:
@@ -674,6 +698,49 @@ class PeTeImage:
                 self.RelocList.append((rtype, aoff))
             offset += sizeof(rdata)
 
+    def ParseRelocTable(self):
+        # Decode the entries of each relocation block at once, and group
+        # the image offsets of the fixups by relocation type
+        (roffset, rsize) = self.GetRelocDir()
+        if self.IsTeImage():
+            adjust = sizeof(self.TeHdr) - self.TeHdr.StrippedSize
+        else:
+            adjust = 0
+        self.RelocTable = {3: [], 10: []}
+        offset = roffset
+        while offset < roffset + rsize:
+            offset = AlignPtr(offset, 4)
+            blkhdr = PE_RELOC_BLOCK_HEADER.from_buffer(self.Data, offset)
+            offset += sizeof(blkhdr)
+            rnum  = int ((blkhdr.BlockSize - sizeof(PE_RELOC_BLOCK_HEADER)) / sizeof(c_uint16))
+            rdata = array('H')
+            rdata.frombytes(bytes(self.Data[offset:offset + rnum * sizeof(c_uint16)]))
+            if sys.byteorder != 'little':
+                rdata.byteswap()
+            rtypes = set(each >> 12 for each in rdata)
+            for rtype in rtypes:
+                if rtype == 0: # IMAGE_REL_BASED_ABSOLUTE:
+                    continue
+                if rtype not in self.RelocTable: # IMAGE_REL_BASED_HIGHLOW and IMAGE_REL_BASED_DIR64
+                    rtype = [each >> 12 for each in rdata if (each >> 12) not in (0, 3, 10)][0]
+                    raise Exception("ERROR: Unsupported relocation type %d!" % rtype)
+                base = blkhdr.PageRVA + adjust
+                self.RelocTable[rtype].extend([base + (each & 0xfff) for each in rdata if (each >> 12) == rtype])
+            offset += rnum * sizeof(c_uint16)
+
+    def RebaseTable(self, delta, fdbin):
+        count = 0
+        if delta == 0:
+            return count
+
+        for (rtype, size) in [(3, sizeof(c_uint32)), (10, sizeof(c_uint64))]:
+            rlist = self.RelocTable[rtype]
+            ApplyFixups (fdbin, [roff + self.Offset for roff in rlist], size, delta)
+            count += len(rlist)
+
+        self.RebaseImageBase(delta, fdbin)
+        return count
+
     def Rebase(self, delta, fdbin):
         count = 0
         if delta == 0:
@@ -695,6 +762,10 @@ class PeTeImage:
             else:
                 raise Exception('ERROR: Unknown relocation type %d !' % rtype)
 
+        self.RebaseImageBase(delta, fdbin)
+        return count
+
+    def RebaseImageBase(self, delta, fdbin):
         if self.IsTeImage():
             offset  = self.Offset + EFI_TE_IMAGE_HEADER.ImageBase.offset
             size    = EFI_TE_IMAGE_HEADER.ImageBase.size
@@ -711,8 +782,6 @@ class PeTeImage:
         value  = Bytes2Val(fdbin[offset:offset+size]) + delta
         fdbin[offset:offset+size] = Val2Bytes(value, size)
 
-        return count
-
 def ShowFspInfo (fspfile):
     fd = FirmwareDevice(0, fspfile)
     fd.ParseFd  ()
@@ -789,7 +858,7 @@ def SplitFspBin (fspfile, outdir, nametemplate):
             hfsp.write(fv.FvData)
         hfsp.close()
 
-def RebaseFspBin (FspBinary, FspComponent, FspBase, OutputDir, OutputFile):
+def RebaseFspBin (FspBinary, FspComponent, FspBase, OutputDir, OutputFile, Verify = False):
     fd = FirmwareDevice(0, FspBinary)
     fd.ParseFd  ()
     fd.ParseFsp ()
@@ -801,6 +870,9 @@ def RebaseFspBin (FspBinary, FspComponent, FspBase, OutputDir, OutputFile):
         return
 
     newfspbin = fd.FdData[:]
+    if Verify:
+        # Rebase a second copy with the per entry relocation to check the result
+        refbin = fd.FdData[:]
 
     for idx, fspcomp in enumerate(FspComponent):
 
@@ -842,13 +914,20 @@ def RebaseFspBin (FspBinary, FspComponent, FspBase, OutputDir, OutputFile):
         pcount  = 0
         for (offset, length) in imglist:
             img = PeTeImage(offset, fd.FdData[offset:offset + length])
-            img.ParseReloc()
-            pcount += img.Rebase(delta, newfspbin)
+            img.ParseRelocTable()
+            count   = img.RebaseTable(delta, newfspbin)
+            pcount += count
             fcount += 1
+            if Verify:
+                img.ParseReloc()
+                if img.Rebase(delta, refbin) != count:
+                    raise Exception("ERROR: Relocation count mismatch in image at offset 0x%08X !" % offset)
 
         print ("  Patched %d entries in %d TE/PE32 images." % (pcount, fcount))
 
         (count, applied) = fsp.Patch(delta, newfspbin)
+        if Verify:
+            fsp.Patch(delta, refbin)
         print ("  Patched %d entries using FSP patch table." % applied)
         if count != applied:
             print ("  %d invalid entries are ignored !" % (count - applied))
@@ -858,6 +937,12 @@ def RebaseFspBin (FspBinary, FspComponent, FspBase, OutputDir, OutputFile):
         base, ext  = os.path.splitext(filename)
         OutputFile = base + "_%08X" % newbase + ext
 
+    if Verify:
+        if newfspbin != refbin:
+            offset = [idx for idx in range(len(refbin)) if newfspbin[idx] != refbin[idx]][0]
+            raise Exception("ERROR: Rebased FSP binary mismatch at offset 0x%08X !" % offset)
+        print ("Verified the rebased FSP binary against the per entry relocation.")
+
     fspname, ext = os.path.splitext(os.path.basename(OutputFile))
     filename = os.path.join(OutputDir, fspname + ext)
     fd = open(filename, "wb")
@@ -875,6 +960,7 @@ def main ():
     parser_rebase.add_argument('-b',  '--newbase', dest='FspBase', nargs='+', type=str, help='Rebased FSP binary file name', default = '', required = True)
     parser_rebase.add_argument('-o',  '--outdir' , dest='OutputDir',  type=str, help='Output directory path', default = '.')
     parser_rebase.add_argument('-n',  '--outfile', dest='OutputFile', type=str, help='Rebased FSP binary file name', default = '')
+    parser_rebase.add_argument('-v',  '--verify',  dest='Verify', action='store_true', help='Verify the relocations against the per entry implementation')
 
     parser_split  = subparsers.add_parser('split',  help='split a FSP into multiple components')
     parser_split.set_defaults(which='split')
@@ -900,7 +986,7 @@ def main ():
             raise Exception ("ERROR: Invalid output directory '%s' !" % args.OutputDir)
 
     if args.which == 'rebase':
-        RebaseFspBin (args.FspBinary, args.FspComponent, args.FspBase, args.OutputDir, args.OutputFile)
+        RebaseFspBin (args.FspBinary, args.FspComponent, args.FspBase, args.OutputDir, args.OutputFile, args.Verify)
     elif args.which == 'split':
         SplitFspBin (args.FspBinary, args.OutputDir, args.NameTemplate)
     elif args.which == 'genhdr':
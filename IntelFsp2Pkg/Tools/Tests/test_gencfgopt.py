@@ -0,0 +1,163 @@
+# @file
+#  Unit tests for the cached DSC parsing and the output generation of GenCfgOpt.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import unittest
+import tempfile
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+currentdir = os.path.dirname(os.path.realpath(__file__))
+parentdir = os.path.dirname(currentdir)
+
+HeaderFiles = ['FspUpd.h', 'FsptUpd.h', 'FspmUpd.h', 'FspsUpd.h', 'FspiUpd.h']
+TxtFiles = ['34686CA3-34F9-4901-B82A-BA630F0714C6.txt',
+            '39A250DB-E465-4DD1-A2AC-E2BD3C0E2385.txt',
+            'CAE3605B-5B34-4C85-B3D7-27D54273C40F.txt']
+OutputFiles = HeaderFiles + ['Output.bsf'] + TxtFiles
+
+#
+# Move the UPDs of the QEMU DSC into an included file, with itemnum additional
+# FSP-S items, and select the PCI base from a macro
+#
+def GenDsc(dscfile, incfile, itemnum):
+    with open(os.path.join(currentdir, 'QemuFspPkg.dsc'), 'r') as fd:
+        lines = fd.readlines()
+    start = lines.index('[PcdsDynamicVpd.Upd]\n') + 1
+    end = start
+    while not lines[end].startswith('#'):
+        end += 1
+    inclines = lines[start:end]
+    lines[start:end] = ['!include %s\n' % os.path.basename(incfile), '\n']
+    end = inclines.index('  # !HDR EMBED:{FSP_S_CONFIG:FspsConfig:END}\n')
+    for idx in range(itemnum):
+        inclines.insert(end + idx, '  # !BSF NAME:{Extra Item %d}\n'
+                                   '  # !BSF TYPE:{EditNum, HEX, (0x00,0xFFFFFFFF)}\n'
+                                   '  # !BSF HELP:{Extra item %d. 0x%08X(Default).}\n'
+                                   '  gQemuFspPkgTokenSpaceGuid.ExtraItem%-28d | * | 0x04 | 0x%08X\n\n' % (idx, idx, idx, idx, idx))
+    with open(dscfile, 'w') as fd:
+        fd.writelines(lines)
+    with open(incfile, 'w') as fd:
+        fd.write(''.join(inclines).replace(
+            '  gQemuFspPkgTokenSpaceGuid.PciTempResourceBase         | * | 0x04 | 0x80000000\n',
+            '!if $(PCI_TEMP_BASE_HIGH) == TRUE\n'
+            '  gQemuFspPkgTokenSpaceGuid.PciTempResourceBase         | * | 0x04 | 0xC0000000\n'
+            '!else\n'
+            '  gQemuFspPkgTokenSpaceGuid.PciTempResourceBase         | * | 0x04 | 0x80000000\n'
+            '!endif\n'))
+
+class TestGenCfgOpt(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.dscfile = os.path.join(self.tmpdir, 'QemuFspPkg.dsc')
+        self.incfile = os.path.join(self.tmpdir, 'FspsConfig.dsc.inc')
+        self.fvdir = os.path.join(self.tmpdir, 'Fv')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def RunTool(self, macros = ['-D', 'PCI_TEMP_BASE_HIGH=FALSE'], dscfile = None):
+        env = dict(os.environ)
+        env.pop('PACKAGES_PATH', None)
+        tool = os.path.join(parentdir, 'GenCfgOpt.py')
+        dscfile = dscfile or self.dscfile
+        output = ''
+        start = time.time()
+        for cmd in [['UPDTXT', dscfile, self.fvdir],
+                    ['HEADER', dscfile, self.fvdir],
+                    ['GENBSF', dscfile, self.fvdir, os.path.join(self.fvdir, 'Output.bsf')]]:
+            output += subprocess.run([sys.executable, tool] + cmd + macros, cwd = self.tmpdir, env = env, check = True,
+                                     stdout = subprocess.PIPE, universal_newlines = True).stdout
+        return time.time() - start, output
+
+    def ReadOutputs(self):
+        contents = {}
+        for name in OutputFiles:
+            with open(os.path.join(self.fvdir, name), 'rb') as fd:
+                contents[name] = fd.read()
+        return contents
+
+    #
+    # Set the outputs back in time, so that a rewrite is seen from their time stamp
+    #
+    def AgeOutputs(self):
+        mtime = time.time() - 100
+        for name in OutputFiles:
+            os.utime(os.path.join(self.fvdir, name), (mtime, mtime))
+        return mtime
+
+    def test_warm_run(self):
+        # The outputs are the same as the ones of the DSC without include
+        self.RunTool(dscfile = os.path.join(currentdir, 'QemuFspPkg.dsc'))
+        expected = self.ReadOutputs()
+        shutil.rmtree(self.fvdir)
+        GenDsc(self.dscfile, self.incfile, 0)
+        self.RunTool()
+        self.assertEqual(self.ReadOutputs(), expected)
+        self.assertTrue(os.path.exists(os.path.join(self.fvdir, 'QemuFspPkg.dsc.cache')))
+
+        mtime = self.AgeOutputs()
+        elapsed, output = self.RunTool()
+        self.assertEqual(self.ReadOutputs(), expected)
+        for name in OutputFiles:
+            self.assertEqual(os.path.getmtime(os.path.join(self.fvdir, name)), mtime)
+        self.assertIn('INFO: No UPD TXT file change', output)
+        self.assertIn('INFO: No UPD header file change', output)
+        self.assertIn('INFO: No UPD BSF file change', output)
+
+        # A cache which cannot be loaded is parsed again
+        with open(os.path.join(self.fvdir, 'QemuFspPkg.dsc.cache'), 'wb') as fd:
+            fd.write(b'\x00')
+        self.RunTool()
+        self.assertEqual(self.ReadOutputs(), expected)
+
+    def test_invalidate(self):
+        GenDsc(self.dscfile, self.incfile, 10)
+        self.RunTool()
+        expected = self.ReadOutputs()
+
+        # A change of the macros selects another value
+        mtime = self.AgeOutputs()
+        self.RunTool(['-D', 'PCI_TEMP_BASE_HIGH=TRUE'])
+        changed = self.ReadOutputs()
+        self.assertIn(b'0xC0000000', changed['CAE3605B-5B34-4C85-B3D7-27D54273C40F.txt'])
+        for name in OutputFiles:
+            self.assertEqual(os.path.getmtime(os.path.join(self.fvdir, name)) == mtime, changed[name] == expected[name])
+        self.assertEqual(changed['FspsUpd.h'], expected['FspsUpd.h'])
+        self.assertEqual(changed['34686CA3-34F9-4901-B82A-BA630F0714C6.txt'], expected['34686CA3-34F9-4901-B82A-BA630F0714C6.txt'])
+
+        # So does a change of the included file only
+        self.RunTool()
+        self.assertEqual(self.ReadOutputs(), expected)
+        with open(self.incfile, 'r') as fd:
+            inclines = fd.read()
+        with open(self.incfile, 'w') as fd:
+            fd.write(inclines.replace('0x00000003', '0x00000033'))
+        self.RunTool()
+        changed = self.ReadOutputs()
+        self.assertIn(b'ExtraItem3|DEFAULT|0x005C|4|0x00000033', changed['CAE3605B-5B34-4C85-B3D7-27D54273C40F.txt'])
+
+        # The cached items give the same outputs as a parse without cache
+        shutil.rmtree(self.fvdir)
+        self.RunTool()
+        self.assertEqual(self.ReadOutputs(), changed)
+
+    def test_time(self):
+        GenDsc(self.dscfile, self.incfile, 2000)
+        coldtime, output = self.RunTool()
+        expected = self.ReadOutputs()
+        warmtime, output = self.RunTool()
+        self.assertEqual(self.ReadOutputs(), expected)
+        print('\n%d items: cold run %.3fs, warm run %.3fs' % (2000, coldtime, warmtime))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+# @file
+#  Unit tests for the expression evaluation of GenYamlCfg.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+import time
+
+currentdir = os.path.dirname(os.path.realpath(__file__))
+parentdir = os.path.dirname(currentdir)
+sys.path.append(os.path.join(parentdir, 'ConfigEditor'))
+
+from GenYamlCfg import CGenYamlCfg, ExpressionEval
+
+#
+# Generate a configuration with structnum structures of 2 * itemnum items,
+# their values and conditions use expressions referring to other items
+#
+def GenYaml(structnum, itemnum):
+    lines = ['variable:', '  COND_ENABLE                    : 1', '',
+             'template:', '', '', 'configs:',
+             '  - $ACTION      :', '      page         : PG::"Page"']
+    for sidx in range(structnum):
+        lines.append('  - PLATFORM_CFG_%d :' % sidx)
+        for cidx in range(2):
+            path = 'PLATFORM_CFG_%d.CONFIG_%d' % (sidx, cidx)
+            lines.append('    - CONFIG_%d :' % cidx)
+            for idx in range(itemnum):
+                lines.append('      - Item%d :' % idx)
+                lines.append('          name         : Item %d' % idx)
+                kind = idx % 5
+                if kind == 0:
+                    lines.append('          type         : EditNum, HEX, (0x00,0xFFFFFFFF)')
+                    lines.append('          length       : 0x04')
+                    lines.append('          value        : 0x%08X' % (idx * 0x1001))
+                elif kind == 1:
+                    lines.append('          length       : 0x04')
+                    lines.append('          value        : $(%s.Item%d) + 1' % (path, idx - 1))
+                    lines.append('          condition    : $(%s.Item%d) > 0x10 and $(COND_ENABLE) == 1' % (path, idx - 1))
+                elif kind == 2:
+                    lines.append('          length       : 0x20')
+                    lines.append('          value        : {%s}' % ', '.join('0x%02X' % ((idx + i) & 0xFF) for i in range(32)))
+                elif kind == 3:
+                    lines.append('          length       : 0x04')
+                    lines.append('          value        : _LENGTH_PLATFORM_CFG_%d_ + _OFFSET_PLATFORM_CFG_%d_' % (sidx, sidx))
+                else:
+                    lines.append('          length       : 0x04')
+                    lines.append('          value        : {0x%02X:1B, $(%s.Item%d):1B, 0x00:1W}' % (idx & 0xFF, path, idx - 4))
+    return '\n'.join(lines) + '\n'
+
+class TestGenYamlCfg(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def LoadYaml(self, structnum, itemnum):
+        yamlfile = os.path.join(self.tmpdir, 'Cfg.yaml')
+        with open(yamlfile, 'w') as fd:
+            fd.write(GenYaml(structnum, itemnum))
+        cfg = CGenYamlCfg()
+        cfg.load_yaml(yamlfile)
+        return cfg
+
+    def test_values(self):
+        cfg = self.LoadYaml(3, 10)
+        data = cfg.generate_binary_array()
+        self.assertEqual(len(data), 3 * 2 * (8 * 4 + 2 * 0x20))
+        for item in cfg.get_cfg_list():
+            offset = item['offset'] // 8
+            value = int.from_bytes(data[offset:offset + 4], 'little')
+            idx = int(item['cname'][4:])
+            if idx % 5 == 1:
+                self.assertEqual(value, (idx - 1) * 0x1001 + 1)
+            elif idx % 5 == 3:
+                struct = cfg.locate_cfg_item(item['path'].split('.')[0])
+                self.assertEqual(value, (struct['$STRUCT']['length'] + struct['$STRUCT']['offset']) // 8)
+            elif idx % 5 == 4:
+                self.assertEqual(value, idx | ((((idx - 4) * 0x1001) & 0xFF) << 8))
+            if item['condition']:
+                self.assertEqual(cfg.evaluate_condition(item), 1 if idx > 1 else 0)
+
+    def test_value_change(self):
+        cfg = self.LoadYaml(2, 5)
+        expr = '$(PLATFORM_CFG_1.CONFIG_0.Item0) + _LENGTH_PLATFORM_CFG_1_'
+        item = cfg.get_item_by_path('PLATFORM_CFG_1.CONFIG_0.Item0')
+        cond = cfg.get_item_by_path('PLATFORM_CFG_1.CONFIG_0.Item1')
+        length = cfg.locate_cfg_item('PLATFORM_CFG_1.$STRUCT')['length'] // 8
+        self.assertEqual(cfg.eval(expr), length)
+        self.assertEqual(cfg.evaluate_condition(cond), 0)
+        # the parsed expressions do not depend on the values of the variables
+        parsed = len(ExpressionEval.expressions)
+        for value in [0x20, 0x08, 0x20, 0x30]:
+            item['value'] = '0x%08X' % value
+            self.assertEqual(cfg.eval(expr), value + length)
+            self.assertEqual(cfg.eval(expr), cfg.eval_expression(expr))
+            self.assertEqual(cfg.evaluate_condition(cond), 1 if value > 0x10 else 0)
+        cfg.set_field_value(cfg.locate_cfg_item('PLATFORM_CFG_1.CONFIG_0.Item0'), bytes(4))
+        self.assertEqual(cfg.eval(expr), length)
+        self.assertEqual(len(ExpressionEval.expressions), parsed)
+
+    def test_locate(self):
+        cfg = self.LoadYaml(2, 5)
+        for item in cfg.get_cfg_list():
+            node = cfg.locate_cfg_item(item['path'])
+            self.assertIs(cfg.get_item_by_index(node['indx']), item)
+        self.assertEqual(cfg.locate_cfg_item('PLATFORM_CFG_1.CONFIG_1.Item3.length'), '0x04')
+        self.assertIsNone(cfg.locate_cfg_item('PLATFORM_CFG_1.Item0', False))
+        with self.assertRaisesRegex(Exception, 'path: PLATFORM_CFG_1.Item0$'):
+            cfg.locate_cfg_item('PLATFORM_CFG_1.Item0.value')
+        with self.assertRaisesRegex(ValueError, 'Item9'):
+            cfg.eval('$(PLATFORM_CFG_0.CONFIG_0.Item9) + 1')
+        self.assertEqual(cfg.eval('$PLATFORM_CFG_0.CONFIG_0.Item1 + 1'), 2)
+        self.assertEqual(ExpressionEval().eval('$(A.B) * 2 + A', {'A.B': 3, 'A': 1}), 7)
+
+    def test_time(self):
+        start = time.time()
+        cfg = self.LoadYaml(100, 100)
+        loadtime = time.time() - start
+        start = time.time()
+        cfg.generate_binary(os.path.join(self.tmpdir, 'Cfg.bin'))
+        cfg.create_header_file(os.path.join(self.tmpdir, 'Cfg.h'))
+        gentime = time.time() - start
+        start = time.time()
+        for item in cfg.get_cfg_list():
+            if item['condition']:
+                cfg.evaluate_condition(item)
+        cfg.update_def_value()
+        evaltime = time.time() - start
+        print('\n%d items: load %.3fs, binary and header %.3fs, refresh %.3fs' % (len(cfg.get_cfg_list()), loadtime, gentime, evaltime))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# @file
+#  Unit tests for patching a FSP FD with PatchFv.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import unittest
+import tempfile
+import os
+import shutil
+import struct as st
+import subprocess
+import sys
+import time
+
+currentdir = os.path.dirname(os.path.realpath(__file__))
+parentdir = os.path.dirname(currentdir)
+
+FSP_BASE      = 0xFFFD0000
+FV_SIZE       = 0x10000
+FV_NAMES      = ['FSP-T', 'FSP-M', 'FSP-S']
+FSP_HDR_GUID  = '912740BE-2284-4734-B971-84B027353F0C'
+FSP_CFG_GUID  = '70BCF6A5-FFB1-47D8-B1AE-EFE5508E23EA'
+SEC_CORE_GUID = '5B94E419-C795-414D-A0D4-B80A877BE5FE'
+FSP_HDR_OFF   = 0x94
+FSP_CFG_OFF   = 0x200
+SEC_CORE_OFF  = 0x1000
+
+#
+# Patch commands used by the FSP build scripts
+#
+PATCH_COMMANDS = [
+    "0x0000,            _BASE_FSP-T_,                                                                                       @Temporary Base",
+    "<[0x0000]>+0x00AC, [<[0x0000]>+0x0020],                                                                                @FSP-T Size",
+    "<[0x0000]>+0x00B0, [0x0000],                                                                                           @FSP-T Base",
+    "<[0x0000]>+0x00B4, ([<[0x0000]>+0x0000] & 0xFFFFFF) - 0x0000,                                                          @FSP-T Image Attribute",
+    "<[0x0000]>+0x00B8, 70BCF6A5-FFB1-47D8-B1AE-EFE5508E23EA:0x1C - <[0x0000]>,                                             @FSP-T CFG Offset",
+    "<[0x0000]>+0x00BC, [70BCF6A5-FFB1-47D8-B1AE-EFE5508E23EA:0x14] & 0xFFFFFF - 0x001C,                                    @FSP-T CFG Size",
+    "<[0x0000]>+0x00C4, FspSecCoreT:_TempRamInitApi - [0x0000],                                                             @TempRamInit API",
+    "0x0000,            0x00000000,                                                                                         @Restore the value",
+    "FspSecCoreT:_FspInfoHeaderRelativeOff, FspSecCoreT:_AsmGetFspInfoHeader - {912740BE-2284-4734-B971-84B027353F0C:0x1C}, @FSP-T Header Offset",
+    "0x0000,            _BASE_FSP-M_,                                                                                       @Temporary Base",
+    "<[0x0000]>+0x00AC, [<[0x0000]>+0x0020],                                                                                @FSP-M Size",
+    "<[0x0000]>+0x00B0, [0x0000],                                                                                           @FSP-M Base",
+    "0x0000,            0x00000000,                                                                                         @Restore the value",
+    "0x0094, <_BASE_FSP-M_> + 0x0094, 0x0048, $COPY,                                                                        @Copy FSP-T Header",
+    "0xFFFFFFFC, FSPS_BASE_ADDRESS:0x0,                                                                                     @Reset Vector",
+]
+
+#
+# Build the FV build directory of a FSP made of FSP-T, FSP-M and FSP-S
+#
+#  param [in]  fvDir       FV build directory
+#  param [in]  fvSize      Size of each FV
+#
+def GenFspBuild(fvDir, fvSize=FV_SIZE):
+    fdData = b''
+    with open(os.path.join(fvDir, 'Guid.xref'), 'w') as xref:
+        xref.write('%s FspSecCoreT\n' % SEC_CORE_GUID)
+    for index, fvName in enumerate(FV_NAMES):
+        fvBase = FSP_BASE + index * fvSize
+        fvData = bytearray(os.urandom(fvSize))
+        fvData[0x20:0x30] = st.pack('<QI4s', fvSize, 0x48564657, b'_FVH')
+        fvData[FSP_HDR_OFF:FSP_HDR_OFF + 0x10] = st.pack('<4sIBBBB4s', b'FSPH', 0x48, 0, 0, 0, 2, b'\0\0\0\0')
+        fvData[FSP_HDR_OFF + 0x48:FSP_HDR_OFF + 0x50] = b'FSPPFSPE'
+        fvData[FSP_CFG_OFF - 0x08:FSP_CFG_OFF - 0x04] = st.pack('<I', 0x1C + 0x100)
+        fdData += fvData
+        fvFile = os.path.join(fvDir, fvName + '.Fv')
+        with open(fvFile, 'wb') as fv:
+            fv.write(fvData)
+        with open(os.path.join(fvDir, fvName + '.inf'), 'w') as inf:
+            inf.write('[options]\nEFI_BASE_ADDRESS = 0x%08X\n' % fvBase)
+        with open(fvFile + '.txt', 'w') as txt:
+            txt.write('0x%08X %s\n' % (FSP_HDR_OFF - 0x1C, FSP_HDR_GUID))
+            txt.write('0x%08X %s\n' % (FSP_CFG_OFF - 0x1C, FSP_CFG_GUID))
+            txt.write('0x%08X %s\n' % (SEC_CORE_OFF - 0x1C, SEC_CORE_GUID))
+        with open(fvFile + '.map', 'w') as map:
+            if index == 0:
+                map.write('FspSecCoreT (Fixed Flash Address, BaseAddress=0x00%08x, EntryPoint=0x00%08x)\n'
+                          % (fvBase + SEC_CORE_OFF, fvBase + SEC_CORE_OFF + 0x100))
+                map.write('(GUID=%s .textbaseaddress=0x00%08x .databaseaddress=0x00%08x)\n\n'
+                          % (SEC_CORE_GUID, fvBase + SEC_CORE_OFF + 0x240, fvBase + SEC_CORE_OFF + 0x800))
+                map.write('  0x00%08x    _TempRamInitApi\n' % (fvBase + SEC_CORE_OFF + 0x300))
+                map.write('  0x00%08x    _AsmGetFspInfoHeader\n' % (fvBase + SEC_CORE_OFF + 0x380))
+                map.write('  0x00%08x    _FspInfoHeaderRelativeOff\n' % (fvBase + SEC_CORE_OFF + 0x400))
+            else:
+                map.write('FspMain%d (Fixed Flash Address, BaseAddress=0x00%08x, EntryPoint=0x00%08x)\n'
+                          % (index, fvBase + SEC_CORE_OFF, fvBase + SEC_CORE_OFF + 0x100))
+    with open(os.path.join(fvDir, 'QEMUFSP.fd'), 'wb') as fd:
+        fd.write(fdData)
+    return fdData
+
+def RunPatchFv(fvDir, commands):
+    fvNames = ':'.join(FV_NAMES + ['QEMUFSP'])
+    return subprocess.run([sys.executable, os.path.join(parentdir, 'PatchFv.py'), fvDir, fvNames] + commands,
+                          stdout=subprocess.PIPE, universal_newlines=True)
+
+class TestPatchFv(unittest.TestCase):
+    def setUp(self):
+        self.fvDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.fvDir)
+
+    def test_patch_fsp(self):
+        fdData = GenFspBuild(self.fvDir)
+        commands = [command.replace('FSPS_BASE_ADDRESS', FSP_CFG_GUID) for command in PATCH_COMMANDS]
+        commands[-1] = "0xFFFFFFFC, {0x%04X},                                                                                    @Reset Vector" % FV_SIZE
+        process = RunPatchFv(self.fvDir, commands)
+        self.assertEqual(process.returncode, 0, process.stdout)
+        with open(os.path.join(self.fvDir, 'QEMUFSP.fd'), 'rb') as fd:
+            patchedData = fd.read()
+
+        expected = bytearray(fdData)
+        st.pack_into('<IIIII', expected, 0xAC, FV_SIZE, FSP_BASE, FSP_BASE & 0xFFFFFF, FSP_CFG_OFF, 0x100)
+        st.pack_into('<I', expected, 0xC4, SEC_CORE_OFF + 0x300)
+        st.pack_into('<I', expected, 0, 0)
+        st.pack_into('<I', expected, SEC_CORE_OFF + 0x400, SEC_CORE_OFF + 0x380 - FSP_HDR_OFF)
+        st.pack_into('<II', expected, FV_SIZE + 0xAC, FV_SIZE, FSP_BASE + FV_SIZE)
+        expected[FV_SIZE + FSP_HDR_OFF:FV_SIZE + FSP_HDR_OFF + 0x48] = expected[FSP_HDR_OFF:FSP_HDR_OFF + 0x48]
+        st.pack_into('<I', expected, len(expected) - 4, FSP_BASE + FV_SIZE)
+        self.assertEqual(patchedData, bytes(expected))
+        self.assertIn('Copied 72 bytes from offset 0x00000094 ~ offset 0x00010094', process.stdout)
+
+    def test_invalid_offset(self):
+        GenFspBuild(self.fvDir)
+        process = RunPatchFv(self.fvDir, ["0x%08X, 0x12345678, @Out of FD" % (len(FV_NAMES) * FV_SIZE - 2)])
+        self.assertEqual(process.returncode, 1)
+        self.assertIn('ERROR:', process.stdout)
+
+    #
+    # Timing of a large number of patches in a large synthetic FD
+    #
+    def test_patch_time(self):
+        GenFspBuild(self.fvDir, 0x400000)
+        commands = ["<_BASE_FSP-S_> + 0x%X, [<_BASE_FSP-T_> + 0x%X] + FspSecCoreT:_TempRamInitApi, @Patch %d"
+                    % (0x100000 + index * 4, index * 4, index) for index in range(2000)]
+        start = time.time()
+        process = RunPatchFv(self.fvDir, commands)
+        print('\n%d patches in a %d MB FD: %.3fs' % (len(commands), 3 * 0x400000 >> 20, time.time() - start))
+        self.assertEqual(process.returncode, 0, process.stdout)
+        self.assertEqual(process.stdout.count('Patched offset'), len(commands))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# @file
+#  Unit tests for rebasing a FSP binary with SplitFspBin.
+#
+#  Copyright (c) 2026, Intel Corporation. All rights reserved.<BR>
+#
+#  SPDX-License-Identifier: BSD-2-Clause-Patent
+#
+##
+
+# Import Modules
+import unittest
+import tempfile
+import os
+import shutil
+import struct as st
+import subprocess
+import sys
+import time
+
+currentdir = os.path.dirname(os.path.realpath(__file__))
+parentdir = os.path.dirname(currentdir)
+sys.path.append(parentdir)
+
+import SplitFspBin
+
+FSP_BASE      = 0xFE000000
+FSP_TYPES     = 'TMS'
+PE_HDR_OFFSET = 0x80
+RELOC_VALUE   = 0x5A5A0000
+
+def Align(offset, alignment=8):
+    return (offset + alignment - 1) & ~(alignment - 1)
+
+#
+# Generate a FFS file with the given (type, data) sections
+#
+def GenFfs(seclist):
+    ffsdata = b''
+    for sectype, secdata in seclist:
+        ffsdata += bytes(Align(len(ffsdata), 4) - len(ffsdata))
+        ffsdata += st.pack('<I', (len(secdata) + 4) | (sectype << 24)) + secdata
+    return st.pack('<16sBBBBI', os.urandom(16), 0, 0, 0x06, 0, (len(ffsdata) + 0x18) | (0xF8 << 24)) + ffsdata
+
+#
+# Generate a PE32, PE32+ or TE image with a relocation for every 0x10 bytes
+# of its pages but the first one, the value of each fixup is RELOC_VALUE +
+# its offset. The relocation blocks are in the last quarter of the image.
+#
+def GenImage(kind, imgsize):
+    image  = bytearray(os.urandom(imgsize))
+    size   = 8 if kind == 'PE32+' else 4
+    rtype  = 10 if kind == 'PE32+' else 3
+    relocs = b''
+    rva    = imgsize - imgsize // 4
+    for page in range(0x1000, rva, 0x1000):
+        entries = [(rtype << 12) | off for off in range(0, 0x1000, 0x10)] + [0, 0]
+        relocs += st.pack('<II%dH' % len(entries), page, 8 + 2 * len(entries), *entries)
+        for off in range(0, 0x1000, 0x10):
+            st.pack_into('<Q' if size == 8 else '<I', image, page + off, RELOC_VALUE + page + off)
+    image[rva:rva + len(relocs)] = relocs
+    if kind == 'TE':
+        image[0:0x28] = st.pack('<2sHBBHIIQII8s', b'VZ', 0x8664, 0, 0, 0x28, 0, 0, 0, rva, len(relocs), bytes(8))
+        return bytes(image)
+
+    image[0:0x40] = b'MZ' + bytes(0x3A) + st.pack('<I', PE_HDR_OFFSET)
+    if size == 8:
+        opthdr = st.pack('<HBBIIIIIQ', 0x20b, 0, 0, 0, 0, 0, 0, 0, 0) + bytes(0x4C) + st.pack('<I', 16)
+    else:
+        opthdr = st.pack('<HBBIIIIIII', 0x10b, 0, 0, 0, 0, 0, 0, 0, 0, 0) + bytes(0x3C) + st.pack('<I', 16)
+    opthdr += bytes(5 * 8) + st.pack('<II', rva, len(relocs)) + bytes(10 * 8)
+    pehdr = b'PE\0\0' + st.pack('<HHIIIHH', 0x8664, 0, 0, 0, 0, len(opthdr), 0) + opthdr
+    image[PE_HDR_OFFSET:PE_HDR_OFFSET + len(pehdr)] = pehdr
+    return bytes(image)
+
+#
+# Generate a FSP 2.x binary with one FV for each of FSP-T, FSP-M and FSP-S.
+# Each FV holds the FSP information header and imgnum images, half of them
+# are placed at an 8 bytes aligned offset. The FSP patch table patches the
+# last two dwords of each FV.
+#
+def GenFsp(imgnum, imgsize):
+    fdData  = b''
+    imgList = []
+    ffsList = []
+    for img in range(imgnum):
+        kind = ['PE32', 'PE32+', 'TE'][img % 3]
+        seclist = [(0x12 if kind == 'TE' else 0x10, GenImage(kind, imgsize))]
+        if img % 2 == 0:
+            seclist.insert(0, (0x19, b''))
+        ffsList.append((kind, len(seclist) * 4 + 0x18, GenFfs(seclist)))
+    fvLen = Align(0x60 + 0x100 + sum(Align(len(ffs)) for kind, imgoff, ffs in ffsList), 0x1000)
+    for idx, ftype in enumerate(FSP_TYPES):
+        base = FSP_BASE + idx * fvLen
+        fih  = st.pack('<4sIHBBI8sIIHHII', b'FSPH', 0x48, 0, 0x20, 6, 1, b'$TSTFSP$', fvLen, base, 0, (idx + 1) << 12, 0, 0)
+        fih += bytes(0x48 - len(fih))
+        fih += st.pack('<4sHBBIII', b'FSPP', 0x14, 1, 0, 2, 0x80000000 | (0x1000000 - 8), 0x80000000 | (0x1000000 - 4))
+        fv  = st.pack('<16s16sQ4sIHHHBB', bytes(16), bytes(16), fvLen, b'_FVH', 0x0004FEFF, 0x48, 0, 0x48, 0, 2)
+        fv += st.pack('<IIII16sI', fvLen // 0x1000, 0x1000, 0, 0, os.urandom(16), 0x14)
+        fv += bytes(Align(len(fv)) - len(fv)) + GenFfs([(0x19, fih)])
+        for kind, imgoff, ffs in ffsList:
+            fv += bytes(Align(len(fv)) - len(fv))
+            imgList.append((kind, len(fdData) + len(fv) + imgoff))
+            fv += ffs
+        fv += b'\xff' * (fvLen - 8 - len(fv)) + st.pack('<II', base + 0x100, base + 0x200)
+        fdData += fv
+    return fdData, imgList, fvLen
+
+class TestSplitFspBin(unittest.TestCase):
+    def setUp(self):
+        self.outDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.outDir)
+
+    def test_rebase(self):
+        fdData, imgList, fvLen = GenFsp(6, 0x4000)
+        fspFile = os.path.join(self.outDir, 'Fsp.fd')
+        with open(fspFile, 'wb') as fd:
+            fd.write(fdData)
+        delta = -0x00200000
+        newBase = ['0x%08X' % (FSP_BASE + idx * fvLen + delta) for idx in range(len(FSP_TYPES))]
+        process = subprocess.run([sys.executable, os.path.join(parentdir, 'SplitFspBin.py'), 'rebase', '-f', fspFile,
+                                  '-c', 't', 'm', 's', '-b'] + newBase + ['-o', self.outDir, '-n', 'Rebased.fd', '--verify'],
+                                 stdout=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(process.returncode, 0, process.stdout)
+        self.assertEqual(process.stdout.count('Patched 3072 entries in 6 TE/PE32 images.'), 3, process.stdout)
+        self.assertEqual(process.stdout.count('Patched 2 entries using FSP patch table.'), 3, process.stdout)
+        self.assertIn('Verified the rebased FSP binary', process.stdout)
+
+        with open(os.path.join(self.outDir, 'Rebased.fd'), 'rb') as fd:
+            newData = fd.read()
+        self.assertEqual(len(newData), len(fdData))
+        for kind, offset in imgList:
+            fmt, mask = ('<Q', (1 << 64) - 1) if kind == 'PE32+' else ('<I', (1 << 32) - 1)
+            for off in range(0x1000, 0x3000, 0x10):
+                self.assertEqual(st.unpack_from(fmt, newData, offset + off)[0], (RELOC_VALUE + off + delta) & mask)
+            self.assertEqual(newData[offset + 0x3000:offset + 0x4000], fdData[offset + 0x3000:offset + 0x4000])
+        for idx in range(len(FSP_TYPES)):
+            base = FSP_BASE + idx * fvLen
+            self.assertEqual(st.unpack_from('<II', newData, (idx + 1) * fvLen - 8), (base + 0x100 + delta, base + 0x200 + delta))
+
+    #
+    # Timing of the relocation of large images, with the per entry relocation
+    # and with the relocation table
+    #
+    def test_rebase_time(self):
+        fdData, imgList, fvLen = GenFsp(30, 0x40000)
+        fspFile = os.path.join(self.outDir, 'Fsp.fd')
+        with open(fspFile, 'wb') as fd:
+            fd.write(fdData)
+        fd = SplitFspBin.FirmwareDevice(0, fspFile)
+        fd.ParseFd()
+        fd.ParseFsp()
+        delta = 0x1000000
+        result = []
+        for table in [False, True]:
+            newData = fd.FdData[:]
+            start = time.time()
+            count = 0
+            for kind, offset in imgList:
+                img = SplitFspBin.PeTeImage(offset, fd.FdData[offset:offset + 0x40000])
+                if table:
+                    img.ParseRelocTable()
+                    count += img.RebaseTable(delta, newData)
+                else:
+                    img.ParseReloc()
+                    count += img.Rebase(delta, newData)
+            print('\n%s: %d relocations in %d images: %.3fs' % ('Table' if table else 'Per entry', count, len(imgList), time.time() - start))
+            result.append(newData)
+        self.assertEqual(result[0], result[1])
+        self.assertNotEqual(result[1], fd.FdData)
+
+if __name__ == '__main__':
+    unittest.main()